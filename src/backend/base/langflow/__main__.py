@@ -537,6 +537,15 @@ def copy_db() -> None:
         typer.echo("Pre-release database not found in the cache directory.")
 
 
+@app.command()
+def build_component_index() -> None:
+    """Build the index of the bundled components, which is shipped with the package to speed up startup."""
+    from langflow.interface.component_index import abuild_bundled_component_index
+
+    index_path = asyncio.run(abuild_bundled_component_index())
+    typer.echo(f"Component index written to {index_path}")
+
+
 async def _migration(*, test: bool, fix: bool) -> None:
     await initialize_services(fix_migration=fix)
     db_service = get_db_service()
@@ -0,0 +1,52 @@
+"""Add message history indexes and message insertion time
+
+Revision ID: 3c8f1e2a9b47
+Revises: 66f72f04a1de
+Create Date: 2026-10-18 23:05:12.418306
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "3c8f1e2a9b47"
+down_revision: Union[str, None] = "66f72f04a1de"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "ix_message_flow_id_session_id_timestamp": ["flow_id", "session_id", "timestamp", "inserted_at"],
+    "ix_message_session_id_timestamp": ["session_id", "timestamp", "inserted_at"],
+}
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    column_names = [column["name"] for column in inspector.get_columns("message")]
+    if "inserted_at" not in column_names:
+        with op.batch_alter_table("message", schema=None) as batch_op:
+            batch_op.add_column(sa.Column("inserted_at", sa.DateTime(), nullable=True))
+        # Messages stored before keep the order of their timestamps
+        op.execute("UPDATE message SET inserted_at = timestamp")
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        for name, columns in INDEXES.items():
+            if name not in indexes_names:
+                batch_op.create_index(name, columns, unique=False)
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    indexes_names = [index["name"] for index in inspector.get_indexes("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        for name in INDEXES:
+            if name in indexes_names:
+                batch_op.drop_index(name)
+    column_names = [column["name"] for column in inspector.get_columns("message")]
+    with op.batch_alter_table("message", schema=None) as batch_op:
+        if "inserted_at" in column_names:
+            batch_op.drop_column("inserted_at")
@@ -0,0 +1,74 @@
+"""Add interface summary to flow
+
+Revision ID: 9d3b6a1c4e25
+Revises: 3c8f1e2a9b47
+Create Date: 2026-10-18 23:41:36.902114
+
+"""
+
+import json
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from loguru import logger
+
+from langflow.helpers.flow import get_flow_interface_summary
+
+revision: str = "9d3b6a1c4e25"
+down_revision: Union[str, None] = "3c8f1e2a9b47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    with op.batch_alter_table("flow", schema=None) as batch_op:
+        if "interface_summary" not in column_names:
+            batch_op.add_column(sa.Column("interface_summary", sa.JSON(), nullable=True))
+    backfill_interface_summaries(conn)
+
+
+def backfill_interface_summaries(conn) -> None:
+    """Summarize the flows saved before the column existed, a batch of flows at a time."""
+    # The data is read untyped and parsed row by row, so that a row with invalid JSON does not fail the query
+    flow = sa.table("flow", sa.column("id"), sa.column("data"), sa.column("interface_summary", sa.JSON))
+    update = (
+        flow.update()
+        .where(flow.c.id == sa.bindparam("flow_id"))
+        .values(interface_summary=sa.bindparam("summary", type_=sa.JSON))
+    )
+    last_id = None
+    while True:
+        stmt = sa.select(flow.c.id, flow.c.data).where(flow.c.interface_summary.is_(None))
+        if last_id is not None:
+            stmt = stmt.where(flow.c.id > last_id)
+        rows = conn.execute(stmt.order_by(flow.c.id).limit(BACKFILL_BATCH_SIZE)).all()
+        if not rows:
+            break
+        summaries = []
+        for flow_id, data in rows:
+            try:
+                summary = get_flow_interface_summary(json.loads(data) if isinstance(data, str | bytes) else data)
+            except Exception:  # noqa: BLE001
+                # A flow with invalid data is summarized when it is listed or saved again
+                logger.warning(f"Could not summarize the interface of flow {flow_id}")
+                continue
+            if summary is not None:
+                summaries.append({"flow_id": flow_id, "summary": summary})
+        if summaries:
+            conn.execute(update, summaries)
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)  # type: ignore
+    column_names = [column["name"] for column in inspector.get_columns("flow")]
+    with op.batch_alter_table("flow", schema=None) as batch_op:
+        if "interface_summary" in column_names:
+            batch_op.drop_column("interface_summary")
@@ -29,14 +29,18 @@ from langflow.api.v1.schemas import (
 from langflow.events.event_manager import EventManager
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.graph.base import Graph
+from langflow.graph.graph.profiler import graph_profile_store
 from langflow.graph.utils import log_vertex_build
 from langflow.schema.message import ErrorMessage
 from langflow.schema.schema import OutputValue
 from langflow.services.database.models.flow import Flow
 from langflow.services.deps import get_chat_service, get_telemetry_service, session_scope
-from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
+from langflow.services.job_queue.service import JobQueueFullError, JobQueueNotFoundError, JobQueueService
 from langflow.services.telemetry.schema import ComponentPayload, PlaygroundPayload
 
+# Builds of public flows are admitted after the builds of authenticated users with the "priority" policy
+PUBLIC_BUILD_PRIORITY = 1
+
 
 async def start_flow_build(
     *,
@@ -51,9 +55,14 @@ async def start_flow_build(
     current_user: CurrentActiveUser,
     queue_service: JobQueueService,
     flow_name: str | None = None,
+    profile: bool = False,
+    priority: int = 0,
 ) -> str:
     """Start the flow build process by setting up the queue and starting the build task.
 
+    When `profile` is True, the vertex profiles of the build are kept under the job id. The build starts once
+    it is admitted by the queue service, in `priority` order with the "priority" admission policy.
+
     Returns:
         the job_id.
     """
@@ -72,8 +81,12 @@ async def start_flow_build(
             log_builds=log_builds,
             current_user=current_user,
             flow_name=flow_name,
+            profile_key=job_id if profile else None,
         )
-        queue_service.start_job(job_id, task_coro)
+        queue_service.start_job(job_id, task_coro, user_id=str(current_user.id), priority=priority)
+        await queue_service.register_job(job_id)
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"}) from e
     except Exception as e:
         logger.exception("Failed to create queue and start task")
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -88,7 +101,7 @@ async def get_flow_events_response(
 ):
     """Get events for a specific build job, either as a stream or single event."""
     try:
-        main_queue, event_manager, event_task, _ = queue_service.get_queue_data(job_id)
+        main_queue, event_manager, event_task, _ = await queue_service.aget_queue_data(job_id)
         if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
             if event_task is None:
                 logger.error(f"No event task found for job {job_id}")
@@ -102,32 +115,21 @@ async def get_flow_events_response(
         # Polling mode - get all available events
         try:
             events: list = []
-            # Get all available events from the queue without blocking
-            while not main_queue.empty():
-                _, value, _ = await main_queue.get()
-                if value is None:
-                    # End of stream, trigger end event
-                    if event_task is not None:
-                        event_task.cancel()
-                    event_manager.on_end(data={})
-                    # Include the end event
-                    events.append(None)
-                    break
+            # Wait for an event if none is available, then get all the available events without blocking
+            _, value, _ = await main_queue.get()
+            while value is not None:
                 events.append(value.decode("utf-8"))
-
-            # If no events were available, wait for one (with timeout)
-            if not events:
+                if main_queue.empty():
+                    break
                 _, value, _ = await main_queue.get()
-                if value is None:
-                    # End of stream, trigger end event
-                    if event_task is not None:
-                        event_task.cancel()
-                    event_manager.on_end(data={})
-                else:
-                    events.append(value.decode("utf-8"))
+            if value is None:
+                # End of stream, trigger end event
+                if event_task is not None:
+                    event_task.cancel()
+                event_manager.on_end(data={})
 
             # Return as NDJSON format - each line is a complete JSON object
-            content = "\n".join([event for event in events if event is not None])
+            content = "\n".join(events)
             return Response(content=content, media_type="application/x-ndjson")
         except asyncio.CancelledError as exc:
             logger.info(f"Event polling was cancelled for job {job_id}")
@@ -191,6 +193,7 @@ async def generate_flow_events(
     log_builds: bool,
     current_user: CurrentActiveUser,
     flow_name: str | None = None,
+    profile_key: str | None = None,
 ) -> None:
     """Generate events for flow building process.
 
@@ -198,6 +201,8 @@ async def generate_flow_events(
     - Building and validating the graph
     - Processing vertices
     - Handling errors and cleanup
+
+    When `profile_key` is set, the vertex builds are profiled and the profile is stored under that key.
     """
     chat_service = get_chat_service()
     telemetry_service = get_telemetry_service()
@@ -450,6 +455,8 @@ async def generate_flow_events(
 
     event_manager.on_vertices_sorted(data={"ids": ids, "to_run": vertices_to_run})
 
+    if profile_key is not None:
+        graph.enable_profiling().start()
     tasks = []
     for vertex_id in ids:
         task = asyncio.create_task(build_vertices(vertex_id, graph, event_manager))
@@ -471,6 +478,10 @@ async def generate_flow_events(
         )
         event_manager.on_error(data=error_message.data)
         raise
+    finally:
+        if graph.profiler is not None and profile_key is not None:
+            graph.profiler.stop()
+            graph_profile_store.save(profile_key, graph.profiler)
 
     event_manager.on_end(data={})
     await graph.end_all_traces()
@@ -496,6 +507,10 @@ async def cancel_flow_build(
         ValueError: If the job doesn't exist
         asyncio.CancelledError: If the task cancellation failed
     """
+    if not queue_service.owns_job(job_id):
+        # The job may be running on another worker
+        return await queue_service.request_cancel(job_id)
+
     # Get the event task and event manager for the job
     _, _, event_task, _ = queue_service.get_queue_data(job_id)
 
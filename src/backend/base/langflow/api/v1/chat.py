@@ -4,7 +4,7 @@ import asyncio
 import time
 import traceback
 import uuid
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, Literal
 
 from fastapi import (
     APIRouter,
@@ -12,6 +12,7 @@ from fastapi import (
     Body,
     Depends,
     HTTPException,
+    Query,
     Request,
     status,
 )
@@ -19,6 +20,7 @@ from fastapi.responses import StreamingResponse
 from loguru import logger
 
 from langflow.api.build import (
+    PUBLIC_BUILD_PRIORITY,
     cancel_flow_build,
     get_flow_events_response,
     start_flow_build,
@@ -47,6 +49,7 @@ from langflow.api.v1.schemas import (
 )
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.graph.base import Graph
+from langflow.graph.graph.profiler import graph_profile_store
 from langflow.graph.utils import log_vertex_build
 from langflow.schema.schema import OutputValue
 from langflow.services.cache.utils import CacheMiss
@@ -154,6 +157,7 @@ async def build_flow(
     queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
     flow_name: str | None = None,
     event_delivery: EventDeliveryType = EventDeliveryType.POLLING,
+    profile: bool = False,
 ):
     """Build and process a flow, returning a job ID for event polling.
 
@@ -173,6 +177,7 @@ async def build_flow(
         queue_service: Queue service for job management
         flow_name: Optional name for the flow
         event_delivery: Optional event delivery type - default is streaming
+        profile: Whether to profile the vertex builds. The profile is served by /build/{job_id}/profile.
 
     Returns:
         Dict with job_id that can be used to poll for build status
@@ -195,6 +200,7 @@ async def build_flow(
         current_user=current_user,
         queue_service=queue_service,
         flow_name=flow_name,
+        profile=profile,
     )
 
     # This is required to support FE tests - we need to be able to set the event delivery to direct
@@ -253,6 +259,25 @@ async def cancel_build(
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)) from exc
 
 
+@router.get("/build/{job_id}/profile")
+async def get_build_profile(
+    job_id: str,
+    profile_format: Annotated[Literal["json", "chrome", "speedscope"], Query(alias="format")] = "json",
+):
+    """Get the vertex profiles of a build started with `profile=true`.
+
+    The "chrome" format loads in chrome://tracing and Perfetto, the "speedscope" format in speedscope.app.
+    """
+    profiler = graph_profile_store.get(job_id)
+    if profiler is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"No profile found for job {job_id}")
+    if profile_format == "chrome":
+        return profiler.to_chrome_trace()
+    if profile_format == "speedscope":
+        return profiler.to_speedscope(name=f"Build {job_id}")
+    return profiler.to_dict()
+
+
 @router.post("/build/{flow_id}/vertices/{vertex_id}", deprecated=True)
 async def build_vertex(
     *,
@@ -623,6 +648,7 @@ async def build_public_tmp(
             current_user=owner_user,
             queue_service=queue_service,
             flow_name=flow_name or f"{client_id}_{flow_id}",
+            priority=PUBLIC_BUILD_PRIORITY,
         )
     except Exception as exc:
         logger.exception("Error building public flow")
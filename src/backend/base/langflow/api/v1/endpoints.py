@@ -32,6 +32,7 @@ from langflow.events.event_manager import create_stream_tokens_event_manager
 from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.exceptions.serialization import SerializationError
 from langflow.graph.graph.base import Graph
+from langflow.graph.graph.template import graph_template_cache
 from langflow.graph.schema import RunOutputs
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
@@ -47,7 +48,6 @@ from langflow.services.database.models.user.model import User, UserRead
 from langflow.services.deps import get_session_service, get_settings_service, get_telemetry_service
 from langflow.services.settings.feature_flags import FEATURE_FLAGS
 from langflow.services.telemetry.schema import RunPayload
-from langflow.utils.compression import compress_response
 from langflow.utils.version import get_version_info
 
 if TYPE_CHECKING:
@@ -58,20 +58,27 @@ router = APIRouter(tags=["Base"])
 
 
 @router.get("/all", dependencies=[Depends(get_current_active_user)])
-async def get_all():
-    """Retrieve all component types with compression for better performance.
+async def get_all(request: Request, since: str | None = None):
+    """Retrieve all component types.
 
-    Returns a compressed response containing all available component types.
+    The catalog is serialized and compressed once per version and its version is returned in the ETag header.
+    Requests with a matching `If-None-Match` header get a 304. With `since`, a version returned in an earlier ETag,
+    only the components changed and removed since that version are returned, if it is still known.
     """
-    from langflow.interface.components import get_and_cache_all_types_dict
+    from langflow.interface.catalog import catalog_response, component_catalog
+    from langflow.interface.components import component_cache, get_and_cache_all_types_dict
 
     try:
         all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
-        # Return compressed response using our utility function
-        return compress_response(all_types)
-
+        snapshot = await component_catalog.get_snapshot(all_types, component_cache.version)
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
+    return await catalog_response(
+        snapshot,
+        accept_encoding=request.headers.get("accept-encoding"),
+        if_none_match=request.headers.get("if-none-match"),
+        since=since,
+    )
 
 
 def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
@@ -122,9 +129,20 @@ async def simple_run_flow(
         if flow.data is None:
             msg = f"Flow {flow_id_str} has no data"
             raise ValueError(msg)
-        graph_data = flow.data.copy()
-        graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
-        graph = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
+        if flow.updated_at is not None:
+            graph_template = graph_template_cache.get_or_create(
+                flow.data,
+                flow_id=flow_id_str,
+                flow_name=flow.name,
+                updated_at=flow.updated_at,
+                tweaks=input_request.tweaks,
+                stream=stream,
+            )
+            graph = graph_template.create_graph(user_id=str(user_id))
+        else:
+            graph_data = flow.data.copy()
+            graph_data = process_tweaks(graph_data, input_request.tweaks or {}, stream=stream)
+            graph = Graph.from_payload(graph_data, flow_id=flow_id_str, user_id=str(user_id), flow_name=flow.name)
         inputs = None
         if input_request.input_value is not None:
             inputs = [
@@ -316,7 +334,12 @@ async def simplified_run_flow(
     if stream:
         asyncio_queue: asyncio.Queue = asyncio.Queue()
         asyncio_queue_client_consumed: asyncio.Queue = asyncio.Queue()
-        event_manager = create_stream_tokens_event_manager(queue=asyncio_queue)
+        settings = get_settings_service().settings
+        event_manager = create_stream_tokens_event_manager(
+            queue=asyncio_queue,
+            token_batch_interval=settings.token_batch_interval,
+            token_batch_size=settings.token_batch_size,
+        )
         main_task = asyncio.create_task(
             run_flow_generator(
                 flow=flow,
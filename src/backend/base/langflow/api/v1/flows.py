@@ -25,6 +25,7 @@ from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.logging import logger
 from langflow.services.database.models.flow import Flow, FlowCreate, FlowRead, FlowUpdate
+from langflow.services.database.models.flow.crud import get_flow_headers, select_flow_headers
 from langflow.services.database.models.flow.model import AccessTypeEnum, FlowHeader
 from langflow.services.database.models.flow.utils import get_webhook_component_in_flow
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
@@ -219,11 +220,22 @@ async def read_flows(
             folder_id = default_folder_id
 
         if auth_settings.AUTO_LOGIN:
-            stmt = select(Flow).where(
-                (Flow.user_id == None) | (Flow.user_id == current_user.id)  # noqa: E711
-            )
+            user_filter = (Flow.user_id == None) | (Flow.user_id == current_user.id)  # noqa: E711
         else:
-            stmt = select(Flow).where(Flow.user_id == current_user.id)
+            user_filter = Flow.user_id == current_user.id
+        stmt = select(Flow).where(user_filter)
+
+        if get_all and header_flows:
+            # The headers are read from their columns, without loading the data of the flows
+            header_stmt = select_flow_headers().where(user_filter)
+            if remove_example_flows:
+                header_stmt = header_stmt.where(Flow.folder_id != starter_folder_id)
+            if components_only:
+                header_stmt = header_stmt.where(Flow.is_component == True)  # noqa: E712
+            flow_headers = await get_flow_headers(session, header_stmt, with_component_data=True)
+            if components_only:
+                flow_headers = [flow_header for flow_header in flow_headers if flow_header.is_component]
+            return compress_response(flow_headers)
 
         if remove_example_flows:
             stmt = stmt.where(Flow.folder_id != starter_folder_id)
@@ -238,10 +250,6 @@ async def read_flows(
                 flows = [flow for flow in flows if flow.is_component]
             if remove_example_flows and starter_folder_id:
                 flows = [flow for flow in flows if flow.folder_id != starter_folder_id]
-            if header_flows:
-                # Convert to FlowHeader objects and compress the response
-                flow_headers = [FlowHeader.model_validate(flow, from_attributes=True) for flow in flows]
-                return compress_response(flow_headers)
 
             # Compress the full flows response
             return compress_response(flows)
@@ -21,8 +21,8 @@ from starlette.background import BackgroundTasks
 
 from langflow.api.v1.chat import build_flow_and_stream
 from langflow.api.v1.schemas import InputValueRequest
+from langflow.base.mcp.tool_catalog import get_mcp_tool_catalog
 from langflow.base.mcp.util import get_flow_snake_case
-from langflow.helpers.flow import json_schema_from_flow
 from langflow.services.auth.utils import get_current_active_user
 from langflow.services.database.models import Flow, User
 from langflow.services.deps import (
@@ -107,7 +107,7 @@ async def handle_list_resources():
         base_url = f"http://{host}:{port}".rstrip("/")
 
         async with db_service.with_session() as session:
-            flows = (await session.exec(select(Flow))).all()
+            flows = (await session.exec(select(Flow.id, Flow.name))).all()
 
             for flow in flows:
                 if flow.id:
@@ -174,35 +174,17 @@ async def handle_read_resource(uri: str) -> bytes:
 
 @server.list_tools()
 async def handle_list_tools():
-    tools = []
     try:
+        current_user = current_user_ctx.get()
         db_service = get_db_service()
         async with db_service.with_session() as session:
-            flows = (await session.exec(select(Flow))).all()
-
-            for flow in flows:
-                if flow.user_id is None:
-                    continue
-
-                flow_name = "_".join(flow.name.lower().split())
-                try:
-                    tool = types.Tool(
-                        name=flow_name,
-                        description=f"{flow.id}: {flow.description}"
-                        if flow.description
-                        else f"Tool generated from flow: {flow_name}",
-                        inputSchema=json_schema_from_flow(flow),
-                    )
-                    tools.append(tool)
-                except Exception as e:  # noqa: BLE001
-                    msg = f"Error in listing tools: {e!s} from flow: {flow_name}"
-                    logger.warning(msg)
-                    continue
+            return await get_mcp_tool_catalog().list_tools(
+                ("user", current_user.id), session, server.request_context.session
+            )
     except Exception as e:
         msg = f"Error in listing tools: {e!s}"
         logger.exception(msg)
         raise
-    return tools
 
 
 @server.call_tool()
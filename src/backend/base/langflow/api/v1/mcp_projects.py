@@ -14,8 +14,7 @@ from fastapi.responses import HTMLResponse
 from mcp import types
 from mcp.server import NotificationOptions, Server
 from mcp.server.sse import SseServerTransport
-from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlmodel import col, select
 
 from langflow.api.v1.chat import build_flow_and_stream
 from langflow.api.v1.mcp import (
@@ -25,10 +24,11 @@ from langflow.api.v1.mcp import (
     with_db_session,
 )
 from langflow.api.v1.schemas import InputValueRequest, MCPSettings
+from langflow.base.mcp.tool_catalog import get_mcp_tool_catalog
 from langflow.base.mcp.util import get_flow_snake_case
-from langflow.helpers.flow import json_schema_from_flow
 from langflow.services.auth.utils import get_current_active_user, get_current_user
 from langflow.services.database.models import Flow, Folder, User
+from langflow.services.database.models.flow.crud import get_flow_headers, select_flow_headers
 from langflow.services.deps import get_db_service, get_settings_service, get_storage_service
 from langflow.services.storage.utils import build_content_type_from_extension
 
@@ -65,29 +65,26 @@ async def list_project_tools(
         async with db_service.with_session() as session:
             # Fetch the project first to verify it exists and belongs to the current user
             project = (
-                await session.exec(
-                    select(Folder)
-                    .options(selectinload(Folder.flows))
-                    .where(Folder.id == project_id, Folder.user_id == current_user.id)
-                )
+                await session.exec(select(Folder).where(Folder.id == project_id, Folder.user_id == current_user.id))
             ).first()
 
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
 
             # Query flows in the project
-            flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+            flows_query = select_flow_headers().where(
+                Flow.folder_id == project_id,
+                Flow.is_component == False,  # noqa: E712
+                col(Flow.user_id).is_not(None),
+            )
 
             # Optionally filter for MCP-enabled flows only
             if mcp_enabled:
                 flows_query = flows_query.where(Flow.mcp_enabled == True)  # noqa: E712
 
-            flows = (await session.exec(flows_query)).all()
+            flows = await get_flow_headers(session, flows_query)
 
             for flow in flows:
-                if flow.user_id is None:
-                    continue
-
                 # Format the flow name according to MCP conventions (snake_case)
                 flow_name = "_".join(flow.name.lower().split())
 
@@ -131,39 +128,16 @@ class ProjectMCPServer:
         @handle_mcp_errors
         async def handle_list_project_tools():
             """Handle listing tools for this specific project."""
-            tools = []
             try:
                 db_service = get_db_service()
                 async with db_service.with_session() as session:
-                    # Get flows with mcp_enabled flag set to True and in this project
-                    flows = (
-                        await session.exec(
-                            select(Flow).where(Flow.mcp_enabled == True, Flow.folder_id == self.project_id)  # noqa: E712
-                        )
-                    ).all()
-
-                    for flow in flows:
-                        if flow.user_id is None:
-                            continue
-
-                        # Use action_name if available, otherwise construct from flow name
-                        name = flow.action_name or "_".join(flow.name.lower().split())
-
-                        # Use action_description if available, otherwise use defaults
-                        description = flow.action_description or (
-                            flow.description if flow.description else f"Tool generated from flow: {name}"
-                        )
-
-                        tool = types.Tool(
-                            name=name,
-                            description=description,
-                            inputSchema=json_schema_from_flow(flow),
-                        )
-                        tools.append(tool)
+                    return await get_mcp_tool_catalog().list_tools(
+                        ("project", self.project_id), session, self.server.request_context.session
+                    )
             except Exception as e:  # noqa: BLE001
-                msg = f"Error in listing project tools: {e!s} from flow: {name}"
+                msg = f"Error in listing project tools: {e!s}"
                 logger.warning(msg)
-            return tools
+                return []
 
         @self.server.list_prompts()
         async def handle_list_prompts():
@@ -184,7 +158,7 @@ class ProjectMCPServer:
                 base_url = f"http://{host}:{port}".rstrip("/")
 
                 async with db_service.with_session() as session:
-                    flows = (await session.exec(select(Flow))).all()
+                    flows = (await session.exec(select(Flow.id, Flow.name))).all()
 
                     for flow in flows:
                         if flow.id:
@@ -518,11 +492,7 @@ async def update_project_mcp_settings(
         async with db_service.with_session() as session:
             # Fetch the project first to verify it exists and belongs to the current user
             project = (
-                await session.exec(
-                    select(Folder)
-                    .options(selectinload(Folder.flows))
-                    .where(Folder.id == project_id, Folder.user_id == current_user.id)
-                )
+                await session.exec(select(Folder).where(Folder.id == project_id, Folder.user_id == current_user.id))
             ).first()
 
             if not project:
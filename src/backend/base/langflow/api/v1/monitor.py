@@ -1,7 +1,7 @@
-from typing import Annotated
+from typing import Annotated, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlmodel import apaginate
 from sqlalchemy import delete
@@ -10,6 +10,7 @@ from sqlmodel import col, select
 from langflow.api.utils import DbSession, custom_params
 from langflow.schema.message import MessageResponse
 from langflow.services.auth.utils import get_current_active_user
+from langflow.services.database.models.message.crud import get_messages_page
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
 from langflow.services.database.models.transactions.crud import transform_transaction_table
 from langflow.services.database.models.transactions.model import TransactionTable
@@ -21,6 +22,8 @@ from langflow.services.database.models.vertex_builds.model import VertexBuildMap
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
+MAX_MESSAGES_PAGE_SIZE = 1000
+
 
 @router.get("/builds")
 async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
@@ -43,12 +46,24 @@ async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSes
 @router.get("/messages")
 async def get_messages(
     session: DbSession,
+    response: Response,
     flow_id: Annotated[UUID | None, Query()] = None,
     session_id: Annotated[str | None, Query()] = None,
     sender: Annotated[str | None, Query()] = None,
     sender_name: Annotated[str | None, Query()] = None,
     order_by: Annotated[str | None, Query()] = "timestamp",
+    order: Annotated[Literal["asc", "desc"], Query()] = "asc",
+    limit: Annotated[int | None, Query(gt=0, le=MAX_MESSAGES_PAGE_SIZE)] = None,
+    cursor: Annotated[str | None, Query()] = None,
 ) -> list[MessageResponse]:
+    """List messages ordered by `order_by`.
+
+    With `limit`, the messages are paginated by timestamp: the cursor of the next page, if any, is returned in the
+    X-Next-Cursor header and passed back as `cursor`.
+    """
+    paginated = limit is not None or cursor is not None
+    if paginated and order_by != "timestamp":
+        raise HTTPException(status_code=400, detail="Paginated messages can only be ordered by timestamp")
     try:
         stmt = select(MessageTable)
         if flow_id:
@@ -59,11 +74,23 @@ async def get_messages(
             stmt = stmt.where(MessageTable.sender == sender)
         if sender_name:
             stmt = stmt.where(MessageTable.sender_name == sender_name)
+        if paginated:
+            messages, next_cursor = await get_messages_page(
+                session, stmt, limit or MAX_MESSAGES_PAGE_SIZE, cursor, descending=order == "desc"
+            )
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
+            return [MessageResponse.model_validate(d, from_attributes=True) for d in messages]
         if order_by:
-            col = getattr(MessageTable, order_by).asc()
-            stmt = stmt.order_by(col)
+            col = getattr(MessageTable, order_by)
+            stmt = stmt.order_by(col.desc() if order == "desc" else col.asc())
+            if order_by == "timestamp":
+                # Messages stored in the same second come back in the order they were stored
+                stmt = stmt.order_by(MessageTable.inserted_at.asc())
         messages = await session.exec(stmt)
         return [MessageResponse.model_validate(d, from_attributes=True) for d in messages]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
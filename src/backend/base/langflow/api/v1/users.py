@@ -17,7 +17,7 @@ from langflow.services.auth.utils import (
 )
 from langflow.services.database.models.user import User, UserCreate, UserRead, UserUpdate
 from langflow.services.database.models.user.crud import get_user_by_id, update_user
-from langflow.services.deps import get_settings_service
+from langflow.services.deps import get_auth_service, get_settings_service
 
 router = APIRouter(tags=["Users"], prefix="/users")
 
@@ -142,5 +142,6 @@ async def delete_user(
 
     await session.delete(user_db)
     await session.commit()
+    get_auth_service().api_key_cache.invalidate_user(user_id)
 
     return {"detail": "User deleted"}
@@ -2,30 +2,120 @@ import io
 import re
 import uuid
 import zipfile
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
 from datetime import datetime
 from http import HTTPStatus
 from pathlib import Path
 from typing import Annotated
 from zoneinfo import ZoneInfo
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
+from fastapi.responses import FileResponse, StreamingResponse
 from sqlmodel import String, cast, col, select
 
 from langflow.api.schemas import UploadFileResponse
 from langflow.api.utils import CurrentActiveUser, DbSession
 from langflow.services.database.models.file import File as UserFile
 from langflow.services.deps import get_settings_service, get_storage_service
-from langflow.services.storage.service import StorageService
+from langflow.services.storage.service import STREAM_CHUNK_SIZE, StorageService
 
 router = APIRouter(tags=["Files"], prefix="/files")
 
 
-async def byte_stream_generator(file_bytes: bytes, chunk_size: int = 8192) -> AsyncGenerator[bytes, None]:
-    """Convert bytes object into an async generator that yields chunks."""
-    for i in range(0, len(file_bytes), chunk_size):
-        yield file_bytes[i : i + chunk_size]
+async def upload_chunks(file: UploadFile, max_size: int) -> AsyncIterator[bytes]:
+    """Read an upload in chunks, failing as soon as it grows past `max_size` bytes."""
+    size = 0
+    while chunk := await file.read(STREAM_CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File size is larger than the maximum file size {max_size // (1024 * 1024)}MB.",
+            )
+        yield chunk
+
+
+async def open_file_stream(stream: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Read the first chunk of a file stream, so a missing file fails before the response is started.
+
+    Raises:
+        HTTPException: 404 if the file does not exist in the storage.
+    """
+    try:
+        first_chunk = await anext(stream, b"")
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail="File not found") from e
+
+    async def chunks() -> AsyncIterator[bytes]:
+        if first_chunk:
+            yield first_chunk
+        async for chunk in stream:
+            yield chunk
+
+    return chunks()
+
+
+class ZipStreamBuffer(io.RawIOBase):
+    """An unseekable sink that keeps what `zipfile` writes until it is drained."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def zip_stream_generator(
+    storage_service: StorageService, folder: str, entries: list[tuple[str, str]]
+) -> AsyncGenerator[bytes, None]:
+    """Build a ZIP archive of stored files while it is being sent.
+
+    Each entry is a (name in the archive, stored file name) pair. Only one chunk of one file is held in
+    memory at a time, whatever the size of the files.
+    """
+    buffer = ZipStreamBuffer()
+    with zipfile.ZipFile(buffer, "w") as zip_file:
+        for arcname, file_name in entries:
+            # The size is unknown until the file is read, so ZIP64 headers are used in case it is over 4 GiB
+            with zip_file.open(arcname, "w", force_zip64=True) as entry:
+                async for chunk in storage_service.open_stream(folder, file_name):
+                    entry.write(chunk)
+                    if data := buffer.drain():
+                        yield data
+            if data := buffer.drain():
+                yield data
+    yield buffer.drain()
+
+
+def parse_range_header(range_header: str, size: int) -> tuple[int, int]:
+    """Return the first and last byte of a single-range `Range` header.
+
+    Raises:
+        HTTPException: 416 if the range is malformed or outside the file.
+    """
+    match = re.fullmatch(r"bytes=(\d*)-(\d*)", range_header.strip())
+    if match is None or match.groups() == ("", ""):
+        raise HTTPException(status_code=416, detail="Invalid range", headers={"Content-Range": f"bytes */{size}"})
+    first, last = match.groups()
+    if not first:
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start, end = int(first), min(int(last), size - 1) if last else size - 1
+    if start > end or start >= size:
+        raise HTTPException(
+            status_code=416, detail="Range not satisfiable", headers={"Content-Range": f"bytes */{size}"}
+        )
+    return start, end
 
 
 async def fetch_file_object(file_id: uuid.UUID, current_user: CurrentActiveUser, session: DbSession):
@@ -66,17 +156,17 @@ async def upload_user_file(
         raise HTTPException(status_code=400, detail="No file provided")
 
     # Validate file size (convert MB to bytes)
-    if file.size > max_file_size_upload * 1024 * 1024:
+    max_size = max_file_size_upload * 1024 * 1024
+    if file.size is not None and file.size > max_size:
         raise HTTPException(
             status_code=413,
             detail=f"File size is larger than the maximum file size {max_file_size_upload}MB.",
         )
 
-    # Read file content and create a unique file name
+    # Stream the file content to the storage under a unique file name
     try:
         # Create a unique file name
         file_id = uuid.uuid4()
-        file_content = await file.read()
 
         # Get file extension of the file
         file_extension = "." + file.filename.split(".")[-1] if file.filename and "." in file.filename else ""
@@ -84,8 +174,10 @@ async def upload_user_file(
 
         # Here we use the current user's id as the folder name
         folder = str(current_user.id)
-        # Save the file using the storage service.
-        await storage_service.save_file(flow_id=folder, file_name=anonymized_file_name, data=file_content)
+        # Save the file using the storage service, one chunk at a time.
+        file_size = await storage_service.save_stream(folder, anonymized_file_name, upload_chunks(file, max_size))
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving file: {e}") from e
 
@@ -121,9 +213,6 @@ async def upload_user_file(
             # Split the extension from the filename
             root_filename = f"{root_filename} ({count + 1})"
 
-        # Compute the file size based on the path
-        file_size = await storage_service.get_file_size(flow_id=folder, file_name=anonymized_file_name)
-
         # Compute the file path
         file_path = f"{folder}/{anonymized_file_name}"
 
@@ -213,27 +302,9 @@ async def download_files_batch(
         if not files:
             raise HTTPException(status_code=404, detail="No files found")
 
-        # Create a byte stream to hold the ZIP file
-        zip_stream = io.BytesIO()
-
-        # Create a ZIP file
-        with zipfile.ZipFile(zip_stream, "w") as zip_file:
-            for file in files:
-                # Get the file content from storage
-                file_content = await storage_service.get_file(
-                    flow_id=str(current_user.id), file_name=file.path.split("/")[-1]
-                )
-
-                # Get the file extension from the original filename
-                file_extension = Path(file.path).suffix
-                # Create the filename with extension
-                filename_with_extension = f"{file.name}{file_extension}"
-
-                # Write the file to the ZIP with the proper extension
-                zip_file.writestr(filename_with_extension, file_content)
-
-        # Seek to the beginning of the byte stream
-        zip_stream.seek(0)
+        # Name each file in the ZIP with the original name and the stored extension
+        entries = [(f"{file.name}{Path(file.path).suffix}", file.path.split("/")[-1]) for file in files]
+        zip_stream = zip_stream_generator(storage_service, str(current_user.id), entries)
 
         # Generate the filename with the current datetime
         current_time = datetime.now(tz=ZoneInfo("UTC")).astimezone().strftime("%Y%m%d_%H%M%S")
@@ -252,35 +323,61 @@ async def download_files_batch(
 @router.get("/{file_id}")
 async def download_file(
     file_id: uuid.UUID,
+    request: Request,
     current_user: CurrentActiveUser,
     session: DbSession,
     storage_service: Annotated[StorageService, Depends(get_storage_service)],
 ):
-    """Download a file by its ID."""
+    """Download a file by its ID.
+
+    Single byte ranges are supported through the `Range` header.
+    """
     try:
         # Fetch the file from the DB
         file = await fetch_file_object(file_id, current_user, session)
 
         # Get the basename of the file path
         file_name = file.path.split("/")[-1]
-
-        # Get file stream
-        file_stream = await storage_service.get_file(flow_id=str(current_user.id), file_name=file_name)
+        folder = str(current_user.id)
 
         file_extension = Path(file.path).suffix
         # Create the filename with extension
         filename_with_extension = f"{file.name}{file_extension}"
 
-        # Ensure file_stream is an async iterator returning bytes
-        byte_stream = byte_stream_generator(file_stream)
+        # Files on the local disk are sent by the server without being read in Python.
+        # FileResponse also answers range requests.
+        local_path = await storage_service.get_local_path(folder, file_name)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error downloading file: {e}") from e
 
+    if local_path is not None:
+        return FileResponse(local_path, media_type="application/octet-stream", filename=filename_with_extension)
+
+    headers = {
+        "Content-Disposition": f'attachment; filename="{filename_with_extension}"',
+        "Accept-Ranges": "bytes",
+    }
+    range_header = request.headers.get("range")
+    if range_header and file.size:
+        start, end = parse_range_header(range_header, file.size)
+        return StreamingResponse(
+            await open_file_stream(storage_service.open_stream(folder, file_name, start=start, end=end)),
+            status_code=HTTPStatus.PARTIAL_CONTENT,
+            media_type="application/octet-stream",
+            headers={
+                **headers,
+                "Content-Range": f"bytes {start}-{end}/{file.size}",
+                "Content-Length": str(end - start + 1),
+            },
+        )
+
     # Return the file as a streaming response
     return StreamingResponse(
-        byte_stream,
+        await open_file_stream(storage_service.open_stream(folder, file_name)),
         media_type="application/octet-stream",
-        headers={"Content-Disposition": f'attachment; filename="{filename_with_extension}"'},
+        headers=headers,
     )
 
 
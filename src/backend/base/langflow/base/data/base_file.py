@@ -1,12 +1,14 @@
 import shutil
 import tarfile
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from zipfile import ZipFile, is_zipfile
 
 import pandas as pd
 
+from langflow.base.data.parse_cache import load_data_with_cache
 from langflow.custom import Component
 from langflow.io import BoolInput, FileInput, HandleInput, Output, StrInput
 from langflow.schema import Data
@@ -375,6 +377,31 @@ class BaseFileComponent(Component, ABC):
 
         return updated_base_files
 
+    def parse_with_cache(
+        self,
+        file_list: list[BaseFile],
+        parse_files: Callable[[list[str]], list[Data | None]],
+        *,
+        parser: str,
+        options: dict | None = None,
+    ) -> list[Data | None]:
+        """Parse the files with `parse_files`, reusing the Data cached for files with the same content.
+
+        Args:
+            file_list (list[BaseFile]): The files to parse.
+            parse_files (Callable): Parses a list of file paths into Data objects with a `file_path` field.
+            parser (str): Name of the parser, part of the cache key.
+            options (dict | None): Parser options that change its output, part of the cache key.
+
+        Returns:
+            list[Data | None]: The Data of each file, in the order of `file_list`.
+        """
+        file_paths = [str(file.path) for file in file_list]
+        processed_data, cache_stats = load_data_with_cache(file_paths, parse_files, parser=parser, options=options)
+        if cache_stats is not None:
+            self.log(cache_stats, name="Parse cache")
+        return processed_data
+
     def _file_path_as_list(self) -> list[Data]:
         file_path = self.file_path
         if not file_path:
@@ -0,0 +1,155 @@
+"""Persistent cache of parsed files, keyed by file content.
+
+Uploaded files are immutable, so parsing the same bytes with the same parser always gives the
+same Data. The cache stores the parsed Data on disk under ``<config_dir>/parse_cache``, keyed by
+the sha256 of the file content, the parser name and version, and the parser options. The path of
+the file is not part of the key: the same content extracted to another temporary directory, or
+uploaded again, is a hit. Least recently used entries are evicted above `parse_cache_max_size`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from functools import cache
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from diskcache import Cache
+from loguru import logger
+
+from langflow.schema import Data
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Bump when the output of the parsers in langflow.base.data.utils changes
+PARSER_VERSION = "1"
+PARSER_PACKAGES = ("pypdf", "python-docx", "chardet", "pyyaml", "defusedxml")
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@cache
+def parser_version() -> str:
+    """Return the parser version combined with the versions of the parsing libraries."""
+    versions = [PARSER_VERSION]
+    for package in PARSER_PACKAGES:
+        try:
+            versions.append(f"{package}=={metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{package}==none")
+    return ";".join(versions)
+
+
+def file_digest(file_path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with Path(file_path).open("rb") as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """Size-bounded, process-safe disk cache of parsed Data."""
+
+    def __init__(self, directory: str | Path, size_limit: int) -> None:
+        self.directory = Path(directory)
+        self.size_limit = size_limit
+        self.cache = Cache(str(self.directory), size_limit=size_limit, eviction_policy="least-recently-used")
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, file_path: str | Path, *, parser: str, options: dict[str, Any] | None = None) -> str:
+        header = orjson.dumps(
+            {"parser": parser, "version": parser_version(), "options": options or {}}, option=orjson.OPT_SORT_KEYS
+        )
+        return hashlib.sha256(header + file_digest(file_path).encode()).hexdigest()
+
+    def get(self, key: str, file_path: str) -> Data | None:
+        """Return the cached Data for `key`, pointing at `file_path`, or None on a miss."""
+        item = self.cache.get(key)
+        if item is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return Data(text_key=item["text_key"], data={**item["data"], "file_path": file_path})
+
+    def set(self, key: str, data: Data) -> None:
+        stored = {key_: value for key_, value in data.data.items() if key_ != "file_path"}
+        self.cache.set(key, {"text_key": data.text_key, "data": stored})
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.cache), "size": self.cache.volume()}
+
+
+_parse_cache: ParseCache | None = None
+_parse_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParseCache | None:
+    """Return the parse cache configured in the settings, or None when it is disabled."""
+    global _parse_cache  # noqa: PLW0603
+    settings = get_settings_service().settings
+    if not settings.parse_cache_max_size or not settings.config_dir:
+        return None
+    directory = Path(settings.config_dir) / "parse_cache"
+    with _parse_cache_lock:
+        if (
+            _parse_cache is None
+            or _parse_cache.directory != directory
+            or _parse_cache.size_limit != settings.parse_cache_max_size
+        ):
+            _parse_cache = ParseCache(directory, settings.parse_cache_max_size)
+        return _parse_cache
+
+
+def load_data_with_cache(
+    file_paths: list[str],
+    parse_files: Callable[[list[str]], list[Data | None]],
+    *,
+    parser: str,
+    options: dict[str, Any] | None = None,
+) -> tuple[list[Data | None], dict[str, int] | None]:
+    """Load files from the parse cache and parse only the missing ones with `parse_files`.
+
+    `parse_files` may return the Data of the files in any order; files that could not be parsed
+    are not cached. Returns the Data in the order of `file_paths` and the hits and misses, or None
+    when the cache is disabled.
+    """
+    parse_cache = get_parse_cache()
+    if parse_cache is None:
+        return parse_files(file_paths), None
+
+    keys: list[str | None] = []
+    loaded: list[Data | None] = []
+    for file_path in file_paths:
+        try:
+            key = parse_cache.key(file_path, parser=parser, options=options)
+        except OSError:
+            # Let the parser report missing or unreadable files
+            key = None
+        keys.append(key)
+        loaded.append(parse_cache.get(key, file_path) if key is not None else None)
+
+    missing = [index for index, data in enumerate(loaded) if data is None]
+    if missing:
+        parsed = {
+            data.data.get("file_path"): data
+            for data in parse_files([file_paths[index] for index in missing])
+            if data is not None
+        }
+        for index in missing:
+            data = parsed.get(file_paths[index])
+            loaded[index] = data
+            if data is not None and (key := keys[index]) is not None:
+                try:
+                    parse_cache.set(key, data)
+                except Exception:  # noqa: BLE001
+                    logger.opt(exception=True).debug(f"Error caching the parsed content of {file_paths[index]}")
+    return loaded, {"hits": len(file_paths) - len(missing), "misses": len(missing)}
@@ -1,6 +1,11 @@
+import math
+import multiprocessing
+import signal
+import threading
 import unicodedata
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from concurrent import futures
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 
 import chardet
@@ -35,6 +40,10 @@ TEXT_FILE_TYPES = [
 
 IMG_FILE_TYPES = ["jpg", "jpeg", "png", "bmp", "image"]
 
+# Chunks submitted per worker when parsing in processes, to balance uneven files without
+# paying the pickling round trip for every single file
+PARSE_CHUNKS_PER_WORKER = 4
+
 
 def normalize_text(text):
     return unicodedata.normalize("NFKD", text)
@@ -183,17 +192,225 @@ def parse_text_file_to_data(file_path: str, *, silent_errors: bool) -> Data | No
 #     return data
 
 
+class FileParseTimeoutError(TimeoutError):
+    """Raised in a parsing process when a single file takes longer than its timeout."""
+
+
+def _raise_parse_timeout(timeout: float):
+    def handler(_signum, _frame):
+        msg = f"Parsing took longer than {timeout} seconds"
+        raise FileParseTimeoutError(msg)
+
+    return handler
+
+
+def load_file_with_timeout(
+    load_function: Callable, file_path: str, *, silent_errors: bool, timeout: float | None = None
+) -> Data | None:
+    """Run `load_function` on a file, interrupting it with SIGALRM after `timeout` seconds.
+
+    The timeout is only enforced in the main thread of a process on platforms with SIGALRM,
+    which is where the workers of the parsing process pool run their tasks.
+    """
+    if not timeout or not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        return load_function(file_path, silent_errors=silent_errors)
+    previous_handler = signal.signal(signal.SIGALRM, _raise_parse_timeout(timeout))
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return load_function(file_path, silent_errors=silent_errors)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous_handler)
+
+
+def _load_chunk(
+    load_function: Callable,
+    file_paths: list[str],
+    silent_errors: bool,  # noqa: FBT001
+    timeout: float | None,
+) -> list[Data | None]:
+    return [
+        load_file_with_timeout(load_function, file_path, silent_errors=silent_errors, timeout=timeout)
+        for file_path in file_paths
+    ]
+
+
+_process_pool: futures.ProcessPoolExecutor | None = None
+_process_pool_workers = 0
+_process_pool_lock = threading.Lock()
+
+
+def _parse_process_context() -> multiprocessing.context.BaseContext:
+    # Workers are never forked from the server process, which runs threads, but from a fork server,
+    # or spawned. The modules preloaded by the fork server are shared by the whole process, so they
+    # are left alone and the workers import the parsers on their first task
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def get_parse_process_pool(max_workers: int) -> futures.ProcessPoolExecutor:
+    """Return the process pool used to parse files, with at least `max_workers` workers.
+
+    The pool is kept between calls so that the cost of starting the workers is only paid once,
+    and it is only recreated when a call needs more workers than it has.
+    """
+    global _process_pool, _process_pool_workers  # noqa: PLW0603
+    with _process_pool_lock:
+        if _process_pool is not None and _process_pool_workers < max_workers:
+            _process_pool.shutdown(wait=False)
+            _process_pool = None
+        if _process_pool is None:
+            _process_pool = futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=_parse_process_context())
+            _process_pool_workers = max_workers
+        return _process_pool
+
+
+def shutdown_parse_process_pool() -> None:
+    """Shut down the process pool used to parse files, waiting for its workers to exit."""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _discard_parse_process_pool(pool: futures.ProcessPoolExecutor) -> None:
+    global _process_pool  # noqa: PLW0603
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _iter_chunk_results(
+    file_paths: list[str],
+    *,
+    silent_errors: bool,
+    max_concurrency: int,
+    load_function: Callable,
+    use_processes: bool,
+    timeout: float | None,
+    chunk_size: int | None,
+) -> Iterator[tuple[int, list[Data | None]]]:
+    """Yield the offset and the results of each chunk of `file_paths` as soon as it is parsed."""
+    max_workers = max(1, max_concurrency)
+    if chunk_size is None:
+        chunk_size = math.ceil(len(file_paths) / (max_workers * PARSE_CHUNKS_PER_WORKER)) if use_processes else 1
+    chunk_size = max(1, chunk_size)
+    chunks = {offset: file_paths[offset : offset + chunk_size] for offset in range(0, len(file_paths), chunk_size)}
+
+    if use_processes:
+        executor = get_parse_process_pool(max_workers)
+    else:
+        executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+    # At most `max_workers` chunks are in flight, since the shared process pool may be larger
+    queued = iter(chunks.items())
+    pending: dict[futures.Future, int] = {}
+
+    def submit_next() -> None:
+        if (chunk := next(queued, None)) is not None:
+            offset, chunk_paths = chunk
+            pending[executor.submit(_load_chunk, load_function, chunk_paths, silent_errors, timeout)] = offset
+
+    for _ in range(max_workers):
+        submit_next()
+    try:
+        while pending:
+            done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                offset = pending.pop(future)
+                submit_next()
+                yield offset, future.result()
+    except BrokenProcessPool:
+        _discard_parse_process_pool(executor)
+        raise
+    finally:
+        for future in pending:
+            future.cancel()
+        if not use_processes:
+            executor.shutdown(wait=False)
+
+
+def iter_load_file_data(
+    file_paths: list[str],
+    *,
+    silent_errors: bool,
+    max_concurrency: int,
+    load_function: Callable = parse_text_file_to_data,
+    use_processes: bool = False,
+    timeout: float | None = None,
+    chunk_size: int | None = None,
+) -> Iterator[tuple[str, Data | None]]:
+    """Parse files in parallel and yield each file path with its Data as they complete, in completion order.
+
+    With `use_processes`, the files are parsed in a shared pool of processes, so that CPU-bound
+    parsers (PDF, DOCX, encoding detection) are not serialized by the GIL. The files are
+    dispatched in chunks of `chunk_size` files and `load_function` must be picklable, i.e.
+    defined at module level. `timeout` bounds the time spent on each file in a process; a file
+    that takes longer fails like any other parsing error of `load_function`.
+    """
+    for offset, results in _iter_chunk_results(
+        file_paths,
+        silent_errors=silent_errors,
+        max_concurrency=max_concurrency,
+        load_function=load_function,
+        use_processes=use_processes,
+        timeout=timeout,
+        chunk_size=chunk_size,
+    ):
+        yield from zip(file_paths[offset : offset + len(results)], results, strict=True)
+
+
+def iter_load_data(
+    file_paths: list[str],
+    *,
+    silent_errors: bool,
+    max_concurrency: int,
+    load_function: Callable = parse_text_file_to_data,
+    use_processes: bool = False,
+    timeout: float | None = None,
+    chunk_size: int | None = None,
+) -> Iterator[Data | None]:
+    """Parse files in parallel and yield their Data as they complete, in completion order.
+
+    See `iter_load_file_data` for the arguments.
+    """
+    for _, data in iter_load_file_data(
+        file_paths,
+        silent_errors=silent_errors,
+        max_concurrency=max_concurrency,
+        load_function=load_function,
+        use_processes=use_processes,
+        timeout=timeout,
+        chunk_size=chunk_size,
+    ):
+        yield data
+
+
 def parallel_load_data(
     file_paths: list[str],
     *,
     silent_errors: bool,
     max_concurrency: int,
     load_function: Callable = parse_text_file_to_data,
+    use_processes: bool = False,
+    timeout: float | None = None,
+    chunk_size: int | None = None,
 ) -> list[Data | None]:
-    with futures.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
-        loaded_files = executor.map(
-            lambda file_path: load_function(file_path, silent_errors=silent_errors),
-            file_paths,
-        )
-    # loaded_files is an iterator, so we need to convert it to a list
-    return list(loaded_files)
+    """Parse files in parallel and return their Data in the order of `file_paths`.
+
+    See `iter_load_data` for the meaning of the parallelism options.
+    """
+    loaded_files: list[Data | None] = [None] * len(file_paths)
+    for offset, results in _iter_chunk_results(
+        file_paths,
+        silent_errors=silent_errors,
+        max_concurrency=max_concurrency,
+        load_function=load_function,
+        use_processes=use_processes,
+        timeout=timeout,
+        chunk_size=chunk_size,
+    ):
+        loaded_files[offset : offset + len(results)] = results
+    return loaded_files
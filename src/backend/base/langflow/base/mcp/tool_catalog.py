@@ -0,0 +1,281 @@
+"""In-process catalog of the MCP tools of each user and project.
+
+The tools of a user or a project are built from the headers of their flows on the first listing and then
+served from memory. Saving or deleting a flow marks it as changed in the catalogs it belonged to or now belongs
+to once the transaction commits, and the next listing of those catalogs reads only the changed flows. The MCP
+sessions that listed a changed catalog are sent a `notifications/tools/list_changed` notification.
+
+Changes made by other processes are seen when a catalog expires, after `mcp_tool_catalog_ttl` seconds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import TYPE_CHECKING, Literal
+from uuid import UUID
+
+from loguru import logger
+from mcp import types
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session, attributes
+from sqlalchemy.sql import operators
+from sqlmodel import col
+
+from langflow.services.database.models.flow.crud import get_flow_headers, select_flow_headers
+from langflow.services.database.models.flow.model import Flow, FlowHeader
+from langflow.services.deps import get_settings_service
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from mcp.server.session import ServerSession
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+ScopeKind = Literal["user", "project"]
+ToolScope = tuple[ScopeKind, UUID]
+"""The tools of the flows of a user, or of the MCP-enabled flows of a project."""
+
+_FLOW_CHANGES_KEY = "mcp_tool_catalog_flow_changes"
+_ALL_FLOWS_CHANGED_KEY = "mcp_tool_catalog_all_flows_changed"
+
+
+@dataclass
+class FlowChange:
+    """A flow saved or deleted, with the users and projects it belonged to before and after the change.
+
+    Unknown owners are left empty: the flow is then looked up in every catalog.
+    """
+
+    flow_id: UUID
+    user_ids: set[UUID] = field(default_factory=set)
+    folder_ids: set[UUID] = field(default_factory=set)
+
+    def scopes(self) -> set[ToolScope]:
+        return {("user", user_id) for user_id in self.user_ids} | {
+            ("project", folder_id) for folder_id in self.folder_ids
+        }
+
+
+@dataclass
+class _Catalog:
+    tools: dict[UUID, types.Tool]
+    loaded_at: float
+    changed: set[UUID] = field(default_factory=set)
+
+
+class MCPToolCatalog:
+    """Caches the MCP tools of each user and project and updates them flow by flow.
+
+    Example:
+        catalog = get_mcp_tool_catalog()
+        tools = await catalog.list_tools(("user", user.id), session, server.request_context.session)
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._catalogs: dict[ToolScope, _Catalog] = {}
+        self._sessions: dict[ToolScope, weakref.WeakSet[ServerSession]] = {}
+        self._changes = 0
+        self._background_tasks: set[asyncio.Task] = set()
+        self.full_loads = 0
+        self.partial_loads = 0
+
+    async def list_tools(
+        self, scope: ToolScope, session: AsyncSession, mcp_session: ServerSession | None = None
+    ) -> list[types.Tool]:
+        """Return the tools of a user or project, reading only the flows changed since the last listing.
+
+        Args:
+            scope (ToolScope): ("user", user_id) or ("project", project_id).
+            session (AsyncSession): The database session used to read the flows.
+            mcp_session (ServerSession, optional): The MCP session listing the tools, notified when they change.
+        """
+        if mcp_session is not None:
+            self._sessions.setdefault(scope, weakref.WeakSet()).add(mcp_session)
+        catalog = self._catalogs.get(scope)
+        if catalog is None or time.monotonic() - catalog.loaded_at >= self.ttl:
+            changes, loaded_at = self._changes, time.monotonic()
+            tools = await self._load_tools(scope, session)
+            self.full_loads += 1
+            # A catalog is only kept if no flow changed while it was read
+            if self.ttl and changes == self._changes:
+                self._catalogs[scope] = _Catalog(tools, loaded_at)
+            return list(tools.values())
+        if catalog.changed:
+            flow_ids, catalog.changed = catalog.changed, set()
+            tools = await self._load_tools(scope, session, flow_ids)
+            self.partial_loads += 1
+            for flow_id in flow_ids:
+                if flow_id in tools:
+                    catalog.tools[flow_id] = tools[flow_id]
+                else:
+                    catalog.tools.pop(flow_id, None)
+        return list(catalog.tools.values())
+
+    def flows_changed(self, changes: Iterable[FlowChange]) -> None:
+        """Mark flows as changed in the catalogs they belong to and notify the sessions that listed them."""
+        changed_scopes: set[ToolScope] = set()
+        for change in changes:
+            scopes = change.scopes()
+            if not scopes:
+                # The owners of the flow are unknown, it changes the catalogs that list it
+                scopes = {scope for scope, catalog in self._catalogs.items() if change.flow_id in catalog.tools}
+            for scope in scopes:
+                if catalog := self._catalogs.get(scope):
+                    catalog.changed.add(change.flow_id)
+            changed_scopes |= scopes
+        self._changes += 1
+        self._notify(changed_scopes)
+
+    def clear(self) -> None:
+        """Drop every catalog and notify every session, when the changed flows are not known."""
+        self._catalogs.clear()
+        self._changes += 1
+        self._notify(set(self._sessions))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "catalogs": len(self._catalogs),
+            "tools": sum(len(catalog.tools) for catalog in self._catalogs.values()),
+            "full_loads": self.full_loads,
+            "partial_loads": self.partial_loads,
+        }
+
+    async def _load_tools(
+        self, scope: ToolScope, session: AsyncSession, flow_ids: set[UUID] | None = None
+    ) -> dict[UUID, types.Tool]:
+        kind, scope_id = scope
+        stmt = select_flow_headers().where(col(Flow.user_id).is_not(None))
+        if kind == "user":
+            stmt = stmt.where(Flow.user_id == scope_id)
+        else:
+            stmt = stmt.where(Flow.folder_id == scope_id, Flow.mcp_enabled == True)  # noqa: E712
+        if flow_ids is not None:
+            stmt = stmt.where(col(Flow.id).in_(flow_ids))
+        tools = {}
+        for flow in await get_flow_headers(session, stmt, with_input_schema=True):
+            tool = _user_tool(flow) if kind == "user" else _project_tool(flow)
+            if tool is not None:
+                tools[flow.id] = tool
+        return tools
+
+    def _notify(self, scopes: set[ToolScope]) -> None:
+        mcp_sessions = {mcp_session for scope in scopes for mcp_session in self._sessions.get(scope, ())}
+        if not mcp_sessions:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        for mcp_session in mcp_sessions:
+            task = loop.create_task(self._send_tool_list_changed(mcp_session))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+    async def _send_tool_list_changed(self, mcp_session: ServerSession) -> None:
+        try:
+            await mcp_session.send_tool_list_changed()
+        except Exception as e:  # noqa: BLE001
+            # The client disconnected, it lists the tools again when it reconnects
+            logger.debug(f"Error notifying an MCP session of changed tools: {e}")
+            for sessions in self._sessions.values():
+                sessions.discard(mcp_session)
+
+
+def _user_tool(flow: FlowHeader) -> types.Tool | None:
+    flow_name = "_".join(flow.name.lower().split())
+    if flow.input_schema is None:
+        logger.warning(f"Error in listing tools: no input schema from flow: {flow_name}")
+        return None
+    return types.Tool(
+        name=flow_name,
+        description=f"{flow.id}: {flow.description}" if flow.description else f"Tool generated from flow: {flow_name}",
+        inputSchema=flow.input_schema,
+    )
+
+
+def _project_tool(flow: FlowHeader) -> types.Tool | None:
+    # Use action_name if available, otherwise construct from flow name
+    name = flow.action_name or "_".join(flow.name.lower().split())
+    if flow.input_schema is None:
+        logger.warning(f"Error in listing project tools: no input schema from flow: {name}")
+        return None
+    # Use action_description if available, otherwise use defaults
+    description = flow.action_description or (
+        flow.description if flow.description else f"Tool generated from flow: {name}"
+    )
+    return types.Tool(name=name, description=description, inputSchema=flow.input_schema)
+
+
+_tool_catalog: MCPToolCatalog | None = None
+
+
+def get_mcp_tool_catalog() -> MCPToolCatalog:
+    global _tool_catalog  # noqa: PLW0603
+    if _tool_catalog is None:
+        _tool_catalog = MCPToolCatalog(ttl=get_settings_service().settings.mcp_tool_catalog_ttl)
+    return _tool_catalog
+
+
+def _owners(flow: Flow, key: str) -> set[UUID]:
+    return {value for value in attributes.get_history(flow, key).sum() if value is not None}
+
+
+def _flow_ids_of(whereclause) -> list[UUID] | None:
+    """Return the IDs a `Flow.id == ...` or `Flow.id.in_(...)` clause selects, or None for any other clause."""
+    left, right = getattr(whereclause, "left", None), getattr(whereclause, "right", None)
+    if getattr(left, "table", None) is not Flow.__table__ or getattr(left, "name", None) != "id":
+        return None
+    value = getattr(right, "value", None)
+    if whereclause.operator is operators.eq and value is not None:
+        return [value]
+    if whereclause.operator is operators.in_op and isinstance(value, list | tuple | set):
+        return list(value)
+    return None
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flow_changes(session: Session, _flush_context) -> None:
+    changes = [
+        FlowChange(flow.id, _owners(flow, "user_id"), _owners(flow, "folder_id"))
+        for flow in chain(session.new, session.dirty, session.deleted)
+        if isinstance(flow, Flow)
+    ]
+    if changes:
+        session.info.setdefault(_FLOW_CHANGES_KEY, []).extend(changes)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_flow_changes(orm_execute_state: ORMExecuteState) -> None:
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    if not any(mapper.class_ is Flow for mapper in orm_execute_state.all_mappers):
+        return
+    flow_ids = _flow_ids_of(orm_execute_state.statement.whereclause) if orm_execute_state.is_delete else None
+    info = orm_execute_state.session.info
+    if flow_ids is None:
+        info[_ALL_FLOWS_CHANGED_KEY] = True
+    else:
+        info.setdefault(_FLOW_CHANGES_KEY, []).extend(FlowChange(flow_id) for flow_id in flow_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_flow_changes(session: Session) -> None:
+    changes = session.info.pop(_FLOW_CHANGES_KEY, None)
+    all_flows_changed = session.info.pop(_ALL_FLOWS_CHANGED_KEY, False)
+    if _tool_catalog is None:
+        return
+    if all_flows_changed:
+        _tool_catalog.clear()
+    elif changes:
+        _tool_catalog.flows_changed(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_flow_changes(session: Session) -> None:
+    session.info.pop(_FLOW_CHANGES_KEY, None)
+    session.info.pop(_ALL_FLOWS_CHANGED_KEY, None)
@@ -109,8 +109,8 @@ class RunFlowBaseComponent(Component):
 
     async def get_flow_names(self) -> list[str]:
         # TODO: get flfow ID with flow name
-        flow_data = await self.alist_flows()
-        return [flow_data.data["name"] for flow_data in flow_data]
+        flow_headers = await self.alist_flow_headers()
+        return [flow_header.data["name"] for flow_header in flow_headers]
 
     async def get_flow(self, flow_name_selected: str) -> Data | None:
         # get flow from flow id
@@ -1,6 +1,6 @@
 from langflow.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data, retrieve_file_paths
 from langflow.custom import Component
-from langflow.io import BoolInput, IntInput, MessageTextInput, MultiselectInput
+from langflow.io import BoolInput, FloatInput, IntInput, MessageTextInput, MultiselectInput
 from langflow.schema import Data
 from langflow.schema.dataframe import DataFrame
 from langflow.template import Output
@@ -64,6 +64,19 @@ class DirectoryComponent(Component):
             advanced=True,
             info="If true, multithreading will be used.",
         ),
+        BoolInput(
+            name="use_multiprocessing",
+            display_name="Use Multiprocessing",
+            advanced=True,
+            info="If true, files are parsed in a pool of processes, which is faster for PDF and DOCX files.",
+        ),
+        FloatInput(
+            name="file_timeout",
+            display_name="File Timeout",
+            advanced=True,
+            info="Maximum seconds to parse each file when using multiprocessing. 0 means no timeout.",
+            value=0,
+        ),
     ]
 
     outputs = [
@@ -100,7 +113,15 @@ class DirectoryComponent(Component):
         )
 
         loaded_data = []
-        if use_multithreading:
+        if self.use_multiprocessing:
+            loaded_data = parallel_load_data(
+                file_paths,
+                silent_errors=silent_errors,
+                max_concurrency=max_concurrency,
+                use_processes=True,
+                timeout=self.file_timeout or None,
+            )
+        elif use_multithreading:
             loaded_data = parallel_load_data(file_paths, silent_errors=silent_errors, max_concurrency=max_concurrency)
         else:
             loaded_data = [parse_text_file_to_data(file_path, silent_errors=silent_errors) for file_path in file_paths]
@@ -1,6 +1,11 @@
 from langflow.base.data import BaseFileComponent
-from langflow.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data
-from langflow.io import BoolInput, IntInput
+from langflow.base.data.utils import (
+    TEXT_FILE_TYPES,
+    iter_load_file_data,
+    parallel_load_data,
+    parse_text_file_to_data,
+)
+from langflow.io import BoolInput, FloatInput, IntInput
 from langflow.schema import Data
 
 
@@ -34,6 +39,20 @@ class FileComponent(BaseFileComponent):
             info="When multiple files are being processed, the number of files to process concurrently.",
             value=1,
         ),
+        BoolInput(
+            name="use_multiprocessing",
+            display_name="Use Multiprocessing",
+            advanced=True,
+            value=False,
+            info="If true, files are parsed in a pool of processes, which is faster for PDF and DOCX files.",
+        ),
+        FloatInput(
+            name="file_timeout",
+            display_name="File Timeout",
+            advanced=True,
+            info="Maximum seconds to parse each file when using multiprocessing. 0 means no timeout.",
+            value=0,
+        ),
     ]
 
     outputs = [
@@ -72,22 +91,46 @@ class FileComponent(BaseFileComponent):
             raise ValueError(msg)
 
         concurrency = 1 if not self.use_multithreading else max(1, self.concurrency_multithreading)
-        file_count = len(file_list)
-
         parallel_processing_threshold = 2
-        if concurrency < parallel_processing_threshold or file_count < parallel_processing_threshold:
-            if file_count > 1:
-                self.log(f"Processing {file_count} files sequentially.")
-            processed_data = [process_file(str(file.path), silent_errors=self.silent_errors) for file in file_list]
-        else:
+
+        def parse_files_in_processes(file_paths: list[str]) -> list[Data | None]:
+            # Files are logged as each chunk of files completes; rollup_data restores the file order
+            processed_data: list[Data | None] = []
+            try:
+                for file_path, data in iter_load_file_data(
+                    file_paths,
+                    silent_errors=self.silent_errors,
+                    max_concurrency=max(1, self.concurrency_multithreading),
+                    use_processes=True,
+                    timeout=self.file_timeout or None,
+                ):
+                    if data is None:
+                        self.log(f"Could not process {file_path}.")
+                    processed_data.append(data)
+            except Exception as e:
+                self.log(f"Unexpected error processing files: {e}")
+                raise
+            return processed_data
+
+        def parse_files(file_paths: list[str]) -> list[Data | None]:
+            file_count = len(file_paths)
+            if self.use_multiprocessing and file_count >= parallel_processing_threshold:
+                self.log(f"Starting multiprocess parsing of {file_count} files.")
+                return parse_files_in_processes(file_paths)
+            if concurrency < parallel_processing_threshold or file_count < parallel_processing_threshold:
+                if file_count > 1:
+                    self.log(f"Processing {file_count} files sequentially.")
+                return [process_file(file_path, silent_errors=self.silent_errors) for file_path in file_paths]
             self.log(f"Starting parallel processing of {file_count} files with concurrency: {concurrency}.")
-            file_paths = [str(file.path) for file in file_list]
-            processed_data = parallel_load_data(
+            return parallel_load_data(
                 file_paths,
                 silent_errors=self.silent_errors,
                 load_function=process_file,
                 max_concurrency=concurrency,
             )
 
+        # Files parsed in earlier runs are loaded from the parse cache
+        processed_data = self.parse_with_cache(file_list, parse_files, parser="parse_text_file_to_data")
+
         # Use rollup_basefile_data to merge processed data with BaseFile objects
         return self.rollup_data(file_list, processed_data)
@@ -73,7 +73,7 @@ class MessageStoreComponent(Component):
             await astore_message(message, flow_id=self.graph.flow_id)
             stored_messages = (
                 await aget_messages(
-                    session_id=message.session_id, sender_name=message.sender_name, sender=message.sender
+                    session_id=message.session_id, sender_name=message.sender_name, sender=message.sender, limit=1
                 )
                 or []
             )
@@ -11,6 +11,7 @@ class ParseDataFrameComponent(Component):
     )
     icon = "braces"
     name = "ParseDataFrame"
+    pure = True
     legacy = True
 
     inputs = [
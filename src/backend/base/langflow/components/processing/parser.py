@@ -21,6 +21,7 @@ class ParserComponent(Component):
         "Enable 'Stringify' to convert input into a readable string instead."
     )
     icon = "braces"
+    pure = True
 
     inputs = [
         TabInput(
@@ -11,6 +11,7 @@ class SplitTextComponent(Component):
     description: str = "Split text into chunks based on specified criteria."
     icon = "scissors-line-dashed"
     name = "SplitText"
+    pure = True
 
     inputs = [
         HandleInput(
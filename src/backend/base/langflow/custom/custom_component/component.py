@@ -3,16 +3,18 @@ from __future__ import annotations
 import ast
 import asyncio
 import inspect
+import time
 from collections.abc import AsyncIterator, Iterator
 from copy import deepcopy
 from textwrap import dedent
 from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, get_type_hints
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import nanoid
 import pandas as pd
 import yaml
 from langchain_core.tools import StructuredTool
+from loguru import logger
 from pydantic import BaseModel, ValidationError
 
 from langflow.base.tools.constants import (
@@ -21,6 +23,11 @@ from langflow.base.tools.constants import (
     TOOLS_METADATA_INFO,
     TOOLS_METADATA_INPUT_NAME,
 )
+from langflow.custom.custom_component.memoization import (
+    MemoizedOutputs,
+    component_output_cache,
+    make_memoization_key,
+)
 from langflow.custom.tree_visitor import RequiredInputsVisitor
 from langflow.exceptions.component import StreamingError
 from langflow.field_typing import Tool  # noqa: TC001 Needed by _add_toolkit_output
@@ -32,6 +39,8 @@ from langflow.schema.artifact import get_artifact_type, post_process_raw
 from langflow.schema.data import Data
 from langflow.schema.message import ErrorMessage, Message
 from langflow.schema.properties import Source
+from langflow.services.database.models.message.model import MessageTable
+from langflow.services.deps import get_message_writer_service, get_settings_service
 from langflow.services.tracing.schema import Log
 from langflow.template.field.base import UNDEFINED, Input, Output
 from langflow.template.frontend_node.custom_components import ComponentFrontendNode
@@ -95,6 +104,9 @@ class Component(CustomComponent):
     inputs: list[InputTypes] = []
     outputs: list[Output] = []
     code_class_base_inheritance: ClassVar[str] = "Component"
+    pure: ClassVar[bool] = False
+    """Whether the outputs depend only on the code and inputs, with no side effects. Outputs of pure components
+    are reused across runs when the `memoize_pure_components` setting is enabled."""
 
     def __init__(self, **kwargs) -> None:
         # Initialize instance-specific attributes first
@@ -117,6 +129,8 @@ class Component(CustomComponent):
         self._components: list[Component] = []
         self._event_manager: EventManager | None = None
         self._state_model = None
+        self._used_memoized_outputs = False
+        self._next_message_checkpoint: float | None = None
 
         # Process input kwargs
         inputs = {}
@@ -938,11 +952,17 @@ class Component(CustomComponent):
 
     async def _build_results(self) -> tuple[dict, dict]:
         results, artifacts = {}, {}
+        self._used_memoized_outputs = False
 
         self._pre_run_setup_if_needed()
         self._handle_tool_mode()
 
-        for output in self._get_outputs_to_process():
+        outputs = list(self._get_outputs_to_process())
+        memoization_key = self._get_memoization_key(outputs)
+        if memoization_key is not None and (memoized := component_output_cache.get(memoization_key)) is not None:
+            return self._restore_memoized_outputs(memoized, outputs)
+
+        for output in outputs:
             self._current_output = output.name
             result = await self._get_output_result(output)
             results[output.name] = result
@@ -950,8 +970,46 @@ class Component(CustomComponent):
             self._log_output(output)
 
         self._finalize_results(results, artifacts)
+        if memoization_key is not None:
+            component_output_cache.set(
+                memoization_key,
+                MemoizedOutputs(
+                    results=results,
+                    artifacts=artifacts,
+                    status=self.status,
+                    output_logs={output.name: self._output_logs.get(output.name) for output in outputs},
+                ),
+            )
         return results, artifacts
 
+    def _get_memoization_key(self, outputs: list[Output]) -> str | None:
+        if not self.pure or not get_settings_service().settings.memoize_pure_components:
+            return None
+        if any(output.name == TOOL_OUTPUT_NAME for output in outputs):
+            return None
+        return make_memoization_key(
+            self._code or "",
+            self.__class__.__name__,
+            [output.name for output in outputs],
+            self._attributes,
+        )
+
+    def _restore_memoized_outputs(self, memoized: MemoizedOutputs, outputs: list[Output]) -> tuple[dict, dict]:
+        flow_id = self._vertex.graph.flow_id if self._vertex is not None else None
+        for output in outputs:
+            if output.name not in memoized.results:
+                continue
+            result = memoized.results[output.name]
+            if flow_id is not None and isinstance(result, Message):
+                result.set_flow_id(flow_id)
+            output.value = result
+        self.status = memoized.status
+        self._output_logs.update(memoized.output_logs)
+        logger.debug(f"Reused memoized outputs of {self.display_name}")
+        self._used_memoized_outputs = True
+        self._finalize_results(memoized.results, memoized.artifacts)
+        return memoized.results, memoized.artifacts
+
     def _pre_run_setup_if_needed(self):
         if hasattr(self, "_pre_run_setup"):
             self._pre_run_setup()
@@ -1274,6 +1332,8 @@ class Component(CustomComponent):
             message.session_id = session_id
         if hasattr(message, "flow_id") and isinstance(message.flow_id, str):
             message.flow_id = UUID(message.flow_id)
+        if self._should_write_once(message):
+            return await self._send_message_write_once(message)
         stored_message = await self._store_message(message)
 
         self._stored_message_id = stored_message.id
@@ -1297,6 +1357,56 @@ class Component(CustomComponent):
         self.status = stored_message
         return stored_message
 
+    def _should_write_once(self, message: Message) -> bool:
+        """Check whether a streamed message is stored once, at the end of the stream, by the message writer."""
+        return (
+            self._event_manager is not None
+            and isinstance(message.text, AsyncIterator | Iterator)
+            and get_settings_service().settings.message_persistence == "write_once"
+            and get_message_writer_service().is_started()
+        )
+
+    async def _send_message_write_once(self, message: Message) -> Message:
+        """Stream a message under an ID assigned here and queue it to the message writer when the stream ends.
+
+        Nothing is written before the first checkpoint: the partial text is written every
+        `message_checkpoint_interval` seconds while the message streams.
+        """
+        if not message.session_id or not message.sender or not message.sender_name:
+            msg = (
+                f"All of session_id, sender, and sender_name must be provided. Session ID: {message.session_id},"
+                f" Sender: {message.sender}, Sender Name: {message.sender_name}"
+            )
+            raise ValueError(msg)
+        message.id = str(getattr(message, "id", None) or uuid4())
+        message_writer = get_message_writer_service()
+        checkpoint_interval = get_settings_service().settings.message_checkpoint_interval
+        self._next_message_checkpoint = time.monotonic() + checkpoint_interval if checkpoint_interval else None
+        self._stored_message_id = message.id
+        try:
+            message.text = await self._stream_message(message.text, message)
+        except Exception:
+            # Remove the checkpoints of the partial text
+            message_writer.delete(UUID(message.id))
+            raise
+        finally:
+            self._next_message_checkpoint = None
+        message_writer.write(self._message_row(message, message.text))
+        self.status = message
+        return message
+
+    def _message_row(self, message: Message, text: str) -> MessageTable:
+        flow_id = self.graph.flow_id if hasattr(self, "graph") and self.graph.flow_id else None
+        row = MessageTable.from_message(message, flow_id=flow_id)
+        row.id = UUID(str(message.id))
+        row.text = text
+        return row
+
+    def _checkpoint_message(self, message: Message, chunks: list[str]) -> None:
+        """Queue the partial text of a streamed message to the message writer."""
+        self._next_message_checkpoint = time.monotonic() + get_settings_service().settings.message_checkpoint_interval
+        get_message_writer_service().write(self._message_row(message, "".join(chunks)))
+
     async def _store_message(self, message: Message) -> Message:
         flow_id: str | None = None
         if hasattr(self, "graph"):
@@ -1361,46 +1471,43 @@ class Component(CustomComponent):
         if isinstance(iterator, AsyncIterator):
             return await self._handle_async_iterator(iterator, message.id, message)
         try:
-            complete_message = ""
-            first_chunk = True
+            chunks: list[str] = []
             for chunk in iterator:
-                complete_message = await self._process_chunk(
-                    chunk.content, complete_message, message.id, message, first_chunk=first_chunk
-                )
-                first_chunk = False
+                await self._process_chunk(chunk.content, chunks, message.id, message, first_chunk=not chunks)
         except Exception as e:
             raise StreamingError(cause=e, source=message.properties.source) from e
         else:
-            return complete_message
+            return "".join(chunks)
 
     async def _handle_async_iterator(self, iterator: AsyncIterator, message_id: str, message: Message) -> str:
-        complete_message = ""
-        first_chunk = True
+        chunks: list[str] = []
         async for chunk in iterator:
-            complete_message = await self._process_chunk(
-                chunk.content, complete_message, message_id, message, first_chunk=first_chunk
-            )
-            first_chunk = False
-        return complete_message
+            await self._process_chunk(chunk.content, chunks, message_id, message, first_chunk=not chunks)
+        return "".join(chunks)
 
     async def _process_chunk(
-        self, chunk: str, complete_message: str, message_id: str, message: Message, *, first_chunk: bool = False
-    ) -> str:
-        complete_message += chunk
+        self, chunk: str, chunks: list[str], message_id: str, message: Message, *, first_chunk: bool = False
+    ) -> None:
+        """Add a chunk to the chunks of the message and send it as a token event.
+
+        The complete text is joined from `chunks` once the stream ends. The default token callback of the
+        event manager only buffers the chunk or puts it on the event queue, so it is called on the event loop;
+        a custom callback may block and is called in a worker thread.
+        """
+        chunks.append(chunk)
         if self._event_manager:
             if first_chunk:
-                # Send the initial message only on the first chunk
-                msg_copy = message.model_copy()
-                msg_copy.text = complete_message
-                await self._send_message_event(msg_copy, id_=message_id)
-            await asyncio.to_thread(
-                self._event_manager.on_token,
-                data={
-                    "chunk": chunk,
-                    "id": str(message_id),
-                },
-            )
-        return complete_message
+                # Send the initial message only on the first chunk. A message is serialized from its data,
+                # which model_copy shares with the copy and does not change with `update`
+                initial_message = message.model_copy(update={"text": chunk, "data": {**message.data, "text": chunk}})
+                await self._send_message_event(initial_message, id_=message_id)
+            data = {"chunk": chunk, "id": str(message_id)}
+            if self._event_manager.has_default_callback("on_token"):
+                self._event_manager.on_token(data=data)
+            else:
+                await asyncio.to_thread(self._event_manager.on_token, data=data)
+        if self._next_message_checkpoint is not None and time.monotonic() >= self._next_message_checkpoint:
+            self._checkpoint_message(message, chunks)
 
     async def send_error(
         self,
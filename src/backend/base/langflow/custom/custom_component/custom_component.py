@@ -11,7 +11,7 @@ from langchain_core.documents import Document
 from pydantic import BaseModel
 
 from langflow.custom.custom_component.base_component import BaseComponent
-from langflow.helpers.flow import list_flows, load_flow, run_flow
+from langflow.helpers.flow import list_flow_headers, list_flows, load_flow, run_flow
 from langflow.schema import Data
 from langflow.services.deps import get_storage_service, get_variable_service, session_scope
 from langflow.services.storage.service import StorageService
@@ -455,6 +455,10 @@ class CustomComponent(BaseComponent):
         else:
             msg = f"Invalid user id: {self.user_id}"
             raise TypeError(msg)
+        # Within a flow run, variables are resolved from the ones loaded for the whole run
+        resolver = self._vertex.graph.variable_resolver if self._vertex is not None else None
+        if resolver is not None and resolver.user_id == user_id:
+            return await resolver.get_variable(name, field)
         async with session_scope() as session:
             return await variable_service.get_variable(user_id=user_id, name=name, field=field, session=session)
 
@@ -536,6 +540,17 @@ class CustomComponent(BaseComponent):
             msg = f"Error listing flows: {e}"
             raise ValueError(msg) from e
 
+    async def alist_flow_headers(self) -> list[Data]:
+        """List the flows of the user like `alist_flows`, with their id, name, description and update time only."""
+        if not self.user_id:
+            msg = "Session is invalid"
+            raise ValueError(msg)
+        try:
+            return await list_flow_headers(user_id=str(self.user_id))
+        except Exception as e:
+            msg = f"Error listing flows: {e}"
+            raise ValueError(msg) from e
+
     def build(self, *args: Any, **kwargs: Any) -> Any:
         """Builds the custom component.
 
@@ -0,0 +1,170 @@
+"""Reuse of the outputs of components whose results only depend on their code and inputs.
+
+A component opts in by setting ``pure = True``. When the `memoize_pure_components` setting is on,
+its outputs are stored under a key derived from the component code, the outputs being built and a
+content fingerprint of every input value, including the results received from upstream vertices.
+Building the same component over the same inputs again, in any flow run or session, returns a copy
+of the stored outputs instead of running the output methods.
+
+Inputs that cannot be fingerprinted by content (models, clients, iterators...) disable memoization
+for that build.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from pathlib import PurePath
+from typing import Any
+from uuid import UUID
+
+import orjson
+import pandas as pd
+from cachetools import LRUCache
+from pydantic import BaseModel
+
+from langflow.schema.data import Data
+from langflow.schema.message import Message
+
+COMPONENT_OUTPUT_CACHE_MAX_ENTRIES = 256
+MAX_FINGERPRINT_DEPTH = 32
+
+# Fields that change on every run without changing what the message says
+MESSAGE_VOLATILE_FIELDS = {"id", "timestamp", "flow_id"}
+
+
+class UnfingerprintableValueError(TypeError):
+    """Raised when a value cannot be identified by its content."""
+
+
+@dataclass
+class MemoizedOutputs:
+    results: dict[str, Any]
+    artifacts: dict[str, Any]
+    status: Any
+    output_logs: dict[str, Any]
+
+
+def fingerprint_value(value: Any, depth: int = 0) -> Any:
+    """Converts a value to plain JSON data that identifies its content.
+
+    Raises:
+        UnfingerprintableValueError: If the value holds objects that cannot be identified by content.
+    """
+    if depth > MAX_FINGERPRINT_DEPTH:
+        msg = "Value is too deeply nested to fingerprint"
+        raise UnfingerprintableValueError(msg)
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, bytes):
+        return {"bytes": hashlib.sha256(value).hexdigest()}
+    if isinstance(value, list | tuple | set | frozenset):
+        items = [fingerprint_value(item, depth + 1) for item in value]
+        if isinstance(value, set | frozenset):
+            items.sort(key=lambda item: orjson.dumps(item, option=orjson.OPT_SORT_KEYS))
+        return {type(value).__name__: items}
+    if isinstance(value, dict):
+        return {
+            "dict": sorted(
+                ([str(key), fingerprint_value(item, depth + 1)] for key, item in value.items()),
+                key=lambda pair: pair[0],
+            )
+        }
+    if isinstance(value, datetime | date | UUID | PurePath | Enum):
+        return {type(value).__name__: str(value)}
+    if isinstance(value, Message):
+        fields = {
+            name: getattr(value, name) for name in type(value).model_fields if name not in MESSAGE_VOLATILE_FIELDS
+        }
+        # The fields of a message are mirrored in its data dict
+        fields["data"] = {key: item for key, item in value.data.items() if key not in MESSAGE_VOLATILE_FIELDS}
+        return {"Message": fingerprint_value(fields, depth + 1)}
+    if isinstance(value, Data):
+        return {
+            "Data": fingerprint_value(
+                {"data": value.data, "text_key": value.text_key, "default_value": value.default_value}, depth + 1
+            )
+        }
+    if isinstance(value, pd.DataFrame):
+        try:
+            row_hashes = pd.util.hash_pandas_object(value, index=True).to_numpy()
+        except TypeError as exc:
+            raise UnfingerprintableValueError(str(exc)) from exc
+        return {"DataFrame": [list(map(str, value.columns)), hashlib.sha256(row_hashes.tobytes()).hexdigest()]}
+    if isinstance(value, BaseModel):
+        try:
+            dumped = value.model_dump(mode="json")
+        except Exception as exc:
+            raise UnfingerprintableValueError(str(exc)) from exc
+        return {type(value).__qualname__: fingerprint_value(dumped, depth + 1)}
+    msg = f"Cannot fingerprint values of type {type(value).__name__}"
+    raise UnfingerprintableValueError(msg)
+
+
+def make_memoization_key(code: str, class_name: str, output_names: list[str], attributes: dict[str, Any]) -> str | None:
+    """Returns the content-addressed key of a component build, or None if an input cannot be fingerprinted."""
+    try:
+        payload = orjson.dumps(
+            [class_name, hashlib.sha256(code.encode()).hexdigest(), sorted(output_names), fingerprint_value(attributes)]
+        )
+    except (UnfingerprintableValueError, TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload).hexdigest()
+
+
+def is_memoizable_result(value: Any) -> bool:
+    if isinstance(value, Iterator | AsyncIterator):
+        return False
+    if isinstance(value, Message):
+        return not isinstance(value.text, Iterator | AsyncIterator)
+    return True
+
+
+class ComponentOutputCache:
+    """Bounded LRU cache of the outputs of pure components, shared by every run in the process.
+
+    Stored outputs are deep copies, and every hit returns a new copy, so downstream components
+    can modify the values they receive.
+    """
+
+    def __init__(self, max_entries: int = COMPONENT_OUTPUT_CACHE_MAX_ENTRIES) -> None:
+        self._outputs: LRUCache[str, MemoizedOutputs] = LRUCache(maxsize=max_entries)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> MemoizedOutputs | None:
+        with self._lock:
+            memoized = self._outputs.get(key)
+            if memoized is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return copy.deepcopy(memoized)
+
+    def set(self, key: str, outputs: MemoizedOutputs) -> bool:
+        """Stores a copy of the outputs. Returns False if they cannot be copied."""
+        if not all(is_memoizable_result(result) for result in outputs.results.values()):
+            return False
+        try:
+            outputs = copy.deepcopy(outputs)
+        except Exception:  # noqa: BLE001
+            return False
+        with self._lock:
+            self._outputs[key] = outputs
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._outputs.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._outputs)}
+
+
+component_output_cache = ComponentOutputCache()
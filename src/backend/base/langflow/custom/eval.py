@@ -1,12 +1,124 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+from loguru import logger
+
 from langflow.utils import validate
 
 if TYPE_CHECKING:
     from langflow.custom import CustomComponent
 
+COMPONENT_CLASS_CACHE_MAX_ENTRIES = 512
+COMPONENT_CLASS_CACHE_MAX_CODE_BYTES = 64 * 1024 * 1024
+
+
+def normalize_component_code(code: str) -> str:
+    """Normalize component code so that formatting-only differences share a cache entry."""
+    lines = code.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+def hash_component_code(code: str) -> str:
+    return hashlib.sha256(normalize_component_code(code).encode("utf-8")).hexdigest()
+
+
+class ComponentClassCache:
+    """Process-wide LRU cache of compiled component classes keyed by the hash of their normalized code.
+
+    The cache is bounded both by the number of entries and by the total size of the cached source code.
+    Since the key is derived from the code itself, changing the code of a component always results
+    in a new compilation.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = COMPONENT_CLASS_CACHE_MAX_ENTRIES,
+        max_code_bytes: int = COMPONENT_CLASS_CACHE_MAX_CODE_BYTES,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_code_bytes = max_code_bytes
+        self._classes: OrderedDict[str, tuple[type, int]] = OrderedDict()
+        self._code_bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compile_time = 0.0
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+    def __contains__(self, code: str) -> bool:
+        return hash_component_code(code) in self._classes
+
+    def get_or_create(self, code: str) -> type["CustomComponent"]:
+        key = hash_component_code(code)
+        with self._lock:
+            if key in self._classes:
+                self._classes.move_to_end(key)
+                self.hits += 1
+                return self._classes[key][0]
+            self.misses += 1
+
+        start_time = time.perf_counter()
+        class_name = validate.extract_class_name(code)
+        component_class = validate.create_class(code, class_name)
+        elapsed = time.perf_counter() - start_time
+
+        with self._lock:
+            self.compile_time += elapsed
+            self._set(key, component_class, len(code.encode("utf-8")))
+        logger.debug(f"Compiled component class {class_name} in {elapsed:.4f}s")
+        return component_class
+
+    def _set(self, key: str, component_class: type, size: int) -> None:
+        if size > self.max_code_bytes:
+            return
+        if key in self._classes:
+            self._code_bytes -= self._classes.pop(key)[1]
+        self._classes[key] = (component_class, size)
+        self._code_bytes += size
+        while len(self._classes) > self.max_entries or self._code_bytes > self.max_code_bytes:
+            _, (_, evicted_size) = self._classes.popitem(last=False)
+            self._code_bytes -= evicted_size
+            self.evictions += 1
+
+    def invalidate(self, code: str) -> None:
+        """Remove the class compiled from the given code."""
+        with self._lock:
+            entry = self._classes.pop(hash_component_code(code), None)
+            if entry is not None:
+                self._code_bytes -= entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._classes.clear()
+            self._code_bytes = 0
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._classes),
+                "code_bytes": self._code_bytes,
+                "compile_time": self.compile_time,
+            }
+
+
+component_class_cache = ComponentClassCache()
+
 
 def eval_custom_component_code(code: str) -> type["CustomComponent"]:
-    """Evaluate custom component code."""
-    class_name = validate.extract_class_name(code)
-    return validate.create_class(code, class_name)
+    """Evaluate custom component code.
+
+    The compiled class is cached by the hash of the code, so evaluating the same code again
+    returns the same class without parsing and compiling it again.
+    """
+    return component_class_cache.get_or_create(code)
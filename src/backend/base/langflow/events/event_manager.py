@@ -1,21 +1,24 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import json
+import threading
 import time
 import uuid
+from datetime import datetime, timezone
 from functools import partial
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
+import orjson
 from fastapi.encoders import jsonable_encoder
 from loguru import logger
+from pydantic import BaseModel
 from typing_extensions import Protocol
 
-from langflow.schema.playground_events import create_event_by_type
+from langflow.schema.playground_events import PlaygroundEvent, TokenEvent, create_event_by_type
 
 if TYPE_CHECKING:
-    import asyncio
-
     from langflow.schema.log import LoggableType
 
 
@@ -27,10 +30,48 @@ class PartialEventCallback(Protocol):
     def __call__(self, *, data: LoggableType): ...
 
 
+def serialize_event(event_type: str, data: Any) -> bytes:
+    """Serialize an event as a JSON line followed by a blank line.
+
+    The playground event models are dumped by pydantic and serialized with orjson; anything else,
+    or anything orjson cannot serialize, goes through jsonable_encoder and json.dumps.
+    """
+    try:
+        if isinstance(data, PlaygroundEvent | TokenEvent):
+            return orjson.dumps({"event": event_type, "data": data.model_dump(mode="json", by_alias=True)}) + b"\n\n"
+        if not isinstance(data, BaseModel):
+            return orjson.dumps({"event": event_type, "data": data}) + b"\n\n"
+    except (TypeError, ValueError):
+        pass
+    json_data = {"event": event_type, "data": jsonable_encoder(data)}
+    return (json.dumps(json_data) + "\n\n").encode("utf-8")
+
+
+def _token_timestamp() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z")
+
+
 class EventManager:
-    def __init__(self, queue: asyncio.Queue):
+    """Serializes events and puts them on a queue read by the client.
+
+    With `token_batch_interval` > 0, token events are not sent one by one: the chunks of each message
+    are buffered and sent as one token event `token_batch_interval` seconds after the first buffered
+    chunk, as soon as `token_batch_size` characters are buffered, or before any other event, so the
+    events keep their order.
+    """
+
+    def __init__(self, queue: asyncio.Queue, *, token_batch_interval: float = 0.0, token_batch_size: int = 0):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        self.token_batch_interval = token_batch_interval
+        self.token_batch_size = token_batch_size
+        self._pending_tokens: dict[str | None, list[str]] = {}
+        self._pending_size = 0
+        self._token_lock = threading.Lock()
+        try:
+            self._loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -65,7 +106,21 @@ class EventManager:
             callback_ = partial(callback, manager=self, event_type=event_type)
         self.events[name] = callback_
 
+    def has_default_callback(self, name: str) -> bool:
+        """Check whether the event `name` is sent by `send_event`, which never blocks, and not by a custom callback."""
+        callback = self.events.get(name)
+        return isinstance(callback, partial) and callback.func == self.send_event
+
     def send_event(self, *, event_type: Literal["message", "error", "warning", "info", "token"], data: LoggableType):
+        if event_type == "token" and self.token_batch_interval > 0 and isinstance(data, dict) and "chunk" in data:
+            self._buffer_token(data)
+            return
+        if self._pending_tokens:
+            self.flush_tokens()
+        if event_type == "token" and isinstance(data, dict) and "chunk" in data:
+            # Same fields as create_token, without building a TokenEvent
+            self._put("token", {"chunk": data["chunk"], "id": data.get("id"), "timestamp": _token_timestamp()})
+            return
         try:
             if isinstance(data, dict) and event_type in {"message", "error", "warning", "info", "token"}:
                 data = create_event_by_type(event_type, **data)
@@ -73,11 +128,51 @@ class EventManager:
             logger.debug(f"Error creating playground event: {e}")
         except Exception:
             raise
-        jsonable_data = jsonable_encoder(data)
-        json_data = {"event": event_type, "data": jsonable_data}
+        self._put(event_type, data)
+
+    def flush_tokens(self) -> None:
+        """Send the buffered chunks of each message as one token event."""
+        with self._token_lock:
+            pending, self._pending_tokens, self._pending_size = self._pending_tokens, {}, 0
+            timestamp = _token_timestamp() if pending else None
+            for message_id, chunks in pending.items():
+                self._put("token", {"chunk": "".join(chunks), "id": message_id, "timestamp": timestamp})
+
+    def _put(self, event_type: str, data: Any) -> None:
         event_id = f"{event_type}-{uuid.uuid4()}"
-        str_data = json.dumps(json_data) + "\n\n"
-        self.queue.put_nowait((event_id, str_data.encode("utf-8"), time.time()))
+        self.queue.put_nowait((event_id, serialize_event(event_type, data), time.time()))
+
+    def _buffer_token(self, data: dict) -> None:
+        chunk = data["chunk"] if isinstance(data["chunk"], str) else str(data["chunk"] or "")
+        message_id = data.get("id")
+        with self._token_lock:
+            first = not self._pending_tokens
+            self._pending_tokens.setdefault(str(message_id) if message_id is not None else None, []).append(chunk)
+            self._pending_size += len(chunk)
+            full = bool(self.token_batch_size) and self._pending_size >= self.token_batch_size
+        if full:
+            self.flush_tokens()
+        elif first:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Flush the buffered tokens after the batch interval, from the event loop.
+
+        Tokens can be sent from worker threads; the timer is always set on the loop the manager was created
+        or first used on. Without a loop the tokens are sent with the next event or when the batch is full.
+        """
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if self._loop is None or self._loop.is_closed():
+            self._loop = running_loop
+        if self._loop is None:
+            return
+        if running_loop is self._loop:
+            self._loop.call_later(self.token_batch_interval, self.flush_tokens)
+        else:
+            self._loop.call_soon_threadsafe(self._loop.call_later, self.token_batch_interval, self.flush_tokens)
 
     def noop(self, *, data: LoggableType) -> None:
         pass
@@ -86,8 +181,8 @@ class EventManager:
         return self.events.get(name, self.noop)
 
 
-def create_default_event_manager(queue):
-    manager = EventManager(queue)
+def create_default_event_manager(queue, *, token_batch_interval: float = 0.0, token_batch_size: int = 0):
+    manager = EventManager(queue, token_batch_interval=token_batch_interval, token_batch_size=token_batch_size)
     manager.register_event("on_token", "token")
     manager.register_event("on_vertices_sorted", "vertices_sorted")
     manager.register_event("on_error", "error")
@@ -100,8 +195,8 @@ def create_default_event_manager(queue):
     return manager
 
 
-def create_stream_tokens_event_manager(queue):
-    manager = EventManager(queue)
+def create_stream_tokens_event_manager(queue, *, token_batch_interval: float = 0.0, token_batch_size: int = 0):
+    manager = EventManager(queue, token_batch_interval=token_batch_interval, token_batch_size=token_batch_size)
     manager.register_event("on_message", "add_message")
     manager.register_event("on_token", "token")
     manager.register_event("on_end", "end")
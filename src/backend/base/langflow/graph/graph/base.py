@@ -20,6 +20,7 @@ from loguru import logger
 from langflow.exceptions.component import ComponentBuildError
 from langflow.graph.edge.base import CycleEdge, Edge
 from langflow.graph.graph.constants import Finish, lazy_load_vertex_dict
+from langflow.graph.graph.profiler import GraphProfiler
 from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
 from langflow.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
 from langflow.graph.graph.state_manager import GraphStateManager
@@ -41,7 +42,7 @@ from langflow.logging.logger import LogConfig, configure
 from langflow.schema.dotdict import dotdict
 from langflow.schema.schema import INPUT_FIELD_NAME, InputType, OutputValue
 from langflow.services.cache.utils import CacheMiss
-from langflow.services.deps import get_chat_service, get_tracing_service
+from langflow.services.deps import get_chat_service, get_tracing_service, get_variable_service
 from langflow.utils.async_helpers import run_until_complete
 
 if TYPE_CHECKING:
@@ -51,10 +52,12 @@ if TYPE_CHECKING:
     from langflow.custom.custom_component.component import Component
     from langflow.events.event_manager import EventManager
     from langflow.graph.edge.schema import EdgeData
+    from langflow.graph.graph.schema import ExecutionMode
     from langflow.graph.schema import ResultData
     from langflow.schema import Data
     from langflow.services.chat.schema import GetCache, SetCache
     from langflow.services.tracing.service import TracingService
+    from langflow.services.variable.resolver import RunVariableResolver
 
 
 class Graph:
@@ -133,6 +136,12 @@ class Graph:
         self._call_order: list[str] = []
         self._snapshots: list[dict[str, Any]] = []
         self._end_trace_tasks: set[asyncio.Task] = set()
+        # Layers computed ahead of time (e.g. by a GraphTemplate), keyed by start component id
+        self._prebuilt_layers: dict[str | None, tuple[list[str], list[list[str]]]] = {}
+        # Vertices built since the graph state was last persisted
+        self._changed_vertex_ids: set[str] = set()
+        self.profiler: GraphProfiler | None = None
+        self.variable_resolver: RunVariableResolver | None = None
 
         if context and not isinstance(context, dict):
             msg = "Context must be a dictionary"
@@ -655,6 +664,7 @@ class Graph:
     async def initialize_run(self) -> None:
         if not self._run_id:
             self.set_run_id()
+        await self.prefetch_variables()
         if self.tracing_service:
             run_name = f"{self.flow_name} - {self.flow_id}"
             await self.tracing_service.start_tracers(
@@ -664,6 +674,38 @@ class Graph:
                 session_id=self.session_id,
             )
 
+    async def prefetch_variables(self) -> None:
+        """Loads the variables used by the load_from_db fields of every vertex with a single query.
+
+        The values are then resolved by `self.variable_resolver` for the rest of the run.
+        """
+        # Keep it here to avoid import errors
+        from langflow.services.variable.resolver import RunVariableResolver
+        from langflow.services.variable.service import DatabaseVariableService
+
+        self.variable_resolver = None
+        if not self.user_id:
+            return
+        variable_service = get_variable_service()
+        if not isinstance(variable_service, DatabaseVariableService):
+            return
+        try:
+            user_id = self.user_id if isinstance(self.user_id, uuid.UUID) else uuid.UUID(self.user_id)
+        except ValueError:
+            return
+        names = {
+            vertex.params[field]
+            for vertex in self.vertices
+            for field in vertex.load_from_db_fields
+            if isinstance(vertex.params.get(field), str) and vertex.params[field]
+        }
+        resolver = RunVariableResolver(variable_service, user_id)
+        try:
+            await resolver.prefetch(names)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Error prefetching variables. They will be loaded when used.")
+        self.variable_resolver = resolver
+
     def _end_all_traces_async(self, outputs: dict[str, Any] | None = None, error: Exception | None = None) -> None:
         task = asyncio.create_task(self.end_all_traces(outputs, error))
         self._end_trace_tasks.add(task)
@@ -740,6 +782,8 @@ class Graph:
         session_id: str,
         fallback_to_env_vars: bool,
         event_manager: EventManager | None = None,
+        execution_mode: ExecutionMode = "layered",
+        max_concurrency: int | None = None,
     ) -> list[ResultData | None]:
         """Runs the graph with the given inputs.
 
@@ -752,6 +796,8 @@ class Graph:
             session_id (str): The session ID for the graph.
             fallback_to_env_vars (bool): Whether to fallback to environment variables.
             event_manager (EventManager | None): The event manager for the graph.
+            execution_mode (ExecutionMode): How to schedule the vertices. See `process`.
+            max_concurrency (int | None): Maximum number of vertices built at once in "ready_queue" mode.
 
         Returns:
             List[Optional["ResultData"]]: The outputs of the graph.
@@ -789,6 +835,8 @@ class Graph:
                 start_component_id=start_component_id,
                 fallback_to_env_vars=fallback_to_env_vars,
                 event_manager=event_manager,
+                execution_mode=execution_mode,
+                max_concurrency=max_concurrency,
             )
             self.increment_run_count()
         except Exception as exc:
@@ -824,6 +872,8 @@ class Graph:
         stream: bool = False,
         fallback_to_env_vars: bool = False,
         event_manager: EventManager | None = None,
+        execution_mode: ExecutionMode = "layered",
+        max_concurrency: int | None = None,
     ) -> list[RunOutputs]:
         """Runs the graph with the given inputs.
 
@@ -836,6 +886,9 @@ class Graph:
             stream (bool, optional): Whether to stream the results or not. Defaults to False.
             fallback_to_env_vars (bool, optional): Whether to fallback to environment variables. Defaults to False.
             event_manager (EventManager | None): The event manager for the graph.
+            execution_mode (ExecutionMode, optional): How to schedule the vertices. Defaults to "layered".
+            max_concurrency (int | None, optional): Maximum number of vertices built at once in "ready_queue" mode.
+                Defaults to None (unbounded).
 
         Returns:
             List[RunOutputs]: The outputs of the graph.
@@ -871,6 +924,8 @@ class Graph:
                 session_id=session_id or "",
                 fallback_to_env_vars=fallback_to_env_vars,
                 event_manager=event_manager,
+                execution_mode=execution_mode,
+                max_concurrency=max_concurrency,
             )
             run_output_object = RunOutputs(inputs=run_inputs, outputs=run_outputs)
             logger.debug(f"Run outputs: {run_output_object}")
@@ -975,6 +1030,16 @@ class Graph:
             parent_child_map[vertex.id] = [child.id for child in self.get_successors(vertex)]
         return parent_child_map
 
+    def pop_changed_vertex_ids(self) -> set[str]:
+        """Returns the ids of the vertices built since the last call and starts tracking again."""
+        changed_vertex_ids, self._changed_vertex_ids = self._changed_vertex_ids, set()
+        return changed_vertex_ids
+
+    def enable_profiling(self, *, trace_memory: bool = False) -> GraphProfiler:
+        """Records a profile of every vertex built from now on. See `langflow.graph.graph.profiler`."""
+        self.profiler = GraphProfiler(trace_memory=trace_memory)
+        return self.profiler
+
     def increment_run_count(self) -> None:
         self._runs += 1
 
@@ -1056,6 +1121,10 @@ class Graph:
             state["run_manager"] = RunnableVerticesManager.from_dict(run_manager)
         self.__dict__.update(state)
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
+        self._prebuilt_layers = {}
+        self._changed_vertex_ids = {vertex.id for vertex in self.vertices if vertex.built}
+        self.profiler = None
+        self.variable_resolver = None
         self.state_manager = GraphStateManager()
         self.tracing_service = get_tracing_service()
         self.set_run_id(self._run_id)
@@ -1228,8 +1297,12 @@ class Graph:
             if edge not in self.edges and edge.source_id in self.vertex_map and edge.target_id in self.vertex_map:
                 self.edges.append(edge)
 
-    def _build_graph(self) -> None:
-        """Builds the graph from the vertices and edges."""
+    def _build_graph(self, cycle_vertices: set[str] | None = None) -> None:
+        """Builds the graph from the vertices and edges.
+
+        Args:
+            cycle_vertices: The vertices in a cycle of the edges, if already known. Searched in the edges otherwise.
+        """
         self.vertices = self._build_vertices()
         self.vertex_map = {vertex.id: vertex for vertex in self.vertices}
         self.edges = self._build_edges()
@@ -1238,7 +1311,7 @@ class Graph:
         # the toolkit vertex
         self._build_vertex_params()
         self._instantiate_components_in_vertices()
-        self._set_cache_to_vertices_in_cycle()
+        self._set_cache_to_vertices_in_cycle(cycle_vertices)
         for vertex in self.vertices:
             if vertex.id in self.cycle_vertices:
                 self.run_manager.add_to_cycle_vertices(vertex.id)
@@ -1249,10 +1322,11 @@ class Graph:
         """Returns the edges of the graph as a list of tuples."""
         return [(e["data"]["sourceHandle"]["id"], e["data"]["targetHandle"]["id"]) for e in self._edges]
 
-    def _set_cache_to_vertices_in_cycle(self) -> None:
+    def _set_cache_to_vertices_in_cycle(self, cycle_vertices: set[str] | None = None) -> None:
         """Sets the cache to the vertices in cycle."""
-        edges = self._get_edges_as_list_of_tuples()
-        cycle_vertices = set(find_cycle_vertices(edges))
+        if cycle_vertices is None:
+            edges = self._get_edges_as_list_of_tuples()
+            cycle_vertices = set(find_cycle_vertices(edges))
         for vertex in self.vertices:
             if vertex.id in cycle_vertices:
                 vertex.apply_on_outputs(lambda output_object: setattr(output_object, "cache", False))
@@ -1419,6 +1493,7 @@ class Graph:
         """
         vertex = self.get_vertex(vertex_id)
         self.run_manager.add_to_vertices_being_run(vertex_id)
+        profile = self.profiler.start_vertex(vertex) if self.profiler is not None else None
         try:
             params = ""
             should_build = False
@@ -1474,10 +1549,15 @@ class Graph:
                     await set_cache(key=vertex.id, data=vertex_dict)
 
         except Exception as exc:
+            if profile is not None:
+                self.profiler.end_vertex(profile, vertex, error=True)
             if not isinstance(exc, ComponentBuildError):
                 logger.exception("Error building Component")
             raise
 
+        if profile is not None:
+            self.profiler.end_vertex(profile, vertex)
+        self._changed_vertex_ids.add(vertex_id)
         if vertex.result is not None:
             params = f"{vertex.built_object_repr()}{params}"
             valid = True
@@ -1525,53 +1605,169 @@ class Graph:
         fallback_to_env_vars: bool,
         start_component_id: str | None = None,
         event_manager: EventManager | None = None,
+        execution_mode: ExecutionMode = "layered",
+        max_concurrency: int | None = None,
     ) -> Graph:
-        """Processes the graph with vertices in each layer run in parallel."""
+        """Processes the graph, building independent vertices in parallel.
+
+        Args:
+            fallback_to_env_vars: Whether to fallback to environment variables.
+            start_component_id: The ID of the component to start from.
+            event_manager: The event manager for the graph.
+            execution_mode: "layered" runs each layer with `asyncio.gather` and waits for the whole layer
+                before scheduling the next one. "ready_queue" schedules each successor as soon as its
+                predecessors are done, so a slow vertex only delays the vertices that depend on it.
+            max_concurrency: Maximum number of vertices built at once in "ready_queue" mode.
+                None or 0 means unbounded.
+        """
+        if execution_mode not in {"layered", "ready_queue"}:
+            msg = f"Invalid execution mode: {execution_mode}. Expected 'layered' or 'ready_queue'"
+            raise ValueError(msg)
         has_webhook_component = "webhook" in start_component_id.lower() if start_component_id else False
         first_layer = self.sort_vertices(start_component_id=start_component_id)
-        vertex_task_run_count: dict[str, int] = {}
-        to_process = deque(first_layer)
-        layer_index = 0
-        chat_service = get_chat_service()
         await self.initialize_run()
-        lock = asyncio.Lock()
-        while to_process:
-            current_batch = list(to_process)  # Copy current deque items to a list
-            to_process.clear()  # Clear the deque for new items
-            tasks = []
-            for vertex_id in current_batch:
-                vertex = self.get_vertex(vertex_id)
-                task = asyncio.create_task(
-                    self.build_vertex(
-                        vertex_id=vertex_id,
-                        user_id=self.user_id,
-                        inputs_dict={},
-                        fallback_to_env_vars=fallback_to_env_vars,
-                        get_cache=chat_service.get_cache,
-                        set_cache=chat_service.set_cache,
-                        event_manager=event_manager,
-                    ),
-                    name=f"{vertex.id} Run {vertex_task_run_count.get(vertex_id, 0)}",
+        if self.profiler is not None:
+            self.profiler.start()
+        try:
+            if execution_mode == "ready_queue":
+                await self._process_ready_queue(
+                    first_layer,
+                    fallback_to_env_vars=fallback_to_env_vars,
+                    event_manager=event_manager,
+                    max_concurrency=max_concurrency,
+                    has_webhook_component=has_webhook_component,
                 )
-                tasks.append(task)
-                vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
+                logger.debug("Graph processing complete")
+                return self
+            vertex_task_run_count: dict[str, int] = {}
+            to_process = deque(first_layer)
+            layer_index = 0
+            chat_service = get_chat_service()
+            lock = asyncio.Lock()
+            while to_process:
+                current_batch = list(to_process)  # Copy current deque items to a list
+                to_process.clear()  # Clear the deque for new items
+                tasks = []
+                for vertex_id in current_batch:
+                    vertex = self.get_vertex(vertex_id)
+                    task = asyncio.create_task(
+                        self.build_vertex(
+                            vertex_id=vertex_id,
+                            user_id=self.user_id,
+                            inputs_dict={},
+                            fallback_to_env_vars=fallback_to_env_vars,
+                            get_cache=chat_service.get_cache,
+                            set_cache=chat_service.set_cache,
+                            event_manager=event_manager,
+                        ),
+                        name=f"{vertex.id} Run {vertex_task_run_count.get(vertex_id, 0)}",
+                    )
+                    tasks.append(task)
+                    vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
 
-            logger.debug(f"Running layer {layer_index} with {len(tasks)} tasks, {current_batch}")
-            try:
-                next_runnable_vertices = await self._execute_tasks(
-                    tasks, lock=lock, has_webhook_component=has_webhook_component
-                )
-            except Exception:
-                logger.exception(f"Error executing tasks in layer {layer_index}")
-                raise
-            if not next_runnable_vertices:
-                break
-            to_process.extend(next_runnable_vertices)
-            layer_index += 1
+                logger.debug(f"Running layer {layer_index} with {len(tasks)} tasks, {current_batch}")
+                try:
+                    next_runnable_vertices = await self._execute_tasks(
+                        tasks, lock=lock, has_webhook_component=has_webhook_component
+                    )
+                except Exception:
+                    logger.exception(f"Error executing tasks in layer {layer_index}")
+                    raise
+                if not next_runnable_vertices:
+                    break
+                to_process.extend(next_runnable_vertices)
+                layer_index += 1
+        finally:
+            if self.profiler is not None:
+                self.profiler.stop()
 
         logger.debug("Graph processing complete")
         return self
 
+    async def _process_ready_queue(
+        self,
+        first_layer: list[str],
+        *,
+        fallback_to_env_vars: bool,
+        event_manager: EventManager | None,
+        max_concurrency: int | None,
+        has_webhook_component: bool,
+    ) -> None:
+        """Builds the vertices as soon as they become runnable instead of layer by layer.
+
+        Every finished vertex releases its runnable successors into a ready queue right away.
+        Up to `max_concurrency` vertices are built at the same time. A vertex made runnable again while
+        it is being built, as in a cycle, is built again once its running build finishes.
+        """
+        chat_service = get_chat_service()
+        lock = asyncio.Lock()
+        vertex_task_run_count: dict[str, int] = {}
+        ready: deque[str] = deque(first_layer)
+        running: dict[asyncio.Task, str] = {}
+        deferred: set[str] = set()
+        for vertex_id in first_layer:
+            # Queued vertices must not be picked up again as runnable predecessors
+            self.run_manager.add_to_vertices_being_run(vertex_id)
+
+        try:
+            while ready or running:
+                while ready and (not max_concurrency or len(running) < max_concurrency):
+                    vertex_id = ready.popleft()
+                    if vertex_id in running.values():
+                        deferred.add(vertex_id)
+                        continue
+                    task = asyncio.create_task(
+                        self.build_vertex(
+                            vertex_id=vertex_id,
+                            user_id=self.user_id,
+                            inputs_dict={},
+                            fallback_to_env_vars=fallback_to_env_vars,
+                            get_cache=chat_service.get_cache,
+                            set_cache=chat_service.set_cache,
+                            event_manager=event_manager,
+                        ),
+                        name=f"{vertex_id} Run {vertex_task_run_count.get(vertex_id, 0)}",
+                    )
+                    running[task] = vertex_id
+                    vertex_task_run_count[vertex_id] = vertex_task_run_count.get(vertex_id, 0) + 1
+
+                if not running:
+                    break
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: running[t]):
+                    vertex_id = running.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as exc:
+                        logger.error(f"Task {task.get_name()} failed with exception: {exc}")
+                        if has_webhook_component:
+                            await self._log_vertex_build_from_exception(vertex_id, exc)
+                        raise
+                    if not isinstance(result, VertexBuildResult):
+                        msg = f"Invalid result from task {task.get_name()}: {result}"
+                        raise TypeError(msg)
+                    await log_vertex_build(
+                        flow_id=self.flow_id or "",
+                        vertex_id=result.vertex.id,
+                        valid=result.valid,
+                        params=result.params,
+                        data=result.result_dict,
+                        artifacts=result.artifacts,
+                    )
+                    logger.debug(f"Vertex {vertex_id}, result: {result.vertex.built_result}")
+                    next_runnable_vertices = await self.get_next_runnable_vertices(
+                        lock, vertex=result.vertex, cache=False
+                    )
+                    if vertex_id in deferred:
+                        deferred.discard(vertex_id)
+                        ready.append(vertex_id)
+                    ready.extend(v_id for v_id in next_runnable_vertices if v_id not in ready)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
     def find_next_runnable_vertices(self, vertex_successors_ids: list[str]) -> list[str]:
         next_runnable_vertices = set()
         for v_id in sorted(vertex_successors_ids):
@@ -1989,20 +2185,23 @@ class Graph:
         """Sorts the vertices in the graph."""
         self.mark_all_vertices("ACTIVE")
 
-        first_layer, remaining_layers = get_sorted_vertices(
-            vertices_ids=self.get_vertex_ids(),
-            cycle_vertices=self.cycle_vertices,
-            stop_component_id=stop_component_id,
-            start_component_id=start_component_id,
-            graph_dict=self.__to_dict(),
-            in_degree_map=self.in_degree_map,
-            successor_map=self.successor_map,
-            predecessor_map=self.predecessor_map,
-            is_input_vertex=self.get_vertex_input_status,
-            get_vertex_predecessors=self.get_vertex_predecessors_ids,
-            get_vertex_successors=self.get_vertex_successors_ids,
-            is_cyclic=self.is_cyclic,
-        )
+        if stop_component_id is None and start_component_id in self._prebuilt_layers:
+            first_layer, remaining_layers = copy.deepcopy(self._prebuilt_layers[start_component_id])
+        else:
+            first_layer, remaining_layers = get_sorted_vertices(
+                vertices_ids=self.get_vertex_ids(),
+                cycle_vertices=self.cycle_vertices,
+                stop_component_id=stop_component_id,
+                start_component_id=start_component_id,
+                graph_dict=self.__to_dict(),
+                in_degree_map=self.in_degree_map,
+                successor_map=self.successor_map,
+                predecessor_map=self.predecessor_map,
+                is_input_vertex=self.get_vertex_input_status,
+                get_vertex_predecessors=self.get_vertex_predecessors_ids,
+                get_vertex_successors=self.get_vertex_successors_ids,
+                is_cyclic=self.is_cyclic,
+            )
 
         self.increment_run_count()
         self._sorted_vertices_layers = [first_layer, *remaining_layers]
@@ -0,0 +1,246 @@
+"""Built-in profiling of flow runs, exportable as Chrome trace and speedscope files.
+
+A `GraphProfiler` is attached to a graph with `Graph.enable_profiling`. Every `Graph.build_vertex`
+call then records a `VertexProfile` with:
+
+* the wall time of the build and the process CPU time spent while it ran;
+* when all of its predecessors had finished (``ready_at``) and how long it then waited to start;
+* the event loop lag observed while it ran, measured by a monitor task that sleeps for short
+  intervals and records how late it wakes up;
+* the tracemalloc peak during the build, when memory tracing is enabled;
+* whether the result came from a frozen vertex or from memoized component outputs.
+
+CPU time, loop lag and memory are process-wide measures, so they are shared by the vertices that
+build at the same time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from cachetools import LRUCache
+
+if TYPE_CHECKING:
+    from langflow.graph.vertex.base import Vertex
+
+LOOP_LAG_INTERVAL = 0.01
+PROFILE_STORE_MAX_ENTRIES = 100
+
+
+@dataclass
+class VertexProfile:
+    vertex_id: str
+    display_name: str
+    start: float
+    """Seconds between the start of the run and the start of the build."""
+    ready_at: float
+    """Seconds between the start of the run and the end of the last predecessor build."""
+    end: float = 0.0
+    cpu_time: float = 0.0
+    loop_blocked_time: float = 0.0
+    memory_peak: int | None = None
+    cache_status: str = "built"
+    error: bool = False
+    _cpu_start: float = field(default=0.0, repr=False)
+    _memory_start: int = field(default=0, repr=False)
+
+    @property
+    def wall_time(self) -> float:
+        return self.end - self.start
+
+    @property
+    def queue_time(self) -> float:
+        """Seconds between the end of the last predecessor and the start of this build."""
+        return max(self.start - self.ready_at, 0.0)
+
+    def to_dict(self) -> dict[str, Any]:
+        data = {key: value for key, value in asdict(self).items() if not key.startswith("_")}
+        return data | {"wall_time": self.wall_time, "queue_time": self.queue_time}
+
+
+class GraphProfiler:
+    """Collects a `VertexProfile` for every vertex built during a run.
+
+    Args:
+        trace_memory: Whether to record the tracemalloc peak of each build. Starts tracemalloc if needed.
+        loop_lag_interval: Seconds between the checks of the event loop lag.
+    """
+
+    def __init__(self, *, trace_memory: bool = False, loop_lag_interval: float = LOOP_LAG_INTERVAL) -> None:
+        self.trace_memory = trace_memory
+        self.loop_lag_interval = loop_lag_interval
+        self.profiles: list[VertexProfile] = []
+        self.started_at: float | None = None
+        self.duration: float | None = None
+        self._finished_at: dict[str, float] = {}
+        self._active: dict[int, VertexProfile] = {}
+        self._monitor_task: asyncio.Task | None = None
+        self._started_tracemalloc = False
+
+    @property
+    def is_running(self) -> bool:
+        return self.started_at is not None and self.duration is None
+
+    def start(self) -> None:
+        """Start a new run, discarding the profiles of the previous one."""
+        self.profiles = []
+        self._finished_at = {}
+        self._active = {}
+        self.started_at = time.perf_counter()
+        self.duration = None
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        with contextlib.suppress(RuntimeError):
+            self._monitor_task = asyncio.get_running_loop().create_task(self._monitor_loop_lag())
+
+    def stop(self) -> None:
+        if self.started_at is None or self.duration is not None:
+            return
+        self.duration = time.perf_counter() - self.started_at
+        if self._monitor_task is not None:
+            self._monitor_task.cancel()
+            self._monitor_task = None
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def start_vertex(self, vertex: Vertex) -> VertexProfile:
+        if not self.is_running:
+            self.start()
+        now = self._elapsed()
+        # The predecessor map is consumed while the graph runs, so the edges are used instead
+        predecessors_end = [
+            self._finished_at[edge.source_id] for edge in vertex.incoming_edges if edge.source_id in self._finished_at
+        ]
+        profile = VertexProfile(
+            vertex_id=vertex.id,
+            display_name=vertex.display_name,
+            start=now,
+            ready_at=max(predecessors_end, default=0.0),
+            _cpu_start=time.process_time(),
+        )
+        if self.trace_memory and tracemalloc.is_tracing():
+            profile._memory_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self._active[id(profile)] = profile
+        return profile
+
+    def end_vertex(self, profile: VertexProfile, vertex: Vertex, *, error: bool = False) -> None:
+        profile.end = self._elapsed()
+        profile.cpu_time = time.process_time() - profile._cpu_start
+        profile.error = error
+        if self.trace_memory and tracemalloc.is_tracing():
+            profile.memory_peak = max(tracemalloc.get_traced_memory()[1] - profile._memory_start, 0)
+        if vertex.result is not None and vertex.result.used_frozen_result:
+            profile.cache_status = "frozen"
+        elif getattr(vertex.custom_component, "_used_memoized_outputs", False):
+            profile.cache_status = "memoized"
+        self._active.pop(id(profile), None)
+        self._finished_at[vertex.id] = profile.end
+        self.profiles.append(profile)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "duration": self.duration if self.duration is not None else self._elapsed(),
+            "vertices": [profile.to_dict() for profile in sorted(self.profiles, key=lambda p: p.start)],
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Export the run in the Chrome trace event format, loadable in chrome://tracing and Perfetto."""
+        events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "Langflow flow run"}},
+        ]
+        for lane, profiles in enumerate(self._lanes()):
+            events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": lane, "args": {"name": f"lane {lane}"}})
+            events.extend(
+                {
+                    "name": profile.display_name,
+                    "cat": profile.cache_status,
+                    "ph": "X",
+                    "ts": profile.start * 1_000_000,
+                    "dur": profile.wall_time * 1_000_000,
+                    "pid": 1,
+                    "tid": lane,
+                    "args": profile.to_dict(),
+                }
+                for profile in profiles
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_speedscope(self, name: str = "Flow run") -> dict[str, Any]:
+        """Export the run in the speedscope file format, with one evented profile per lane of concurrent builds."""
+        frames: list[dict[str, str]] = []
+        frame_indexes: dict[str, int] = {}
+        profiles = []
+        end_value = self.to_dict()["duration"]
+        for lane, lane_profiles in enumerate(self._lanes()):
+            events = []
+            for profile in lane_profiles:
+                frame_name = f"{profile.display_name} ({profile.vertex_id})"
+                if frame_name not in frame_indexes:
+                    frame_indexes[frame_name] = len(frames)
+                    frames.append({"name": frame_name})
+                events.append({"type": "O", "frame": frame_indexes[frame_name], "at": profile.start})
+                events.append({"type": "C", "frame": frame_indexes[frame_name], "at": profile.end})
+            profiles.append(
+                {
+                    "type": "evented",
+                    "name": f"{name} lane {lane}",
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": max(end_value, max((p.end for p in lane_profiles), default=0.0)),
+                    "events": events,
+                }
+            )
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+    def _lanes(self) -> list[list[VertexProfile]]:
+        """Assigns each build to the first lane that is free when it starts, so builds in a lane never overlap."""
+        lanes: list[list[VertexProfile]] = []
+        for profile in sorted(self.profiles, key=lambda p: (p.start, p.end)):
+            for lane in lanes:
+                if lane[-1].end <= profile.start:
+                    lane.append(profile)
+                    break
+            else:
+                lanes.append([profile])
+        return lanes
+
+    def _elapsed(self) -> float:
+        return time.perf_counter() - self.started_at if self.started_at is not None else 0.0
+
+    async def _monitor_loop_lag(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.loop_lag_interval
+            await asyncio.sleep(self.loop_lag_interval)
+            lag = time.perf_counter() - expected
+            if lag > self.loop_lag_interval:
+                for profile in list(self._active.values()):
+                    profile.loop_blocked_time += lag
+
+
+class GraphProfileStore:
+    """Keeps the profiles of the latest profiled builds, keyed by job id."""
+
+    def __init__(self, max_entries: int = PROFILE_STORE_MAX_ENTRIES) -> None:
+        self._profiles: LRUCache[str, GraphProfiler] = LRUCache(maxsize=max_entries)
+
+    def save(self, key: str, profiler: GraphProfiler) -> None:
+        self._profiles[key] = profiler
+
+    def get(self, key: str) -> GraphProfiler | None:
+        return self._profiles.get(key)
+
+
+graph_profile_store = GraphProfileStore()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+from typing import TYPE_CHECKING, Any
+
+from cachetools import LRUCache
+from loguru import logger
+
+from langflow.graph.graph.base import Graph
+from langflow.graph.graph.utils import find_cycle_vertices, find_start_component_id
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from langflow.graph.edge.schema import EdgeData
+    from langflow.graph.graph.schema import GraphData
+    from langflow.graph.vertex.schema import NodeData
+    from langflow.schema.graph import Tweaks
+
+GRAPH_TEMPLATE_CACHE_MAX_ENTRIES = 256
+
+
+class GraphTemplate:
+    """The immutable structure of a flow, used to stamp out `Graph` instances cheaply.
+
+    Building a `Graph` from a payload ungroups the nodes, detects cycles and sorts the vertices
+    into layers. None of that depends on the run, so a template does it once and every
+    instance created with `create_graph` starts from the precomputed structure.
+    """
+
+    def __init__(self, payload: dict, flow_id: str | None = None, flow_name: str | None = None) -> None:
+        graph = Graph.from_payload(payload, flow_id=flow_id, flow_name=flow_name)
+        self.flow_id = flow_id
+        self.flow_name = flow_name
+        self.raw_graph_data: GraphData = copy.deepcopy(graph.raw_graph_data)
+        self.nodes: list[NodeData] = graph._vertices
+        self.edges: list[EdgeData] = graph._edges
+        self.top_level_vertices: list[str] = list(graph.top_level_vertices)
+        self.cycle_vertices: set[str] = set(graph.cycle_vertices)
+        # The outputs of these vertices are not cached; searched in the edges after the groups are expanded
+        self.uncached_vertices: set[str] = set(find_cycle_vertices(graph._get_edges_as_list_of_tuples()))
+        self.predecessor_map = copy.deepcopy(graph.predecessor_map)
+        self.successor_map = copy.deepcopy(graph.successor_map)
+        self.in_degree_map = copy.deepcopy(graph.in_degree_map)
+        self.parent_child_map = copy.deepcopy(graph.parent_child_map)
+        self.layers: dict[str | None, tuple[list[str], list[list[str]]]] = {}
+        for start_component_id in {None, find_start_component_id(graph._is_input_vertices)}:
+            first_layer = graph.sort_vertices(start_component_id=start_component_id)
+            self.layers[start_component_id] = copy.deepcopy((first_layer, graph.vertices_layers))
+
+    def create_graph(self, user_id: str | None = None) -> Graph:
+        """Creates a new `Graph` ready to be run from the template."""
+        graph = Graph(flow_id=self.flow_id, flow_name=self.flow_name, user_id=user_id)
+        graph.raw_graph_data = copy.deepcopy(self.raw_graph_data)
+        graph.top_level_vertices = list(self.top_level_vertices)
+        graph._cycle_vertices = set(self.cycle_vertices)
+        for vertex_id in self.cycle_vertices:
+            graph.run_manager.add_to_cycle_vertices(vertex_id)
+        graph._vertices = copy.deepcopy(self.nodes)
+        graph._edges = copy.deepcopy(self.edges)
+        # Building the graph does not search the cycles again
+        graph._build_graph(cycle_vertices=self.uncached_vertices)
+        graph.predecessor_map = copy.deepcopy(self.predecessor_map)
+        graph.successor_map = copy.deepcopy(self.successor_map)
+        graph.in_degree_map = copy.deepcopy(self.in_degree_map)
+        graph.parent_child_map = copy.deepcopy(self.parent_child_map)
+        graph.define_vertices_lists()
+        graph._prebuilt_layers = self.layers
+        return graph
+
+
+def hash_tweaks(tweaks: dict[str, Any] | None, *, stream: bool = False) -> str:
+    payload = json.dumps({"tweaks": tweaks or {}, "stream": stream}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class GraphTemplateCache:
+    """LRU cache of `GraphTemplate` objects keyed by flow id, flow version and tweaks.
+
+    A flow is identified by its id and `updated_at`, so saving the flow makes the next run build
+    a new template. Templates of older versions of a flow are dropped when a newer one is stored.
+    """
+
+    def __init__(self, max_entries: int = GRAPH_TEMPLATE_CACHE_MAX_ENTRIES) -> None:
+        self._templates: LRUCache = LRUCache(maxsize=max_entries)
+        self._versions: dict[str, datetime] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_create(
+        self,
+        graph_data: dict,
+        *,
+        flow_id: str,
+        flow_name: str | None,
+        updated_at: datetime,
+        tweaks: Tweaks | dict[str, Any] | None = None,
+        stream: bool = False,
+    ) -> GraphTemplate:
+        from langflow.processing.process import process_tweaks
+
+        if tweaks is not None and not isinstance(tweaks, dict):
+            tweaks = tweaks.model_dump()
+        key = (flow_id, updated_at, hash_tweaks(tweaks, stream=stream))
+        if (template := self._templates.get(key)) is not None:
+            self.hits += 1
+            return template
+
+        self.misses += 1
+        if (previous_version := self._versions.get(flow_id)) is not None and previous_version != updated_at:
+            self.invalidate(flow_id)
+        graph_data = process_tweaks(copy.deepcopy(graph_data), copy.deepcopy(tweaks or {}), stream=stream)
+        template = GraphTemplate(graph_data, flow_id=flow_id, flow_name=flow_name)
+        self._templates[key] = template
+        self._versions[flow_id] = updated_at
+        logger.debug(f"Built graph template for flow {flow_id}")
+        return template
+
+    def invalidate(self, flow_id: str) -> None:
+        """Removes every template of the given flow."""
+        for key in [key for key in self._templates if key[0] == flow_id]:
+            self._templates.pop(key, None)
+        self._versions.pop(flow_id, None)
+
+    def clear(self) -> None:
+        self._templates.clear()
+        self._versions.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._templates)}
+
+
+graph_template_cache = GraphTemplateCache()
@@ -8,8 +8,10 @@ from loguru import logger
 from pydantic.v1 import BaseModel, Field, create_model
 from sqlmodel import select
 
+from langflow.schema import Data
 from langflow.schema.schema import INPUT_FIELD_NAME
 from langflow.services.database.models.flow import Flow
+from langflow.services.database.models.flow.crud import get_flow_headers, select_flow_headers
 from langflow.services.database.models.flow.model import FlowRead
 from langflow.services.deps import get_settings_service, session_scope
 
@@ -19,7 +21,6 @@ if TYPE_CHECKING:
     from langflow.graph.graph.base import Graph
     from langflow.graph.schema import RunOutputs
     from langflow.graph.vertex.base import Vertex
-    from langflow.schema import Data
 
 INPUT_TYPE_MAP = {
     "ChatInput": {"type_hint": "Optional[str]", "default": '""'},
@@ -44,6 +45,33 @@ async def list_flows(*, user_id: str | None = None) -> list[Data]:
         raise ValueError(msg) from e
 
 
+async def list_flow_headers(*, user_id: str | None = None) -> list[Data]:
+    """List the flows of a user like `list_flows`, without their data."""
+    if not user_id:
+        msg = "Session is invalid"
+        raise ValueError(msg)
+    try:
+        async with session_scope() as session:
+            uuid_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
+            stmt = select_flow_headers().where(Flow.user_id == uuid_user_id).where(Flow.is_component == False)  # noqa: E712
+            flow_headers = await get_flow_headers(session, stmt)
+
+            return [
+                Data(
+                    data={
+                        "id": flow_header.id,
+                        "name": flow_header.name,
+                        "description": flow_header.description,
+                        "updated_at": flow_header.updated_at,
+                    }
+                )
+                for flow_header in flow_headers
+            ]
+    except Exception as e:
+        msg = f"Error listing flows: {e}"
+        raise ValueError(msg) from e
+
+
 async def load_flow(
     user_id: str, flow_id: str | None = None, flow_name: str | None = None, tweaks: dict | None = None
 ) -> Graph:
@@ -319,18 +347,29 @@ async def generate_unique_flow_name(flow_name, user_id, session):
 
 def json_schema_from_flow(flow: Flow) -> dict:
     """Generate JSON schema from flow input nodes."""
-    from langflow.graph.graph.base import Graph
-
     # Get the flow's data which contains the nodes and their configurations
-    flow_data = flow.data or {}
+    return json_schema_from_flow_data(flow.data or {})
+
 
-    graph = Graph.from_payload(flow_data)
-    input_nodes = [vertex for vertex in graph.vertices if vertex.is_input]
+def json_schema_from_flow_data(flow_data: dict) -> dict:
+    """Generate JSON schema from the input nodes of the data of a flow.
+
+    The nodes are read from the data, group nodes ungrouped, without building the components of the flow.
+    """
+    from langflow.graph.graph.utils import process_flow
+    from langflow.graph.schema import INPUT_COMPONENTS
+
+    input_nodes = [
+        node
+        for node in process_flow(flow_data).get("nodes", [])
+        if node.get("data", {}).get("node", {}).get("is_input")
+        or any(input_component_name in node["id"] for input_component_name in INPUT_COMPONENTS)
+    ]
 
     properties = {}
     required = []
     for node in input_nodes:
-        node_data = node.data["node"]
+        node_data = node["data"]["node"]
         template = node_data["template"]
 
         for field_name, field_data in template.items():
@@ -358,3 +397,23 @@ def json_schema_from_flow(flow: Flow) -> dict:
                     required.append(field_name)
 
     return {"type": "object", "properties": properties, "required": required}
+
+
+def get_flow_interface_summary(flow_data: dict | None, *, input_schema: bool = True) -> dict | None:
+    """Summarize what listing a flow needs from its data.
+
+    Returns a dict with `is_component`, whether the flow is a component, and `input_schema`, the JSON schema
+    of its inputs or None if it can't be built. Returns None for a flow without data or whose data is not a dict.
+    """
+    if not flow_data or not isinstance(flow_data, dict):
+        return None
+    is_component = flow_data.get("is_component")
+    if is_component is None:
+        is_component = len(flow_data.get("nodes", [])) == 1
+    schema = None
+    if input_schema:
+        try:
+            schema = json_schema_from_flow_data(flow_data)
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"Error building the input schema of a flow: {e}")
+    return {"is_component": is_component, "input_schema": schema}
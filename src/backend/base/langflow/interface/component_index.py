@@ -0,0 +1,251 @@
+"""Persisted index of the component templates found in a components path.
+
+Building the templates of a components path imports and evaluates every component module, which
+dominates startup time. The index stores the result of that build (the template, outputs and code of
+every component, by category) together with the size, mtime and sha256 of every source file and of
+the modules they can import: the other Python files of the path, like `__init__.py` files and helpers,
+and the modules of the `langflow` package, like `langflow.base` and `langflow.inputs`. At startup a
+path whose index still matches those files is loaded from the index without importing any component;
+the modules are only evaluated when a flow instantiates a component.
+
+An index is looked up first in `config_dir/component_index`, where indexes built at runtime are
+written, and then in a `component_index.json` file shipped at the root of the components path,
+generated at build time with `langflow build-component-index`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from loguru import logger
+
+from langflow.custom.directory_reader import DirectoryReader
+from langflow.custom.directory_reader.utils import (
+    abuild_and_validate_all_files,
+    build_invalid_menu,
+    build_valid_menu,
+    load_files_from_path,
+    merge_nested_dicts_with_renaming,
+)
+from langflow.utils.version import get_version_info
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Container
+
+COMPONENT_INDEX_VERSION = 3
+COMPONENT_INDEX_FILE_NAME = "component_index.json"
+LANGFLOW_PACKAGE_PATH = Path(__file__).resolve().parent.parent
+_LANGFLOW_PACKAGE_PREFIX = "langflow/"
+
+
+def _file_sha256(file_path: Path) -> str:
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def list_source_files(path: str) -> dict[str, tuple[int, int]]:
+    """Return the size and mtime of the component sources of `path`, by path relative to it."""
+    root = Path(path)
+    sources = {}
+    for file_path in map(Path, load_files_from_path(path)):
+        stat = file_path.stat()
+        sources[file_path.relative_to(root).as_posix()] = (stat.st_size, stat.st_mtime_ns)
+    return sources
+
+
+def list_dependency_files(path: str, sources: Container[str]) -> dict[str, tuple[int, int]]:
+    """Return the size and mtime of the modules the component sources of `path` can import.
+
+    These are the Python files of `path` that are not component sources, by path relative to it, and the
+    modules of the `langflow` package, by path relative to it prefixed with `langflow/`. The whole package is
+    included because the templates are built from `langflow.inputs`, `langflow.io`, `langflow.template`,
+    `langflow.custom` and `langflow.schema` as well as from the base classes of `langflow.base`.
+    """
+    root = Path(path)
+    dependencies = {}
+    for file_path in root.rglob("*.py"):
+        relative_path = file_path.relative_to(root).as_posix()
+        if relative_path not in sources:
+            stat = file_path.stat()
+            dependencies[relative_path] = (stat.st_size, stat.st_mtime_ns)
+    for file_path in LANGFLOW_PACKAGE_PATH.rglob("*.py"):
+        stat = file_path.stat()
+        dependencies[_LANGFLOW_PACKAGE_PREFIX + file_path.relative_to(LANGFLOW_PACKAGE_PATH).as_posix()] = (
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+    return dependencies
+
+
+def dependency_file_path(path: str, relative_path: str) -> Path:
+    if relative_path.startswith(_LANGFLOW_PACKAGE_PREFIX):
+        return LANGFLOW_PACKAGE_PATH / relative_path.removeprefix(_LANGFLOW_PACKAGE_PREFIX)
+    return Path(path) / relative_path
+
+
+def environment_fingerprint() -> str:
+    """Fingerprint the Python environment, which changes when packages are installed or removed."""
+    entries = [sys.version, get_version_info()["version"]]
+    for entry in sys.path:
+        try:
+            entries.append(f"{entry}:{Path(entry).stat().st_mtime_ns}")
+        except OSError:
+            continue
+    return hashlib.sha256("\n".join(entries).encode()).hexdigest()
+
+
+def _files_match(
+    indexed_files: dict[str, dict[str, Any]], files: dict[str, tuple[int, int]], resolve: Callable[[str], Path]
+) -> bool:
+    if files.keys() != indexed_files.keys():
+        return False
+    for relative_path, (size, mtime_ns) in files.items():
+        indexed = indexed_files[relative_path]
+        if indexed["size"] == size and indexed["mtime_ns"] == mtime_ns:
+            continue
+        if indexed["size"] != size or indexed["sha256"] != _file_sha256(resolve(relative_path)):
+            return False
+        indexed["mtime_ns"] = mtime_ns
+    return True
+
+
+def _file_entries(files: dict[str, tuple[int, int]], resolve: Callable[[str], Path]) -> dict[str, dict[str, Any]]:
+    return {
+        relative_path: {"size": size, "mtime_ns": mtime_ns, "sha256": _file_sha256(resolve(relative_path))}
+        for relative_path, (size, mtime_ns) in files.items()
+    }
+
+
+def index_matches_sources(index: dict[str, Any], path: str) -> bool:
+    """Check that an index was built from the current sources of `path`, with this Langflow version.
+
+    The modules the sources can import, listed by `list_dependency_files`, are checked the same way.
+    Files whose size and mtime changed are compared by content, so an index copied with different
+    mtimes, like the one shipped in the package, is still valid. The mtimes of the index are updated
+    in place. An index with invalid components, which usually fail because of missing dependencies,
+    is also tied to the environment it was built in.
+    """
+    langflow_version = get_version_info()["version"]
+    if index.get("index_version") != COMPONENT_INDEX_VERSION or index.get("langflow_version") != langflow_version:
+        return False
+    if index.get("has_errors") and index.get("environment") != environment_fingerprint():
+        return False
+    sources = list_source_files(path)
+    root = Path(path)
+    if not _files_match(index.get("files", {}), sources, lambda relative_path: root / relative_path):
+        return False
+    dependencies = list_dependency_files(path, sources)
+    return _files_match(
+        index.get("dependencies", {}),
+        dependencies,
+        lambda relative_path: dependency_file_path(path, relative_path),
+    )
+
+
+async def abuild_component_index(path: str) -> dict[str, Any]:
+    """Build the component templates of `path` and the index of its sources."""
+    sources = await asyncio.to_thread(list_source_files, path)
+    dependencies = await asyncio.to_thread(list_dependency_files, path, sources)
+    reader = DirectoryReader(path, compress_code_field=False)
+    file_list = [str(Path(path) / relative_path) for relative_path in sources]
+    valid_components, invalid_components = await abuild_and_validate_all_files(reader, file_list)
+    types = merge_nested_dicts_with_renaming(build_valid_menu(valid_components), build_invalid_menu(invalid_components))
+    has_errors = any(menu["components"] for menu in invalid_components.get("menu", []))
+
+    return {
+        "index_version": COMPONENT_INDEX_VERSION,
+        "langflow_version": get_version_info()["version"],
+        "has_errors": has_errors,
+        "environment": environment_fingerprint() if has_errors else None,
+        "files": await asyncio.to_thread(_file_entries, sources, lambda relative_path: Path(path) / relative_path),
+        "dependencies": await asyncio.to_thread(
+            _file_entries, dependencies, lambda relative_path: dependency_file_path(path, relative_path)
+        ),
+        "types": types,
+    }
+
+
+def runtime_index_path(path: str, index_dir: str | Path) -> Path:
+    name = hashlib.sha256(str(Path(path).resolve()).encode()).hexdigest()[:16]
+    return Path(index_dir) / f"{name}.json"
+
+
+def read_component_index(index_path: Path) -> dict[str, Any] | None:
+    try:
+        return orjson.loads(index_path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError):
+        logger.opt(exception=True).debug(f"Ignoring unreadable component index {index_path}")
+        return None
+
+
+def write_component_index(index: dict[str, Any], index_path: Path) -> None:
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = index_path.with_suffix(".tmp")
+    temporary_path.write_bytes(orjson.dumps(index))
+    temporary_path.replace(index_path)
+
+
+def _load_valid_index(path: str, index_dir: str | Path | None) -> tuple[dict[str, Any] | None, bool]:
+    """Return the first valid index of `path` and whether the runtime copy needs to be written."""
+    runtime_path = runtime_index_path(path, index_dir) if index_dir else None
+    candidates = [runtime_path, Path(path) / COMPONENT_INDEX_FILE_NAME]
+    for index_path in filter(None, candidates):
+        index = read_component_index(index_path)
+        if index is None:
+            continue
+        mtimes = {
+            (field, relative_path): entry["mtime_ns"]
+            for field in ("files", "dependencies")
+            for relative_path, entry in index.get(field, {}).items()
+        }
+        if index_matches_sources(index, path):
+            refreshed = any(
+                entry["mtime_ns"] != mtimes[field, relative_path]
+                for field in ("files", "dependencies")
+                for relative_path, entry in index[field].items()
+            )
+            return index, runtime_path is not None and (index_path != runtime_path or refreshed)
+        logger.debug(f"Component index {index_path} is out of date")
+    return None, runtime_path is not None
+
+
+async def aload_component_types(path: str, index_dir: str | Path | None) -> dict[str, Any]:
+    """Return the component templates of `path`, from its index when it matches the sources."""
+    index, write = await asyncio.to_thread(_load_valid_index, path, index_dir)
+    if index is None:
+        logger.debug(f"Building the component index of {path}")
+        index = await abuild_component_index(path)
+    if write and index_dir:
+        try:
+            await asyncio.to_thread(lambda: write_component_index(index, runtime_index_path(path, index_dir)))
+        except OSError:
+            logger.opt(exception=True).warning(f"Could not write the component index of {path}")
+    return index["types"]
+
+
+async def aget_indexed_types_dict(components_paths: list[str], index_dir: str | Path | None) -> dict[str, Any]:
+    """Get all types dictionary, loading each components path from its index when possible."""
+    all_types: dict[str, Any] = {}
+    processed_paths = set()
+    for path in map(str, components_paths):
+        if path in processed_paths or not await asyncio.to_thread(Path(path).is_dir):
+            continue
+        all_types = merge_nested_dicts_with_renaming(all_types, await aload_component_types(path, index_dir))
+        processed_paths.add(path)
+    return all_types
+
+
+async def abuild_bundled_component_index() -> Path:
+    """Write the index of the bundled components, shipped with the package."""
+    from langflow.services.settings.base import BASE_COMPONENTS_PATH
+
+    index = await abuild_component_index(BASE_COMPONENTS_PATH)
+    index_path = Path(BASE_COMPONENTS_PATH) / COMPONENT_INDEX_FILE_NAME
+    write_component_index(index, index_path)
+    return index_path
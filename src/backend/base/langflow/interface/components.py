@@ -17,6 +17,8 @@ class ComponentCache:
     def __init__(self):
         self.all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        # Incremented whenever all_types_dict is changed in place
+        self.version = 0
 
 
 # Singleton instance
@@ -34,6 +36,14 @@ async def get_and_cache_all_types_dict(
             # Partial loading mode - just load component metadata
             logger.debug("Using partial component loading")
             component_cache.all_types_dict = await aget_component_metadata(settings_service.settings.components_path)
+        elif settings_service.settings.use_component_index:
+            from langflow.interface.component_index import aget_indexed_types_dict
+
+            config_dir = settings_service.settings.config_dir
+            component_cache.all_types_dict = await aget_indexed_types_dict(
+                settings_service.settings.components_path,
+                Path(config_dir) / "component_index" if config_dir else None,
+            )
         else:
             # Traditional full loading
             component_cache.all_types_dict = await aget_all_types_dict(settings_service.settings.components_path)
@@ -198,6 +208,7 @@ async def ensure_component_loaded(component_type: str, component_name: str, sett
         if full_component:
             # Replace the stub with the fully loaded component
             component_cache.all_types_dict["components"][component_type][component_name] = full_component
+            component_cache.version += 1
             # Remove lazy_loaded flag if it exists
             if "lazy_loaded" in component_cache.all_types_dict["components"][component_type][component_name]:
                 del component_cache.all_types_dict["components"][component_type][component_name]["lazy_loaded"]
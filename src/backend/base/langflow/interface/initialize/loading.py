@@ -110,6 +110,15 @@ async def update_params_with_load_from_db_fields(
     *,
     fallback_to_env_vars=False,
 ):
+    vertex = getattr(custom_component, "_vertex", None)
+    resolver = vertex.graph.variable_resolver if vertex is not None else None
+    if resolver is not None:
+        # Load the variables of every field at once instead of one query per field
+        names = [params[field] for field in load_from_db_fields if isinstance(params.get(field), str) and params[field]]
+        try:
+            await resolver.prefetch(names)
+        except Exception:  # noqa: BLE001
+            logger.opt(exception=True).debug("Error prefetching variables")
     for field in load_from_db_fields:
         if field not in params or not params[field]:
             continue
@@ -36,6 +36,9 @@ from langflow.interface.utils import setup_llm_caching
 from langflow.logging.logger import configure
 from langflow.middleware import ContentSizeLimitMiddleware
 from langflow.services.deps import (
+    get_auth_service,
+    get_build_log_service,
+    get_message_writer_service,
     get_queue_service,
     get_settings_service,
     get_telemetry_service,
@@ -169,6 +172,15 @@ def get_lifespan(*, fix_migration=False, version=None):
             queue_service = get_queue_service()
             if not queue_service.is_started():  # Start if not already started
                 queue_service.start()
+            build_log_service = get_build_log_service()
+            if not build_log_service.is_started():
+                build_log_service.start()
+            message_writer_service = get_message_writer_service()
+            if not message_writer_service.is_started():
+                message_writer_service.start()
+            auth_service = get_auth_service()
+            if not auth_service.is_started():
+                auth_service.start()
             logger.debug(f"Flows loaded in {asyncio.get_event_loop().time() - current_time:.2f}s")
 
             current_time = asyncio.get_event_loop().time()
@@ -35,8 +35,11 @@ def _get_variable_query(
     if flow_id:
         stmt = stmt.where(MessageTable.flow_id == flow_id)
     if order_by:
-        col = getattr(MessageTable, order_by).desc() if order == "DESC" else getattr(MessageTable, order_by).asc()
-        stmt = stmt.order_by(col)
+        order_col = getattr(MessageTable, order_by).desc() if order == "DESC" else getattr(MessageTable, order_by).asc()
+        stmt = stmt.order_by(order_col)
+        if order_by == "timestamp":
+            # Messages stored in the same second come back in the order they were stored
+            stmt = stmt.order_by(col(MessageTable.inserted_at).asc())
     if limit:
         stmt = stmt.limit(limit)
     return stmt
@@ -96,7 +99,39 @@ async def aget_messages(
     async with session_scope() as session:
         stmt = _get_variable_query(sender, sender_name, session_id, order_by, order, flow_id, limit)
         messages = await session.exec(stmt)
-        return [await Message.create(**d.model_dump()) for d in messages]
+        return [await Message.create(**d.model_dump(exclude={"inserted_at"})) for d in messages]
+
+
+async def aget_last_messages(
+    session_id: str | UUID,
+    limit: int,
+    sender: str | None = None,
+    sender_name: str | None = None,
+    flow_id: UUID | None = None,
+) -> list[Message]:
+    """Retrieves the last `limit` messages of a session, oldest first.
+
+    The messages are read newest first through the message history indexes, so the query reads
+    `limit` rows whatever the size of the history.
+
+    Args:
+        session_id (str): The session ID associated with the messages.
+        limit (int): The number of messages to retrieve.
+        sender (Optional[str]): The sender of the messages (e.g., "Machine" or "User")
+        sender_name (Optional[str]): The name of the sender.
+        flow_id (Optional[UUID]): The flow ID associated with the messages.
+
+    Returns:
+        List[Message]: The last messages of the session, in chronological order.
+    """
+    if limit <= 0:
+        return []
+    stmt = _get_variable_query(sender, sender_name, session_id, None, None, flow_id, limit).order_by(
+        col(MessageTable.timestamp).desc(), col(MessageTable.inserted_at).desc()
+    )
+    async with session_scope() as session:
+        messages = (await session.exec(stmt)).all()
+        return [await Message.create(**message.model_dump(exclude={"inserted_at"})) for message in reversed(messages)]
 
 
 def add_messages(messages: Message | list[Message], flow_id: str | UUID | None = None):
@@ -121,7 +156,7 @@ async def aadd_messages(messages: Message | list[Message], flow_id: str | UUID |
         messages_models = [MessageTable.from_message(msg, flow_id=flow_id) for msg in messages]
         async with session_scope() as session:
             messages_models = await aadd_messagetables(messages_models, session)
-        return [await Message.create(**message.model_dump()) for message in messages_models]
+        return [await Message.create(**message.model_dump(exclude={"inserted_at"})) for message in messages_models]
     except Exception as e:
         logger.exception(e)
         raise
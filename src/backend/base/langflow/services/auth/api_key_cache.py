@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from cachetools import TTLCache
+
+from langflow.services.database.models.user.model import User
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+API_KEY_CACHE_MAX_ENTRIES = 10_000
+
+
+def hash_api_key(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedApiKey:
+    api_key_id: UUID
+    user_id: UUID
+    user_data: dict[str, Any]
+
+    def user(self) -> User:
+        """Returns a new, detached copy of the user that owns the key."""
+        return User(**self.user_data)
+
+
+class ApiKeyAuthCache:
+    """TTL cache of the API keys that authenticated successfully, keyed by the SHA-256 of the key.
+
+    Keys are only stored hashed. Deleting a key or updating its user removes the matching entries
+    in this process; other processes see the change after at most `ttl` seconds.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = API_KEY_CACHE_MAX_ENTRIES) -> None:
+        self.ttl = ttl
+        self._entries: TTLCache[str, CachedApiKey] | None = TTLCache(maxsize=max_entries, ttl=ttl) if ttl else None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._entries is not None
+
+    def get(self, api_key: str) -> CachedApiKey | None:
+        if self._entries is None:
+            return None
+        with self._lock:
+            cached = self._entries.get(hash_api_key(api_key))
+            if cached is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return cached
+
+    def set(self, api_key: str, api_key_id: UUID, user: User) -> None:
+        if self._entries is None:
+            return
+        cached = CachedApiKey(api_key_id=api_key_id, user_id=user.id, user_data=user.model_dump())
+        with self._lock:
+            self._entries[hash_api_key(api_key)] = cached
+
+    def invalidate_key(self, api_key_id: UUID) -> None:
+        self._invalidate(lambda cached: str(cached.api_key_id) == str(api_key_id))
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        self._invalidate(lambda cached: str(cached.user_id) == str(user_id))
+
+    def clear(self) -> None:
+        if self._entries is not None:
+            with self._lock:
+                self._entries.clear()
+
+    def stats(self) -> dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries) if self._entries is not None else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def _invalidate(self, predicate) -> None:
+        if self._entries is None:
+            return
+        with self._lock:
+            for key in [key for key, cached in self._entries.items() if predicate(cached)]:
+                self._entries.pop(key, None)
+
+
+@dataclass
+class ApiKeyUsage:
+    uses: int
+    last_used_at: datetime
+
+
+class ApiKeyUsageCounter:
+    """Aggregates the uses of each API key in memory until they are written in bulk."""
+
+    def __init__(self) -> None:
+        self._pending: dict[UUID, ApiKeyUsage] = {}
+        self._oldest_pending: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record(self, api_key_id: UUID) -> None:
+        now = datetime.now(timezone.utc)
+        if (usage := self._pending.get(api_key_id)) is None:
+            self._pending[api_key_id] = ApiKeyUsage(uses=1, last_used_at=now)
+        else:
+            usage.uses += 1
+            usage.last_used_at = now
+        if self._oldest_pending is None:
+            self._oldest_pending = time.monotonic()
+
+    def pop_all(self) -> tuple[dict[UUID, ApiKeyUsage], float]:
+        """Returns the pending uses and the seconds since the oldest of them was recorded."""
+        pending, self._pending = self._pending, {}
+        lag = time.monotonic() - self._oldest_pending if self._oldest_pending is not None else 0.0
+        self._oldest_pending = None
+        return pending, lag
+
+    def restore(self, pending: dict[UUID, ApiKeyUsage]) -> None:
+        """Puts back uses that could not be written, merging them with the ones recorded since."""
+        for api_key_id, usage in pending.items():
+            if (current := self._pending.get(api_key_id)) is None:
+                self._pending[api_key_id] = usage
+            else:
+                current.uses += usage.uses
+                current.last_used_at = max(current.last_used_at, usage.last_used_at)
+        if pending and self._oldest_pending is None:
+            self._oldest_pending = time.monotonic()
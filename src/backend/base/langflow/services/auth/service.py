@@ -1,15 +1,122 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from typing import TYPE_CHECKING
 
+from loguru import logger
+
+from langflow.services.auth.api_key_cache import ApiKeyAuthCache, ApiKeyUsageCounter
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from langflow.services.settings.service import SettingsService
+    from langflow.services.telemetry.opentelemetry import OpenTelemetry
 
 
 class AuthService(Service):
+    """Caches API key authentications and writes API key usage in bulk.
+
+    Successful API key checks are cached for `api_key_cache_ttl` seconds. While the service is started,
+    the uses of each key are counted in memory and written every `api_key_usage_flush_interval` seconds
+    with a single UPDATE, instead of one transaction per request.
+
+    Example:
+        service = AuthService(settings_service)
+        service.start()
+        service.record_api_key_use(api_key_id)
+        await service.stop()  # writes the pending uses
+    """
+
     name = "auth_service"
 
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        settings = settings_service.settings
+        self.api_key_cache = ApiKeyAuthCache(ttl=settings.api_key_cache_ttl)
+        self.usage_counter = ApiKeyUsageCounter()
+        self.flush_interval = settings.api_key_usage_flush_interval
+        self._flush_task: asyncio.Task | None = None
+        self._ot: OpenTelemetry | None = None
+        self.flushes = 0
+        self.failed_flushes = 0
+        self.last_flush_lag = 0.0
+
+    def is_started(self) -> bool:
+        return self._flush_task is not None and not self._flush_task.done()
+
+    def start(self) -> None:
+        if self.is_started():
+            return
+        self._flush_task = asyncio.create_task(self._flush_periodically())
+        logger.debug("AuthService started")
+
+    async def stop(self) -> None:
+        """Stop the periodic flush after writing the pending API key uses."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush_api_key_usage()
+
+    async def teardown(self) -> None:
+        await self.stop()
+
+    def record_api_key_use(self, api_key_id: UUID) -> None:
+        self.usage_counter.record(api_key_id)
+
+    def record_cache_lookup(self, *, hit: bool) -> None:
+        if (metrics := self._metrics()) is not None:
+            metrics.increment_counter("api_key_auth_cache_lookups", {"result": "hit" if hit else "miss"})
+
+    async def flush_api_key_usage(self) -> None:
+        """Write the pending API key uses with a single UPDATE."""
+        # Keep it here to avoid import errors
+        from langflow.services.database.models.api_key.crud import add_api_key_uses
+        from langflow.services.database.utils import session_getter
+        from langflow.services.deps import get_db_service
+
+        if not len(self.usage_counter):
+            return
+        pending, lag = self.usage_counter.pop_all()
+        try:
+            async with session_getter(get_db_service()) as session:
+                await add_api_key_uses(session, pending)
+        except Exception:  # noqa: BLE001
+            self.failed_flushes += 1
+            self.usage_counter.restore(pending)
+            logger.exception(f"Error writing the usage of {len(pending)} API keys")
+            status = "error"
+        else:
+            self.flushes += 1
+            self.last_flush_lag = lag
+            status = "ok"
+        if (metrics := self._metrics()) is not None:
+            metrics.observe_histogram("api_key_usage_flush_lag", lag, {"status": status})
+
+    def stats(self) -> dict[str, float]:
+        return {
+            **self.api_key_cache.stats(),
+            "pending_usage": len(self.usage_counter),
+            "flushes": self.flushes,
+            "failed_flushes": self.failed_flushes,
+            "last_flush_lag": self.last_flush_lag,
+        }
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush_api_key_usage()
+
+    def _metrics(self) -> OpenTelemetry | None:
+        if self._ot is None:
+            try:
+                from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+                self._ot = OpenTelemetry(prometheus_enabled=self.settings_service.settings.prometheus_enabled)
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug("Error initializing the auth metrics")
+        return self._ot
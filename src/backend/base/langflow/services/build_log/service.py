@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from sqlalchemy.exc import DataError, IntegrityError
+
+from langflow.services.base import Service
+from langflow.services.database.models.transactions.crud import log_transactions, trim_transactions
+from langflow.services.database.models.transactions.model import TransactionBase
+from langflow.services.database.models.vertex_builds.crud import log_vertex_builds, trim_vertex_builds
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase
+from langflow.services.database.utils import session_getter
+from langflow.services.deps import get_db_service
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from uuid import UUID
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from langflow.services.settings.service import SettingsService
+
+BuildLogItem = VertexBuildBase | TransactionBase
+
+_STOP = object()
+
+
+class BuildLogService(Service):
+    """Writes vertex builds and transactions to the database in batches from a background task.
+
+    Items are queued by `log_vertex_build` and `log_transaction` and written with one bulk insert per
+    batch. A batch is written when it reaches `build_log_batch_size` items or `build_log_flush_interval`
+    seconds after its first item. When an item violates a constraint, the items of its insert are written
+    one by one and only the invalid ones are dropped. The history limits are enforced every
+    `build_log_trim_interval` seconds for the flows written since the previous trim, instead of on every
+    insert.
+
+    When the queue is full, `build_log_overflow_policy` decides whether `add` waits for room ("block")
+    or discards the item ("drop").
+
+    Example:
+        service = BuildLogService(settings_service)
+        service.start()
+        await service.add(vertex_build)
+        await service.stop()  # writes everything still queued
+    """
+
+    name = "build_log_service"
+
+    def __init__(self, settings_service: SettingsService) -> None:
+        settings = settings_service.settings
+        self.batch_size = settings.build_log_batch_size
+        self.flush_interval = settings.build_log_flush_interval
+        self.trim_interval = settings.build_log_trim_interval
+        self.overflow_policy = settings.build_log_overflow_policy
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=settings.build_log_queue_size)
+        self._batch_ready = asyncio.Event()
+        self._worker_task: asyncio.Task | None = None
+        self._stopping = False
+        self._flows_to_trim: set[UUID] = set()
+        self._vertices_to_trim: dict[UUID, set[str]] = defaultdict(set)
+        self._last_trim = time.monotonic()
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+    def is_started(self) -> bool:
+        return self._worker_task is not None and not self._worker_task.done()
+
+    def start(self) -> None:
+        if self.is_started():
+            return
+        self._worker_task = asyncio.create_task(self._worker())
+        logger.debug("BuildLogService started")
+
+    async def stop(self) -> None:
+        """Stop the background writer after it writes everything that is queued."""
+        task, self._worker_task = self._worker_task, None
+        if task is None:
+            return
+        if not task.done():
+            self._stopping = True
+            await self._queue.put(_STOP)
+            self._batch_ready.set()
+            await task
+            self._stopping = False
+        await self._trim()
+        logger.debug("BuildLogService stopped")
+
+    async def teardown(self) -> None:
+        await self.stop()
+
+    async def add(self, item: BuildLogItem) -> bool:
+        """Queue a vertex build or transaction to be written.
+
+        Returns:
+            bool: False if the item was dropped because the queue is full.
+        """
+        if self.overflow_policy == "drop":
+            try:
+                self._queue.put_nowait(item)
+            except asyncio.QueueFull:
+                self.dropped += 1
+                if self.dropped == 1 or self.dropped % 1000 == 0:
+                    logger.warning(f"Build log queue is full. {self.dropped} items dropped so far.")
+                return False
+        else:
+            await self._queue.put(item)
+        if self._queue.qsize() >= self.batch_size:
+            self._batch_ready.set()
+        return True
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+    async def _worker(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [await self._queue.get()]
+            if self._queue.qsize() + 1 < self.batch_size and not self._stopping:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+            self._batch_ready.clear()
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if _STOP in batch:
+                stopping = True
+                # Everything queued before the stop request is written before exiting
+                batch = [item for item in batch if item is not _STOP]
+                while not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+            await self._write(batch)
+            if time.monotonic() - self._last_trim >= self.trim_interval:
+                await self._trim()
+
+    async def _write(self, batch: list[BuildLogItem]) -> None:
+        for start in range(0, len(batch), self.batch_size):
+            chunk = batch[start : start + self.batch_size]
+            vertex_builds = [item for item in chunk if isinstance(item, VertexBuildBase)]
+            transactions = [item for item in chunk if isinstance(item, TransactionBase)]
+            written = self.written
+            if vertex_builds:
+                await self._insert(vertex_builds, log_vertex_builds)
+            if transactions:
+                await self._insert(transactions, log_transactions)
+            if self.written > written:
+                self.batches += 1
+
+    async def _insert(self, items: list, log_items: Callable[[AsyncSession, list], Awaitable]) -> None:
+        """Write items with one insert, or one by one when an invalid item makes the insert fail."""
+        try:
+            async with session_getter(get_db_service()) as session:
+                await log_items(session, items)
+        except (IntegrityError, DataError):
+            if len(items) == 1:
+                self.failed += 1
+                logger.exception(f"Error writing a build log item of flow {items[0].flow_id}")
+                return
+            # An invalid item rolls back the whole insert, so the items are written one by one to drop only it
+            logger.opt(exception=True).warning(f"Error writing {len(items)} build log items, retrying one by one")
+            for item in items:
+                await self._insert([item], log_items)
+            return
+        except Exception:  # noqa: BLE001
+            self.failed += len(items)
+            logger.exception(f"Error writing {len(items)} build log items")
+            return
+        self._mark_written(items)
+
+    def _mark_written(self, items: list[BuildLogItem]) -> None:
+        self.written += len(items)
+        for item in items:
+            if isinstance(item, VertexBuildBase):
+                self._vertices_to_trim[item.flow_id].add(item.id)
+            else:
+                self._flows_to_trim.add(item.flow_id)
+
+    async def _trim(self) -> None:
+        self._last_trim = time.monotonic()
+        flows_to_trim, self._flows_to_trim = self._flows_to_trim, set()
+        vertices_to_trim, self._vertices_to_trim = self._vertices_to_trim, defaultdict(set)
+        if not flows_to_trim and not vertices_to_trim:
+            return
+        try:
+            async with session_getter(get_db_service()) as session:
+                if vertices_to_trim:
+                    await trim_vertex_builds(session, vertices_to_trim)
+                if flows_to_trim:
+                    await trim_transactions(session, list(flows_to_trim))
+        except Exception:  # noqa: BLE001
+            logger.exception("Error trimming the build log history")
@@ -1,4 +1,6 @@
 from langflow.services.cache.service import AsyncInMemoryCache, CacheService, RedisCache, ThreadingInMemoryCache
+from langflow.services.cache.sharded import ShardedInMemoryCache
+from langflow.services.cache.tiered import TieredCache
 
 from . import factory, service
 
@@ -6,7 +8,9 @@ __all__ = [
     "AsyncInMemoryCache",
     "CacheService",
     "RedisCache",
+    "ShardedInMemoryCache",
     "ThreadingInMemoryCache",
+    "TieredCache",
     "factory",
     "service",
 ]
@@ -4,6 +4,7 @@ import threading
 from typing import Generic, TypeVar
 
 from langflow.services.base import Service
+from langflow.services.cache.utils import CACHE_MISS
 
 LockType = TypeVar("LockType", bound=threading.Lock)
 AsyncLockType = TypeVar("AsyncLockType", bound=asyncio.Lock)
@@ -168,6 +169,25 @@ class AsyncBaseCacheService(Service, Generic[AsyncLockType]):
             True if the key is in the cache, False otherwise.
         """
 
+    async def touch(self, keys: list, lock: AsyncLockType | None = None) -> list:
+        """Restart the expiration time of items without changing them.
+
+        Args:
+            keys: The keys of the items.
+            lock: A lock to use for the operation.
+
+        Returns:
+            The keys that are not in the cache.
+        """
+        missing = []
+        for key in keys:
+            value = await self.get(key, lock=lock)
+            if value is CACHE_MISS:
+                missing.append(key)
+            else:
+                await self.set(key, value, lock=lock)
+        return missing
+
 
 class ExternalAsyncBaseCacheService(AsyncBaseCacheService):
     """Abstract base class for an external async cache."""
@@ -1,5 +1,4 @@
 import asyncio
-import pickle
 import time
 from typing import Generic
 
@@ -7,11 +6,14 @@ from diskcache import Cache
 from loguru import logger
 
 from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType
+from langflow.services.cache.serialization import CacheSerializer
 from langflow.services.cache.utils import CACHE_MISS
 
 
 class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
-    def __init__(self, cache_dir, max_size=None, expiration_time=3600) -> None:
+    def __init__(
+        self, cache_dir, max_size=None, expiration_time=3600, serializer: CacheSerializer | None = None
+    ) -> None:
         self.cache = Cache(cache_dir)
         # Let's clear the cache for now to maintain a similar
         # behavior as the in-memory cache
@@ -22,6 +24,7 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         self.lock = asyncio.Lock()
         self.max_size = max_size
         self.expiration_time = expiration_time
+        self.serializer = serializer or CacheSerializer(fallback="pickle")
 
     async def get(self, key, lock: asyncio.Lock | None = None):
         if not lock:
@@ -35,7 +38,7 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
         if item:
             if time.time() - item["time"] < self.expiration_time:
                 self.cache.touch(key)  # Refresh the expiry time
-                return pickle.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
+                return self.serializer.loads(item["value"]) if isinstance(item["value"], bytes) else item["value"]
             logger.info(f"Cache item for key '{key}' has expired and will be deleted.")
             self.cache.delete(key)  # Log before deleting the expired item
         return CACHE_MISS
@@ -50,7 +53,7 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
     async def _set(self, key, value) -> None:
         if self.max_size and len(self.cache) >= self.max_size:
             await asyncio.to_thread(self.cache.cull)
-        item = {"value": pickle.dumps(value) if not isinstance(value, str | bytes) else value, "time": time.time()}
+        item = {"value": self.serializer.dumps(value) if not isinstance(value, str) else value, "time": time.time()}
         await asyncio.to_thread(self.cache.set, key, item)
 
     async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
@@ -90,6 +93,27 @@ class AsyncDiskCache(AsyncBaseCacheService, Generic[AsyncLockType]):
     async def contains(self, key) -> bool:
         return await asyncio.to_thread(self.cache.__contains__, key)
 
+    async def touch(self, keys: list, lock: asyncio.Lock | None = None) -> list:
+        if not lock:
+            async with self.lock:
+                return await asyncio.to_thread(self._touch, keys)
+        return await asyncio.to_thread(self._touch, keys)
+
+    def _touch(self, keys: list) -> list:
+        missing = []
+        now = time.time()
+        for key in keys:
+            item = self.cache.get(key, default=None)
+            if not item or now - item["time"] >= self.expiration_time:
+                missing.append(key)
+            else:
+                self.cache.set(key, {**item, "time": now})
+        return missing
+
+    def serialization_stats(self) -> dict[str, dict[str, float]]:
+        """Return the serialization counters grouped by value type."""
+        return self.serializer.stats.to_dict()
+
     async def teardown(self) -> None:
         # Clean up the cache directory
         self.cache.clear(retry=True)
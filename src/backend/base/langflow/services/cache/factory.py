@@ -6,7 +6,10 @@ from typing_extensions import override
 
 from langflow.logging.logger import logger
 from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.serialization import CacheSerializer
 from langflow.services.cache.service import AsyncInMemoryCache, CacheService, RedisCache, ThreadingInMemoryCache
+from langflow.services.cache.sharded import ShardedInMemoryCache
+from langflow.services.cache.tiered import TieredCache
 from langflow.services.factory import ServiceFactory
 
 if TYPE_CHECKING:
@@ -24,21 +27,52 @@ class CacheServiceFactory(ServiceFactory):
 
         if settings_service.settings.cache_type == "redis":
             logger.debug("Creating Redis cache")
-            return RedisCache(
-                host=settings_service.settings.redis_host,
-                port=settings_service.settings.redis_port,
-                db=settings_service.settings.redis_db,
-                url=settings_service.settings.redis_url,
-                expiration_time=settings_service.settings.redis_cache_expire,
+            return self._create_redis_cache(settings_service)
+        if settings_service.settings.cache_type == "tiered":
+            logger.debug("Creating tiered in-memory and Redis cache")
+            return TieredCache(
+                self._create_redis_cache(settings_service),
+                l1_max_size=settings_service.settings.tiered_cache_l1_max_size,
+                l1_max_memory=settings_service.settings.cache_max_memory,
+                write_mode=settings_service.settings.tiered_cache_write_mode,
+                write_behind_interval=settings_service.settings.tiered_cache_write_behind_interval,
+                invalidation_channel=settings_service.settings.tiered_cache_invalidation_channel,
             )
 
         if settings_service.settings.cache_type == "memory":
             return ThreadingInMemoryCache(expiration_time=settings_service.settings.cache_expire)
         if settings_service.settings.cache_type == "async":
             return AsyncInMemoryCache(expiration_time=settings_service.settings.cache_expire)
+        if settings_service.settings.cache_type == "sharded":
+            return ShardedInMemoryCache(
+                num_shards=settings_service.settings.cache_shards,
+                max_memory=settings_service.settings.cache_max_memory,
+                expiration_time=settings_service.settings.cache_expire,
+                sweep_interval=settings_service.settings.cache_sweep_interval,
+            )
         if settings_service.settings.cache_type == "disk":
             return AsyncDiskCache(
                 cache_dir=settings_service.settings.config_dir,
                 expiration_time=settings_service.settings.cache_expire,
+                serializer=CacheSerializer(
+                    fallback="pickle",
+                    compression=settings_service.settings.cache_compression,
+                    compression_threshold=settings_service.settings.cache_compression_threshold,
+                ),
             )
         return None
+
+    @staticmethod
+    def _create_redis_cache(settings_service: SettingsService) -> RedisCache:
+        return RedisCache(
+            host=settings_service.settings.redis_host,
+            port=settings_service.settings.redis_port,
+            db=settings_service.settings.redis_db,
+            url=settings_service.settings.redis_url,
+            expiration_time=settings_service.settings.redis_cache_expire,
+            serializer=CacheSerializer(
+                fallback="dill",
+                compression=settings_service.settings.cache_compression,
+                compression_threshold=settings_service.settings.cache_compression_threshold,
+            ),
+        )
@@ -0,0 +1,251 @@
+"""Serializers used by the cache backends that store bytes (Redis and disk).
+
+Values are written with a small header so the reader knows how they were encoded::
+
+    b"LFC" | version | codec | compression | payload
+
+Plain data (dicts, lists, strings, numbers, datetimes and `Data` holding plain data) goes
+through orjson. Everything else falls back to dill or pickle. Payloads above a size threshold can be
+compressed with zstd or lz4 when those packages are installed, or with zlib otherwise.
+Values without the header are loaded with the fallback, so entries written before the
+header existed are still readable.
+"""
+
+from __future__ import annotations
+
+import math
+import pickle
+import threading
+import time
+import zlib
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Literal
+
+import dill
+import orjson
+from loguru import logger
+
+MAGIC = b"LFC"
+VERSION = 1
+HEADER_SIZE = len(MAGIC) + 3
+
+CODEC_PICKLE = 0
+CODEC_DILL = 1
+CODEC_JSON = 2
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZ4 = 2
+COMPRESSION_ZSTD = 3
+
+CompressionType = Literal["none", "zlib", "lz4", "zstd"]
+FallbackType = Literal["pickle", "dill"]
+
+MODEL_MARKER = "__lf_model__"
+MAX_STRUCTURED_DEPTH = 64
+
+
+def _get_structured_models() -> dict[str, type]:
+    from langflow.schema.data import Data
+
+    return {"Data": Data}
+
+
+class SerializationStats:
+    """Counters of the bytes written and the time spent serializing, grouped by value type."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, float]] = defaultdict(
+            lambda: {"count": 0, "bytes": 0, "raw_bytes": 0, "serialize_time": 0.0, "fallbacks": 0}
+        )
+
+    def record(self, key_type: str, *, raw_bytes: int, written_bytes: int, elapsed: float, fallback: bool) -> None:
+        with self._lock:
+            stats = self._stats[key_type]
+            stats["count"] += 1
+            stats["raw_bytes"] += raw_bytes
+            stats["bytes"] += written_bytes
+            stats["serialize_time"] += elapsed
+            stats["fallbacks"] += int(fallback)
+
+    def to_dict(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            return {key_type: dict(stats) for key_type, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+class CacheSerializer:
+    """Encodes cache values to bytes and back.
+
+    Args:
+        fallback: The serializer used for values the structured codec cannot handle.
+        compression: The compression algorithm for payloads larger than `compression_threshold`.
+        compression_threshold: Minimum payload size in bytes before compressing.
+        structured: Whether to try the orjson codec before the fallback.
+    """
+
+    def __init__(
+        self,
+        fallback: FallbackType = "pickle",
+        compression: CompressionType = "none",
+        compression_threshold: int = 4096,
+        *,
+        structured: bool = True,
+    ) -> None:
+        self.fallback = fallback
+        self.compression = _resolve_compression(compression)
+        self.compression_threshold = compression_threshold
+        self.structured = structured
+        self.stats = SerializationStats()
+
+    def dumps(self, value: Any) -> bytes:
+        start_time = time.perf_counter()
+        codec, payload = self._encode(value)
+        raw_size = len(payload)
+        compression = COMPRESSION_NONE
+        if self.compression != COMPRESSION_NONE and raw_size >= self.compression_threshold:
+            compression = self.compression
+            payload = _compress(compression, payload)
+        data = MAGIC + bytes((VERSION, codec, compression)) + payload
+        self.stats.record(
+            type(value).__name__,
+            raw_bytes=raw_size,
+            written_bytes=len(data),
+            elapsed=time.perf_counter() - start_time,
+            fallback=codec != CODEC_JSON,
+        )
+        return data
+
+    def loads(self, data: bytes) -> Any:
+        if not data.startswith(MAGIC) or len(data) < HEADER_SIZE:
+            return self._fallback_loads(data)
+        version, codec, compression = data[len(MAGIC) : HEADER_SIZE]
+        if version != VERSION:
+            msg = f"Unsupported cache serialization version: {version}"
+            raise ValueError(msg)
+        payload = _decompress(compression, data[HEADER_SIZE:])
+        if codec == CODEC_JSON:
+            return _decode_structured(orjson.loads(payload))
+        if codec == CODEC_DILL:
+            return dill.loads(payload)
+        if codec == CODEC_PICKLE:
+            return pickle.loads(payload)
+        msg = f"Unknown cache serialization codec: {codec}"
+        raise ValueError(msg)
+
+    def _encode(self, value: Any) -> tuple[int, bytes]:
+        if self.structured:
+            try:
+                return CODEC_JSON, orjson.dumps(_encode_structured(value, _get_structured_models()))
+            except (TypeError, ValueError):
+                pass
+        if self.fallback == "dill":
+            return CODEC_DILL, dill.dumps(value, recurse=True)
+        return CODEC_PICKLE, pickle.dumps(value)
+
+    def _fallback_loads(self, data: bytes) -> Any:
+        if self.fallback == "dill":
+            return dill.loads(data)
+        return pickle.loads(data)
+
+
+def _encode_structured(value: Any, models: dict[str, type], depth: int = 0) -> Any:
+    """Converts the value to plain JSON types, raising TypeError if that would lose information."""
+    if depth > MAX_STRUCTURED_DEPTH:
+        msg = "Value is too deeply nested for the structured codec"
+        raise ValueError(msg)
+    if value is None or type(value) in {str, int, bool}:
+        return value
+    if type(value) is float:
+        if not math.isfinite(value):
+            msg = "Non-finite floats are not supported by the structured codec"
+            raise ValueError(msg)
+        return value
+    if type(value) is list:
+        return [_encode_structured(item, models, depth + 1) for item in value]
+    if type(value) is dict:
+        if MODEL_MARKER in value or not all(type(key) is str for key in value):
+            msg = "Dictionary keys must be strings"
+            raise TypeError(msg)
+        return {key: _encode_structured(item, models, depth + 1) for key, item in value.items()}
+    if type(value) is datetime:
+        return {MODEL_MARKER: "datetime", "value": value.isoformat()}
+    model_name = type(value).__name__
+    if models.get(model_name) is type(value):
+        # Fields are read directly instead of through model_dump, which would turn nested models into dicts.
+        fields = {name: getattr(value, name) for name in type(value).model_fields}
+        return {MODEL_MARKER: model_name, "value": _encode_structured(fields, models, depth + 1)}
+    msg = f"Type {type(value).__name__} is not supported by the structured codec"
+    raise TypeError(msg)
+
+
+def _decode_structured(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_decode_structured(item) for item in value]
+    if isinstance(value, dict):
+        if value.get(MODEL_MARKER) == "datetime":
+            return datetime.fromisoformat(value["value"])
+        if MODEL_MARKER in value:
+            model = _get_structured_models()[value[MODEL_MARKER]]
+            return model.model_validate(_decode_structured(value["value"]))
+        return {key: _decode_structured(item) for key, item in value.items()}
+    return value
+
+
+def _resolve_compression(compression: CompressionType) -> int:
+    if compression == "none":
+        return COMPRESSION_NONE
+    if compression == "zlib":
+        return COMPRESSION_ZLIB
+    if compression == "lz4":
+        try:
+            import lz4.frame  # noqa: F401
+        except ImportError:
+            logger.warning("lz4 is not installed. Falling back to zlib compression for the cache.")
+            return COMPRESSION_ZLIB
+        return COMPRESSION_LZ4
+    if compression == "zstd":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            logger.warning("zstandard is not installed. Falling back to zlib compression for the cache.")
+            return COMPRESSION_ZLIB
+        return COMPRESSION_ZSTD
+    msg = f"Unknown cache compression: {compression}"
+    raise ValueError(msg)
+
+
+def _compress(compression: int, payload: bytes) -> bytes:
+    if compression == COMPRESSION_ZLIB:
+        return zlib.compress(payload, 1)
+    if compression == COMPRESSION_LZ4:
+        import lz4.frame
+
+        return lz4.frame.compress(payload)
+    if compression == COMPRESSION_ZSTD:
+        import zstandard
+
+        return zstandard.ZstdCompressor(level=3).compress(payload)
+    return payload
+
+
+def _decompress(compression: int, payload: bytes) -> bytes:
+    if compression == COMPRESSION_NONE:
+        return payload
+    if compression == COMPRESSION_ZLIB:
+        return zlib.decompress(payload)
+    if compression == COMPRESSION_LZ4:
+        import lz4.frame
+
+        return lz4.frame.decompress(payload)
+    if compression == COMPRESSION_ZSTD:
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompress(payload)
+    msg = f"Unknown cache compression: {compression}"
+    raise ValueError(msg)
@@ -5,7 +5,6 @@ import time
 from collections import OrderedDict
 from typing import Generic, Union
 
-import dill
 from loguru import logger
 from typing_extensions import override
 
@@ -16,6 +15,7 @@ from langflow.services.cache.base import (
     ExternalAsyncBaseCacheService,
     LockType,
 )
+from langflow.services.cache.serialization import CacheSerializer
 from langflow.services.cache.utils import CACHE_MISS
 
 
@@ -196,7 +196,16 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         b = cache["b"]
     """
 
-    def __init__(self, host="localhost", port=6379, db=0, url=None, expiration_time=60 * 60) -> None:
+    def __init__(
+        self,
+        host="localhost",
+        port=6379,
+        db=0,
+        url=None,
+        expiration_time=60 * 60,
+        serializer: CacheSerializer | None = None,
+        client=None,
+    ) -> None:
         """Initialize a new RedisCache instance.
 
         Args:
@@ -206,6 +215,10 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             url (str, optional): Redis URL.
             expiration_time (int, optional): Time in seconds after which a
                 cached item expires. Default is 1 hour.
+            serializer (CacheSerializer, optional): Serializer for the cached values.
+                Defaults to the structured codec with a dill fallback.
+            client (redis.asyncio.Redis, optional): An existing client to use instead of connecting
+                with the other arguments.
         """
         try:
             from redis.asyncio import StrictRedis
@@ -219,11 +232,19 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             "RedisCache is an experimental feature and may not work as expected."
             " Please report any issues to our GitHub repository."
         )
-        if url:
+        if client is not None:
+            self._client = client
+        elif url:
             self._client = StrictRedis.from_url(url)
         else:
             self._client = StrictRedis(host=host, port=port, db=db)
         self.expiration_time = expiration_time
+        self.serializer = serializer or CacheSerializer(fallback="dill")
+
+    @property
+    def client(self):
+        """The redis.asyncio client used by the cache."""
+        return self._client
 
     async def is_connected(self) -> bool:
         """Check if the Redis client is connected."""
@@ -242,12 +263,12 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
         if key is None:
             return CACHE_MISS
         value = await self._client.get(str(key))
-        return dill.loads(value) if value else CACHE_MISS
+        return self.serializer.loads(value) if value else CACHE_MISS
 
     @override
     async def set(self, key, value, lock=None) -> None:
         try:
-            if pickled := dill.dumps(value, recurse=True):
+            if pickled := self.serializer.dumps(value):
                 result = await self._client.setex(str(key), self.expiration_time, pickled)
                 if not result:
                     msg = "RedisCache could not set the value."
@@ -291,6 +312,21 @@ class RedisCache(ExternalAsyncBaseCacheService, Generic[LockType]):
             return False
         return bool(await self._client.exists(str(key)))
 
+    @override
+    async def touch(self, keys: list, lock=None) -> list:
+        """Restart the expiration time of keys with a single EXPIRE pipeline, without reading their values."""
+        if not keys:
+            return []
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.expire(str(key), self.expiration_time)
+            results = await pipe.execute()
+        return [key for key, found in zip(keys, results, strict=True) if not found]
+
+    def serialization_stats(self) -> dict[str, dict[str, float]]:
+        """Return the serialization counters grouped by value type."""
+        return self.serializer.stats.to_dict()
+
     def __repr__(self) -> str:
         """Return a string representation of the RedisCache instance."""
         return f"RedisCache(expiration_time={self.expiration_time})"
@@ -0,0 +1,324 @@
+"""In-memory cache split into lock-striped shards with a memory budget.
+
+Each key is assigned to one of `num_shards` shards by its hash. A shard keeps its entries in LRU order
+behind its own lock, so operations on keys of different shards never wait on each other. Every entry
+records an approximate size in bytes; when a shard goes above its share of `max_memory` (or of
+`max_size` entries) the least recently used entries of that shard are evicted.
+
+Entries expire `expiration_time` seconds after they are set, or after the `ttl` given to `set`.
+Expired entries are removed when they are read and by a background sweep.
+
+Sizes are estimated by walking the value. Small values are walked inline; a value with more than
+`INLINE_SIZE_ESTIMATE_OBJECTS` objects is walked again in a worker thread, so that caching a large
+graph does not block the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from typing import Any, Generic
+
+from loguru import logger
+from pydantic import BaseModel
+
+from langflow.services.cache.base import AsyncBaseCacheService, AsyncLockType
+from langflow.services.cache.utils import CACHE_MISS
+
+DEFAULT_NUM_SHARDS = 16
+MAX_SIZE_ESTIMATE_OBJECTS = 50_000
+INLINE_SIZE_ESTIMATE_OBJECTS = 1_000
+
+_SIZE_SKIPPED_TYPES = (type, type(sys), type(len), type(lambda: None), type(threading.Lock()))
+
+
+def estimate_size(value: Any, max_objects: int = MAX_SIZE_ESTIMATE_OBJECTS) -> int:
+    """Approximates the memory held by a value by walking its containers and attributes.
+
+    Objects reachable from several places are counted once. The walk stops after `max_objects`
+    objects, so the result is a lower bound for very large values.
+    """
+    return _walk_size(value, max_objects)[0]
+
+
+def _walk_size(value: Any, max_objects: int) -> tuple[int, bool]:
+    """Return the estimated size of a value and whether every object reachable from it was walked."""
+    seen: set[int] = set()
+    stack = [value]
+    total = 0
+    while stack and len(seen) < max_objects:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SIZE_SKIPPED_TYPES):
+            continue
+        seen.add(id(obj))
+        try:
+            total += sys.getsizeof(obj)
+        except TypeError:
+            continue
+        if isinstance(obj, str | bytes | bytearray | int | float | bool) or obj is None:
+            continue
+        if isinstance(obj, Mapping):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, list | tuple | set | frozenset):
+            stack.extend(obj)
+        elif isinstance(obj, BaseModel):
+            stack.extend(obj.__dict__.values())
+        else:
+            if (attributes := getattr(obj, "__dict__", None)) is not None:
+                stack.append(attributes)
+            stack.extend(getattr(obj, slot, None) for slot in getattr(type(obj), "__slots__", ()))
+    return total, not stack
+
+
+class _Entry:
+    __slots__ = ("expires_at", "size", "value")
+
+    def __init__(self, value: Any, size: int, expires_at: float | None) -> None:
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+
+    def is_expired(self, now: float) -> bool:
+        return self.expires_at is not None and now >= self.expires_at
+
+
+class _Shard:
+    __slots__ = ("bytes", "entries", "evictions", "expirations", "hits", "lock", "misses")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[Any, _Entry] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def pop(self, key) -> _Entry | None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+        return entry
+
+    def get_live(self, key, now: float) -> _Entry | None:
+        entry = self.entries.get(key)
+        if entry is not None and entry.is_expired(now):
+            self.pop(key)
+            self.expirations += 1
+            return None
+        return entry
+
+    def sweep(self, now: float) -> int:
+        expired = [key for key, entry in self.entries.items() if entry.is_expired(now)]
+        for key in expired:
+            self.pop(key)
+        self.expirations += len(expired)
+        return len(expired)
+
+
+class ShardedInMemoryCache(AsyncBaseCacheService, Generic[AsyncLockType]):
+    """An in-memory cache with lock-striped shards, a memory budget and per-key expiration.
+
+    Args:
+        num_shards: Number of shards the keys are spread over.
+        max_size: Maximum number of entries, split evenly between the shards.
+        max_memory: Approximate maximum size of the cached values in bytes, split evenly between the shards.
+        expiration_time: Default time in seconds after which an entry expires. None disables expiration.
+        sweep_interval: Seconds between background sweeps of expired entries. None or 0 disables the sweep.
+        sizeof: Function returning the size of a value in bytes. Defaults to `estimate_size`.
+
+    Example:
+        cache = ShardedInMemoryCache(num_shards=8, max_memory=512 * 1024 * 1024, expiration_time=3600)
+        await cache.set("graph", graph)
+        await cache.set("token", token, ttl=60)
+        graph = await cache.get("graph")
+    """
+
+    def __init__(
+        self,
+        num_shards: int = DEFAULT_NUM_SHARDS,
+        max_size: int | None = None,
+        max_memory: int | None = None,
+        expiration_time: float | None = 3600,
+        sweep_interval: float | None = 60,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        if num_shards < 1:
+            msg = "num_shards must be at least 1"
+            raise ValueError(msg)
+        self.num_shards = num_shards
+        self.max_size = max_size
+        self.max_memory = max_memory
+        self.expiration_time = expiration_time
+        self.sweep_interval = sweep_interval
+        self.sizeof = sizeof
+        self._shards = [_Shard() for _ in range(num_shards)]
+        self._shard_max_size = -(-max_size // num_shards) if max_size else None
+        self._shard_max_memory = max_memory // num_shards if max_memory else None
+        self._sweep_task: asyncio.Task | None = None
+
+    async def get(self, key, lock: asyncio.Lock | None = None):
+        async with lock or contextlib.nullcontext():
+            return self._get(key)
+
+    async def set(
+        self, key, value, lock: asyncio.Lock | None = None, *, ttl: float | None = None, size: int | None = None
+    ) -> None:
+        """Add an item to the cache.
+
+        Args:
+            key: The key of the item.
+            value: The value to cache.
+            lock: A lock to use for the operation.
+            ttl: Seconds until this item expires, instead of `expiration_time`.
+            size: Size of the value in bytes, when the caller already knows it. Computed with `sizeof` otherwise.
+        """
+        async with lock or contextlib.nullcontext():
+            # The size is computed outside the shard lock because walking a large value can take a while
+            if size is None:
+                size = await self._sizeof(value)
+            self._set(key, value, ttl, size)
+
+    async def upsert(self, key, value, lock: asyncio.Lock | None = None, *, ttl: float | None = None) -> None:
+        async with lock or contextlib.nullcontext():
+            value = self._merge(key, value)
+            self._set(key, value, ttl, await self._sizeof(value))
+
+    async def delete(self, key, lock: asyncio.Lock | None = None) -> None:
+        shard = self._shard(key)
+        async with lock or contextlib.nullcontext():
+            with shard.lock:
+                shard.pop(key)
+
+    async def clear(self, lock: asyncio.Lock | None = None) -> None:
+        async with lock or contextlib.nullcontext():
+            for shard in self._shards:
+                with shard.lock:
+                    shard.entries.clear()
+                    shard.bytes = 0
+
+    async def contains(self, key) -> bool:
+        shard = self._shard(key)
+        with shard.lock:
+            return shard.get_live(key, time.monotonic()) is not None
+
+    def sweep(self) -> int:
+        """Remove the expired entries of every shard, one shard at a time.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += shard.sweep(time.monotonic())
+        return removed
+
+    def stats(self) -> dict[str, int | None]:
+        """Return the hit, miss, eviction and expiration counters with the current entries and bytes."""
+        counters = dict.fromkeys(("entries", "bytes", "hits", "misses", "evictions", "expirations"), 0)
+        for shard in self._shards:
+            with shard.lock:
+                counters["entries"] += len(shard.entries)
+                counters["bytes"] += shard.bytes
+                counters["hits"] += shard.hits
+                counters["misses"] += shard.misses
+                counters["evictions"] += shard.evictions
+                counters["expirations"] += shard.expirations
+        return {**counters, "max_memory": self.max_memory, "max_size": self.max_size}
+
+    async def teardown(self) -> None:
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sweep_task
+            self._sweep_task = None
+
+    def __len__(self) -> int:
+        return sum(len(shard.entries) for shard in self._shards)
+
+    def __repr__(self) -> str:
+        return (
+            f"ShardedInMemoryCache(num_shards={self.num_shards}, max_size={self.max_size}, "
+            f"max_memory={self.max_memory}, expiration_time={self.expiration_time})"
+        )
+
+    def _shard(self, key) -> _Shard:
+        return self._shards[hash(key) % self.num_shards]
+
+    def _get(self, key):
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.get_live(key, time.monotonic())
+            if entry is None:
+                shard.misses += 1
+                return CACHE_MISS
+            shard.entries.move_to_end(key)
+            shard.hits += 1
+            return entry.value
+
+    async def _sizeof(self, value) -> int:
+        if self.sizeof is not estimate_size:
+            return self.sizeof(value)
+        size, complete = _walk_size(value, INLINE_SIZE_ESTIMATE_OBJECTS)
+        if complete:
+            return size
+        return await asyncio.to_thread(estimate_size, value)
+
+    def _set(self, key, value, ttl: float | None, size: int) -> None:
+        self._store(key, value, size, ttl)
+        self._ensure_sweep_task()
+
+    def _merge(self, key, value):
+        """Return the cached dict of `key` updated with `value`, or `value` if there is no dict to update."""
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.get_live(key, time.monotonic())
+            if entry is not None and isinstance(entry.value, dict) and isinstance(value, dict):
+                entry.value.update(value)
+                return entry.value
+        return value
+
+    def _store(self, key, value, size: int, ttl: float | None) -> None:
+        ttl = self.expiration_time if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        shard = self._shard(key)
+        with shard.lock:
+            shard.pop(key)
+            shard.entries[key] = _Entry(value, size, expires_at)
+            shard.bytes += size
+            self._evict(shard, key)
+
+    def _evict(self, shard: _Shard, new_key) -> None:
+        while len(shard.entries) > 1 and (
+            (self._shard_max_size and len(shard.entries) > self._shard_max_size)
+            or (self._shard_max_memory and shard.bytes > self._shard_max_memory)
+        ):
+            shard.pop(next(iter(shard.entries)))
+            shard.evictions += 1
+        if self._shard_max_memory and shard.bytes > self._shard_max_memory:
+            logger.warning(
+                f"Cache entry {new_key!r} uses about {shard.entries[new_key].size} bytes,"
+                f" more than the {self._shard_max_memory} bytes available to its shard"
+            )
+
+    def _ensure_sweep_task(self) -> None:
+        if not self.sweep_interval or (self._sweep_task is not None and not self._sweep_task.done()):
+            return
+        try:
+            self._sweep_task = asyncio.get_running_loop().create_task(self._sweep_periodically())
+        except RuntimeError:
+            # No running loop: expired entries are still removed when they are read
+            return
+
+    async def _sweep_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            if removed := self.sweep():
+                logger.debug(f"Removed {removed} expired cache entries")
@@ -0,0 +1,273 @@
+"""Two-level cache with a per-process in-memory cache (L1) in front of Redis (L2).
+
+Reads are served from L1 when possible and fall back to Redis, filling L1 with the loaded value.
+Every write to Redis is followed by a message on a pub/sub channel listing the changed keys, and
+every process drops those keys from its L1. L1 is only used while the process is subscribed to
+that channel, so a lost connection degrades to plain Redis reads instead of stale values.
+
+In "write-through" mode `set` returns after the value is in Redis. In "write-behind" mode the
+value is serialized right away but written to Redis in batches from a background task, so other
+processes can read the previous value for up to `write_behind_interval` seconds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import pickle
+import uuid
+from typing import TYPE_CHECKING, Generic, Literal
+
+import orjson
+from loguru import logger
+
+from langflow.services.cache.base import AsyncLockType, ExternalAsyncBaseCacheService
+from langflow.services.cache.sharded import ShardedInMemoryCache
+from langflow.services.cache.utils import CACHE_MISS
+
+if TYPE_CHECKING:
+    from langflow.services.cache.service import RedisCache
+
+DEFAULT_INVALIDATION_CHANNEL = "langflow:cache:invalidate"
+LISTENER_RETRY_DELAY = 1.0
+
+WriteMode = Literal["write-through", "write-behind"]
+
+
+class TieredCache(ExternalAsyncBaseCacheService, Generic[AsyncLockType]):
+    """A read-through cache that keeps recently used Redis values in process.
+
+    Args:
+        redis_cache: The Redis cache used as the second level.
+        l1_max_size: Maximum number of entries kept in process.
+        l1_max_memory: Approximate memory budget in bytes of the in-process entries, measured by their serialized size.
+        l1_expiration_time: Seconds an entry stays in process. Defaults to the expiration time of `redis_cache`.
+        write_mode: "write-through" or "write-behind".
+        write_behind_interval: Seconds between batched writes in "write-behind" mode.
+        invalidation_channel: The Redis pub/sub channel used to invalidate the in-process entries.
+
+    Like `RedisCache`, the cache never acquires the `lock` passed to its methods: callers such as
+    `Graph.get_next_runnable_vertices` already hold it.
+
+    Example:
+        cache = TieredCache(RedisCache(url="redis://localhost:6379"), l1_max_size=512)
+        await cache.set("graph", graph)
+        graph = await cache.get("graph")  # served from memory
+    """
+
+    def __init__(
+        self,
+        redis_cache: RedisCache,
+        l1_max_size: int = 1024,
+        l1_max_memory: int | None = None,
+        l1_expiration_time: float | None = None,
+        write_mode: WriteMode = "write-through",
+        write_behind_interval: float = 0.5,
+        invalidation_channel: str = DEFAULT_INVALIDATION_CHANNEL,
+    ) -> None:
+        if write_mode not in {"write-through", "write-behind"}:
+            msg = f"Unknown cache write mode: {write_mode}"
+            raise ValueError(msg)
+        self.l2 = redis_cache
+        self.serializer = redis_cache.serializer
+        self.l1 = ShardedInMemoryCache(
+            max_size=l1_max_size,
+            max_memory=l1_max_memory,
+            expiration_time=l1_expiration_time or redis_cache.expiration_time,
+            sweep_interval=None,
+        )
+        self.write_mode = write_mode
+        self.write_behind_interval = write_behind_interval
+        self.invalidation_channel = invalidation_channel
+        self.instance_id = uuid.uuid4().hex
+        self._pending: dict[str, bytes] = {}
+        self._listener_task: asyncio.Task | None = None
+        self._writer_task: asyncio.Task | None = None
+        self._listening = False
+        self._invalidations = 0
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+        self.write_failures = 0
+
+    @property
+    def expiration_time(self):
+        return self.l2.expiration_time
+
+    async def is_connected(self) -> bool:
+        return await self.l2.is_connected()
+
+    async def get(self, key, lock: asyncio.Lock | None = None):  # noqa: ARG002
+        if key is None:
+            return CACHE_MISS
+        key = str(key)
+        self._ensure_background_tasks()
+        if self._listening and (value := await self.l1.get(key)) is not CACHE_MISS:
+            self.l1_hits += 1
+            return value
+        if (payload := self._pending.get(key)) is not None:
+            self.l1_hits += 1
+            return self.serializer.loads(payload)
+        invalidations = self._invalidations
+        payload = await self.l2.client.get(key)
+        if not payload:
+            self.misses += 1
+            return CACHE_MISS
+        self.l2_hits += 1
+        value = self.serializer.loads(payload)
+        # A value read while another process invalidated keys may already be stale
+        if self._listening and invalidations == self._invalidations:
+            await self.l1.set(key, value, size=len(payload))
+        return value
+
+    async def set(self, key, value, lock: asyncio.Lock | None = None) -> None:  # noqa: ARG002
+        key = str(key)
+        self._ensure_background_tasks()
+        try:
+            payload = self.serializer.dumps(value)
+        except pickle.PicklingError as exc:
+            msg = "TieredCache only accepts values that can be pickled. "
+            raise TypeError(msg) from exc
+        if self.write_mode == "write-behind":
+            self._pending[key] = payload
+        else:
+            await self._write({key: payload})
+        if self._listening:
+            await self.l1.set(key, value, size=len(payload))
+
+    async def upsert(self, key, value, lock: asyncio.Lock | None = None) -> None:
+        """Inserts or updates a value in the cache.
+
+        If the existing value and the new value are both dictionaries, they are merged.
+        """
+        if key is None:
+            return
+        existing_value = await self.get(key, lock)
+        if existing_value is not CACHE_MISS and isinstance(existing_value, dict) and isinstance(value, dict):
+            existing_value.update(value)
+            value = existing_value
+        await self.set(key, value, lock)
+
+    async def delete(self, key, lock: asyncio.Lock | None = None) -> None:  # noqa: ARG002
+        key = str(key)
+        self._pending.pop(key, None)
+        await self.l1.delete(key)
+        async with self.l2.client.pipeline(transaction=False) as pipe:
+            pipe.delete(key)
+            pipe.publish(self.invalidation_channel, self._invalidation_message([key]))
+            await pipe.execute()
+
+    async def clear(self, lock: asyncio.Lock | None = None) -> None:  # noqa: ARG002
+        self._pending.clear()
+        await self.l1.clear()
+        await self.l2.clear()
+        await self.l2.client.publish(self.invalidation_channel, self._invalidation_message(None))
+
+    async def contains(self, key) -> bool:
+        if key is None:
+            return False
+        key = str(key)
+        self._ensure_background_tasks()
+        if key in self._pending or (self._listening and await self.l1.contains(key)):
+            return True
+        return bool(await self.l2.client.exists(key))
+
+    async def touch(self, keys: list, lock: asyncio.Lock | None = None) -> list:  # noqa: ARG002
+        # Pending values get a new expiration time when they are written
+        return await self.l2.touch([key for key in keys if str(key) not in self._pending])
+
+    async def flush(self) -> None:
+        """Write the values waiting in "write-behind" mode to Redis."""
+        if not self._pending:
+            return
+        items, self._pending = self._pending, {}
+        try:
+            await self._write(items)
+        except Exception:  # noqa: BLE001
+            self.write_failures += len(items)
+            logger.exception(f"Error writing {len(items)} cache entries to Redis")
+            # Values set again while writing are newer than the ones that failed
+            for key, payload in items.items():
+                self._pending.setdefault(key, payload)
+
+    def stats(self) -> dict:
+        """Return the hit and miss counters of both levels."""
+        return {
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "invalidations": self._invalidations,
+            "pending_writes": len(self._pending),
+            "write_failures": self.write_failures,
+            "listening": self._listening,
+            "l1": self.l1.stats(),
+        }
+
+    def serialization_stats(self) -> dict[str, dict[str, float]]:
+        """Return the serialization counters grouped by value type."""
+        return self.l2.serialization_stats()
+
+    async def teardown(self) -> None:
+        for task in (self._listener_task, self._writer_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._listener_task = self._writer_task = None
+        await self.flush()
+
+    def __repr__(self) -> str:
+        return f"TieredCache(write_mode={self.write_mode}, l1={self.l1!r})"
+
+    async def _write(self, items: dict[str, bytes]) -> None:
+        async with self.l2.client.pipeline(transaction=False) as pipe:
+            for key, payload in items.items():
+                pipe.setex(key, self.l2.expiration_time, payload)
+            pipe.publish(self.invalidation_channel, self._invalidation_message(list(items)))
+            await pipe.execute()
+
+    def _invalidation_message(self, keys: list[str] | None) -> bytes:
+        return orjson.dumps({"origin": self.instance_id, "keys": keys})
+
+    def _ensure_background_tasks(self) -> None:
+        if self._listener_task is None or self._listener_task.done():
+            self._listener_task = asyncio.create_task(self._listen())
+        if self.write_mode == "write-behind" and (self._writer_task is None or self._writer_task.done()):
+            self._writer_task = asyncio.create_task(self._write_periodically())
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.l2.client.pubsub()
+            try:
+                await pubsub.subscribe(self.invalidation_channel)
+                self._listening = True
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        await self._invalidate(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.exception("Lost the cache invalidation channel. Reading from Redis only until it reconnects.")
+            finally:
+                self._listening = False
+                # Invalidations may be missed while unsubscribed, so nothing in process can be trusted
+                await self.l1.clear()
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+            await asyncio.sleep(LISTENER_RETRY_DELAY)
+
+    async def _invalidate(self, data: bytes) -> None:
+        message = orjson.loads(data)
+        if message["origin"] == self.instance_id:
+            return
+        self._invalidations += 1
+        if message["keys"] is None:
+            await self.l1.clear()
+            return
+        for key in message["keys"]:
+            await self.l1.delete(key)
+
+    async def _write_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.write_behind_interval)
+            await self.flush()
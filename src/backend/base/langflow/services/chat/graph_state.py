@@ -0,0 +1,279 @@
+"""Incremental persistence of the graphs cached between build steps.
+
+Storing a `Graph` as a single cache value means every build step serializes every vertex,
+component and result again. `GraphStateStore` splits a graph into three kinds of entries:
+
+* ``{key}:graph``: the flow payload, written only when the graph structure changes;
+* ``{key}``: a small `GraphRunState` with the scheduler state, written on every save;
+* ``{key}:vertex:{vertex_id}``: the build results of a vertex, written only when the vertex
+  was built since the previous save.
+
+The entries that are not written again get a new expiration time on every save instead.
+
+Loading reads the run state and rebuilds the graph from a `GraphTemplate` kept in process (or
+from the structure entry when the template is not cached), then applies the vertex entries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from cachetools import LRUCache
+from loguru import logger
+
+from langflow.services.cache.base import AsyncBaseCacheService
+from langflow.services.cache.utils import CACHE_MISS, CacheMiss
+
+if TYPE_CHECKING:
+    from langflow.graph.graph.base import Graph
+    from langflow.graph.graph.template import GraphTemplate
+
+GRAPH_STATE_MAX_TEMPLATES = 64
+GRAPH_STATE_MAX_GRAPHS = 32
+
+VERTEX_STATE_FIELDS = (
+    "built",
+    "built_object",
+    "built_result",
+    "artifacts",
+    "artifacts_raw",
+    "artifacts_type",
+    "results",
+    "result",
+    "outputs_logs",
+    "logs",
+    "build_times",
+    "use_result",
+)
+
+
+@dataclass
+class GraphRunState:
+    """The part of a graph that changes between build steps."""
+
+    revision: str
+    fingerprint: str
+    flow_id: str | None
+    flow_name: str | None
+    description: str | None
+    user_id: str | None
+    run_id: str
+    run_manager: dict[str, Any]
+    cycle_vertices: set[str]
+    run_queue: list[str]
+    first_layer: list[str]
+    vertices_layers: list[list[str]]
+    vertices_to_run: set[str]
+    stop_vertex: str | None
+    inactivated_vertices: set[str]
+    activated_vertices: list[str]
+    vertex_states: dict[str, str]
+    built_vertex_ids: set[str] = field(default_factory=set)
+
+
+@dataclass
+class _LoadedGraph:
+    revision: str
+    graph: Graph
+    run_state: GraphRunState
+
+
+def fingerprint_graph_data(graph_data: dict) -> str:
+    return hashlib.sha256(orjson.dumps(graph_data, option=orjson.OPT_SORT_KEYS, default=str)).hexdigest()
+
+
+class GraphStateStore:
+    """Stores graphs in a cache service as a structure entry plus run-state and per-vertex deltas.
+
+    Graphs loaded or saved by this process are also kept in a small LRU keyed by cache key. When the
+    revision stored in the cache matches the local one, loading returns the local graph without
+    reading any vertex entry.
+
+    Args:
+        cache_service: The cache service the entries are written to.
+        max_templates: Maximum number of graph templates kept in process.
+        max_graphs: Maximum number of graphs kept in process.
+    """
+
+    def __init__(
+        self,
+        cache_service: AsyncBaseCacheService,
+        max_templates: int = GRAPH_STATE_MAX_TEMPLATES,
+        max_graphs: int = GRAPH_STATE_MAX_GRAPHS,
+    ) -> None:
+        self.cache_service = cache_service
+        self._templates: LRUCache[str, GraphTemplate] = LRUCache(maxsize=max_templates)
+        self._graphs: LRUCache[str, _LoadedGraph] = LRUCache(maxsize=max_graphs)
+
+    @staticmethod
+    def supports(cache_service: Any) -> bool:
+        """Whether the cache service serializes its values, which is when deltas pay off."""
+        serializer = getattr(cache_service, "serializer", None)
+        return isinstance(cache_service, AsyncBaseCacheService) and serializer is not None
+
+    @staticmethod
+    def accepts(data: Any) -> bool:
+        from langflow.graph.graph.base import Graph
+
+        return isinstance(data, Graph)
+
+    @staticmethod
+    def is_run_state(cached: Any) -> bool:
+        return isinstance(cached, dict) and isinstance(cached.get("result"), GraphRunState)
+
+    async def save(self, key: str, graph: Graph, lock: asyncio.Lock | None = None) -> None:
+        """Writes the run state of the graph and the entries of the vertices that changed.
+
+        The structure and vertex entries written by earlier saves get a new expiration time, so they expire
+        with the run state that refers to them, and are written again if they already expired.
+        """
+        loaded = self._graphs.get(key)
+        if loaded is not None and loaded.graph is graph:
+            fingerprint = loaded.run_state.fingerprint
+            persisted_vertex_ids = loaded.run_state.built_vertex_ids
+        else:
+            fingerprint = fingerprint_graph_data(graph.raw_graph_data)
+            persisted_vertex_ids = set()
+        built_vertex_ids = {vertex.id for vertex in graph.vertices if vertex.built}
+        changed_vertex_ids = graph.pop_changed_vertex_ids() | (built_vertex_ids - persisted_vertex_ids)
+        write_structure = loaded is None or loaded.run_state.fingerprint != fingerprint
+
+        kept_keys = [self._vertex_key(key, vertex_id) for vertex_id in sorted(built_vertex_ids - changed_vertex_ids)]
+        if not write_structure:
+            kept_keys.append(self._graph_key(key))
+        missing_keys = set(await self.cache_service.touch(kept_keys, lock=lock)) if kept_keys else set()
+        if write_structure or self._graph_key(key) in missing_keys:
+            await self.cache_service.set(
+                self._graph_key(key),
+                {
+                    "fingerprint": fingerprint,
+                    "payload": graph.raw_graph_data,
+                    "flow_id": graph.flow_id,
+                    "flow_name": graph.flow_name,
+                },
+                lock=lock,
+            )
+        for vertex_id in sorted(built_vertex_ids):
+            if vertex_id in changed_vertex_ids or self._vertex_key(key, vertex_id) in missing_keys:
+                vertex = graph.get_vertex(vertex_id)
+                vertex_state = {name: getattr(vertex, name) for name in VERTEX_STATE_FIELDS}
+                await self.cache_service.set(self._vertex_key(key, vertex_id), vertex_state, lock=lock)
+
+        run_state = self._get_run_state(graph, fingerprint, built_vertex_ids)
+        await self.cache_service.set(key, {"result": run_state, "type": type(graph)}, lock=lock)
+        self._graphs[key] = _LoadedGraph(run_state.revision, graph, run_state)
+        logger.debug(f"Saved graph state for {key} with {len(changed_vertex_ids)} changed vertices")
+
+    async def load(self, key: str, cached: dict, lock: asyncio.Lock | None = None) -> dict | CacheMiss:
+        """Rebuilds the graph described by a cached `GraphRunState`.
+
+        Returns:
+            The cache entry with the graph as its result, or a cache miss if the structure is gone.
+        """
+        run_state: GraphRunState = cached["result"]
+        loaded = self._graphs.get(key)
+        if loaded is not None and loaded.revision == run_state.revision:
+            return {"result": loaded.graph, "type": cached["type"]}
+
+        template = await self._get_template(key, run_state, lock=lock)
+        if template is None:
+            return CACHE_MISS
+        graph = template.create_graph(user_id=run_state.user_id)
+        self._apply_run_state(graph, run_state)
+
+        vertex_ids = sorted(run_state.built_vertex_ids)
+        vertex_states = await asyncio.gather(
+            *(self.cache_service.get(self._vertex_key(key, vertex_id), lock=lock) for vertex_id in vertex_ids)
+        )
+        for vertex_id, vertex_state in zip(vertex_ids, vertex_states, strict=True):
+            if isinstance(vertex_state, CacheMiss):
+                logger.warning(f"Missing state of vertex {vertex_id} for {key}")
+                return CACHE_MISS
+            vertex = graph.get_vertex(vertex_id)
+            for name, value in vertex_state.items():
+                setattr(vertex, name, value)
+
+        self._graphs[key] = _LoadedGraph(run_state.revision, graph, run_state)
+        return {"result": graph, "type": cached["type"]}
+
+    async def delete(self, key: str, cached: Any, lock: asyncio.Lock | None = None) -> None:
+        """Deletes the structure and vertex entries that belong to a cached `GraphRunState`."""
+        self._graphs.pop(key, None)
+        if not self.is_run_state(cached):
+            return
+        await self.cache_service.delete(self._graph_key(key), lock=lock)
+        for vertex_id in cached["result"].built_vertex_ids:
+            await self.cache_service.delete(self._vertex_key(key, vertex_id), lock=lock)
+
+    async def _get_template(
+        self, key: str, run_state: GraphRunState, lock: asyncio.Lock | None
+    ) -> GraphTemplate | None:
+        from langflow.graph.graph.template import GraphTemplate
+
+        if (template := self._templates.get(run_state.fingerprint)) is not None:
+            return template
+        structure = await self.cache_service.get(self._graph_key(key), lock=lock)
+        if isinstance(structure, CacheMiss) or structure["fingerprint"] != run_state.fingerprint:
+            logger.warning(f"Graph structure for {key} is missing from the cache")
+            return None
+        template = GraphTemplate(structure["payload"], flow_id=structure["flow_id"], flow_name=structure["flow_name"])
+        self._templates[run_state.fingerprint] = template
+        return template
+
+    @staticmethod
+    def _get_run_state(graph: Graph, fingerprint: str, built_vertex_ids: set[str]) -> GraphRunState:
+        return GraphRunState(
+            revision=uuid.uuid4().hex,
+            fingerprint=fingerprint,
+            flow_id=graph.flow_id,
+            flow_name=graph.flow_name,
+            description=graph.description,
+            user_id=graph.user_id,
+            run_id=graph._run_id,
+            run_manager=graph.run_manager.to_dict(),
+            cycle_vertices=set(graph.run_manager.cycle_vertices),
+            run_queue=list(graph._run_queue),
+            first_layer=list(graph._first_layer or []),
+            vertices_layers=graph.vertices_layers,
+            vertices_to_run=set(graph.vertices_to_run),
+            stop_vertex=graph.stop_vertex,
+            inactivated_vertices=set(graph.inactivated_vertices),
+            activated_vertices=list(graph.activated_vertices),
+            vertex_states={vertex.id: vertex.state.name for vertex in graph.vertices},
+            built_vertex_ids=built_vertex_ids,
+        )
+
+    @staticmethod
+    def _apply_run_state(graph: Graph, run_state: GraphRunState) -> None:
+        from langflow.graph.graph.runnable_vertices_manager import RunnableVerticesManager
+        from langflow.graph.vertex.base import VertexStates
+
+        graph.description = run_state.description
+        graph.set_run_id(run_state.run_id)
+        graph.run_manager = RunnableVerticesManager.from_dict(run_state.run_manager)
+        graph.run_manager.cycle_vertices = run_state.cycle_vertices
+        graph._run_queue = deque(run_state.run_queue)
+        graph._first_layer = run_state.first_layer
+        graph.vertices_layers = run_state.vertices_layers
+        graph.vertices_to_run = run_state.vertices_to_run
+        graph.stop_vertex = run_state.stop_vertex
+        graph.inactivated_vertices = run_state.inactivated_vertices
+        graph.activated_vertices = run_state.activated_vertices
+        for vertex in graph.vertices:
+            if (state := run_state.vertex_states.get(vertex.id)) is not None:
+                vertex.state = VertexStates[state]
+        graph._prepared = True
+
+    @staticmethod
+    def _graph_key(key: str) -> str:
+        return f"{key}:graph"
+
+    @staticmethod
+    def _vertex_key(key: str, vertex_id: str) -> str:
+        return f"{key}:vertex:{vertex_id}"
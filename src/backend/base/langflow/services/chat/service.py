@@ -5,7 +5,8 @@ from typing import Any
 
 from langflow.services.base import Service
 from langflow.services.cache.base import AsyncBaseCacheService, CacheService
-from langflow.services.deps import get_cache_service
+from langflow.services.chat.graph_state import GraphStateStore
+from langflow.services.deps import get_cache_service, get_settings_service
 
 
 class ChatService(Service):
@@ -17,6 +18,11 @@ class ChatService(Service):
         self.async_cache_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._sync_cache_locks: dict[str, RLock] = defaultdict(RLock)
         self.cache_service: CacheService | AsyncBaseCacheService = get_cache_service()
+        self.graph_state_store: GraphStateStore | None = None
+        if get_settings_service().settings.graph_state_persistence == "delta" and GraphStateStore.supports(
+            self.cache_service
+        ):
+            self.graph_state_store = GraphStateStore(self.cache_service)
 
     async def set_cache(self, key: str, data: Any, lock: asyncio.Lock | None = None) -> bool:
         """Set the cache for a client.
@@ -29,6 +35,9 @@ class ChatService(Service):
         Returns:
             bool: True if the cache was set successfully, False otherwise.
         """
+        if self.graph_state_store is not None and self.graph_state_store.accepts(data):
+            await self.graph_state_store.save(str(key), data, lock=lock or self.async_cache_locks[key])
+            return True
         result_dict = {
             "result": data,
             "type": type(data),
@@ -52,7 +61,10 @@ class ChatService(Service):
             Any: The cached data.
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
-            return await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
+            cached = await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
+            if self.graph_state_store is not None and self.graph_state_store.is_run_state(cached):
+                return await self.graph_state_store.load(key, cached, lock=lock or self.async_cache_locks[key])
+            return cached
         return await asyncio.to_thread(self.cache_service.get, key, lock=lock or self._sync_cache_locks[key])
 
     async def clear_cache(self, key: str, lock: asyncio.Lock | None = None) -> None:
@@ -63,5 +75,8 @@ class ChatService(Service):
             lock (Optional[asyncio.Lock], optional): The lock to use for the cache operation. Defaults to None.
         """
         if isinstance(self.cache_service, AsyncBaseCacheService):
+            if self.graph_state_store is not None:
+                cached = await self.cache_service.get(key, lock=lock or self.async_cache_locks[key])
+                await self.graph_state_store.delete(key, cached, lock=lock or self.async_cache_locks[key])
             return await self.cache_service.delete(key, lock=lock or self.async_cache_locks[key])
         return await asyncio.to_thread(self.cache_service.delete, key, lock=lock or self._sync_cache_locks[key])
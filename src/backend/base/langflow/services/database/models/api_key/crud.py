@@ -4,13 +4,15 @@ import secrets
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from sqlalchemy import case, update
 from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlmodel import col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from langflow.services.auth.api_key_cache import ApiKeyUsage
 from langflow.services.database.models import User
 from langflow.services.database.models.api_key import ApiKey, ApiKeyCreate, ApiKeyRead, UnmaskedApiKeyRead
-from langflow.services.deps import session_scope
+from langflow.services.deps import get_auth_service, session_scope
 
 if TYPE_CHECKING:
     from sqlmodel.sql.expression import SelectOfScalar
@@ -48,23 +50,44 @@ async def delete_api_key(session: AsyncSession, api_key_id: UUID) -> None:
         raise ValueError(msg)
     await session.delete(api_key)
     await session.commit()
+    get_auth_service().api_key_cache.invalidate_key(api_key_id)
 
 
 update_total_uses_tasks: set[asyncio.Task] = set()
 
 
 async def check_key(session: AsyncSession, api_key: str) -> User | None:
-    """Check if the API key is valid."""
+    """Check if the API key is valid.
+
+    Valid keys are cached by the auth service, so repeated checks of the same key skip the database.
+    """
+    auth_service = get_auth_service()
+    if auth_service.api_key_cache.enabled:
+        cached = auth_service.api_key_cache.get(api_key)
+        auth_service.record_cache_lookup(hit=cached is not None)
+        if cached is not None:
+            _record_use(cached.api_key_id)
+            return cached.user()
     query: SelectOfScalar = select(ApiKey).options(selectinload(ApiKey.user)).where(ApiKey.api_key == api_key)
     api_key_object: ApiKey | None = (await session.exec(query)).first()
     if api_key_object is not None:
-        task = asyncio.create_task(update_total_uses(api_key_object.id))
-        task.add_done_callback(update_total_uses_tasks.discard)
-        update_total_uses_tasks.add(task)
+        auth_service.api_key_cache.set(api_key, api_key_object.id, api_key_object.user)
+        _record_use(api_key_object.id)
         return api_key_object.user
     return None
 
 
+def _record_use(api_key_id: UUID) -> None:
+    auth_service = get_auth_service()
+    if auth_service.is_started():
+        # Written in bulk by the auth service
+        auth_service.record_api_key_use(api_key_id)
+        return
+    task = asyncio.create_task(update_total_uses(api_key_id))
+    task.add_done_callback(update_total_uses_tasks.discard)
+    update_total_uses_tasks.add(task)
+
+
 async def update_total_uses(api_key_id: UUID):
     """Update the total uses and last used at."""
     async with session_scope() as session:
@@ -76,3 +99,26 @@ async def update_total_uses(api_key_id: UUID):
         new_api_key.last_used_at = datetime.datetime.now(datetime.timezone.utc)
         session.add(new_api_key)
         await session.commit()
+
+
+async def add_api_key_uses(session: AsyncSession, uses: dict[UUID, ApiKeyUsage]) -> None:
+    """Add the aggregated uses of several API keys with a single UPDATE."""
+    if not uses:
+        return
+    api_key_id = col(ApiKey.id)
+    stmt = (
+        update(ApiKey)
+        .where(api_key_id.in_(list(uses)))
+        .values(
+            total_uses=col(ApiKey.total_uses)
+            + case({key_id: usage.uses for key_id, usage in uses.items()}, value=api_key_id, else_=0),
+            last_used_at=case(
+                {key_id: usage.last_used_at for key_id, usage in uses.items()},
+                value=api_key_id,
+                else_=col(ApiKey.last_used_at),
+            ),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await session.exec(stmt)
+    await session.commit()
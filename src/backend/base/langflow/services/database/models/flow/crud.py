@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlmodel import col, select
+
+from .model import Flow, FlowHeader
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from sqlmodel.ext.asyncio.session import AsyncSession
+    from sqlmodel.sql.expression import Select
+
+FLOW_HEADER_COLUMNS = (
+    Flow.id,
+    Flow.name,
+    Flow.description,
+    Flow.folder_id,
+    Flow.endpoint_name,
+    Flow.updated_at,
+    Flow.is_component,
+    Flow.access_type,
+    Flow.tags,
+    Flow.mcp_enabled,
+    Flow.action_name,
+    Flow.action_description,
+    Flow.interface_summary,
+)
+
+
+def select_flow_headers() -> Select:
+    """Select the columns of the headers of flows, without `Flow.data`.
+
+    Filter and order the statement as a `select(Flow)`, then read it with `get_flow_headers`.
+    """
+    return select(*FLOW_HEADER_COLUMNS)
+
+
+async def get_flow_headers(
+    session: AsyncSession,
+    stmt: Select,
+    *,
+    with_component_data: bool = False,
+    with_input_schema: bool = False,
+) -> list[FlowHeader]:
+    """Read the flow headers selected by a `select_flow_headers` statement.
+
+    Whether a flow is a component and the schema of its inputs are read from `Flow.interface_summary`. The data
+    of a flow is only read for flows saved before the summary existed and, with `with_component_data`, for
+    components, whose header holds their data.
+
+    Args:
+        session (AsyncSession): The database session.
+        stmt (Select): A statement built from `select_flow_headers`.
+        with_component_data (bool): Whether to return the data of components. Defaults to False.
+        with_input_schema (bool): Whether to build the input schema of flows without a summary. Defaults to False.
+
+    Returns:
+        list[FlowHeader]: The headers of the flows, in the order of the statement.
+    """
+    rows = [dict(row._mapping) for row in (await session.exec(stmt)).all()]
+    summaries: dict[UUID, dict[str, Any] | None] = {row["id"]: row.pop("interface_summary") for row in rows}
+    data_ids = [flow_id for flow_id, summary in summaries.items() if summary is None]
+    if with_component_data:
+        data_ids += [row["id"] for row in rows if summaries[row["id"]] and _is_component(row, summaries[row["id"]])]
+    flow_datas: dict[UUID, dict | None] = {}
+    if data_ids:
+        data_stmt = select(Flow.id, Flow.data).where(col(Flow.id).in_(data_ids))
+        flow_datas = dict((await session.exec(data_stmt)).all())
+
+    if any(summary is None for summary in summaries.values()):
+        from langflow.helpers.flow import get_flow_interface_summary
+
+        for flow_id, summary in summaries.items():
+            if summary is None:
+                summaries[flow_id] = get_flow_interface_summary(flow_datas.get(flow_id), input_schema=with_input_schema)
+
+    headers = []
+    for row in rows:
+        summary = summaries[row["id"]] or {}
+        row["is_component"] = _is_component(row, summary)
+        row["input_schema"] = summary.get("input_schema")
+        if with_component_data and row["is_component"]:
+            row["data"] = flow_datas.get(row["id"])
+        headers.append(FlowHeader.model_validate(row))
+    return headers
+
+
+def _is_component(row: dict[str, Any], summary: dict[str, Any] | None) -> bool | None:
+    if row["is_component"] is not None:
+        return row["is_component"]
+    return (summary or {}).get("is_component")
@@ -17,7 +17,8 @@ from pydantic import (
     field_validator,
 )
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Text, UniqueConstraint, text
+from sqlalchemy import Text, UniqueConstraint, event, text
+from sqlalchemy.orm import attributes
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 from langflow.schema import Data
@@ -199,6 +200,9 @@ class Flow(FlowBase, table=True):  # type: ignore[call-arg]
     folder_id: UUID | None = Field(default=None, foreign_key="folder.id", nullable=True, index=True)
     fs_path: str | None = Field(default=None, nullable=True)
     folder: Optional["Folder"] = Relationship(back_populates="flows")
+    interface_summary: dict | None = Field(default=None, sa_column=Column(JSON))
+    """Whether the flow is a component and the JSON schema of its inputs, kept up to date with `data` on save,
+    so flow headers and MCP tools are listed without reading `data`."""
 
     def to_data(self):
         serialized = self.model_dump()
@@ -248,6 +252,8 @@ class FlowHeader(BaseModel):
     mcp_enabled: bool | None = Field(None, description="Flag indicating whether the flow is exposed in the MCP server")
     action_name: str | None = Field(None, description="The name of the action associated with the flow")
     action_description: str | None = Field(None, description="The description of the action associated with the flow")
+    updated_at: datetime | None = Field(None, description="The last time the flow was updated")
+    input_schema: dict | None = Field(None, description="The JSON schema of the inputs of the flow, if it is known")
 
     @field_validator("data", mode="before")
     @classmethod
@@ -286,3 +292,14 @@ class FlowUpdate(SQLModel):
                     detail="Endpoint name must contain only letters, numbers, hyphens, and underscores",
                 )
         return v
+
+
+@event.listens_for(Flow, "before_insert")
+@event.listens_for(Flow, "before_update")
+def update_interface_summary(_mapper, _connection, flow: Flow) -> None:
+    """Summarize the interface of a flow whenever its data is saved."""
+    if flow.interface_summary is not None and not attributes.get_history(flow, "data").has_changes():
+        return
+    from langflow.helpers.flow import get_flow_interface_summary
+
+    flow.interface_summary = get_flow_interface_summary(flow.data)
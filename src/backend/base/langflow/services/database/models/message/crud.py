@@ -1,5 +1,13 @@
+import base64
+import json
+from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import and_, delete, or_
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlmodel.sql.expression import SelectOfScalar
+
 from langflow.services.database.models.message.model import MessageTable, MessageUpdate
 from langflow.services.deps import session_scope
 from langflow.utils.async_helpers import run_until_complete
@@ -24,3 +32,96 @@ async def _update_message(message_id: UUID | str, message: MessageUpdate | dict)
 def update_message(message_id: UUID | str, message: MessageUpdate | dict):
     """DEPRECATED - Kept for backward compatibility. Do not use."""
     return run_until_complete(_update_message(message_id, message))
+
+
+async def awrite_messagetables(messages: list[MessageTable], deleted_ids: list[UUID], session: AsyncSession) -> None:
+    """Insert or update the given messages, by ID, and delete the messages with the given IDs.
+
+    The existing messages are read with a single query and everything is flushed in one commit.
+    """
+    ids = [message.id for message in messages]
+    existing: dict[UUID, MessageTable] = {}
+    if ids:
+        rows = await session.exec(select(MessageTable).where(col(MessageTable.id).in_(ids)))
+        existing = {row.id: row for row in rows.all()}
+    for message in messages:
+        if (row := existing.get(message.id)) is None:
+            session.add(message)
+            existing[message.id] = message
+            continue
+        for field in MessageTable.model_fields:
+            if field not in {"id", "inserted_at"}:
+                setattr(row, field, getattr(message, field))
+        session.add(row)
+    if deleted_ids:
+        await session.exec(delete(MessageTable).where(col(MessageTable.id).in_(deleted_ids)))
+    await session.commit()
+
+
+def encode_message_cursor(message: MessageTable) -> str:
+    """Return an opaque cursor pointing at a message in a list ordered by timestamp, insertion time and id."""
+    raw = json.dumps([message.timestamp.isoformat(), message.inserted_at.isoformat(), str(message.id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_message_cursor(cursor: str) -> tuple[datetime, datetime, UUID]:
+    """Return the timestamp, insertion time and id of the message a cursor points at.
+
+    Raises:
+        ValueError: If the cursor was not returned by `encode_message_cursor`.
+    """
+    try:
+        timestamp, inserted_at, message_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(timestamp), datetime.fromisoformat(inserted_at), UUID(message_id)
+    except (ValueError, TypeError) as exc:
+        msg = f"Invalid message cursor: {cursor}"
+        raise ValueError(msg) from exc
+
+
+async def get_messages_page(
+    session: AsyncSession,
+    stmt: SelectOfScalar[MessageTable],
+    limit: int,
+    cursor: str | None = None,
+    *,
+    descending: bool = False,
+) -> tuple[list[MessageTable], str | None]:
+    """Read a page of messages with keyset pagination on (timestamp, inserted_at, id).
+
+    The page holds the `limit` messages of `stmt` that come after the message `cursor` points at, so every
+    page reads `limit` rows through the message indexes instead of skipping an offset. Messages of the same
+    second are in the order they were stored; the id only orders messages stored at the same instant.
+
+    Returns:
+        The messages of the page and the cursor of the next page, or None if this is the last page.
+    """
+    timestamp_col, inserted_at_col, id_col = (
+        col(MessageTable.timestamp),
+        col(MessageTable.inserted_at),
+        col(MessageTable.id),
+    )
+    if cursor is not None:
+        timestamp, inserted_at, message_id = decode_message_cursor(cursor)
+        if descending:
+            after = or_(
+                timestamp_col < timestamp,
+                and_(timestamp_col == timestamp, inserted_at_col < inserted_at),
+                and_(timestamp_col == timestamp, inserted_at_col == inserted_at, id_col < message_id),
+            )
+            stmt = stmt.where(timestamp_col <= timestamp, after)
+        else:
+            after = or_(
+                timestamp_col > timestamp,
+                and_(timestamp_col == timestamp, inserted_at_col > inserted_at),
+                and_(timestamp_col == timestamp, inserted_at_col == inserted_at, id_col > message_id),
+            )
+            stmt = stmt.where(timestamp_col >= timestamp, after)
+    if descending:
+        stmt = stmt.order_by(timestamp_col.desc(), inserted_at_col.desc(), id_col.desc())
+    else:
+        stmt = stmt.order_by(timestamp_col.asc(), inserted_at_col.asc(), id_col.asc())
+    messages = list((await session.exec(stmt.limit(limit + 1))).all())
+    if len(messages) <= limit:
+        return messages, None
+    messages = messages[:limit]
+    return messages, encode_message_cursor(messages[-1])
@@ -5,7 +5,7 @@ from uuid import UUID, uuid4
 
 from litellm import ConfigDict
 from pydantic import field_serializer, field_validator
-from sqlalchemy import Text
+from sqlalchemy import Index, Text
 from sqlmodel import JSON, Column, Field, SQLModel
 
 from langflow.schema.content_block import ContentBlock
@@ -118,7 +118,15 @@ class MessageBase(SQLModel):
 class MessageTable(MessageBase, table=True):  # type: ignore[call-arg]
     model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
     __tablename__ = "message"
+    # History is read newest first by session, optionally within a flow; inserted_at breaks timestamp ties
+    __table_args__ = (
+        Index("ix_message_flow_id_session_id_timestamp", "flow_id", "session_id", "timestamp", "inserted_at"),
+        Index("ix_message_session_id_timestamp", "session_id", "timestamp", "inserted_at"),
+    )
     id: UUID = Field(default_factory=uuid4, primary_key=True)
+    inserted_at: datetime | None = Field(default_factory=lambda: datetime.now(timezone.utc), nullable=True)
+    """When the message was first stored. `timestamp` only has second precision, so this keeps the messages of
+    the same second in the order they were stored."""
 
     flow_id: UUID | None = Field(default=None)
     files: list[str] = Field(sa_column=Column(JSON))
@@ -9,6 +9,7 @@ from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from langflow.services.database.models.user.model import User, UserUpdate
+from langflow.services.deps import get_auth_service
 
 
 async def get_user_by_username(db: AsyncSession, username: str) -> User | None:
@@ -50,6 +51,7 @@ async def update_user(user_db: User | None, user: UserUpdate, db: AsyncSession)
         await db.rollback()
         raise HTTPException(status_code=400, detail=str(e)) from e
 
+    get_auth_service().api_key_cache.invalidate_user(user_db.id)
     return user_db
 
 
@@ -130,6 +130,70 @@ async def log_vertex_build(
     return table
 
 
+async def log_vertex_builds(db: AsyncSession, vertex_builds: list[VertexBuildBase]) -> list[VertexBuildTable]:
+    """Insert many vertex builds in a single commit, without trimming the history.
+
+    Used by the batched build log writer, which trims the history periodically with `trim_vertex_builds`.
+    """
+    tables = [VertexBuildTable(**vertex_build.model_dump()) for vertex_build in vertex_builds]
+    try:
+        db.add_all(tables)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return tables
+
+
+async def trim_vertex_builds(
+    db: AsyncSession,
+    vertices: dict[UUID, set[str]],
+    *,
+    max_builds_to_keep: int | None = None,
+    max_builds_per_vertex: int | None = None,
+) -> None:
+    """Enforce the build history limits for the given vertices and globally.
+
+    Args:
+        db (AsyncSession): The database session for executing queries.
+        vertices (dict[UUID, set[str]]): The vertex ids to trim, grouped by flow id.
+        max_builds_to_keep (int | None, optional): Maximum number of builds to keep globally.
+            If None, uses system settings.
+        max_builds_per_vertex (int | None, optional): Maximum number of builds to keep per vertex.
+            If None, uses system settings.
+    """
+    settings = get_settings_service().settings
+    max_global = max_builds_to_keep or settings.max_vertex_builds_to_keep
+    max_per_vertex = max_builds_per_vertex or settings.max_vertex_builds_per_vertex
+    try:
+        for flow_id, vertex_ids in vertices.items():
+            for vertex_id in vertex_ids:
+                keep_vertex_subq = (
+                    select(VertexBuildTable.build_id)
+                    .where(VertexBuildTable.flow_id == flow_id, VertexBuildTable.id == vertex_id)
+                    .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+                    .limit(max_per_vertex)
+                )
+                await db.exec(
+                    delete(VertexBuildTable).where(
+                        VertexBuildTable.flow_id == flow_id,
+                        VertexBuildTable.id == vertex_id,
+                        col(VertexBuildTable.build_id).not_in(keep_vertex_subq),
+                    )
+                )
+
+        keep_global_subq = (
+            select(VertexBuildTable.build_id)
+            .order_by(col(VertexBuildTable.timestamp).desc(), col(VertexBuildTable.build_id).desc())
+            .limit(max_global)
+        )
+        await db.exec(delete(VertexBuildTable).where(col(VertexBuildTable.build_id).not_in(keep_global_subq)))
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+
 async def delete_vertex_builds_by_flow_id(db: AsyncSession, flow_id: UUID) -> None:
     """Delete all vertex builds associated with a specific flow ID.
 
@@ -12,10 +12,13 @@ if TYPE_CHECKING:
 
     from sqlmodel.ext.asyncio.session import AsyncSession
 
+    from langflow.services.auth.service import AuthService
+    from langflow.services.build_log.service import BuildLogService
     from langflow.services.cache.service import AsyncBaseCacheService, CacheService
     from langflow.services.chat.service import ChatService
     from langflow.services.database.service import DatabaseService
     from langflow.services.job_queue.service import JobQueueService
+    from langflow.services.message_writer.service import MessageWriterService
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
     from langflow.services.socket.service import SocketIOService
@@ -247,3 +250,24 @@ def get_queue_service() -> JobQueueService:
     from langflow.services.job_queue.factory import JobQueueServiceFactory
 
     return get_service(ServiceType.JOB_QUEUE_SERVICE, JobQueueServiceFactory())
+
+
+def get_build_log_service() -> BuildLogService:
+    """Retrieves the BuildLogService instance from the service manager."""
+    from langflow.services.build_log.factory import BuildLogServiceFactory
+
+    return get_service(ServiceType.BUILD_LOG_SERVICE, BuildLogServiceFactory())
+
+
+def get_message_writer_service() -> MessageWriterService:
+    """Retrieves the MessageWriterService instance from the service manager."""
+    from langflow.services.message_writer.factory import MessageWriterServiceFactory
+
+    return get_service(ServiceType.MESSAGE_WRITER_SERVICE, MessageWriterServiceFactory())
+
+
+def get_auth_service() -> AuthService:
+    """Retrieves the AuthService instance from the service manager."""
+    from langflow.services.auth.factory import AuthServiceFactory
+
+    return get_service(ServiceType.AUTH_SERVICE, AuthServiceFactory())
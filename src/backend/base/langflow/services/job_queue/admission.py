@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Literal
+
+
+class JobQueueFullError(Exception):
+    """Exception raised when a job is rejected because the admission queue is full."""
+
+    def __init__(self, depth: int) -> None:
+        self.depth = depth
+        super().__init__(f"Too many builds waiting to start ({depth}); try again later")
+
+
+@dataclass(order=True)
+class AdmissionTicket:
+    """A job waiting for, or holding, a build slot."""
+
+    sort_key: tuple[int, int]
+    user_id: str | None = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: asyncio.Future = field(compare=False, repr=False)
+    admitted_at: float | None = field(default=None, compare=False)
+    released: bool = field(default=False, compare=False)
+
+    @property
+    def wait_time(self) -> float:
+        return (self.admitted_at or self.enqueued_at) - self.enqueued_at
+
+
+class AdmissionController:
+    """Limits how many builds run at once, globally and per user, and queues the others.
+
+    Waiting jobs are admitted in submission order ("fifo"), or by ascending priority and then
+    submission order ("priority"). A job that cannot start because its user is at the per-user limit
+    does not hold back jobs of other users queued behind it. A limit of 0 disables it.
+
+    Example:
+        controller = AdmissionController(max_concurrent=8, max_per_user=2, max_queued=100)
+        ticket = controller.submit(user_id)
+        await ticket.future  # resolved when the job may start
+        ...
+        controller.release(ticket)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int = 0,
+        max_per_user: int = 0,
+        max_queued: int = 0,
+        policy: Literal["fifo", "priority"] = "fifo",
+    ) -> None:
+        self.max_concurrent = max_concurrent
+        self.max_per_user = max_per_user
+        self.max_queued = max_queued
+        self.policy = policy
+        self._waiting: list[AdmissionTicket] = []
+        self._running_by_user: Counter[str | None] = Counter()
+        self._running = 0
+        self._sequence = itertools.count()
+        self.admitted = 0
+        self.rejected = 0
+        self.max_wait_time = 0.0
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiting)
+
+    def submit(self, user_id: str | None = None, priority: int = 0) -> AdmissionTicket:
+        """Queue a job for admission; its future is already resolved when a slot is free.
+
+        Raises:
+            JobQueueFullError: If `max_queued` jobs are already waiting.
+        """
+        loop = asyncio.get_running_loop()
+        sort_key = (priority if self.policy == "priority" else 0, next(self._sequence))
+        ticket = AdmissionTicket(sort_key, user_id, loop.time(), loop.create_future())
+        if not self._waiting and self._has_slot(user_id):
+            self._admit(ticket)
+            return ticket
+        if self.max_queued and len(self._waiting) >= self.max_queued:
+            self.rejected += 1
+            raise JobQueueFullError(len(self._waiting))
+        self._waiting.append(ticket)
+        self._dispatch()
+        return ticket
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Free the slot of a finished job, or withdraw a job that is still waiting."""
+        if ticket.released:
+            return
+        ticket.released = True
+        if ticket.admitted_at is None:
+            self._waiting.remove(ticket)
+            ticket.future.cancel()
+            return
+        self._running -= 1
+        self._running_by_user[ticket.user_id] -= 1
+        if not self._running_by_user[ticket.user_id]:
+            del self._running_by_user[ticket.user_id]
+        self._dispatch()
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "running": self._running,
+            "waiting": len(self._waiting),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "max_wait_time": self.max_wait_time,
+        }
+
+    def _has_slot(self, user_id: str | None) -> bool:
+        if self.max_concurrent and self._running >= self.max_concurrent:
+            return False
+        return not (self.max_per_user and user_id is not None and self._running_by_user[user_id] >= self.max_per_user)
+
+    def _admit(self, ticket: AdmissionTicket) -> None:
+        ticket.admitted_at = asyncio.get_running_loop().time()
+        self._running += 1
+        self._running_by_user[ticket.user_id] += 1
+        self.admitted += 1
+        self.max_wait_time = max(self.max_wait_time, ticket.wait_time)
+        ticket.future.set_result(None)
+
+    def _dispatch(self) -> None:
+        if not self._waiting or (self.max_concurrent and self._running >= self.max_concurrent):
+            return
+        admitted = False
+        for ticket in sorted(self._waiting):
+            # The future of a job cancelled while waiting is cancelled before the job releases its ticket
+            if ticket.future.cancelled():
+                continue
+            if self.max_concurrent and self._running >= self.max_concurrent:
+                break
+            if self._has_slot(ticket.user_id):
+                self._admit(ticket)
+                admitted = True
+        if admitted:
+            self._waiting = [ticket for ticket in self._waiting if ticket.admitted_at is None]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Literal
+
+import orjson
+
+EventQueueItem = tuple[str | None, bytes | None, float]
+
+
+def is_token_event(event_id: str | None) -> bool:
+    return event_id is not None and event_id.startswith("token-")
+
+
+class BoundedEventQueue(asyncio.Queue):
+    """Queue of the events of a build, bounded for slow consumers without blocking or failing the build.
+
+    Token events are the bulk of a streamed build and are superseded by the message they belong to, so
+    they are the ones given up when the queue is full. With the "coalesce" policy a token is appended to
+    the last queued token event of the same message, so the client still gets the whole text in fewer,
+    larger events; with "drop" (or when it cannot be merged) it is discarded and the client gets the text
+    from the final message, as with polling. Any other event makes room by evicting the oldest queued
+    token event and is never discarded, so the queue only grows past `maxsize` with no token left in it.
+
+    `put` never waits, and `put_nowait` never raises QueueFull.
+    """
+
+    def __init__(self, maxsize: int = 0, overflow_policy: Literal["coalesce", "drop"] = "coalesce") -> None:
+        super().__init__(maxsize)
+        self.overflow_policy = overflow_policy
+        self.coalesced = 0
+        self.dropped = 0
+
+    async def put(self, item: EventQueueItem) -> None:
+        self.put_nowait(item)
+
+    def put_nowait(self, item: EventQueueItem) -> None:
+        if not self.full():
+            super().put_nowait(item)
+            return
+        event_id, value, _ = item
+        if is_token_event(event_id):
+            if self.overflow_policy == "coalesce" and value is not None and self._coalesce(value):
+                self.coalesced += 1
+            else:
+                self.dropped += 1
+            return
+        if self._evict_token_event():
+            super().put_nowait(item)
+            return
+        # Mirrors asyncio.Queue.put_nowait without the size check
+        self._put(item)
+        self._unfinished_tasks += 1
+        self._finished.clear()
+        self._wakeup_next(self._getters)
+
+    def stats(self) -> dict[str, int]:
+        return {"size": self.qsize(), "coalesced": self.coalesced, "dropped": self.dropped}
+
+    def _coalesce(self, value: bytes) -> bool:
+        """Append the chunk of a token event to the last queued event, if it is a token of the same message."""
+        queue = self._queue
+        if not queue or not is_token_event(queue[-1][0]):
+            return False
+        last_id, last_value, put_time = queue[-1]
+        last_event, event = _load_token_event(last_value), _load_token_event(value)
+        if last_event is None or event is None or last_event["data"].get("id") != event["data"].get("id"):
+            return False
+        last_event["data"]["chunk"] = f"{last_event['data'].get('chunk') or ''}{event['data'].get('chunk') or ''}"
+        queue[-1] = (last_id, orjson.dumps(last_event) + b"\n\n", put_time)
+        return True
+
+    def _evict_token_event(self) -> bool:
+        queue = self._queue
+        for index, (event_id, _, _) in enumerate(queue):
+            if is_token_event(event_id):
+                del queue[index]
+                self._unfinished_tasks -= 1
+                self.dropped += 1
+                return True
+        return False
+
+
+def _load_token_event(value: bytes | None) -> dict[str, Any] | None:
+    try:
+        event = orjson.loads(value) if value is not None else None
+    except orjson.JSONDecodeError:
+        return None
+    return event if isinstance(event, dict) and isinstance(event.get("data"), dict) else None
@@ -0,0 +1,262 @@
+"""Job registry and event streams shared by the workers of a deployment.
+
+With a single worker, the events of a build are read from the in-process queue of the job. With
+several workers behind a load balancer, the request reading the events or cancelling a build may land
+on a worker that did not start it. A `JobRegistry` records which jobs exist, carries their events in a
+stream any worker can read, and forwards cancellations to the worker running the job.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from langflow.services.job_queue.event_queue import EventQueueItem
+
+CONSUMER_GROUP = "consumers"
+LISTENER_RETRY_DELAY = 1.0
+# The most events read from the stream of a job at once
+READ_BATCH_SIZE = 100
+
+
+class JobRegistry(ABC):
+    """Registry of the jobs of all workers and of their event streams."""
+
+    worker_id: str
+    stream_max_len: int
+    """The most unread events in the stream of a job; beyond it, the events of the job wait in its queue."""
+
+    @abstractmethod
+    async def register_job(self, job_id: str) -> None:
+        """Record a job started by this worker and create its event stream."""
+
+    @abstractmethod
+    async def job_exists(self, job_id: str) -> bool:
+        """Check whether a job was registered by any worker and has not expired."""
+
+    @abstractmethod
+    async def publish_events(self, job_id: str, items: list[EventQueueItem]) -> int:
+        """Append events to the stream of a job; an item with a None value ends the stream.
+
+        Returns the number of events in the stream, which only keeps the last read one besides the unread ones.
+        """
+
+    @abstractmethod
+    async def stream_length(self, job_id: str) -> int:
+        """Return the number of events in the stream of a job, as `publish_events` does."""
+
+    @abstractmethod
+    async def read_events(self, job_id: str, timeout: float, count: int) -> list[EventQueueItem]:
+        """Return up to `count` events of a job not read by any consumer yet.
+
+        Waits at most `timeout` seconds for the first one, and returns an empty list if none comes.
+        """
+
+    @abstractmethod
+    async def finish_job(self, job_id: str) -> None:
+        """End the event stream of a job that was cleaned up before it ended it."""
+
+    @abstractmethod
+    async def request_cancel(self, job_id: str) -> bool:
+        """Ask the worker running a job to cancel it. Returns False if the job does not exist."""
+
+    @abstractmethod
+    async def listen_for_cancellations(self, on_cancel: Callable[[str], Awaitable[None]]) -> None:
+        """Call `on_cancel` with the id of every job whose cancellation is requested, until cancelled."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release the connections of the registry."""
+
+
+class RedisJobRegistry(JobRegistry):
+    """Job registry backed by Redis: a hash per job, a stream of events per job and a cancellation channel.
+
+    Each job stream has a single consumer group shared by all workers, so every event is delivered once,
+    to whichever worker is serving the events of the job at that moment, as with the in-process queue.
+    Events are trimmed from the stream once read, so it only holds the unread events and the last read one.
+    Jobs and streams expire `ttl` seconds after their last event.
+
+    Example:
+        registry = RedisJobRegistry(redis.asyncio.Redis.from_url(url))
+        await registry.register_job(job_id)
+        await registry.publish_events(job_id, [(event_id, value, time.time())])
+        [(event_id, value, put_time)] = await registry.read_events(job_id, timeout=5, count=1)
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        key_prefix: str = "langflow:job:",
+        ttl: int = 3600,
+        stream_max_len: int = 10000,
+        worker_id: str | None = None,
+    ) -> None:
+        self.client = client
+        self.key_prefix = key_prefix
+        self.ttl = ttl
+        self.stream_max_len = stream_max_len
+        self.worker_id = worker_id or uuid.uuid4().hex
+        self.cancel_channel = f"{key_prefix}cancel"
+        self.listening = False
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.key_prefix}{job_id}"
+
+    def _stream_key(self, job_id: str) -> str:
+        return f"{self.key_prefix}{job_id}:events"
+
+    async def register_job(self, job_id: str) -> None:
+        stream_key = self._stream_key(job_id)
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.hset(self._job_key(job_id), mapping={"worker": self.worker_id, "created_at": time.time()})
+            pipe.expire(self._job_key(job_id), self.ttl)
+            pipe.xgroup_create(stream_key, CONSUMER_GROUP, id="0", mkstream=True)
+            pipe.expire(stream_key, self.ttl)
+            await pipe.execute()
+
+    async def job_exists(self, job_id: str) -> bool:
+        return bool(await self.client.exists(self._job_key(job_id)))
+
+    async def publish_events(self, job_id: str, items: list[EventQueueItem]) -> int:
+        stream_key = self._stream_key(job_id)
+        async with self.client.pipeline(transaction=False) as pipe:
+            for event_id, value, put_time in items:
+                fields = {"ts": put_time} if value is None else {"id": event_id or "", "value": value, "ts": put_time}
+                pipe.xadd(stream_key, fields)
+            pipe.expire(stream_key, self.ttl)
+            pipe.expire(self._job_key(job_id), self.ttl)
+            pipe.xlen(stream_key)
+            results = await pipe.execute()
+        return results[-1]
+
+    async def stream_length(self, job_id: str) -> int:
+        return await self.client.xlen(self._stream_key(job_id))
+
+    async def read_events(self, job_id: str, timeout: float, count: int) -> list[EventQueueItem]:
+        stream_key = self._stream_key(job_id)
+        try:
+            response = await self.client.xreadgroup(
+                CONSUMER_GROUP, self.worker_id, {stream_key: ">"}, count=count, block=max(int(timeout * 1000), 1)
+            )
+        except Exception as exc:
+            if "NOGROUP" not in str(exc):
+                raise
+            # The stream expired, or was never created
+            return [(None, None, time.time())]
+        if not response:
+            return []
+        entries = response[0][1]
+        entry_ids = [entry_id for entry_id, _ in entries]
+        # Only acknowledged events are trimmed, up to the last one, so that the stream is never left empty
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.xack(stream_key, CONSUMER_GROUP, *entry_ids)
+            pipe.xtrim(stream_key, minid=entry_ids[-1], approximate=False)
+            await pipe.execute()
+        return [_event_from_fields(fields) for _, fields in entries]
+
+    async def finish_job(self, job_id: str) -> None:
+        await self.publish_events(job_id, [(None, None, time.time())])
+
+    async def request_cancel(self, job_id: str) -> bool:
+        if not await self.job_exists(job_id):
+            return False
+        await self.client.publish(self.cancel_channel, job_id)
+        return True
+
+    async def listen_for_cancellations(self, on_cancel: Callable[[str], Awaitable[None]]) -> None:
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.subscribe(self.cancel_channel)
+                self.listening = True
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        data = message["data"]
+                        await on_cancel(data.decode() if isinstance(data, bytes) else data)
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001
+                logger.exception("Lost the job cancellation channel; reconnecting")
+            finally:
+                self.listening = False
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+            await asyncio.sleep(LISTENER_RETRY_DELAY)
+
+    async def close(self) -> None:
+        with contextlib.suppress(Exception):
+            await self.client.aclose()
+
+
+class RegistryEventQueue:
+    """Read side of the event stream of a job, with the `get`, `get_nowait` and `empty` methods of a queue.
+
+    `get` waits for the next event and reads it along with the events already in the stream, up to
+    `read_batch_size`, which `empty` and `get_nowait` then return without waiting. The stream ends when
+    its end marker is read, or when the job no longer exists in the registry, for instance because the
+    worker running it died.
+    """
+
+    def __init__(
+        self, registry: JobRegistry, job_id: str, poll_timeout: float = 5.0, read_batch_size: int = READ_BATCH_SIZE
+    ) -> None:
+        self.registry = registry
+        self.job_id = job_id
+        self.poll_timeout = poll_timeout
+        self.read_batch_size = read_batch_size
+        self._buffer: deque[EventQueueItem] = deque()
+
+    def empty(self) -> bool:
+        return not self._buffer
+
+    def get_nowait(self) -> EventQueueItem:
+        if not self._buffer:
+            raise asyncio.QueueEmpty
+        return self._buffer.popleft()
+
+    async def get(self) -> EventQueueItem:
+        while not self._buffer:
+            self._buffer.extend(await self.registry.read_events(self.job_id, self.poll_timeout, self.read_batch_size))
+            if not self._buffer and not await self.registry.job_exists(self.job_id):
+                return None, None, time.time()
+        return self._buffer.popleft()
+
+
+class RemoteJobHandle:
+    """Stands for the task of a job running on another worker: cancelling it cancels the job there."""
+
+    def __init__(self, registry: JobRegistry, job_id: str) -> None:
+        self.registry = registry
+        self.job_id = job_id
+        self._cancel_task: asyncio.Task | None = None
+
+    def cancel(self, msg: Any | None = None) -> bool:  # noqa: ARG002
+        if self._cancel_task is None:
+            self._cancel_task = asyncio.create_task(self.registry.request_cancel(self.job_id))
+        return True
+
+    def cancelled(self) -> bool:
+        return self._cancel_task is not None
+
+    def done(self) -> bool:
+        return False
+
+
+def _event_from_fields(fields: dict) -> EventQueueItem:
+    fields = {key.decode() if isinstance(key, bytes) else key: value for key, value in fields.items()}
+    put_time = float(fields["ts"])
+    if "value" not in fields:
+        return None, None, put_time
+    event_id = fields["id"].decode() if isinstance(fields["id"], bytes) else fields["id"]
+    return event_id, fields["value"], put_time
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
 from langflow.events.event_manager import EventManager, create_default_event_manager
 from langflow.services.base import Service
+from langflow.services.job_queue.admission import AdmissionController, AdmissionTicket, JobQueueFullError
+from langflow.services.job_queue.event_queue import BoundedEventQueue
+from langflow.services.job_queue.registry import JobRegistry, RedisJobRegistry, RegistryEventQueue, RemoteJobHandle
+
+if TYPE_CHECKING:
+    from langflow.services.settings.base import Settings
+    from langflow.services.settings.service import SettingsService
+    from langflow.services.telemetry.opentelemetry import OpenTelemetry
 
 
 class JobQueueNotFoundError(Exception):
@@ -16,6 +25,12 @@ class JobQueueNotFoundError(Exception):
         super().__init__(f"Job queue not found for job_id: {job_id}")
 
 
+# The most events read from a job queue and written to the job registry at once
+FORWARD_BATCH_SIZE = 100
+# Seconds between two checks of whether the readers of a full event stream caught up
+FORWARD_RETRY_DELAY = 0.1
+
+
 class JobQueueService(Service):
     """Asynchronous service for managing job-specific queues and their associated tasks.
 
@@ -26,6 +41,17 @@ class JobQueueService(Service):
       - Safely clean up resources by cancelling active tasks and emptying queues.
       - Automatically perform periodic cleanup of inactive or completed job queues.
 
+    Jobs go through admission control: at most `max_concurrent_builds` run at once, and at most
+    `max_concurrent_builds_per_user` for the same user. The others wait in a FIFO or priority queue
+    (`build_admission_policy`) of at most `max_queued_builds` jobs, beyond which `start_job` raises
+    JobQueueFullError. Event queues hold at most `event_queue_max_size` events; when a client reads
+    them too slowly, token events are coalesced or dropped (`event_queue_overflow_policy`).
+
+    With the "redis" `job_queue_backend`, jobs registered with `register_job` are shared with the other
+    workers through a JobRegistry: their events are forwarded to a Redis stream that `aget_queue_data`
+    reads on any worker, and `request_cancel` cancels them from any worker. Once a stream
+    holds `job_event_stream_max_len` unread events, the next ones wait in the event queue of the job.
+
     The cleanup process follows a two-phase approach:
       1. When a task is cancelled or fails, it is marked for cleanup by setting a timestamp
       2. The actual cleanup only occurs after CLEANUP_GRACE_PERIOD seconds have elapsed
@@ -49,10 +75,10 @@ class JobQueueService(Service):
             Default is 300 seconds (5 minutes).
 
     Example:
-        service = JobQueueService()
-        await service.start()
+        service = JobQueueService(settings_service)
+        service.start()
         queue, event_manager = service.create_queue("job123")
-        service.start_job("job123", some_async_coroutine())
+        service.start_job("job123", some_async_coroutine(), user_id=str(user.id))
         # Retrieve and use the queue data as needed
         data = service.get_queue_data("job123")
         await service.cleanup_job("job123")
@@ -61,12 +87,28 @@ class JobQueueService(Service):
 
     name = "job_queue_service"
 
-    def __init__(self) -> None:
+    def __init__(self, settings_service: SettingsService, job_registry: JobRegistry | None = None) -> None:
         """Initialize the JobQueueService.
 
-        Sets up the internal registry for job queues, initializes the cleanup task, and sets the service state
-        to active.
+        Sets up the internal registry for job queues, the admission controller, the job registry shared with
+        other workers (if any), initializes the cleanup task, and sets the service state to active.
         """
+        self.settings_service = settings_service
+        settings = settings_service.settings
+        self.admission = AdmissionController(
+            max_concurrent=settings.max_concurrent_builds,
+            max_per_user=settings.max_concurrent_builds_per_user,
+            max_queued=settings.max_queued_builds,
+            policy=settings.build_admission_policy,
+        )
+        self.event_queue_max_size = settings.event_queue_max_size
+        self.event_queue_overflow_policy = settings.event_queue_overflow_policy
+        self.token_batch_interval = settings.token_batch_interval
+        self.token_batch_size = settings.token_batch_size
+        self._ot: OpenTelemetry | None = None
+        self.job_registry = job_registry or self._create_job_registry(settings)
+        self._forwarders: dict[str, asyncio.Task] = {}
+        self._cancel_listener_task: asyncio.Task | None = None
         self._queues: dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]] = {}
         self._cleanup_task: asyncio.Task | None = None
         self._closed = False
@@ -94,6 +136,10 @@ class JobQueueService(Service):
         """
         self._closed = False
         self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
+        if self.job_registry is not None:
+            self._cancel_listener_task = asyncio.create_task(
+                self.job_registry.listen_for_cancellations(self._on_cancel_requested)
+            )
         logger.debug("JobQueueService started: periodic cleanup task initiated.")
 
     async def stop(self) -> None:
@@ -106,6 +152,10 @@ class JobQueueService(Service):
             clearing queued items.
         """
         self._closed = True
+        if self._cancel_listener_task:
+            self._cancel_listener_task.cancel()
+            await asyncio.wait([self._cancel_listener_task])
+            self._cancel_listener_task = None
         if self._cleanup_task:
             self._cleanup_task.cancel()
             await asyncio.wait([self._cleanup_task])
@@ -117,6 +167,8 @@ class JobQueueService(Service):
         # Clean up each registered job queue.
         for job_id in list(self._queues.keys()):
             await self.cleanup_job(job_id)
+        if self.job_registry is not None:
+            await self.job_registry.close()
         logger.debug("JobQueueService stopped: all job queues have been cleaned up.")
 
     async def teardown(self) -> None:
@@ -143,26 +195,36 @@ class JobQueueService(Service):
             logger.error(msg)
             raise RuntimeError(msg)
 
-        main_queue: asyncio.Queue = asyncio.Queue()
-        event_manager = create_default_event_manager(main_queue)
+        main_queue: asyncio.Queue = BoundedEventQueue(
+            self.event_queue_max_size, overflow_policy=self.event_queue_overflow_policy
+        )
+        event_manager = create_default_event_manager(
+            main_queue, token_batch_interval=self.token_batch_interval, token_batch_size=self.token_batch_size
+        )
 
         # Register the queue without an active task.
         self._queues[job_id] = (main_queue, event_manager, None, None)
         logger.debug(f"Queue and event manager successfully created for job_id {job_id}")
         return main_queue, event_manager
 
-    def start_job(self, job_id: str, task_coro) -> None:
+    def start_job(self, job_id: str, task_coro, *, user_id: str | None = None, priority: int = 0) -> None:
         """Start an asynchronous task for a given job, replacing any existing active task.
 
         The method performs the following:
           - Verifies the presence of a registered queue for the job.
+          - Submits the job for admission, rejecting it if the admission queue is full.
           - Cancels any currently running task associated with the job.
-          - Launches a new asynchronous task using the provided coroutine.
+          - Launches a new asynchronous task that runs the provided coroutine once the job is admitted.
           - Updates the internal registry with the new task.
 
         Args:
             job_id (str): Unique identifier for the job.
             task_coro: A coroutine representing the job's asynchronous task.
+            user_id (str | None): The user the job runs for, counted against the per-user limit.
+            priority (int): Admission priority with the "priority" policy; lower values start first.
+
+        Raises:
+            JobQueueFullError: If too many jobs are waiting to start. The job's queue is removed.
         """
         if job_id not in self._queues:
             msg = f"No queue found for job_id {job_id}"
@@ -174,6 +236,15 @@ class JobQueueService(Service):
             logger.error(msg)
             raise RuntimeError(msg)
 
+        try:
+            ticket = self.admission.submit(user_id, priority)
+        except JobQueueFullError:
+            task_coro.close()
+            self._queues.pop(job_id, None)
+            self._record_admission_metrics(None)
+            logger.warning(f"Rejected job_id {job_id}: {self.admission.waiting} jobs are waiting to start")
+            raise
+
         main_queue, event_manager, existing_task, _ = self._queues[job_id]
 
         if existing_task and not existing_task.done():
@@ -181,13 +252,112 @@ class JobQueueService(Service):
             existing_task.cancel()
 
         # Initiate the new asynchronous task.
-        task = asyncio.create_task(task_coro)
+        task = asyncio.create_task(self._run_admitted(job_id, ticket, task_coro))
         self._queues[job_id] = (main_queue, event_manager, task, None)
+        self._record_admission_metrics(None)
         logger.debug(f"New task started for job_id {job_id}")
 
+    async def _run_admitted(self, job_id: str, ticket: AdmissionTicket, task_coro) -> None:
+        """Wait for the job to be admitted, run it, and free its slot for the next waiting job."""
+        try:
+            if not ticket.future.done():
+                logger.debug(f"Job_id {job_id} is waiting to start behind {self.admission.waiting - 1} jobs")
+                await ticket.future
+            self._record_admission_metrics(ticket)
+            await task_coro
+        finally:
+            # Close the coroutine if the job was cancelled before it started
+            task_coro.close()
+            self.admission.release(ticket)
+            self._record_admission_metrics(None)
+
+    def stats(self) -> dict[str, float]:
+        event_queues = [queue for queue, *_ in self._queues.values() if isinstance(queue, BoundedEventQueue)]
+        return {
+            **self.admission.stats(),
+            "jobs": len(self._queues),
+            "queued_events": sum(queue.qsize() for queue in event_queues),
+            "coalesced_events": sum(queue.coalesced for queue in event_queues),
+            "dropped_events": sum(queue.dropped for queue in event_queues),
+        }
+
+    def _record_admission_metrics(self, admitted: AdmissionTicket | None) -> None:
+        """Update the running and waiting build gauges, and the wait time of a newly admitted job."""
+        if (metrics := self._metrics()) is None:
+            return
+        metrics.update_gauge("build_jobs", self.admission.running, {"state": "running"})
+        metrics.update_gauge("build_jobs", self.admission.waiting, {"state": "waiting"})
+        if admitted is not None:
+            labels = {"policy": self.admission.policy}
+            metrics.observe_histogram("build_admission_wait_time", admitted.wait_time, labels)
+
+    def _metrics(self) -> OpenTelemetry | None:
+        if self._ot is None:
+            try:
+                from langflow.services.telemetry.opentelemetry import OpenTelemetry
+
+                self._ot = OpenTelemetry(prometheus_enabled=self.settings_service.settings.prometheus_enabled)
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).debug("Error initializing the job queue metrics")
+        return self._ot
+
+    async def register_job(self, job_id: str) -> None:
+        """Share a job started by this worker with the other workers, when a job registry is configured.
+
+        From then on the events of the job are forwarded to the registry, and read from it by
+        `get_queue_data` and `aget_queue_data` on any worker.
+        """
+        if self.job_registry is None or job_id not in self._queues:
+            return
+        await self.job_registry.register_job(job_id)
+        main_queue = self._queues[job_id][0]
+        self._forwarders[job_id] = asyncio.create_task(self._forward_events(job_id, main_queue))
+
+    def owns_job(self, job_id: str) -> bool:
+        """Check whether a job was created by this worker and has not been cleaned up."""
+        return job_id in self._queues
+
+    async def aget_queue_data(self, job_id: str) -> tuple[Any, EventManager, Any, float | None]:
+        """Like `get_queue_data`, but also finds the jobs of the other workers in the job registry.
+
+        The events of a job of another worker are read from the registry, and cancelling its task
+        requests the cancellation of the job from the worker running it.
+
+        Raises:
+            JobQueueNotFoundError: If the job_id is not found on this worker nor in the job registry.
+            RuntimeError: If the service is closed.
+        """
+        if job_id in self._queues or self.job_registry is None:
+            return self.get_queue_data(job_id)
+        if self._closed:
+            msg = f"Queue service is closed for job_id: {job_id}"
+            raise RuntimeError(msg)
+        if not await self.job_registry.job_exists(job_id):
+            raise JobQueueNotFoundError(job_id)
+        # Nothing is registered on the events of a remote job, so its on_* callbacks are no-ops
+        event_manager = EventManager(asyncio.Queue())
+        return (
+            RegistryEventQueue(self.job_registry, job_id),
+            event_manager,
+            RemoteJobHandle(self.job_registry, job_id),
+            None,
+        )
+
+    async def request_cancel(self, job_id: str) -> bool:
+        """Cancel a job running on another worker through the job registry.
+
+        Raises:
+            JobQueueNotFoundError: If there is no job registry or the job does not exist.
+        """
+        if self.job_registry is None or not await self.job_registry.request_cancel(job_id):
+            raise JobQueueNotFoundError(job_id)
+        return True
+
     def get_queue_data(self, job_id: str) -> tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]:
         """Retrieve the complete data structure associated with a job's queue.
 
+        The events of a job registered with `register_job` are read from the job registry instead of the queue.
+
         Args:
             job_id (str): Unique identifier for the job.
 
@@ -205,9 +375,12 @@ class JobQueueService(Service):
             raise RuntimeError(msg)
 
         try:
-            return self._queues[job_id]
+            queue_data = self._queues[job_id]
         except KeyError as exc:
             raise JobQueueNotFoundError(job_id) from exc
+        if self.job_registry is not None and job_id in self._forwarders:
+            return (RegistryEventQueue(self.job_registry, job_id), *queue_data[1:])  # type: ignore[return-value]
+        return queue_data
 
     async def cleanup_job(self, job_id: str) -> None:
         """Clean up and release resources for a specific job.
@@ -234,7 +407,7 @@ class JobQueueService(Service):
             task.cancel()
             await asyncio.wait([task])
             # Log any exceptions that occurred during the task's execution.
-            if exc := task.exception():
+            if not task.cancelled() and (exc := task.exception()):
                 logger.error(f"Error in task for job_id {job_id}: {exc}")
             logger.debug(f"Task cancellation complete for job_id {job_id}")
 
@@ -248,10 +421,70 @@ class JobQueueService(Service):
                 break
 
         logger.debug(f"Removed {items_cleared} items from queue for job_id {job_id}")
+        if (forwarder := self._forwarders.pop(job_id, None)) is not None:
+            forwarder.cancel()
+            await asyncio.wait([forwarder])
+            if self.job_registry is not None:
+                try:
+                    await self.job_registry.finish_job(job_id)
+                except Exception:  # noqa: BLE001
+                    logger.opt(exception=True).warning(f"Could not end the event stream of job_id {job_id}")
         # Remove the job entry from the registry
         self._queues.pop(job_id, None)
         logger.debug(f"Cleanup successful for job_id {job_id}: resources have been released.")
 
+    async def _forward_events(self, job_id: str, main_queue: asyncio.Queue) -> None:
+        """Move the events of a job from its queue to the job registry, until the end of the stream.
+
+        While the stream holds `stream_max_len` unread events, as when nobody reads them, the events are left
+        in the queue, whose overflow policy coalesces or drops token events and keeps every other event.
+        """
+        registry = self.job_registry
+        if registry is None:
+            return
+        stream_length = 0
+        while True:
+            # The stream also keeps the last event read from it
+            while stream_length > registry.stream_max_len:
+                await asyncio.sleep(FORWARD_RETRY_DELAY)
+                try:
+                    stream_length = await registry.stream_length(job_id)
+                except Exception:  # noqa: BLE001
+                    logger.opt(exception=True).warning(f"Could not read the event stream length of job_id {job_id}")
+            batch_size = min(FORWARD_BATCH_SIZE, registry.stream_max_len + 1 - stream_length)
+            items = [await main_queue.get()]
+            while len(items) < batch_size and not main_queue.empty():
+                items.append(main_queue.get_nowait())
+            try:
+                stream_length = await registry.publish_events(job_id, items)
+            except Exception:  # noqa: BLE001
+                logger.opt(exception=True).error(f"Could not publish {len(items)} events of job_id {job_id}")
+            if any(value is None for _, value, _ in items):
+                return
+
+    async def _on_cancel_requested(self, job_id: str) -> None:
+        if job_id in self._queues:
+            logger.debug(f"Cancelling job_id {job_id} at the request of another worker")
+            await self.cleanup_job(job_id)
+
+    @staticmethod
+    def _create_job_registry(settings: Settings) -> JobRegistry | None:
+        if settings.job_queue_backend != "redis":
+            return None
+        try:
+            from redis.asyncio import StrictRedis
+        except ImportError as exc:
+            msg = (
+                "The redis job queue backend requires the redis-py package."
+                " Please install Langflow with the deploy extra: pip install langflow[deploy]"
+            )
+            raise ImportError(msg) from exc
+        if settings.redis_url:
+            client = StrictRedis.from_url(settings.redis_url)
+        else:
+            client = StrictRedis(host=settings.redis_host, port=settings.redis_port, db=settings.redis_db)
+        return RedisJobRegistry(client, ttl=settings.job_registry_ttl, stream_max_len=settings.job_event_stream_max_len)
+
     async def _periodic_cleanup(self) -> None:
         """Execute a periodic task that cleans up completed or cancelled job queues.
 
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from sqlalchemy.exc import DataError, IntegrityError
+
+from langflow.services.base import Service
+from langflow.services.database.models.message.crud import awrite_messagetables
+from langflow.services.deps import session_scope
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+    from langflow.services.database.models.message.model import MessageTable
+    from langflow.services.settings.service import SettingsService
+
+_STOP = object()
+
+
+class _Delete:
+    __slots__ = ("message_id",)
+
+    def __init__(self, message_id: UUID) -> None:
+        self.message_id = message_id
+
+
+class MessageWriterService(Service):
+    """Writes chat messages to the database in batches from a background task.
+
+    Messages are queued by `write` and `delete` and written with one transaction per batch. A batch is
+    written when it reaches `message_writer_batch_size` items or `message_writer_flush_interval` seconds
+    after its first item. When a batch holds several writes of the same message, for instance a checkpoint
+    of its partial text and its final text, only the last one is written.
+
+    The queue is not bounded, so messages are never dropped for lack of room. A message the database rejects,
+    for instance for a constraint violation, is dropped and counted as failed; the other messages of its batch
+    are then written one by one.
+
+    Example:
+        service = MessageWriterService(settings_service)
+        service.start()
+        service.write(MessageTable.from_message(message))
+        await service.flush()  # waits until everything queued so far is written
+        await service.stop()
+    """
+
+    name = "message_writer_service"
+
+    def __init__(self, settings_service: SettingsService) -> None:
+        settings = settings_service.settings
+        self.batch_size = settings.message_writer_batch_size
+        self.flush_interval = settings.message_writer_flush_interval
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._batch_ready = asyncio.Event()
+        self._worker_task: asyncio.Task | None = None
+        self._stopping = False
+        self.written = 0
+        self.deleted = 0
+        self.failed = 0
+        self.batches = 0
+
+    def is_started(self) -> bool:
+        return self._worker_task is not None and not self._worker_task.done()
+
+    def start(self) -> None:
+        if self.is_started():
+            return
+        self._worker_task = asyncio.create_task(self._worker())
+        logger.debug("MessageWriterService started")
+
+    async def stop(self) -> None:
+        """Stop the background writer after it writes everything that is queued."""
+        task, self._worker_task = self._worker_task, None
+        if task is None:
+            return
+        if not task.done():
+            self._stopping = True
+            self._queue.put_nowait(_STOP)
+            self._batch_ready.set()
+            await task
+            self._stopping = False
+        logger.debug("MessageWriterService stopped")
+
+    async def teardown(self) -> None:
+        await self.stop()
+
+    def write(self, message: MessageTable) -> None:
+        """Queue a message to be inserted, or updated if a message with its ID exists."""
+        self._put(message)
+
+    def delete(self, message_id: UUID) -> None:
+        """Queue the deletion of a message, after the writes of the message queued before."""
+        self._put(_Delete(message_id))
+
+    async def flush(self) -> None:
+        """Wait until everything queued so far is written."""
+        if not self.is_started():
+            return
+        done = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(done)
+        self._batch_ready.set()
+        await done
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "deleted": self.deleted,
+            "failed": self.failed,
+            "batches": self.batches,
+        }
+
+    def _put(self, item: MessageTable | _Delete) -> None:
+        self._queue.put_nowait(item)
+        if self._queue.qsize() >= self.batch_size:
+            self._batch_ready.set()
+
+    async def _worker(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = [await self._queue.get()]
+            if self._queue.qsize() + 1 < self.batch_size and not self._stopping:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+            self._batch_ready.clear()
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            if _STOP in batch:
+                stopping = True
+                # Everything queued before the stop request is written before exiting
+                batch = [item for item in batch if item is not _STOP]
+                while not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+            waiters = [item for item in batch if isinstance(item, asyncio.Future)]
+            await self._write([item for item in batch if not isinstance(item, asyncio.Future)])
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    async def _write(self, batch: list[MessageTable | _Delete]) -> None:
+        if not batch:
+            return
+        # The last write or deletion of each message wins
+        latest: dict[UUID, MessageTable | _Delete] = {}
+        for item in batch:
+            message_id = item.message_id if isinstance(item, _Delete) else item.id
+            latest.pop(message_id, None)
+            latest[message_id] = item
+        await self._write_items(list(latest.values()))
+
+    async def _write_items(self, items: list[MessageTable | _Delete]) -> None:
+        """Write messages with one transaction, or one by one when an invalid message makes it fail."""
+        messages = [item for item in items if not isinstance(item, _Delete)]
+        deleted_ids = [item.message_id for item in items if isinstance(item, _Delete)]
+        try:
+            async with session_scope() as session:
+                await awrite_messagetables(messages, deleted_ids, session)
+        except (IntegrityError, DataError):
+            if len(items) == 1:
+                self.failed += 1
+                logger.exception("Error writing a message")
+                return
+            # An invalid message rolls back the whole batch, so the messages are written one by one to drop only it
+            logger.opt(exception=True).warning(f"Error writing {len(items)} messages, retrying one by one")
+            for item in items:
+                await self._write_items([item])
+            return
+        except Exception:  # noqa: BLE001
+            self.failed += len(items)
+            logger.exception(f"Error writing {len(items)} messages")
+            return
+        self.written += len(messages)
+        self.deleted += len(deleted_ids)
+        self.batches += 1
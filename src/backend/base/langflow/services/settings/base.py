@@ -122,12 +122,35 @@ class Settings(BaseSettings):
     """
 
     # cache configuration
-    cache_type: Literal["async", "redis", "memory", "disk"] = "async"
-    """The cache type can be 'async' or 'redis'."""
+    cache_type: Literal["async", "redis", "memory", "disk", "sharded", "tiered"] = "async"
+    """The cache type can be 'async', 'redis', 'memory', 'disk', 'sharded' or 'tiered'. 'tiered' keeps recently used
+    values in process in front of Redis."""
     cache_expire: int = 3600
     """The cache expire in seconds."""
+    cache_shards: int = Field(default=16, ge=1)
+    """Number of lock-striped shards used by the sharded cache."""
+    cache_max_memory: int | None = Field(default=None, ge=0)
+    """Approximate memory budget in bytes for the sharded cache and for the in-process level of the tiered cache."""
+    cache_sweep_interval: float = Field(default=60.0, ge=0)
+    """Seconds between sweeps of expired entries in the sharded cache. 0 disables the background sweep."""
+    cache_compression: Literal["none", "zlib", "lz4", "zstd"] = "none"
+    """Compression for values stored by the redis and disk caches. lz4 and zstd fall back to zlib if not installed."""
+    cache_compression_threshold: int = Field(default=4096, ge=0)
+    """Minimum size in bytes of a cached value before it is compressed."""
+    graph_state_persistence: Literal["full", "delta"] = "full"
+    """How graphs cached between build steps are stored by the redis and disk caches. 'full' stores the whole graph
+    on every step, 'delta' stores the flow structure once and then only the vertices built since the last step."""
+    memoize_pure_components: bool = False
+    """If set to True, the outputs of components marked as pure are reused when they are built again with the same
+    code and inputs, across flow runs and sessions."""
     variable_store: str = "db"
     """The store can be 'db' or 'kubernetes'."""
+    variable_cache_ttl: float = Field(default=0.0, ge=0)
+    """Seconds the variables loaded from the 'db' store are kept in memory for the next runs of the same user.
+    Creating, updating or deleting a variable clears the cache of its user. 0 disables the cache."""
+    parse_cache_max_size: int = Field(default=512 * 1024 * 1024, ge=0)
+    """Maximum size in bytes of the on-disk cache of parsed files used by the File component, stored in
+    `config_dir/parse_cache`. Least recently used entries are evicted first. 0 disables the cache."""
 
     prometheus_enabled: bool = False
     """If set to True, Langflow will expose Prometheus metrics."""
@@ -146,6 +169,15 @@ class Settings(BaseSettings):
     redis_db: int = 0
     redis_url: str | None = None
     redis_cache_expire: int = 3600
+    tiered_cache_l1_max_size: int = Field(default=1024, ge=1)
+    """Maximum number of entries the tiered cache keeps in process."""
+    tiered_cache_write_mode: Literal["write-through", "write-behind"] = "write-through"
+    """Whether the tiered cache writes to Redis before returning ('write-through') or in background batches
+    ('write-behind')."""
+    tiered_cache_write_behind_interval: float = Field(default=0.5, gt=0)
+    """Seconds between the batched Redis writes of the tiered cache in 'write-behind' mode."""
+    tiered_cache_invalidation_channel: str = "langflow:cache:invalidate"
+    """Redis pub/sub channel the tiered cache uses to drop in-process entries changed by other workers."""
 
     # Sentry
     sentry_dsn: str | None = None
@@ -220,6 +252,64 @@ class Settings(BaseSettings):
     """The maximum number of vertex builds to keep in the database."""
     max_vertex_builds_per_vertex: int = 2
     """The maximum number of builds to keep per vertex. Older builds will be deleted."""
+    build_log_batch_size: int = Field(default=100, gt=0)
+    """The maximum number of vertex builds and transactions written to the database in one batch."""
+    build_log_flush_interval: float = Field(default=1.0, gt=0)
+    """Seconds to wait for a batch of vertex builds and transactions to fill up before writing it."""
+    build_log_queue_size: int = Field(default=10000, gt=0)
+    """The maximum number of vertex builds and transactions waiting to be written to the database."""
+    build_log_overflow_policy: Literal["block", "drop"] = "block"
+    """What to do when the build log queue is full: 'block' waits for room, 'drop' discards the new item."""
+    build_log_trim_interval: float = Field(default=30.0, gt=0)
+    """Seconds between enforcing max_transactions_to_keep and the vertex build limits."""
+    message_persistence: Literal["eager", "write_once"] = "eager"
+    """How streamed chat messages are stored. 'eager' inserts the message before streaming it and updates it
+    at the end; 'write_once' assigns its ID in the process, streams it right away and writes it once, at the end
+    of the stream, through the message writer."""
+    message_checkpoint_interval: float = Field(default=5.0, ge=0)
+    """With 'write_once' message persistence, seconds between writes of the partial text of a streamed message,
+    so a crash loses at most this much text. 0 disables the checkpoints."""
+    message_writer_batch_size: int = Field(default=100, gt=0)
+    """The maximum number of messages written to the database in one batch."""
+    message_writer_flush_interval: float = Field(default=0.1, gt=0)
+    """Seconds to wait for a batch of messages to fill up before writing it."""
+    api_key_cache_ttl: float = Field(default=30.0, ge=0)
+    """Seconds a valid API key is accepted without checking the database again. Deleting the key or updating its
+    user clears it in the process that made the change; other processes see it after at most this long.
+    0 disables the cache."""
+    api_key_usage_flush_interval: float = Field(default=5.0, gt=0)
+    """Seconds between writes of the aggregated API key usage counters (total_uses and last_used_at)."""
+    max_concurrent_builds: int = Field(default=32, ge=0)
+    """The maximum number of flow builds running at once in each worker. Other builds wait to be admitted.
+    0 means no limit."""
+    max_concurrent_builds_per_user: int = Field(default=0, ge=0)
+    """The maximum number of flow builds of the same user running at once in each worker. 0 means no limit."""
+    max_queued_builds: int = Field(default=1000, ge=0)
+    """The maximum number of flow builds waiting to be admitted. Further builds are rejected with a 503.
+    0 means no limit."""
+    build_admission_policy: Literal["fifo", "priority"] = "fifo"
+    """The order in which waiting builds are admitted: 'fifo' in arrival order, 'priority' by priority first,
+    so builds of public flows wait for the builds of authenticated users."""
+    event_queue_max_size: int = Field(default=10000, ge=0)
+    """The maximum number of events of a build waiting to be read by the client. 0 means no limit."""
+    event_queue_overflow_policy: Literal["coalesce", "drop"] = "coalesce"
+    """What to do with token events when the event queue of a build is full: 'coalesce' appends them to the last
+    queued token of the same message, 'drop' discards them. The client gets the full text with the message."""
+    token_batch_interval: float = Field(default=0, ge=0)
+    """Seconds during which the streamed tokens of a message are coalesced into a single token event, in build
+    events and in streamed /run responses. 0, the default, sends every token as its own event."""
+    token_batch_size: int = Field(default=2048, ge=0)
+    """The number of characters of coalesced tokens after which they are sent without waiting for the end of
+    token_batch_interval. 0 means no limit."""
+    job_queue_backend: Literal["memory", "redis"] = "memory"
+    """Where the jobs of flow builds are tracked. 'memory' keeps them in the worker that started them; 'redis'
+    also registers them in Redis (see the redis_* settings) and carries their events in Redis Streams, so any
+    worker can serve the events of a build or cancel it."""
+    job_registry_ttl: int = Field(default=3600, gt=0)
+    """Seconds a build job and its event stream are kept in Redis after its last event."""
+    job_event_stream_max_len: int = Field(default=10000, gt=0)
+    """The maximum number of unread events in the Redis stream of a build job. Further events wait in the event queue
+    of the job, where event_queue_overflow_policy applies."""
     webhook_polling_interval: int = 5000
     """The polling interval for the webhook in ms."""
     fs_flows_polling_interval: int = 10000
@@ -234,6 +324,9 @@ class Settings(BaseSettings):
     """If set to False, Langflow will not enable the MCP server."""
     mcp_server_enable_progress_notifications: bool = False
     """If set to False, Langflow will not send progress notifications in the MCP server."""
+    mcp_tool_catalog_ttl: float = Field(default=60.0, ge=0)
+    """Seconds the MCP tools of a user or a project are listed from memory. Saving or deleting a flow updates them
+    in the process that made the change; other processes see it after at most this long. 0 disables the cache."""
 
     # Public Flow Settings
     public_flow_cleanup_interval: int = Field(default=3600, gt=600)
@@ -247,6 +340,15 @@ class Settings(BaseSettings):
     lazy_load_components: bool = False
     """If set to True, Langflow will only partially load components at startup and fully load them on demand.
     This significantly reduces startup time but may cause a slight delay when a component is first used."""
+    use_component_index: bool = True
+    """If set to True, the component templates of each components path are loaded at startup from an index
+    persisted in `config_dir/component_index` or shipped with the package, as long as it matches the component
+    sources, instead of importing every component module."""
+    graph_execution_mode: Literal["layered", "ready_queue"] = "layered"
+    """How flows run through the API schedule their components. 'layered' waits for every component in a layer
+    before starting the next layer. 'ready_queue' starts each component as soon as its dependencies are built."""
+    graph_max_concurrency: int = Field(default=0, ge=0)
+    """Maximum number of components built concurrently in 'ready_queue' mode. 0 means unbounded."""
 
     @field_validator("event_delivery", mode="before")
     @classmethod
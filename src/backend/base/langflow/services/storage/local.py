@@ -1,8 +1,16 @@
+from __future__ import annotations
+
+import uuid
+from typing import TYPE_CHECKING
+
 import anyio
 from aiofile import async_open
 from loguru import logger
 
-from .service import StorageService
+from .service import STREAM_CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
 
 
 class LocalStorageService(StorageService):
@@ -67,6 +75,68 @@ class LocalStorageService(StorageService):
         logger.debug(f"File {file_name} retrieved successfully from flow {flow_id}.")
         return content
 
+    async def save_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file in the local storage from an iterable of chunks.
+
+        The chunks are written to a temporary file that replaces the target once complete, so readers
+        never see a partial file.
+
+        Returns:
+            The number of bytes written.
+        """
+        folder_path = self.data_dir / flow_id
+        await folder_path.mkdir(parents=True, exist_ok=True)
+        file_path = folder_path / file_name
+        partial_path = folder_path / f".{file_name}.{uuid.uuid4().hex}.part"
+
+        size = 0
+        try:
+            async with async_open(str(partial_path), "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+                    size += len(chunk)
+            await partial_path.replace(file_path)
+        except BaseException:
+            logger.exception(f"Error saving file {file_name} in flow {flow_id}")
+            await partial_path.unlink(missing_ok=True)
+            raise
+        logger.info(f"File {file_name} saved successfully in flow {flow_id}.")
+        return size
+
+    async def open_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file, or the bytes from `start` to `end` (inclusive), from the local storage in chunks.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        file_path = self.data_dir / flow_id / file_name
+        if not await file_path.exists():
+            msg = f"File {file_name} not found in flow {flow_id}"
+            raise FileNotFoundError(msg)
+
+        remaining = None if end is None else end - start + 1
+        async with async_open(str(file_path), "rb") as f:
+            f.seek(start)
+            while remaining is None or remaining > 0:
+                chunk = await f.read(chunk_size if remaining is None else min(chunk_size, remaining))
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+
+    async def get_local_path(self, flow_id: str, file_name: str) -> str | None:
+        file_path = self.data_dir / flow_id / file_name
+        return str(file_path) if await file_path.is_file() else None
+
     async def list_files(self, flow_id: str):
         """List all files in a specified flow.
 
@@ -1,8 +1,19 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 from loguru import logger
 
-from .service import StorageService
+from .service import STREAM_CHUNK_SIZE, StorageService
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+# S3 rejects multipart upload parts smaller than 5 MiB, except the last one
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
 
 
 class S3StorageService(StorageService):
@@ -57,6 +68,90 @@ class S3StorageService(StorageService):
             logger.exception(f"Error retrieving file {file_name} from folder {folder}")
             raise
 
+    async def save_stream(self, folder: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file to the S3 bucket from an iterable of chunks, with a multipart upload.
+
+        At most one part of `MULTIPART_PART_SIZE` bytes is held in memory.
+
+        Returns:
+            The number of bytes written.
+        """
+        key = f"{folder}/{file_name}"
+        upload = await asyncio.to_thread(self.s3_client.create_multipart_upload, Bucket=self.bucket, Key=key)
+        upload_id = upload["UploadId"]
+        parts: list[dict] = []
+        buffer = bytearray()
+        size = 0
+
+        async def upload_part(data: bytes) -> None:
+            response = await asyncio.to_thread(
+                self.s3_client.upload_part,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=len(parts) + 1,
+                Body=data,
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": len(parts) + 1})
+
+        try:
+            async for chunk in chunks:
+                buffer += chunk
+                size += len(chunk)
+                if len(buffer) >= MULTIPART_PART_SIZE:
+                    await upload_part(bytes(buffer))
+                    buffer.clear()
+            if buffer or not parts:
+                await upload_part(bytes(buffer))
+            await asyncio.to_thread(
+                self.s3_client.complete_multipart_upload,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            logger.exception(f"Error saving file {file_name} in folder {folder}")
+            await asyncio.to_thread(
+                self.s3_client.abort_multipart_upload, Bucket=self.bucket, Key=key, UploadId=upload_id
+            )
+            raise
+        logger.info(f"File {file_name} saved successfully in folder {folder}.")
+        return size
+
+    async def open_stream(
+        self,
+        folder: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file, or the bytes from `start` to `end` (inclusive), from the S3 bucket in chunks.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        params = {"Bucket": self.bucket, "Key": f"{folder}/{file_name}"}
+        # S3 rejects any range on an empty object, so the whole object is read without one
+        if start > 0 or end is not None:
+            params["Range"] = f"bytes={start}-{'' if end is None else end}"
+        try:
+            response = await asyncio.to_thread(self.s3_client.get_object, **params)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in {"NoSuchKey", "404"}:
+                msg = f"File {file_name} not found in folder {folder}"
+                raise FileNotFoundError(msg) from e
+            logger.exception(f"Error retrieving file {file_name} from folder {folder}")
+            raise
+        body = response["Body"]
+        try:
+            while chunk := await asyncio.to_thread(body.read, chunk_size):
+                yield chunk
+        finally:
+            body.close()
+
     async def list_files(self, folder: str):
         """List all files in a specified folder of the S3 bucket.
 
@@ -8,11 +8,23 @@ import anyio
 from langflow.services.base import Service
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
     from langflow.services.session.service import SessionService
     from langflow.services.settings.service import SettingsService
 
 
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
 class StorageService(Service):
+    """Stores the files of each flow or user.
+
+    `save_file` and `get_file` move whole files in memory. `save_stream` and `open_stream` move them in
+    chunks of `STREAM_CHUNK_SIZE` bytes, so memory use does not depend on the file size. Their default
+    implementations fall back to the in-memory methods and should be overridden by each backend.
+    """
+
     name = "storage_service"
 
     def __init__(self, session_service: SessionService, settings_service: SettingsService):
@@ -35,6 +47,38 @@ class StorageService(Service):
     async def get_file(self, flow_id: str, file_name: str) -> bytes:
         raise NotImplementedError
 
+    async def save_stream(self, flow_id: str, file_name: str, chunks: AsyncIterable[bytes]) -> int:
+        """Save a file from an iterable of chunks.
+
+        Returns:
+            The number of bytes written.
+        """
+        data = b"".join([chunk async for chunk in chunks])
+        await self.save_file(flow_id, file_name, data)
+        return len(data)
+
+    async def open_stream(
+        self,
+        flow_id: str,
+        file_name: str,
+        *,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Read a file, or the bytes from `start` to `end` (inclusive, like HTTP ranges), in chunks."""
+        data = await self.get_file(flow_id, file_name)
+        stop = len(data) if end is None else min(end + 1, len(data))
+        for offset in range(start, stop, chunk_size):
+            yield data[offset : min(offset + chunk_size, stop)]
+
+    async def get_local_path(self, flow_id: str, file_name: str) -> str | None:  # noqa: ARG002
+        """Return the path of the file on the local file system, or None if it is not stored locally.
+
+        Local files can be served by the web server directly, without reading them in Python.
+        """
+        return None
+
     @abstractmethod
     async def list_files(self, flow_id: str) -> list[str]:
         raise NotImplementedError
@@ -140,6 +140,34 @@ class OpenTelemetry(metaclass=ThreadSafeSingletonMetaUsingWeakref):
             metric_type=MetricType.COUNTER,
             labels={"flow_id": mandatory_label},
         )
+        self._add_metric(
+            name="api_key_auth_cache_lookups",
+            description="The number of API key checks answered from the in-process cache (hit) or the database (miss)",
+            unit="",
+            metric_type=MetricType.COUNTER,
+            labels={"result": mandatory_label},
+        )
+        self._add_metric(
+            name="api_key_usage_flush_lag",
+            description="Seconds between recording the oldest pending API key use and writing it to the database",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"status": mandatory_label},
+        )
+        self._add_metric(
+            name="build_jobs",
+            description="The number of flow builds running or waiting to be admitted in this worker",
+            unit="",
+            metric_type=MetricType.OBSERVABLE_GAUGE,
+            labels={"state": mandatory_label},
+        )
+        self._add_metric(
+            name="build_admission_wait_time",
+            description="Seconds a flow build waited to be admitted before it started",
+            unit="s",
+            metric_type=MetricType.HISTOGRAM,
+            labels={"policy": mandatory_label},
+        )
 
     def __init__(self, *, prometheus_enabled: bool = True):
         # Only initialize once
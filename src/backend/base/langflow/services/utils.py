@@ -139,9 +139,22 @@ async def teardown_services() -> None:
     try:
         from langflow.services.manager import service_manager
 
+        # Write the buffered build logs, messages and API key usage while the database service is still available
+        if (build_log_service := service_manager.services.get(ServiceType.BUILD_LOG_SERVICE)) is not None:
+            await build_log_service.stop()
+        if (message_writer_service := service_manager.services.get(ServiceType.MESSAGE_WRITER_SERVICE)) is not None:
+            await message_writer_service.stop()
+        if (auth_service := service_manager.services.get(ServiceType.AUTH_SERVICE)) is not None:
+            await auth_service.stop()
         await service_manager.teardown()
     except Exception as exc:  # noqa: BLE001
         logger.exception(exc)
+    try:
+        from langflow.base.data.utils import shutdown_parse_process_pool
+
+        await asyncio.to_thread(shutdown_parse_process_pool)
+    except Exception as exc:  # noqa: BLE001
+        logger.exception(exc)
 
 
 def initialize_settings_service() -> None:
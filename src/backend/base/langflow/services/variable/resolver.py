@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from langflow.services.deps import session_scope
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+    from langflow.services.variable.service import DatabaseVariableService, StoredVariable
+
+
+class RunVariableResolver:
+    """Resolves the variables used during a single flow run.
+
+    The variables a run needs are loaded with one query by `prefetch`. Each value is decrypted the first
+    time it is used and kept for the rest of the run. Names that were not prefetched are loaded on demand.
+
+    Example:
+        resolver = RunVariableResolver(variable_service, user_id)
+        await resolver.prefetch(["OPENAI_API_KEY", "ANTHROPIC_API_KEY"])
+        api_key = await resolver.get_variable("OPENAI_API_KEY", field="api_key")
+    """
+
+    def __init__(self, variable_service: DatabaseVariableService, user_id: UUID) -> None:
+        self.variable_service = variable_service
+        self.user_id = user_id
+        self.loads = 0
+        self._stored: dict[str, StoredVariable | None] = {}
+        self._values: dict[str, str] = {}
+
+    async def prefetch(self, names: Iterable[str]) -> None:
+        """Loads the variables that were not loaded yet with a single query."""
+        missing = {name for name in names if name not in self._stored}
+        if not missing:
+            return
+        async with session_scope() as session:
+            stored = await self.variable_service.get_stored_variables(self.user_id, missing, session)
+        self.loads += 1
+        for name in missing:
+            self._stored[name] = stored.get(name)
+
+    async def get_variable(self, name: str, field: str) -> str:
+        """Returns the decrypted value of a variable, with the same checks as `VariableService.get_variable`."""
+        if name not in self._stored:
+            await self.prefetch([name])
+        variable = self._stored[name]
+        self.variable_service.check_variable_use(variable, name, field)
+        if name not in self._values:
+            self._values[name] = self.variable_service.decrypt_variable(variable)
+        return self._values[name]
@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import os
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
+from cachetools import TTLCache
 from loguru import logger
-from sqlmodel import select
+from sqlmodel import col, select
 from typing_extensions import override
 
 from langflow.services.auth import utils as auth_utils
@@ -15,7 +16,7 @@ from langflow.services.variable.base import VariableService
 from langflow.services.variable.constants import CREDENTIAL_TYPE, GENERIC_TYPE
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Collection, Sequence
     from uuid import UUID
 
     from sqlmodel.ext.asyncio.session import AsyncSession
@@ -23,9 +24,26 @@ if TYPE_CHECKING:
     from langflow.services.settings.service import SettingsService
 
 
+VARIABLE_CACHE_MAX_USERS = 1024
+
+
+class StoredVariable(NamedTuple):
+    """A variable as stored in the database, with its value still encrypted."""
+
+    name: str
+    type: str | None
+    value: str | None
+
+
 class DatabaseVariableService(VariableService, Service):
     def __init__(self, settings_service: SettingsService):
         self.settings_service = settings_service
+        # The variables of each user, cached between runs when `variable_cache_ttl` is set.
+        # None marks a name that was looked up and not found.
+        ttl = settings_service.settings.variable_cache_ttl
+        self._variable_cache: TTLCache[str, dict[str, StoredVariable | None]] | None = (
+            TTLCache(maxsize=VARIABLE_CACHE_MAX_USERS, ttl=ttl) if ttl else None
+        )
 
     async def initialize_user_variables(self, user_id: UUID | str, session: AsyncSession) -> None:
         if not self.settings_service.settings.store_environment_variables:
@@ -62,10 +80,37 @@ class DatabaseVariableService(VariableService, Service):
         session: AsyncSession,
     ) -> str:
         # we get the credential from the database
-        # credential = session.query(Variable).filter(Variable.user_id == user_id, Variable.name == name).first()
-        stmt = select(Variable).where(Variable.user_id == user_id, Variable.name == name)
-        variable = (await session.exec(stmt)).first()
+        stored = await self.get_stored_variables(user_id, [name], session)
+        variable = stored.get(name)
+        self.check_variable_use(variable, name, field)
+        # we decrypt the value
+        return self.decrypt_variable(variable)
 
+    async def get_stored_variables(
+        self,
+        user_id: UUID | str,
+        names: Collection[str],
+        session: AsyncSession,
+    ) -> dict[str, StoredVariable]:
+        """Loads several variables of a user with a single query, without decrypting them.
+
+        Names that are not found are left out of the result.
+        """
+        cached = self._variable_cache.setdefault(str(user_id), {}) if self._variable_cache is not None else {}
+        missing = [name for name in names if name not in cached]
+        if missing:
+            stmt = select(Variable).where(Variable.user_id == user_id, col(Variable.name).in_(missing))
+            loaded = {
+                variable.name: StoredVariable(variable.name, variable.type, variable.value)
+                for variable in (await session.exec(stmt)).all()
+            }
+            for name in missing:
+                cached[name] = loaded.get(name)
+        return {name: variable for name in names if (variable := cached.get(name)) is not None}
+
+    @staticmethod
+    def check_variable_use(variable: StoredVariable | None, name: str, field: str) -> None:
+        """Raises if the variable does not exist or cannot be used in the given field."""
         if not variable or not variable.value:
             msg = f"{name} variable not found."
             raise ValueError(msg)
@@ -77,9 +122,14 @@ class DatabaseVariableService(VariableService, Service):
             )
             raise TypeError(msg)
 
-        # we decrypt the value
+    def decrypt_variable(self, variable: StoredVariable) -> str:
         return auth_utils.decrypt_api_key(variable.value, settings_service=self.settings_service)
 
+    def invalidate_user_variables(self, user_id: UUID | str) -> None:
+        """Drops the cached variables of a user. Called whenever one of them is created, updated or deleted."""
+        if self._variable_cache is not None:
+            self._variable_cache.pop(str(user_id), None)
+
     async def get_all(self, user_id: UUID | str, session: AsyncSession) -> list[VariableRead]:
         stmt = select(Variable).where(Variable.user_id == user_id)
         variables = list((await session.exec(stmt)).all())
@@ -121,6 +171,7 @@ class DatabaseVariableService(VariableService, Service):
         variable.value = encrypted
         session.add(variable)
         await session.commit()
+        self.invalidate_user_variables(user_id)
         await session.refresh(variable)
         return variable
 
@@ -145,6 +196,7 @@ class DatabaseVariableService(VariableService, Service):
 
         session.add(db_variable)
         await session.commit()
+        self.invalidate_user_variables(user_id)
         await session.refresh(db_variable)
         return db_variable
 
@@ -162,6 +214,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.invalidate_user_variables(user_id)
 
     @override
     async def delete_variable_by_id(self, user_id: UUID | str, variable_id: UUID, session: AsyncSession) -> None:
@@ -172,6 +225,7 @@ class DatabaseVariableService(VariableService, Service):
             raise ValueError(msg)
         await session.delete(variable)
         await session.commit()
+        self.invalidate_user_variables(user_id)
 
     async def create_variable(
         self,
@@ -192,5 +246,6 @@ class DatabaseVariableService(VariableService, Service):
         variable = Variable.model_validate(variable_base, from_attributes=True, update={"user_id": user_id})
         session.add(variable)
         await session.commit()
+        self.invalidate_user_variables(user_id)
         await session.refresh(variable)
         return variable
@@ -0,0 +1,48 @@
+"""Startup time of loading the component templates with and without the component index.
+
+Without an index every bundled component module is imported and evaluated. With an index that
+still matches the component sources, the templates are read from disk without importing any
+component, which must take less than a second.
+"""
+
+import time
+
+import pytest
+from langflow.interface.components import component_cache, get_and_cache_all_types_dict
+from langflow.services.deps import get_settings_service
+
+MAX_INDEXED_STARTUP_TIME = 1.0
+
+
+@pytest.fixture
+def settings_service(tmp_path, monkeypatch):
+    settings_service = get_settings_service()
+    monkeypatch.setattr(settings_service.settings, "config_dir", str(tmp_path))
+    monkeypatch.setattr(settings_service.settings, "lazy_load_components", False)
+    monkeypatch.setattr(component_cache, "all_types_dict", None)
+    return settings_service
+
+
+async def timed_types_dict(settings_service) -> tuple[float, dict]:
+    component_cache.all_types_dict = None
+    start = time.perf_counter()
+    all_types_dict = await get_and_cache_all_types_dict(settings_service)
+    return time.perf_counter() - start, all_types_dict
+
+
+@pytest.mark.benchmark
+async def test_indexed_startup_is_under_a_second(settings_service, monkeypatch):
+    monkeypatch.setattr(settings_service.settings, "use_component_index", False)
+    full_time, full_types = await timed_types_dict(settings_service)
+
+    monkeypatch.setattr(settings_service.settings, "use_component_index", True)
+    build_time, _ = await timed_types_dict(settings_service)
+    indexed_time, indexed_types = await timed_types_dict(settings_service)
+
+    component_count = sum(len(category) for category in indexed_types.values())
+    print(  # noqa: T201
+        f"\n{component_count} components: full load {full_time:.2f}s, "
+        f"index build {build_time:.2f}s, indexed load {indexed_time:.3f}s"
+    )
+    assert indexed_types.keys() == full_types.keys()
+    assert indexed_time < MAX_INDEXED_STARTUP_TIME
@@ -0,0 +1,76 @@
+"""Tokens per second a worker streams through `Component._stream_message`.
+
+A component streams TOKENS chunks of an LLM answer to the event manager of a build. Before, each chunk was
+sent from a worker thread with `asyncio.to_thread` and appended to the text with `+=`; now chunks are
+published on the event loop into the per-message token buffer of the event manager and joined once.
+"""
+
+import asyncio
+import time
+import uuid
+
+import pytest
+from langflow.custom.custom_component.component import Component
+from langflow.events.event_manager import create_default_event_manager
+from langflow.schema.message import Message
+
+TOKENS = 5_000
+
+
+class StreamChunk:
+    def __init__(self, content: str):
+        self.content = content
+
+
+class StreamingComponent(Component):
+    def build(self) -> None:
+        pass
+
+
+class ThreadHopStreamingComponent(StreamingComponent):
+    """The streaming path before: a thread hop per chunk and a quadratic `+=` of the text."""
+
+    async def _handle_async_iterator(self, iterator, message_id, message):
+        complete_message = ""
+        first_chunk = True
+        async for chunk in iterator:
+            complete_message += chunk.content
+            if first_chunk:
+                msg_copy = message.model_copy()
+                msg_copy.text = complete_message
+                await self._send_message_event(msg_copy, id_=message_id)
+            await asyncio.to_thread(self._event_manager.on_token, data={"chunk": chunk.content, "id": str(message_id)})
+            first_chunk = False
+        return complete_message
+
+
+async def llm_answer():
+    for index in range(TOKENS):
+        yield StreamChunk(f" tok{index % 10}")
+
+
+async def stream_answer(component: StreamingComponent) -> tuple[float, float, int]:
+    """Stream an answer; return the wall time, the CPU time and the number of events queued."""
+    queue: asyncio.Queue = asyncio.Queue()
+    component.set_event_manager(create_default_event_manager(queue, token_batch_interval=0.05, token_batch_size=2048))
+    message = Message(sender="Machine", sender_name="AI", text="", id=str(uuid.uuid4()))
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    text = await component._stream_message(llm_answer(), message)
+    component._event_manager.flush_tokens()
+    wall_time, cpu_time = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    assert len(text) == TOKENS * 5
+    return wall_time, cpu_time, queue.qsize()
+
+
+@pytest.mark.benchmark
+async def test_streaming_tokens_on_the_event_loop_is_faster():
+    results = {
+        "before": await stream_answer(ThreadHopStreamingComponent()),
+        "after": await stream_answer(StreamingComponent()),
+    }
+    for mode, (wall_time, cpu_time, events) in results.items():
+        print(  # noqa: T201
+            f"\n{mode}: {TOKENS / wall_time:,.0f} tokens/s, {wall_time / TOKENS * 1e6:.1f} us/token, "
+            f"{cpu_time / TOKENS * 1e6:.1f} us CPU/token, {events} events"
+        )
+    assert results["after"][0] < results["before"][0]
@@ -0,0 +1,98 @@
+"""Throughput of parsing a local corpus of PDF, DOCX and text files with threads vs processes.
+
+The parsers are CPU-bound and hold the GIL, so the thread pool is expected to be about as fast
+as parsing sequentially, while the process pool scales with the number of cores. The process
+pool is warmed up first, since its workers are started once and reused by later calls.
+"""
+
+import os
+import time
+
+import pytest
+from langflow.base.data.utils import parallel_load_data
+
+FILES_PER_TYPE = int(os.getenv("LANGFLOW_BENCHMARK_FILES_PER_TYPE", "12"))
+PAGES_PER_PDF = 20
+LINES_PER_PAGE = 40
+
+
+def build_pdf(pages: list[list[str]]) -> bytes:
+    """Build a minimal PDF with one Helvetica text line per entry of each page."""
+    page_count = len(pages)
+    font_id = 3 + 2 * page_count
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids ["
+        + b" ".join(f"{3 + 2 * index} 0 R".encode() for index in range(page_count))
+        + f"] /Count {page_count} >>".encode(),
+    ]
+    for index, lines in enumerate(pages):
+        content = b"BT /F1 10 Tf 12 TL 40 800 Td " + b" ".join(f"({line}) '".encode() for line in lines) + b" ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Contents {4 + 2 * index} 0 R "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> >>".encode()
+        )
+        objects.append(f"<< /Length {len(content)} >>\nstream\n".encode() + content + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+    xref_offset = len(pdf)
+    pdf += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    pdf += b"".join(f"{offset:010d} 00000 n \n".encode() for offset in offsets)
+    pdf += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    return bytes(pdf)
+
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory):
+    from docx import Document
+
+    directory = tmp_path_factory.mktemp("corpus")
+    paths = []
+    for index in range(FILES_PER_TYPE):
+        pages = [
+            [f"Document {index} page {page} line {line}" for line in range(LINES_PER_PAGE)]
+            for page in range(PAGES_PER_PDF)
+        ]
+        pdf_path = directory / f"document_{index}.pdf"
+        pdf_path.write_bytes(build_pdf(pages))
+
+        document = Document()
+        for line in range(PAGES_PER_PDF * LINES_PER_PAGE):
+            document.add_paragraph(f"Document {index} paragraph {line}")
+        docx_path = directory / f"document_{index}.docx"
+        document.save(docx_path)
+
+        # Non-ASCII text makes the encoding detection go through the whole file
+        text_path = directory / f"document_{index}.txt"
+        text_path.write_text("Überprüfung der Übersetzung, déjà vu.\n" * 5000, encoding="utf-8")
+        paths.extend([str(pdf_path), str(docx_path), str(text_path)])
+    return paths
+
+
+def timed_load(corpus: list[str], *, use_processes: bool) -> tuple[float, list]:
+    start = time.perf_counter()
+    loaded = parallel_load_data(
+        corpus, silent_errors=False, max_concurrency=os.cpu_count() or 1, use_processes=use_processes
+    )
+    return time.perf_counter() - start, loaded
+
+
+@pytest.mark.benchmark
+def test_process_pool_parsing_throughput(corpus):
+    # Start the workers of the shared process pool before measuring
+    parallel_load_data(corpus[:1], silent_errors=False, max_concurrency=os.cpu_count() or 1, use_processes=True)
+
+    thread_time, thread_loaded = timed_load(corpus, use_processes=False)
+    process_time, process_loaded = timed_load(corpus, use_processes=True)
+
+    print(  # noqa: T201
+        f"\n{len(corpus)} files on {os.cpu_count()} CPUs: threads {len(corpus) / thread_time:.1f} files/s, "
+        f"processes {len(corpus) / process_time:.1f} files/s ({thread_time / process_time:.2f}x)"
+    )
+    assert [data.data for data in process_loaded] == [data.data for data in thread_loaded]
+    assert "Document 0 page 0 line 0" in process_loaded[0].text
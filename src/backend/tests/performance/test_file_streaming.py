@@ -0,0 +1,99 @@
+"""Peak memory of streaming multi-GB files through the storage service.
+
+A sparse file of `FILE_SIZE` bytes is downloaded, zipped and uploaded again through the streaming
+storage API. The resident set size is sampled while the bytes flow and must only grow by a few
+chunks, not by the size of the file.
+"""
+
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import anyio
+import pytest
+from langflow.api.v2.files import zip_stream_generator
+from langflow.services.storage.local import LocalStorageService
+
+FILE_SIZE = int(os.getenv("LANGFLOW_BENCHMARK_FILE_SIZE", str(2 * 1024**3)))
+MAX_RSS_GROWTH = 64 * 1024 * 1024
+
+pytestmark = pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads the RSS from /proc")
+
+
+class RssSampler:
+    def __init__(self) -> None:
+        self.page_size = os.sysconf("SC_PAGE_SIZE")
+        self.baseline = self.rss()
+        self.peak = self.baseline
+
+    def rss(self) -> int:
+        with open("/proc/self/statm", "rb") as statm:  # noqa: PTH123
+            return int(statm.read().split()[1]) * self.page_size
+
+    def sample(self) -> None:
+        self.peak = max(self.peak, self.rss())
+
+    @property
+    def growth(self) -> int:
+        return self.peak - self.baseline
+
+
+@pytest.fixture
+async def storage(tmp_path):
+    settings_service = SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path)))
+    storage = LocalStorageService(session_service=None, settings_service=settings_service)
+    await (storage.data_dir / "folder").mkdir()
+    # Sparse, so the benchmark does not need FILE_SIZE bytes of disk to start with
+    async with await anyio.open_file(storage.build_full_path("folder", "large.bin"), "wb") as large_file:
+        await large_file.truncate(FILE_SIZE)
+    return storage
+
+
+async def drain(stream, sampler: RssSampler) -> int:
+    size = 0
+    async for chunk in stream:
+        size += len(chunk)
+        sampler.sample()
+    return size
+
+
+@pytest.mark.benchmark
+async def test_download_and_zip_stream_in_constant_memory(storage):
+    sampler = RssSampler()
+
+    start = time.perf_counter()
+    downloaded = await drain(storage.open_stream("folder", "large.bin"), sampler)
+    download_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    zipped = await drain(zip_stream_generator(storage, "folder", [("large.bin", "large.bin")]), sampler)
+    zip_time = time.perf_counter() - start
+
+    print(  # noqa: T201
+        f"\n{FILE_SIZE / 1024**2:.0f} MiB: download {download_time:.2f}s, zip {zip_time:.2f}s "
+        f"({zipped / 1024**2:.1f} MiB), RSS growth {sampler.growth / 1024**2:.1f} MiB"
+    )
+    assert downloaded == FILE_SIZE
+    assert sampler.growth < MAX_RSS_GROWTH
+
+
+@pytest.mark.benchmark
+async def test_upload_streams_in_constant_memory(storage):
+    sampler = RssSampler()
+    chunk = bytes(1024 * 1024)
+
+    async def upload_chunks():
+        for _ in range(FILE_SIZE // len(chunk)):
+            sampler.sample()
+            yield chunk
+
+    start = time.perf_counter()
+    size = await storage.save_stream("folder", "copy.bin", upload_chunks())
+    upload_time = time.perf_counter() - start
+
+    print(  # noqa: T201
+        f"\n{size / 1024**2:.0f} MiB: upload {upload_time:.2f}s, RSS growth {sampler.growth / 1024**2:.1f} MiB"
+    )
+    assert size == FILE_SIZE // len(chunk) * len(chunk)
+    assert sampler.growth < MAX_RSS_GROWTH
@@ -0,0 +1,60 @@
+"""Latency of listing the headers of the flows of a user.
+
+FLOWS flows with the data of a starter project are saved in a SQLite file. Before, the headers were read by
+loading every flow with its data and validating a `FlowHeader` from it; now they are read from the header
+columns and the interface summary with `get_flow_headers`.
+"""
+
+import json
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from langflow import initial_setup
+from langflow.api.utils import validate_is_component
+from langflow.services.database.models.flow.crud import get_flow_headers, select_flow_headers
+from langflow.services.database.models.flow.model import Flow, FlowHeader
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+FLOWS = 500
+REPEAT = 5
+
+
+async def list_headers(session: AsyncSession, user_id, *, projected: bool) -> float:
+    """Return the mean time, in ms, to list the headers of the flows of the user."""
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        if projected:
+            headers = await get_flow_headers(session, select_flow_headers().where(Flow.user_id == user_id))
+        else:
+            flows = validate_is_component((await session.exec(select(Flow).where(Flow.user_id == user_id))).all())
+            headers = [FlowHeader.model_validate(flow, from_attributes=True) for flow in flows]
+        assert len(headers) == FLOWS
+        session.expunge_all()
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+@pytest.mark.benchmark
+async def test_flow_headers_are_listed_without_the_data(tmp_path):
+    starter_project = Path(initial_setup.__file__).parent / "starter_projects" / "Basic Prompting.json"
+    flow_data = json.loads(starter_project.read_text(encoding="utf-8"))["data"]
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'flows.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    user_id = uuid4()
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add_all(Flow(name=f"Flow {index}", data=flow_data, user_id=user_id) for index in range(FLOWS))
+        await session.commit()
+
+        results = {
+            "before": await list_headers(session, user_id, projected=False),
+            "after": await list_headers(session, user_id, projected=True),
+        }
+    await engine.dispose()
+
+    for mode, elapsed in results.items():
+        print(f"\n{mode}: {FLOWS} flow headers in {elapsed:.1f} ms")  # noqa: T201
+    assert results["after"] < results["before"]
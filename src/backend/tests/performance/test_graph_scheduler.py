@@ -0,0 +1,85 @@
+"""Wall-time comparison of the layered and ready-queue graph schedulers.
+
+Each synthetic graph fans out from a single source into `width` independent branches of `depth`
+components and joins them back in a single sink. Only one component per layer is slow, so the
+layered scheduler pays `depth * slow_delay` while the ready-queue scheduler only pays the
+critical path of the slowest branch.
+"""
+
+import asyncio
+import time
+
+import pytest
+from langflow.custom import Component
+from langflow.graph import Graph
+from langflow.inputs import FloatInput, MessageTextInput
+from langflow.schema.message import Message
+from langflow.template import Output
+
+FAST_DELAY = 0.001
+SLOW_DELAY = 0.05
+
+
+class SleepComponent(Component):
+    display_name = "Sleep"
+    inputs = [
+        MessageTextInput(name="input_value", is_list=True),
+        FloatInput(name="delay", value=0.0),
+    ]
+    outputs = [Output(name="output", method="build_output")]
+
+    async def build_output(self) -> Message:
+        await asyncio.sleep(self.delay)
+        return Message(text=self._id)
+
+
+def build_synthetic_graph(width: int, depth: int) -> Graph:
+    source = SleepComponent(_id="source")
+    source.set(input_value="start")
+    tails = []
+    for branch in range(width):
+        previous = source
+        for level in range(depth):
+            # The slow vertex of each layer is on a different branch
+            delay = SLOW_DELAY if branch == level % width else FAST_DELAY
+            component = SleepComponent(_id=f"branch{branch}_level{level}")
+            component.set(input_value=previous.build_output, delay=delay)
+            previous = component
+        tails.append(previous)
+    sink = SleepComponent(_id="sink")
+    sink.set(input_value=[tail.build_output for tail in tails])
+    return Graph(source, sink)
+
+
+async def _run(graph: Graph, execution_mode: str, max_concurrency: int | None = None) -> float:
+    start = time.perf_counter()
+    await graph.process(fallback_to_env_vars=False, execution_mode=execution_mode, max_concurrency=max_concurrency)
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(("width", "depth"), [(8, 4), (16, 8), (4, 16)])
+async def test_ready_queue_vs_layered_wall_time(width, depth):
+    layered_graph = build_synthetic_graph(width, depth)
+    ready_queue_graph = build_synthetic_graph(width, depth)
+
+    layered_time = await _run(layered_graph, "layered")
+    ready_queue_time = await _run(ready_queue_graph, "ready_queue")
+
+    print(  # noqa: T201
+        f"width={width} depth={depth} layered={layered_time:.3f}s ready_queue={ready_queue_time:.3f}s "
+        f"speedup={layered_time / ready_queue_time:.2f}x"
+    )
+    assert all(vertex.built for vertex in ready_queue_graph.vertices)
+    assert ready_queue_time < layered_time
+
+
+@pytest.mark.benchmark
+async def test_ready_queue_respects_max_concurrency():
+    graph = build_synthetic_graph(width=8, depth=2)
+    unbounded_time = await _run(graph, "ready_queue")
+    graph = build_synthetic_graph(width=8, depth=2)
+    bounded_time = await _run(graph, "ready_queue", max_concurrency=1)
+
+    print(f"unbounded={unbounded_time:.3f}s max_concurrency=1 -> {bounded_time:.3f}s")  # noqa: T201
+    assert bounded_time > unbounded_time
@@ -0,0 +1,58 @@
+"""Latency of listing the MCP tools of a user as the number of flows grows.
+
+Flows with the data of a starter project are saved in a SQLite file. Before, every `tools/list` request read
+the headers of all the flows of the user and built their tools; now the tools come from the catalog, which
+only reads the flows changed since the last listing.
+"""
+
+import json
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from langflow import initial_setup
+from langflow.base.mcp import tool_catalog
+from langflow.base.mcp.tool_catalog import MCPToolCatalog
+from langflow.services.database.models.flow.model import Flow
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+FLOW_COUNTS = (100, 1_000)
+REPEAT = 20
+
+
+async def list_tools(session: AsyncSession, user_id, catalog: MCPToolCatalog, flows: int) -> float:
+    """Return the mean time, in ms, to list the tools of the user."""
+    await catalog.list_tools(("user", user_id), session)
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        assert len(await catalog.list_tools(("user", user_id), session)) == flows
+    return (time.perf_counter() - start) / REPEAT * 1000
+
+
+@pytest.mark.benchmark
+async def test_tool_listing_does_not_depend_on_the_number_of_flows(tmp_path, monkeypatch):
+    starter_project = Path(initial_setup.__file__).parent / "starter_projects" / "Basic Prompting.json"
+    flow_data = json.loads(starter_project.read_text(encoding="utf-8"))["data"]
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'flows.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    cached = MCPToolCatalog(ttl=3600)
+    monkeypatch.setattr(tool_catalog, "_tool_catalog", cached)
+    results = {}
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        for flows in FLOW_COUNTS:
+            user_id = uuid4()
+            session.add_all(Flow(name=f"Flow {index}", data=flow_data, user_id=user_id) for index in range(flows))
+            await session.commit()
+            results[f"{flows} flows, before"] = await list_tools(session, user_id, MCPToolCatalog(ttl=0), flows)
+            results[f"{flows} flows, after"] = await list_tools(session, user_id, cached, flows)
+    await engine.dispose()
+
+    for mode, elapsed in results.items():
+        print(f"\n{mode}: tools/list in {elapsed:.2f} ms")  # noqa: T201
+    small, large = FLOW_COUNTS
+    assert results[f"{large} flows, after"] < results[f"{large} flows, before"]
+    assert results[f"{large} flows, after"] < results[f"{small} flows, before"]
@@ -0,0 +1,97 @@
+"""Latency of reading the recent history of a chat session as the message table grows.
+
+The message table is seeded in a SQLite file with MESSAGE_ROWS messages spread over SESSIONS sessions. The
+last HISTORY messages of a session are read with the query `aget_last_messages` and the Memory component run,
+and a page of the monitor API is read with keyset pagination, after the first rows and after all of them.
+Without the message history indexes ("before"), both read every message of the table.
+"""
+
+import os
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from langflow.memory import _get_variable_query
+from langflow.services.database.models.message.model import MessageTable
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlmodel import select
+
+MESSAGE_ROWS = int(os.getenv("LANGFLOW_BENCHMARK_MESSAGE_ROWS", "1000000"))
+SMALL_TABLE_ROWS = 10_000
+SESSIONS = 100
+HISTORY = 20
+SEED_BATCH = 50_000
+REPEAT = 20
+
+
+def seed(engine, start: int, stop: int) -> None:
+    columns = [column.name for column in MessageTable.__table__.columns]
+    statement = f"INSERT INTO message ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"  # noqa: S608
+    epoch = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    defaults = {
+        "sender": "User",
+        "sender_name": "User",
+        "text": "How do I paginate the message history?",
+        "files": "[]",
+        "error": 0,
+        "edit": 0,
+        "properties": "{}",
+        "category": "message",
+        "content_blocks": "[]",
+        "flow_id": None,
+    }
+    with engine.begin() as connection:
+        for batch_start in range(start, stop, SEED_BATCH):
+            rows = []
+            for index in range(batch_start, min(batch_start + SEED_BATCH, stop)):
+                timestamp = (epoch + timedelta(seconds=index)).strftime("%Y-%m-%d %H:%M:%S.%f")
+                row = {
+                    **defaults,
+                    "id": uuid.uuid4().hex,
+                    "session_id": f"session-{index % SESSIONS}",
+                    "timestamp": timestamp,
+                    "inserted_at": timestamp,
+                }
+                rows.append(tuple(row[column] for column in columns))
+            connection.exec_driver_sql(statement, rows)
+
+
+def read_history(engine) -> tuple[float, float]:
+    """Return the mean time, in ms, to read the last messages of a session and a page of its history."""
+    last_messages = _get_variable_query(session_id="session-7", order="DESC", limit=HISTORY)
+    page = (
+        select(MessageTable)
+        .where(MessageTable.session_id == "session-7")
+        .order_by(MessageTable.timestamp.desc(), MessageTable.inserted_at.desc(), MessageTable.id.desc())
+        .limit(HISTORY + 1)
+    )
+    timings = []
+    with Session(engine) as session:
+        for stmt in (last_messages, page):
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                assert len(session.scalars(stmt).all()) >= HISTORY
+            timings.append((time.perf_counter() - start) / REPEAT * 1000)
+    return timings[0], timings[1]
+
+
+@pytest.mark.benchmark
+def test_recent_history_is_read_in_constant_time(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'messages.db'}")
+    MessageTable.__table__.create(engine)
+    seed(engine, 0, SMALL_TABLE_ROWS)
+    results = {f"{SMALL_TABLE_ROWS:,} rows": read_history(engine)}
+    seed(engine, SMALL_TABLE_ROWS, MESSAGE_ROWS)
+    results[f"{MESSAGE_ROWS:,} rows"] = read_history(engine)
+    with engine.begin() as connection:
+        for index in MessageTable.__table__.indexes:
+            connection.execute(text(f"DROP INDEX {index.name}"))
+    results[f"{MESSAGE_ROWS:,} rows, before"] = read_history(engine)
+
+    for mode, (last_messages, page) in results.items():
+        print(f"\n{mode}: last {HISTORY} messages {last_messages:.2f} ms, keyset page {page:.2f} ms")  # noqa: T201
+    small, large, before = results.values()
+    assert large[0] < small[0] * 5
+    assert large[0] < before[0]
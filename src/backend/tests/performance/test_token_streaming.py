@@ -0,0 +1,73 @@
+"""Throughput and CPU cost of streaming LLM tokens through the streamed /run response.
+
+A producer sends tokens to the event manager of a streamed `/api/v1/run` response while
+`consume_and_yield` drains its queue, as the endpoint does. Each token is sent on its own, as before
+token batching, and coalesced with `token_batch_interval`, reporting the tokens and events per second
+and the CPU time per token of each mode.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from langflow.api.v1.endpoints import consume_and_yield
+from langflow.events.event_manager import EventManager, create_stream_tokens_event_manager
+from langflow.schema.playground_events import create_event_by_type
+
+TOKENS = 20_000
+MESSAGE_ID = "7b0c7ac4-0c56-4e0f-b5a8-1b2a4ef1f0a1"
+
+
+class UnbatchedEventManager(EventManager):
+    """The send_event of the event manager before the orjson fast path and token batching."""
+
+    def send_event(self, *, event_type, data):
+        data = create_event_by_type(event_type, **data) if isinstance(data, dict) else data
+        str_data = json.dumps({"event": event_type, "data": jsonable_encoder(data)}) + "\n\n"
+        self.queue.put_nowait((f"{event_type}-{uuid.uuid4()}", str_data.encode("utf-8"), time.time()))
+
+
+async def stream_tokens(event_manager: EventManager) -> tuple[float, float, int]:
+    """Send TOKENS tokens and read them back; return the wall time, the CPU time and the number of events."""
+    queue = event_manager.queue
+    consumed: asyncio.Queue = asyncio.Queue()
+
+    async def produce():
+        for index in range(TOKENS):
+            event_manager.on_token(data={"chunk": f" tok{index % 10}", "id": MESSAGE_ID})
+            if index % 50 == 0:
+                await asyncio.sleep(0)
+        event_manager.on_end(data={"result": {}})
+        await queue.put((None, None, time.time()))
+
+    events = 0
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    producer = asyncio.create_task(produce())
+    async for _ in consume_and_yield(queue, consumed):
+        events += 1
+    await producer
+    return time.perf_counter() - wall_start, time.process_time() - cpu_start, events
+
+
+@pytest.mark.benchmark
+async def test_token_batching_reduces_cpu_per_token():
+    unbatched_manager = UnbatchedEventManager(asyncio.Queue())
+    unbatched_manager.register_event("on_token", "token")
+    unbatched_manager.register_event("on_end", "end")
+    results = {
+        "before": await stream_tokens(unbatched_manager),
+        "unbatched": await stream_tokens(create_stream_tokens_event_manager(asyncio.Queue())),
+        "batched": await stream_tokens(
+            create_stream_tokens_event_manager(asyncio.Queue(), token_batch_interval=0.05, token_batch_size=2048)
+        ),
+    }
+    for mode, (wall_time, cpu_time, events) in results.items():
+        print(  # noqa: T201
+            f"\n{mode}: {TOKENS / wall_time:,.0f} tokens/s, {events / wall_time:,.0f} events/s, "
+            f"{events} events, {cpu_time / TOKENS * 1e6:.1f} us CPU/token"
+        )
+    assert results["batched"][2] < TOKENS / 10
+    assert results["batched"][1] < results["before"][1]
@@ -0,0 +1,100 @@
+import multiprocessing
+import time
+
+import pytest
+from langflow.base.data import utils
+from langflow.base.data.utils import (
+    FileParseTimeoutError,
+    get_parse_process_pool,
+    iter_load_data,
+    iter_load_file_data,
+    load_file_with_timeout,
+    parallel_load_data,
+    shutdown_parse_process_pool,
+)
+from langflow.schema import Data
+
+
+def slow_load(file_path: str, *, silent_errors: bool) -> Data | None:  # noqa: ARG001
+    if "slow" in file_path:
+        time.sleep(30)
+    return Data(data={"file_path": file_path, "text": "fast"})
+
+
+@pytest.fixture
+def file_paths(tmp_path):
+    paths = []
+    for index in range(7):
+        path = tmp_path / f"file_{index}.txt"
+        path.write_text(f"content {index}", encoding="utf-8")
+        paths.append(str(path))
+    json_path = tmp_path / "data.json"
+    json_path.write_text('{"key": "value"}', encoding="utf-8")
+    return [*paths, str(json_path)]
+
+
+@pytest.mark.parametrize("use_processes", [False, True])
+def test_parallel_load_data_keeps_the_order_of_the_files(file_paths, use_processes):
+    loaded = parallel_load_data(
+        file_paths, silent_errors=False, max_concurrency=2, use_processes=use_processes, chunk_size=3
+    )
+
+    assert [data.data["file_path"] for data in loaded] == file_paths
+    assert [data.text for data in loaded[:7]] == [f"content {index}" for index in range(7)]
+    assert loaded[-1].text == '{"key":"value"}'
+
+
+def test_iter_load_data_yields_every_file(file_paths):
+    loaded = list(iter_load_data(file_paths, silent_errors=False, max_concurrency=2, use_processes=True))
+
+    assert sorted(data.data["file_path"] for data in loaded) == sorted(file_paths)
+
+
+def test_iter_load_file_data_yields_the_path_of_each_file(file_paths):
+    loaded = dict(iter_load_file_data(file_paths, silent_errors=False, max_concurrency=2, use_processes=True))
+
+    assert sorted(loaded) == sorted(file_paths)
+    assert all(data.data["file_path"] == file_path for file_path, data in loaded.items())
+
+
+def test_process_pool_is_shut_down_without_changing_the_global_context():
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        preload = multiprocessing.forkserver._forkserver._preload_modules
+    pool = get_parse_process_pool(1)
+
+    shutdown_parse_process_pool()
+
+    assert utils._process_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(time.sleep, 0)
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        assert multiprocessing.forkserver._forkserver._preload_modules == preload
+
+
+def test_process_parsing_errors_are_raised_or_silenced(tmp_path):
+    missing = [str(tmp_path / "missing.txt")]
+
+    with pytest.raises(ValueError, match="Error loading file"):
+        parallel_load_data(missing, silent_errors=False, max_concurrency=1, use_processes=True)
+    assert parallel_load_data(missing, silent_errors=True, max_concurrency=1, use_processes=True) == [None]
+
+
+def test_slow_files_time_out_in_processes(file_paths):
+    start = time.perf_counter()
+    with pytest.raises(FileParseTimeoutError):
+        parallel_load_data(
+            [*file_paths, "slow.txt"],
+            silent_errors=False,
+            max_concurrency=1,
+            load_function=slow_load,
+            use_processes=True,
+            timeout=0.5,
+        )
+
+    assert time.perf_counter() - start < 20
+
+
+def test_load_file_with_timeout_in_the_main_thread():
+    assert load_file_with_timeout(slow_load, "fast.txt", silent_errors=False, timeout=1).text == "fast"
+    with pytest.raises(FileParseTimeoutError):
+        load_file_with_timeout(slow_load, "slow.txt", silent_errors=False, timeout=0.1)
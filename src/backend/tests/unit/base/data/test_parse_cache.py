@@ -0,0 +1,92 @@
+import shutil
+
+import pytest
+from langflow.base.data.parse_cache import get_parse_cache, load_data_with_cache
+from langflow.base.data.utils import parse_text_file_to_data
+from langflow.services.deps import get_settings_service
+
+
+@pytest.fixture
+def parse_cache(tmp_path, monkeypatch):
+    settings = get_settings_service().settings
+    monkeypatch.setattr(settings, "config_dir", str(tmp_path / "config"))
+    monkeypatch.setattr(settings, "parse_cache_max_size", 1024 * 1024)
+    return get_parse_cache()
+
+
+class CountingParser:
+    def __init__(self):
+        self.parsed: list[str] = []
+
+    def __call__(self, file_paths):
+        self.parsed.extend(file_paths)
+        return [parse_text_file_to_data(file_path, silent_errors=True) for file_path in file_paths]
+
+
+def test_files_with_the_same_content_are_parsed_once(parse_cache, tmp_path):  # noqa: ARG001
+    first = tmp_path / "first.json"
+    first.write_text('{"key": "value"}', encoding="utf-8")
+    copy = tmp_path / "bundle" / "copy.json"
+    copy.parent.mkdir()
+    shutil.copy(first, copy)
+    parse_files = CountingParser()
+
+    loaded, stats = load_data_with_cache([str(first)], parse_files, parser="text")
+    assert stats == {"hits": 0, "misses": 1}
+
+    loaded_again, stats = load_data_with_cache([str(first), str(copy)], parse_files, parser="text")
+
+    assert stats == {"hits": 2, "misses": 0}
+    assert parse_files.parsed == [str(first)]
+    assert loaded_again[0].data == loaded[0].data
+    assert loaded_again[1].data == {"file_path": str(copy), "text": '{"key":"value"}'}
+
+
+def test_content_parser_and_options_are_part_of_the_key(parse_cache, tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_text("first", encoding="utf-8")
+    parse_files = CountingParser()
+    load_data_with_cache([str(path)], parse_files, parser="text")
+
+    path.write_text("second", encoding="utf-8")
+    loaded, _ = load_data_with_cache([str(path)], parse_files, parser="text")
+    load_data_with_cache([str(path)], parse_files, parser="text", options={"ocr": True})
+    load_data_with_cache([str(path)], parse_files, parser="other")
+
+    assert loaded[0].text == "second"
+    assert len(parse_files.parsed) == 4
+    assert parse_cache.stats()["entries"] == 4
+
+
+def test_files_that_fail_to_parse_are_not_cached(parse_cache, tmp_path):
+    missing = str(tmp_path / "missing.txt")
+    parse_files = CountingParser()
+
+    for _ in range(2):
+        loaded, stats = load_data_with_cache([missing], parse_files, parser="text")
+        assert loaded == [None]
+        assert stats == {"hits": 0, "misses": 1}
+    assert parse_cache.stats()["entries"] == 0
+
+
+def test_cache_can_be_disabled(tmp_path, monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "parse_cache_max_size", 0)
+    path = tmp_path / "file.txt"
+    path.write_text("content", encoding="utf-8")
+
+    loaded, stats = load_data_with_cache([str(path)], CountingParser(), parser="text")
+
+    assert stats is None
+    assert loaded[0].text == "content"
+
+
+def test_file_component_logs_parse_cache_hits(parse_cache, tmp_path):  # noqa: ARG001
+    from langflow.components.data.file import FileComponent
+
+    path = tmp_path / "notes.txt"
+    path.write_text("knowledge", encoding="utf-8")
+
+    for expected in ({"hits": 0, "misses": 1}, {"hits": 1, "misses": 0}):
+        component = FileComponent(path=[str(path)])
+        assert [data.text for data in component.load_files()] == ["knowledge"]
+        assert [log.message for log in component._logs if log.name == "Parse cache"] == [expected]
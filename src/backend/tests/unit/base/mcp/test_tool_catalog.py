@@ -0,0 +1,99 @@
+import asyncio
+import json
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from langflow import initial_setup
+from langflow.base.mcp import tool_catalog
+from langflow.base.mcp.tool_catalog import MCPToolCatalog
+from langflow.services.database.models.flow.model import Flow
+from sqlalchemy import delete, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+STARTER_PROJECTS = Path(initial_setup.__file__).parent / "starter_projects"
+
+
+class FakeMCPSession:
+    def __init__(self):
+        self.notifications = 0
+
+    async def send_tool_list_changed(self):
+        self.notifications += 1
+
+
+@pytest.fixture
+def flow_data():
+    return json.loads((STARTER_PROJECTS / "Basic Prompting.json").read_text(encoding="utf-8"))["data"]
+
+
+@pytest.fixture
+def catalog(monkeypatch):
+    catalog = MCPToolCatalog(ttl=60)
+    monkeypatch.setattr(tool_catalog, "_tool_catalog", catalog)
+    return catalog
+
+
+async def test_user_tools_are_updated_flow_by_flow(async_session: AsyncSession, catalog, flow_data):
+    user_id = uuid4()
+    first = Flow(name="First Flow", data=flow_data, user_id=user_id)
+    async_session.add(first)
+    async_session.add(Flow(name="Other user", data=flow_data, user_id=uuid4()))
+    await async_session.commit()
+    mcp_session = FakeMCPSession()
+
+    tools = await catalog.list_tools(("user", user_id), async_session, mcp_session)
+    assert [tool.name for tool in tools] == ["first_flow"]
+    assert "input_value" in tools[0].inputSchema["properties"]
+    await catalog.list_tools(("user", user_id), async_session)
+    assert catalog.stats()["full_loads"] == 1
+    assert catalog.stats()["partial_loads"] == 0
+
+    async_session.add(Flow(name="Second Flow", data=flow_data, user_id=user_id))
+    first.name = "Renamed Flow"
+    async_session.add(first)
+    await async_session.commit()
+    await asyncio.sleep(0)
+    assert mcp_session.notifications == 1
+
+    tools = await catalog.list_tools(("user", user_id), async_session)
+    assert sorted(tool.name for tool in tools) == ["renamed_flow", "second_flow"]
+    assert catalog.stats()["partial_loads"] == 1
+
+    await async_session.exec(delete(Flow).where(Flow.id == first.id))
+    await async_session.commit()
+    await asyncio.sleep(0)
+    assert mcp_session.notifications == 2
+
+    tools = await catalog.list_tools(("user", user_id), async_session)
+    assert [tool.name for tool in tools] == ["second_flow"]
+    assert catalog.stats()["full_loads"] == 1
+
+
+async def test_project_tools_follow_the_mcp_settings_of_flows(async_session: AsyncSession, catalog, flow_data):
+    project_id = uuid4()
+    flow = Flow(name="Project Flow", data=flow_data, user_id=uuid4(), folder_id=project_id, mcp_enabled=True)
+    async_session.add(flow)
+    await async_session.commit()
+
+    tools = await catalog.list_tools(("project", project_id), async_session)
+    assert [tool.name for tool in tools] == ["project_flow"]
+
+    flow.action_name = "answer"
+    async_session.add(flow)
+    await async_session.commit()
+    tools = await catalog.list_tools(("project", project_id), async_session)
+    assert [tool.name for tool in tools] == ["answer"]
+
+    flow.mcp_enabled = False
+    async_session.add(flow)
+    await async_session.flush()
+    await async_session.rollback()
+    assert await catalog.list_tools(("project", project_id), async_session)
+    assert catalog.stats()["partial_loads"] == 1
+
+    # Moving flows with a bulk update drops the catalogs, the flows it changed are not known
+    await async_session.exec(update(Flow).where(Flow.folder_id == project_id).values(folder_id=uuid4()))
+    await async_session.commit()
+    assert catalog.stats()["catalogs"] == 0
+    assert await catalog.list_tools(("project", project_id), async_session) == []
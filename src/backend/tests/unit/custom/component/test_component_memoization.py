@@ -0,0 +1,82 @@
+import pytest
+from langflow.custom import Component
+from langflow.custom.custom_component.memoization import component_output_cache, fingerprint_value
+from langflow.io import HandleInput, MessageTextInput, Output
+from langflow.schema.data import Data
+from langflow.schema.message import Message
+from langflow.services.deps import get_settings_service
+
+
+class UpperComponent(Component):
+    pure = True
+    calls = 0
+
+    inputs = [
+        MessageTextInput(name="text", display_name="Text"),
+        HandleInput(name="extra", display_name="Extra", input_types=["Data"]),
+    ]
+    outputs = [Output(display_name="Upper", name="upper", method="build_upper")]
+
+    def build_upper(self) -> Data:
+        UpperComponent.calls += 1
+        self.status = "done"
+        return Data(data={"text": self.text.upper()})
+
+
+@pytest.fixture
+def memoization_enabled(monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "memoize_pure_components", True)
+    component_output_cache.clear()
+    UpperComponent.calls = 0
+    yield
+    component_output_cache.clear()
+
+
+@pytest.mark.usefixtures("memoization_enabled")
+async def test_pure_component_outputs_are_reused():
+    first, _ = await UpperComponent(text="hello").build_results()
+    first["upper"].data["text"] = "modified downstream"
+
+    second_component = UpperComponent(text="hello")
+    second, _ = await second_component.build_results()
+
+    assert UpperComponent.calls == 1
+    assert second["upper"].data == {"text": "HELLO"}
+    assert second_component.status == "done"
+    assert component_output_cache.stats()["hits"] == 1
+
+
+@pytest.mark.usefixtures("memoization_enabled")
+async def test_different_inputs_are_built_again():
+    await UpperComponent(text="hello").build_results()
+    await UpperComponent(text="hello", extra=Data(data={"a": 1})).build_results()
+    await UpperComponent(text="hello", extra=Data(data={"a": 2})).build_results()
+
+    assert UpperComponent.calls == 3
+
+
+@pytest.mark.usefixtures("memoization_enabled")
+async def test_unfingerprintable_inputs_disable_memoization():
+    await UpperComponent(text="hello", extra=object()).build_results()
+    await UpperComponent(text="hello", extra=object()).build_results()
+
+    assert UpperComponent.calls == 2
+    assert component_output_cache.stats()["entries"] == 0
+
+
+async def test_memoization_is_off_by_default():
+    component_output_cache.clear()
+    UpperComponent.calls = 0
+
+    await UpperComponent(text="hello").build_results()
+    await UpperComponent(text="hello").build_results()
+
+    assert UpperComponent.calls == 2
+
+
+def test_message_fingerprint_ignores_id_and_timestamp():
+    first = Message(text="hi", sender="User", id="1", timestamp="2024-01-01 00:00:00 UTC")
+    second = Message(text="hi", sender="User", id="2", timestamp="2025-01-01 00:00:00 UTC")
+
+    assert fingerprint_value(first) == fingerprint_value(second)
+    assert fingerprint_value(first) != fingerprint_value(Message(text="bye", sender="User"))
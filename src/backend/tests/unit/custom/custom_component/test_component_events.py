@@ -1,4 +1,5 @@
 import asyncio
+import json
 import time
 from typing import Any
 from unittest.mock import MagicMock
@@ -252,3 +253,41 @@ async def test_component_streaming_message():
             tokens.append(event)
 
     assert len(tokens) > 0
+
+
+async def test_component_streaming_tokens_are_sent_on_the_event_loop(monkeypatch):
+    """Tokens sent by the default callback are put on the queue without a worker thread per chunk."""
+    queue = asyncio.Queue()
+    event_manager = EventManager(queue)
+    event_manager.register_event("on_token", "token")
+    event_manager.register_event("on_message", "add_message")
+    component = ComponentForTesting()
+    component.set_event_manager(event_manager)
+
+    threaded_calls = []
+    to_thread = asyncio.to_thread
+
+    async def record_to_thread(func, /, *args, **kwargs):
+        threaded_calls.append(func)
+        return await to_thread(func, *args, **kwargs)
+
+    monkeypatch.setattr(asyncio, "to_thread", record_to_thread)
+
+    class StreamChunk:
+        def __init__(self, content: str):
+            self.content = content
+
+    async def text_generator():
+        for chunk in ["Hello", " ", "World", "!"]:
+            yield StreamChunk(chunk)
+
+    message = Message(sender="test_sender", sender_name="test_sender_name", text="", id=str(uuid4()))
+    complete_message = await component._stream_message(text_generator(), message)
+
+    assert complete_message == "Hello World!"
+    assert event_manager.on_token not in threaded_calls
+    events = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert [event_id.split("-")[0] for event_id, _, _ in events] == ["add_message", "token", "token", "token", "token"]
+    assert json.loads(events[0][1])["data"]["text"] == "Hello"
+    # The initial message event carries a copy of the message, the streamed message is left as it was
+    assert message.data["text"] == ""
@@ -0,0 +1,71 @@
+import pytest
+from langflow.custom.eval import ComponentClassCache, hash_component_code
+
+CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class EchoComponent(Component):
+    inputs = [MessageTextInput(name="input_value")]
+    outputs = [Output(name="output", method="echo")]
+
+    def echo(self) -> Message:
+        return Message(text=self.input_value)
+"""
+
+
+def test_hash_ignores_formatting_differences():
+    assert hash_component_code(CODE) == hash_component_code(CODE.replace("\n", "\r\n") + "   \n")
+    assert hash_component_code(CODE) != hash_component_code(CODE.replace("EchoComponent", "OtherComponent"))
+
+
+def test_cache_returns_same_class_for_same_code():
+    cache = ComponentClassCache()
+
+    first = cache.get_or_create(CODE)
+    second = cache.get_or_create(CODE)
+
+    assert first is second
+    assert first.__name__ == "EchoComponent"
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["compile_time"] > 0
+
+
+def test_cache_recompiles_changed_code():
+    cache = ComponentClassCache()
+    first = cache.get_or_create(CODE)
+    changed = cache.get_or_create(CODE.replace("EchoComponent", "ChangedComponent"))
+
+    assert changed is not first
+    assert changed.__name__ == "ChangedComponent"
+
+    cache.invalidate(CODE)
+    assert CODE not in cache
+    assert cache.get_or_create(CODE) is not first
+
+
+def test_cache_is_bounded():
+    cache = ComponentClassCache(max_entries=2)
+    codes = [CODE.replace("EchoComponent", f"Echo{i}Component") for i in range(3)]
+    for code in codes:
+        cache.get_or_create(code)
+
+    assert len(cache) == 2
+    assert codes[0] not in cache
+    assert cache.stats()["evictions"] == 1
+
+    cache = ComponentClassCache(max_code_bytes=len(CODE) + 10)
+    for code in codes:
+        cache.get_or_create(code)
+    assert len(cache) == 1
+
+
+def test_cache_does_not_store_errors():
+    cache = ComponentClassCache()
+    with pytest.raises(TypeError):
+        cache.get_or_create("x = 1")
+    assert len(cache) == 0
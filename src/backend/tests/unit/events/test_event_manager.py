@@ -4,7 +4,7 @@ import time
 import uuid
 
 import pytest
-from langflow.events.event_manager import EventManager
+from langflow.events.event_manager import EventManager, create_default_event_manager
 from langflow.schema.log import LoggableType
 
 
@@ -210,3 +210,76 @@ class TestEventManager:
         # Accessing a non-registered event callback should return the 'noop' function
         callback = event_manager.on_non_existing_event
         assert callback.__name__ == "noop"
+
+    def test_has_default_callback(self):
+        event_manager = EventManager(asyncio.Queue())
+        event_manager.register_event("on_token", "token")
+        event_manager.register_event("on_message", "message", lambda manager, event_type, data: None)  # noqa: ARG005
+
+        assert event_manager.has_default_callback("on_token")
+        assert not event_manager.has_default_callback("on_message")
+        assert not event_manager.has_default_callback("on_missing")
+
+
+def read_events(queue: asyncio.Queue) -> list[dict]:
+    events = []
+    while not queue.empty():
+        _, value, _ = queue.get_nowait()
+        events.append(json.loads(value))
+    return events
+
+
+class TestTokenBatching:
+    def test_token_event_has_the_token_schema(self):
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue)
+        manager.on_token(data={"chunk": "Hello", "id": "m1"})
+
+        [event] = read_events(queue)
+        assert event["event"] == "token"
+        assert event["data"].keys() == {"chunk", "id", "timestamp"}
+        assert event["data"]["chunk"] == "Hello"
+
+    def test_tokens_are_flushed_in_order_before_other_events(self):
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, token_batch_interval=60)
+        for chunk in ["Hel", "lo", " world"]:
+            manager.on_token(data={"chunk": chunk, "id": "m1"})
+        manager.on_token(data={"chunk": "other", "id": "m2"})
+        assert queue.empty()
+
+        manager.on_end(data={})
+        events = read_events(queue)
+        assert [(event["event"], event["data"].get("chunk")) for event in events] == [
+            ("token", "Hello world"),
+            ("token", "other"),
+            ("end", None),
+        ]
+
+    def test_batch_is_sent_when_full(self):
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, token_batch_interval=60, token_batch_size=4)
+        for chunk in ["ab", "cd", "e"]:
+            manager.on_token(data={"chunk": chunk, "id": "m1"})
+
+        assert [event["data"]["chunk"] for event in read_events(queue)] == ["abcd"]
+        manager.flush_tokens()
+        assert [event["data"]["chunk"] for event in read_events(queue)] == ["e"]
+
+    async def test_batch_is_sent_after_the_interval(self):
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue, token_batch_interval=0.01)
+        manager.on_token(data={"chunk": "a", "id": "m1"})
+        await asyncio.to_thread(manager.on_token, data={"chunk": "b", "id": "m1"})
+
+        _, value, _ = await asyncio.wait_for(queue.get(), timeout=1)
+        assert json.loads(value)["data"]["chunk"] == "ab"
+
+    def test_events_orjson_cannot_serialize_fall_back_to_jsonable_encoder(self):
+        queue = asyncio.Queue()
+        manager = create_default_event_manager(queue)
+        manager.on_end_vertex(data={"ids": {1, 2}, "big": 2**70})
+
+        [event] = read_events(queue)
+        assert sorted(event["data"]["ids"]) == [1, 2]
+        assert event["data"]["big"] == 2**70
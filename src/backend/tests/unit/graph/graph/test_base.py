@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from collections import deque
 
@@ -7,7 +8,9 @@ from langflow.components.langchain_utilities import ToolCallingAgentComponent
 from langflow.components.outputs import ChatOutput, TextOutputComponent
 from langflow.components.tools import YfinanceToolComponent
 from langflow.graph import Graph
+from langflow.graph.graph import base as graph_base
 from langflow.graph.graph.constants import Finish
+from langflow.graph.graph.schema import VertexBuildResult
 
 
 async def test_graph_not_prepared():
@@ -131,6 +134,66 @@ def test_graph_functional_start_end():
     assert results[-1] == Finish()
 
 
+async def test_graph_process_ready_queue():
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=text_output.text_response, should_store_message=False)
+    graph = Graph(chat_input, chat_output)
+
+    await graph.process(fallback_to_env_vars=False, execution_mode="ready_queue", max_concurrency=1)
+
+    assert all(vertex.built for vertex in graph.vertices)
+    assert not graph.run_manager.vertices_being_run
+
+
+async def test_graph_process_ready_queue_rebuilds_a_vertex_made_runnable_while_running(monkeypatch):
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    graph = Graph(chat_input, chat_output)
+    builds: list[str] = []
+
+    async def build_vertex(vertex_id, **_kwargs):
+        builds.append(vertex_id)
+        await asyncio.sleep(0 if vertex_id == "chat_input" else 0.05)
+        return VertexBuildResult(
+            result_dict={}, params="", valid=True, artifacts={}, vertex=graph.get_vertex(vertex_id)
+        )
+
+    async def get_next_runnable_vertices(_lock, vertex, **_kwargs):
+        # chat_input makes chat_output runnable again while its first build is running
+        return ["chat_output"] if vertex.id == "chat_input" else []
+
+    async def log_vertex_build(**_kwargs):
+        pass
+
+    monkeypatch.setattr(graph, "build_vertex", build_vertex)
+    monkeypatch.setattr(graph, "get_next_runnable_vertices", get_next_runnable_vertices)
+    monkeypatch.setattr(graph_base, "log_vertex_build", log_vertex_build)
+
+    await graph._process_ready_queue(
+        ["chat_input", "chat_output"],
+        fallback_to_env_vars=False,
+        event_manager=None,
+        max_concurrency=None,
+        has_webhook_component=False,
+    )
+
+    assert builds == ["chat_input", "chat_output", "chat_output"]
+
+
+async def test_graph_process_invalid_execution_mode():
+    chat_input = ChatInput(_id="chat_input")
+    chat_output = ChatOutput(input_value="test", _id="chat_output")
+    chat_output.set(sender_name=chat_input.message_response)
+    graph = Graph(chat_input, chat_output)
+
+    with pytest.raises(ValueError, match="Invalid execution mode"):
+        await graph.process(fallback_to_env_vars=False, execution_mode="unknown")
+
+
 @pytest.mark.skip(reason="Temporarily disabled")
 def test_graph_set_with_valid_component():
     tool = YfinanceToolComponent()
@@ -0,0 +1,60 @@
+from langflow.components.inputs import ChatInput
+from langflow.components.outputs import ChatOutput, TextOutputComponent
+from langflow.graph import Graph
+from langflow.graph.graph.profiler import GraphProfiler, VertexProfile
+
+
+def create_graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    chat_input.set(should_store_message=False)
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=chat_input.message_response)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=text_output.text_response, should_store_message=False)
+    return Graph(chat_input, chat_output)
+
+
+async def test_process_records_a_profile_per_vertex():
+    graph = create_graph()
+    profiler = graph.enable_profiling(trace_memory=True)
+
+    await graph.process(fallback_to_env_vars=False)
+
+    profile = profiler.to_dict()
+    vertices = {vertex["vertex_id"]: vertex for vertex in profile["vertices"]}
+    assert set(vertices) == {"chat_input", "text_output", "chat_output"}
+    assert not profiler.is_running
+    assert vertices["text_output"]["ready_at"] == vertices["chat_input"]["end"]
+    assert vertices["chat_output"]["start"] >= vertices["text_output"]["end"]
+    for vertex in vertices.values():
+        assert vertex["wall_time"] >= 0
+        assert vertex["memory_peak"] is not None
+        assert vertex["cache_status"] == "built"
+        assert not vertex["error"]
+
+
+def test_exports_put_concurrent_builds_in_separate_lanes():
+    profiler = GraphProfiler()
+    profiler.profiles = [
+        VertexProfile(vertex_id="a", display_name="A", start=0.0, ready_at=0.0, end=1.0),
+        VertexProfile(vertex_id="b", display_name="B", start=0.5, ready_at=0.0, end=1.5),
+        VertexProfile(vertex_id="c", display_name="C", start=1.5, ready_at=1.0, end=2.0),
+    ]
+    profiler.duration = 2.0
+
+    trace = profiler.to_chrome_trace()
+    spans = {event["name"]: event for event in trace["traceEvents"] if event["ph"] == "X"}
+    assert spans["A"]["tid"] == spans["C"]["tid"] != spans["B"]["tid"]
+    assert spans["B"]["ts"] == 500_000
+    assert spans["B"]["dur"] == 1_000_000
+    assert spans["C"]["args"]["queue_time"] == 0.5
+
+    speedscope = profiler.to_speedscope()
+    assert [frame["name"] for frame in speedscope["shared"]["frames"]] == ["A (a)", "C (c)", "B (b)"]
+    assert len(speedscope["profiles"]) == 2
+    assert speedscope["profiles"][0]["events"] == [
+        {"type": "O", "frame": 0, "at": 0.0},
+        {"type": "C", "frame": 0, "at": 1.0},
+        {"type": "O", "frame": 1, "at": 1.5},
+        {"type": "C", "frame": 1, "at": 2.0},
+    ]
@@ -0,0 +1,95 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from langflow.graph import Graph
+from langflow.graph.graph import base as graph_base
+from langflow.graph.graph.template import GraphTemplate, GraphTemplateCache
+
+
+@pytest.fixture
+def memory_chatbot_data():
+    with pytest.MEMORY_CHATBOT_NO_LLM.open(encoding="utf-8") as f:
+        return json.load(f)["data"]
+
+
+def test_graph_from_template_matches_graph_from_payload(memory_chatbot_data):
+    template = GraphTemplate(memory_chatbot_data, flow_id="flow", flow_name="Memory Chatbot")
+    expected = Graph.from_payload(memory_chatbot_data, flow_id="flow", flow_name="Memory Chatbot")
+
+    graph = template.create_graph(user_id="user")
+
+    assert graph.user_id == "user"
+    assert sorted(graph.vertex_map) == sorted(expected.vertex_map)
+    assert {(e.source_id, e.target_id) for e in graph.edges} == {(e.source_id, e.target_id) for e in expected.edges}
+    assert graph.predecessor_map == expected.predecessor_map
+    assert graph.sort_vertices() == expected.sort_vertices()
+    assert graph.vertices_layers == expected.vertices_layers
+
+
+def test_graphs_from_template_are_independent(memory_chatbot_data):
+    template = GraphTemplate(memory_chatbot_data, flow_id="flow")
+
+    first = template.create_graph()
+    second = template.create_graph()
+
+    assert first.vertices[0] is not second.vertices[0]
+    first.sort_vertices()
+    first.vertices_layers.clear()
+    second.sort_vertices()
+    assert second.vertices_layers == template.layers[None][1]
+
+
+def test_graphs_from_template_do_not_search_cycles_or_share_the_payload(memory_chatbot_data, monkeypatch):
+    template = GraphTemplate(memory_chatbot_data, flow_id="flow")
+
+    def find_cycle_vertices(_edges):
+        msg = "Cycles searched again"
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(graph_base, "find_cycle_vertices", find_cycle_vertices)
+    first = template.create_graph()
+    second = template.create_graph()
+
+    first.raw_graph_data["nodes"].clear()
+    assert second.raw_graph_data["nodes"]
+    assert template.raw_graph_data["nodes"]
+
+
+def test_graphs_built_without_a_template_search_cycles_in_their_edges(memory_chatbot_data, monkeypatch):
+    graph = Graph.from_payload(memory_chatbot_data, flow_id="flow")
+    vertex = graph.vertices[-1]
+    searched_edges = []
+
+    def find_cycle_vertices(edges):
+        searched_edges.append(edges)
+        return [vertex.id]
+
+    # A cycle search cached before the edges changed must not decide which outputs are cached
+    graph._cycle_vertices = set()
+    monkeypatch.setattr(graph_base, "find_cycle_vertices", find_cycle_vertices)
+    graph._set_cache_to_vertices_in_cycle()
+
+    assert searched_edges == [graph._get_edges_as_list_of_tuples()]
+    assert vertex.custom_component._outputs_map
+    assert all(output.cache is False for output in vertex.custom_component._outputs_map.values())
+
+
+def test_template_cache_hits_and_invalidation(memory_chatbot_data):
+    cache = GraphTemplateCache()
+    updated_at = datetime.now(timezone.utc)
+
+    first = cache.get_or_create(memory_chatbot_data, flow_id="flow", flow_name=None, updated_at=updated_at)
+    second = cache.get_or_create(memory_chatbot_data, flow_id="flow", flow_name=None, updated_at=updated_at)
+    assert first is second
+
+    tweaked = cache.get_or_create(
+        memory_chatbot_data, flow_id="flow", flow_name=None, updated_at=updated_at, tweaks={"stream": True}
+    )
+    assert tweaked is not first
+
+    newer = cache.get_or_create(
+        memory_chatbot_data, flow_id="flow", flow_name=None, updated_at=updated_at + timedelta(seconds=1)
+    )
+    assert newer is not first
+    assert cache.stats() == {"hits": 1, "misses": 3, "entries": 1}
@@ -0,0 +1,92 @@
+import copy
+import gzip
+
+import orjson
+import pytest
+from langflow.interface.catalog import ComponentCatalog, catalog_response, choose_encoding, component_catalog
+
+
+@pytest.fixture
+def all_types():
+    return {
+        "inputs": {"ChatInput": {"display_name": "Chat Input"}, "TextInput": {"display_name": "Text Input"}},
+        "outputs": {"ChatOutput": {"display_name": "Chat Output"}},
+    }
+
+
+@pytest.fixture(autouse=True)
+def clear_catalog():
+    component_catalog.clear()
+    yield
+    component_catalog.clear()
+
+
+async def test_snapshot_is_built_once_per_registry_version(all_types):
+    catalog = ComponentCatalog()
+
+    snapshot = await catalog.get_snapshot(all_types, 0)
+    assert await catalog.get_snapshot(all_types, 0) is snapshot
+
+    all_types["inputs"]["ChatInput"]["display_name"] = "Chat"
+    changed = await catalog.get_snapshot(all_types, 1)
+    assert changed.version != snapshot.version
+    assert orjson.loads(changed.body) == all_types
+
+
+async def test_response_is_precompressed_and_revalidated(all_types):
+    snapshot = await component_catalog.get_snapshot(all_types, 0)
+
+    response = await catalog_response(snapshot, accept_encoding="gzip, deflate", if_none_match=None, since=None)
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == f'"{snapshot.version}-gzip"'
+    assert response.body is snapshot.encodings["gzip"]
+    assert orjson.loads(gzip.decompress(response.body)) == all_types
+
+    not_modified = await catalog_response(
+        snapshot, accept_encoding="gzip", if_none_match=response.headers["etag"], since=None
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.body == b""
+    assert not_modified.headers["etag"] == response.headers["etag"]
+
+    identity = await catalog_response(snapshot, accept_encoding=None, if_none_match='"stale"', since=None)
+    assert identity.status_code == 200
+    assert "content-encoding" not in identity.headers
+    assert orjson.loads(identity.body) == all_types
+
+
+async def test_delta_since_an_older_version(all_types):
+    old = await component_catalog.get_snapshot(all_types, 0)
+    new_types = copy.deepcopy(all_types)
+    new_types["inputs"]["ChatInput"]["display_name"] = "Chat"
+    del new_types["inputs"]["TextInput"]
+    new_types["tools"] = {"Calculator": {"display_name": "Calculator"}}
+    new = await component_catalog.get_snapshot(new_types, 1)
+
+    response = await catalog_response(new, accept_encoding=None, if_none_match=None, since=old.version)
+
+    assert response.headers["x-catalog-delta-since"] == old.version
+    assert orjson.loads(response.body) == {
+        "version": new.version,
+        "since": old.version,
+        "changed": {"inputs": {"ChatInput": {"display_name": "Chat"}}, "tools": new_types["tools"]},
+        "removed": {"inputs": ["TextInput"]},
+    }
+
+    from_etag = await catalog_response(new, accept_encoding="gzip", if_none_match=None, since=f'"{old.version}-gzip"')
+    assert from_etag.headers["x-catalog-delta-since"] == old.version
+    assert orjson.loads(gzip.decompress(from_etag.body)) == orjson.loads(response.body)
+
+    unknown = await catalog_response(new, accept_encoding=None, if_none_match=None, since="unknown")
+    assert "x-catalog-delta-since" not in unknown.headers
+    assert orjson.loads(unknown.body) == new_types
+
+
+def test_choose_encoding():
+    available = {"gzip": b"", "br": b""}
+    assert choose_encoding("gzip, br", available) == "br"
+    assert choose_encoding("gzip, br;q=0", available) == "gzip"
+    assert choose_encoding("br", {"gzip": b""}) is None
+    assert choose_encoding("*", {"gzip": b""}) == "gzip"
+    assert choose_encoding(None, available) is None
@@ -0,0 +1,122 @@
+import asyncio
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from langflow.interface import component_index
+from langflow.interface.component_index import (
+    COMPONENT_INDEX_FILE_NAME,
+    abuild_component_index,
+    aget_indexed_types_dict,
+    runtime_index_path,
+    write_component_index,
+)
+
+COMPONENT_CODE = """
+from langflow.custom import Component
+from langflow.io import MessageTextInput, Output
+from langflow.schema.message import Message
+
+
+class EchoComponent(Component):
+    display_name = "Echo"
+    description = "{description}"
+    name = "Echo"
+
+    inputs = [MessageTextInput(name="input_value", display_name="Input")]
+    outputs = [Output(display_name="Message", name="message", method="echo")]
+
+    def echo(self) -> Message:
+        return Message(text=self.input_value)
+"""
+
+
+@pytest.fixture
+def components_path(tmp_path) -> Path:
+    path = tmp_path / "components"
+    (path / "custom").mkdir(parents=True)
+    (path / "custom" / "echo.py").write_text(COMPONENT_CODE.format(description="Echoes"), encoding="utf-8")
+    return path
+
+
+def not_built():
+    return patch.object(component_index, "abuild_and_validate_all_files", side_effect=AssertionError("rebuilt"))
+
+
+async def test_index_is_reused_until_the_sources_change(components_path, tmp_path):
+    index_dir = tmp_path / "index"
+
+    types = await aget_indexed_types_dict([str(components_path)], index_dir)
+    assert types["custom"]["Echo"]["description"] == "Echoes"
+    assert await asyncio.to_thread(lambda: runtime_index_path(str(components_path), index_dir).exists())
+
+    with not_built():
+        assert await aget_indexed_types_dict([str(components_path)], index_dir) == types
+
+    # Same content with a new mtime, like files extracted from a wheel
+    source = components_path / "custom" / "echo.py"
+    await asyncio.to_thread(os.utime, source, ns=(0, 10**18))
+    with not_built():
+        assert await aget_indexed_types_dict([str(components_path)], index_dir) == types
+
+    await asyncio.to_thread(source.write_text, COMPONENT_CODE.format(description="Echoes again"), encoding="utf-8")
+    types = await aget_indexed_types_dict([str(components_path)], index_dir)
+    assert types["custom"]["Echo"]["description"] == "Echoes again"
+
+
+async def test_new_components_invalidate_the_index(components_path, tmp_path):
+    index_dir = tmp_path / "index"
+    await aget_indexed_types_dict([str(components_path)], index_dir)
+
+    await asyncio.to_thread(
+        (components_path / "custom" / "other.py").write_text,
+        COMPONENT_CODE.replace("Echo", "Other").format(description="Other"),
+        encoding="utf-8",
+    )
+    types = await aget_indexed_types_dict([str(components_path)], index_dir)
+
+    assert set(types["custom"]) == {"Echo", "Other"}
+
+
+async def test_shipped_index_is_used_without_building(components_path, tmp_path):
+    index = await abuild_component_index(str(components_path))
+    await asyncio.to_thread(write_component_index, index, components_path / COMPONENT_INDEX_FILE_NAME)
+
+    with not_built():
+        types = await aget_indexed_types_dict([str(components_path)], tmp_path / "index")
+
+    assert types == index["types"]
+    # The shipped index is copied to the runtime directory with the local mtimes
+    assert await asyncio.to_thread(lambda: runtime_index_path(str(components_path), tmp_path / "index").exists())
+
+
+async def test_helpers_and_package_files_invalidate_the_index(components_path, tmp_path):
+    index_dir = tmp_path / "index"
+    helper = components_path / "custom" / "helpers" / "text.py"
+    await asyncio.to_thread(helper.parent.mkdir)
+    await asyncio.to_thread(helper.write_text, "SUFFIX = ''\n", encoding="utf-8")
+    types = await aget_indexed_types_dict([str(components_path)], index_dir)
+
+    for file_path in (helper, components_path / "custom" / "__init__.py"):
+        await asyncio.to_thread(file_path.write_text, "SUFFIX = '!'\n", encoding="utf-8")
+        with pytest.raises(AssertionError, match="rebuilt"), not_built():
+            await aget_indexed_types_dict([str(components_path)], index_dir)
+        assert await aget_indexed_types_dict([str(components_path)], index_dir) == types
+
+
+@pytest.mark.parametrize("module_path", ["base/module.py", "inputs/inputs.py"])
+async def test_langflow_package_changes_invalidate_the_index(components_path, tmp_path, monkeypatch, module_path):
+    package_path = tmp_path / "langflow"
+    module = package_path / module_path
+    await asyncio.to_thread(module.parent.mkdir, parents=True)
+    await asyncio.to_thread(module.write_text, "VALUE = 1\n", encoding="utf-8")
+    monkeypatch.setattr(component_index, "LANGFLOW_PACKAGE_PATH", package_path)
+    index_dir = tmp_path / "index"
+    await aget_indexed_types_dict([str(components_path)], index_dir)
+
+    with not_built():
+        await aget_indexed_types_dict([str(components_path)], index_dir)
+    await asyncio.to_thread(module.write_text, "VALUE = 2\n", encoding="utf-8")
+    with pytest.raises(AssertionError, match="rebuilt"), not_built():
+        await aget_indexed_types_dict([str(components_path)], index_dir)
@@ -0,0 +1,93 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from langflow.services.auth.api_key_cache import ApiKeyUsage, ApiKeyUsageCounter
+from langflow.services.database.models.api_key import ApiKey, ApiKeyCreate
+from langflow.services.database.models.api_key.crud import (
+    add_api_key_uses,
+    check_key,
+    create_api_key,
+    delete_api_key,
+)
+from langflow.services.database.models.user.model import User
+from langflow.services.deps import get_auth_service
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def auth_service(monkeypatch):
+    auth_service = get_auth_service()
+    auth_service.api_key_cache.clear()
+    # Count the uses in memory instead of writing them from a background task
+    monkeypatch.setattr(auth_service, "is_started", lambda: True)
+    yield auth_service
+    auth_service.usage_counter.pop_all()
+    auth_service.api_key_cache.clear()
+
+
+@pytest.fixture
+async def user(session: AsyncSession):
+    user = User(username="api-key-user", password="hashed", is_active=True)  # noqa: S106
+    session.add(user)
+    await session.commit()
+    return user
+
+
+async def test_check_key_is_cached_until_the_key_is_deleted(session: AsyncSession, user: User, auth_service):
+    api_key = await create_api_key(session, ApiKeyCreate(name="key"), user.id)
+
+    assert (await check_key(session, api_key.api_key)).id == user.id
+    with patch.object(session, "exec", side_effect=AssertionError("not cached")):
+        cached_user = await check_key(session, api_key.api_key)
+    assert cached_user.id == user.id
+    assert cached_user.username == "api-key-user"
+    assert auth_service.api_key_cache.stats()["hits"] == 1
+    assert len(auth_service.usage_counter) == 1
+
+    await delete_api_key(session, api_key.id)
+
+    assert await check_key(session, api_key.api_key) is None
+
+
+async def test_add_api_key_uses_updates_all_keys_at_once(session: AsyncSession, user: User):
+    first = await create_api_key(session, ApiKeyCreate(name="first"), user.id)
+    second = await create_api_key(session, ApiKeyCreate(name="second"), user.id)
+    last_used_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    await add_api_key_uses(
+        session,
+        {
+            first.id: ApiKeyUsage(uses=3, last_used_at=last_used_at),
+            second.id: ApiKeyUsage(uses=1, last_used_at=last_used_at),
+        },
+    )
+
+    session.expire_all()
+    assert (await session.get(ApiKey, first.id)).total_uses == 3
+    assert (await session.get(ApiKey, second.id)).total_uses == 1
+    assert (await session.get(ApiKey, second.id)).last_used_at.replace(tzinfo=timezone.utc) == last_used_at
+
+
+def test_usage_counter_merges_uses_that_failed_to_be_written():
+    counter = ApiKeyUsageCounter()
+    counter.record("a")
+    counter.record("a")
+    pending, lag = counter.pop_all()
+    counter.record("a")
+
+    counter.restore(pending)
+
+    assert lag >= 0
+    assert counter.pop_all()[0]["a"].uses == 3
@@ -0,0 +1,126 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from langflow.services.build_log.service import BuildLogService
+from langflow.services.database.models.transactions.model import TransactionBase, TransactionTable
+from langflow.services.database.models.vertex_builds.model import VertexBuildBase, VertexBuildTable
+from langflow.services.settings.base import Settings
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+MODELS = "langflow.services.database.models"
+
+
+@pytest.fixture
+def settings():
+    return Settings().model_copy(
+        update={
+            "build_log_batch_size": 3,
+            "build_log_flush_interval": 10,
+            "build_log_queue_size": 100,
+            "build_log_trim_interval": 60,
+            "max_vertex_builds_to_keep": 100,
+            "max_vertex_builds_per_vertex": 2,
+            "max_transactions_to_keep": 3,
+        }
+    )
+
+
+@pytest.fixture
+def use_test_session(async_session: AsyncSession, settings):
+    @asynccontextmanager
+    async def session_getter(_db_service):
+        yield async_session
+
+    settings_service = SimpleNamespace(settings=settings)
+    with (
+        patch("langflow.services.build_log.service.session_getter", session_getter),
+        patch("langflow.services.build_log.service.get_db_service"),
+        patch(f"{MODELS}.vertex_builds.crud.get_settings_service", return_value=settings_service),
+        patch(f"{MODELS}.transactions.crud.get_settings_service", return_value=settings_service),
+    ):
+        yield
+
+
+def make_service(settings, **overrides) -> BuildLogService:
+    return BuildLogService(SimpleNamespace(settings=settings.model_copy(update=overrides)))
+
+
+def make_vertex_build(flow_id, vertex_id="vertex") -> VertexBuildBase:
+    return VertexBuildBase(id=vertex_id, flow_id=flow_id, valid=True)
+
+
+async def count_rows(session: AsyncSession, table) -> int:
+    return len((await session.exec(select(table))).all())
+
+
+@pytest.mark.usefixtures("use_test_session")
+async def test_writes_queued_items_in_batches(async_session, settings):
+    service = make_service(settings)
+    service.start()
+    flow_id = uuid4()
+
+    for i in range(7):
+        await service.add(make_vertex_build(flow_id, vertex_id=f"vertex-{i}"))
+    await service.stop()
+
+    assert await count_rows(async_session, VertexBuildTable) == 7
+    assert service.stats() == {"queued": 0, "written": 7, "dropped": 0, "failed": 0, "batches": 3}
+    assert not service.is_started()
+
+
+@pytest.mark.usefixtures("use_test_session")
+async def test_writes_partial_batch_after_flush_interval(async_session, settings):
+    service = make_service(settings, build_log_flush_interval=0.05)
+    service.start()
+
+    await service.add(TransactionBase(vertex_id="vertex", status="success", flow_id=uuid4()))
+    await asyncio.sleep(0.3)
+
+    assert await count_rows(async_session, TransactionTable) == 1
+    await service.stop()
+
+
+@pytest.mark.usefixtures("use_test_session")
+async def test_trims_history_per_vertex_and_flow(async_session, settings):
+    service = make_service(settings)
+    service.start()
+    flow_id = uuid4()
+
+    for _ in range(5):
+        await service.add(make_vertex_build(flow_id))
+        await service.add(TransactionBase(vertex_id="vertex", status="success", flow_id=flow_id))
+    await service.stop()
+
+    assert await count_rows(async_session, VertexBuildTable) == 2
+    assert await count_rows(async_session, TransactionTable) == 3
+
+
+async def test_drop_policy_discards_items_when_full(settings):
+    service = make_service(settings, build_log_queue_size=2, build_log_overflow_policy="drop")
+    flow_id = uuid4()
+
+    results = [await service.add(make_vertex_build(flow_id)) for _ in range(3)]
+
+    assert results == [True, True, False]
+    assert service.stats()["dropped"] == 1
+
+
+@pytest.mark.usefixtures("use_test_session")
+async def test_invalid_item_does_not_drop_the_rest_of_its_batch(async_session, settings):
+    service = make_service(settings)
+    service.start()
+    flow_id = uuid4()
+
+    await service.add(make_vertex_build(flow_id, vertex_id="vertex-1"))
+    # A vertex build without an id violates the NOT NULL constraint of its table
+    await service.add(VertexBuildBase.model_construct(id=None, flow_id=flow_id, valid=True))
+    await service.add(make_vertex_build(flow_id, vertex_id="vertex-2"))
+    await service.stop()
+
+    assert await count_rows(async_session, VertexBuildTable) == 2
+    assert service.stats() == {"queued": 0, "written": 2, "dropped": 0, "failed": 1, "batches": 1}
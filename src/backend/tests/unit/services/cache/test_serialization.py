@@ -0,0 +1,85 @@
+import asyncio
+import pickle
+import zlib
+from datetime import datetime, timezone
+
+import dill
+import pytest
+from langflow.schema.data import Data
+from langflow.schema.message import Message
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.serialization import CODEC_JSON, HEADER_SIZE, CacheSerializer
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"a": 1, "b": [1.5, "x", None, True]},
+        "text",
+        [],
+        Data(data={"text": "hello", "n": 1}),
+        {"records": [Data(data={"text": "hi"})], "at": datetime.now(timezone.utc)},
+    ],
+)
+def test_structured_values_round_trip(value):
+    serializer = CacheSerializer()
+
+    data = serializer.dumps(value)
+
+    assert data[4] == CODEC_JSON
+    loaded = serializer.loads(data)
+    assert loaded == value
+    assert type(loaded) is type(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {1: "int key"},
+        (1, 2),
+        {"a": {1, 2}},
+        float("nan"),
+        b"bytes",
+        Message(text="hi", sender="User", sender_name="User"),
+    ],
+)
+def test_unsupported_values_use_fallback(value):
+    serializer = CacheSerializer(fallback="dill")
+
+    data = serializer.dumps(value)
+
+    assert data[4] != CODEC_JSON
+    loaded = serializer.loads(data)
+    assert loaded == value or loaded != loaded  # noqa: PLR0124
+    stats = serializer.stats.to_dict()
+    assert stats[type(value).__name__]["fallbacks"] == 1
+
+
+def test_loads_values_written_without_header():
+    assert CacheSerializer(fallback="pickle").loads(pickle.dumps({"a": (1, 2)})) == {"a": (1, 2)}
+    assert CacheSerializer(fallback="dill").loads(dill.dumps([1, 2])) == [1, 2]
+
+
+def test_compression_above_threshold():
+    serializer = CacheSerializer(compression="zlib", compression_threshold=100)
+    small = serializer.dumps("x")
+    large = serializer.dumps("x" * 10_000)
+
+    assert small[HEADER_SIZE:] == b'"x"'
+    assert zlib.decompress(large[HEADER_SIZE:]) == b'"' + b"x" * 10_000 + b'"'
+    assert serializer.loads(large) == "x" * 10_000
+    stats = serializer.stats.to_dict()["str"]
+    assert stats["bytes"] < stats["raw_bytes"]
+
+
+def test_disk_cache_uses_serializer(tmp_path):
+    cache = AsyncDiskCache(tmp_path, serializer=CacheSerializer(compression="zlib", compression_threshold=0))
+
+    async def set_and_get():
+        await cache.set("data", Data(data={"text": "hello"}))
+        await cache.set("tuple", (1, 2))
+        return await cache.get("data"), await cache.get("tuple")
+
+    assert asyncio.run(set_and_get()) == (Data(data={"text": "hello"}), (1, 2))
+    assert set(cache.serialization_stats()) == {"Data", "tuple"}
+    cache.cache.close()
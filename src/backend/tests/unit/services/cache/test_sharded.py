@@ -0,0 +1,101 @@
+import asyncio
+import threading
+
+from langflow.services.cache import sharded
+from langflow.services.cache.sharded import ShardedInMemoryCache, estimate_size
+from langflow.services.cache.utils import CACHE_MISS
+
+
+async def test_get_set_and_counters():
+    cache = ShardedInMemoryCache(num_shards=4, sweep_interval=None)
+
+    await cache.set("a", {"x": 1})
+    await cache.upsert("a", {"y": 2})
+
+    assert await cache.get("a") == {"x": 1, "y": 2}
+    assert await cache.get("missing") is CACHE_MISS
+    await cache.delete("a")
+    assert not await cache.contains("a")
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 0
+    assert stats["bytes"] == 0
+
+
+async def test_per_key_ttl_and_contains_respect_expiry():
+    cache = ShardedInMemoryCache(num_shards=2, expiration_time=60, sweep_interval=None)
+
+    await cache.set("short", "value", ttl=0.01)
+    await cache.set("long", "value")
+    await asyncio.sleep(0.02)
+
+    assert not await cache.contains("short")
+    assert await cache.get("short") is CACHE_MISS
+    assert await cache.get("long") == "value"
+    assert cache.stats()["expirations"] == 1
+
+
+async def test_sweep_removes_expired_entries():
+    cache = ShardedInMemoryCache(num_shards=4, expiration_time=0.01, sweep_interval=None)
+    for i in range(10):
+        await cache.set(f"key-{i}", i)
+    await asyncio.sleep(0.02)
+
+    assert cache.sweep() == 10
+    assert len(cache) == 0
+    assert cache.stats()["bytes"] == 0
+
+
+async def test_memory_budget_evicts_least_recently_used():
+    cache = ShardedInMemoryCache(num_shards=1, max_memory=3000, sweep_interval=None, sizeof=lambda _: 1000)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.set("c", 3)
+    await cache.get("a")
+
+    await cache.set("d", 4)
+
+    assert await cache.get("b") is CACHE_MISS
+    assert await cache.get("a") == 1
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["bytes"] == 3000
+
+
+async def test_background_sweep_runs_and_stops_on_teardown():
+    cache = ShardedInMemoryCache(num_shards=2, expiration_time=0.01, sweep_interval=0.02)
+    await cache.set("a", 1)
+    await asyncio.sleep(0.1)
+
+    assert len(cache) == 0
+    await cache.teardown()
+    assert cache._sweep_task is None
+
+
+def test_estimate_size_counts_nested_values_once():
+    shared = "x" * 10_000
+    value = {"a": shared, "b": [shared, shared]}
+
+    assert estimate_size(shared) < estimate_size(value) < 2 * estimate_size(shared)
+
+
+async def test_large_values_are_sized_in_a_thread(monkeypatch):
+    walk_size = sharded._walk_size
+    threads = []
+
+    def recording_walk_size(value, max_objects):
+        threads.append(threading.current_thread())
+        return walk_size(value, max_objects)
+
+    monkeypatch.setattr(sharded, "_walk_size", recording_walk_size)
+    cache = ShardedInMemoryCache(sweep_interval=None)
+    small, large = {"a": 1}, [str(index) for index in range(5_000)]
+
+    await cache.set("small", small)
+    await cache.set("large", large)
+
+    main_thread = threading.main_thread()
+    assert threads[:2] == [main_thread, main_thread]
+    assert threads[2] is not main_thread
+    assert cache.stats()["bytes"] == estimate_size(small) + estimate_size(large)
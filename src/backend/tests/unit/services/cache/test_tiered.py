@@ -0,0 +1,122 @@
+import asyncio
+
+import fakeredis
+import pytest
+from langflow.services.cache.service import RedisCache
+from langflow.services.cache.tiered import TieredCache
+from langflow.services.cache.utils import CACHE_MISS
+
+
+@pytest.fixture
+def server():
+    server = fakeredis.FakeServer()
+    # The first connection reads the redis package metadata, which is a blocking call inside the event loop
+    fakeredis.FakeRedis(server=server).ping()
+    return server
+
+
+def create_cache(server, **kwargs) -> TieredCache:
+    redis_cache = RedisCache(client=fakeredis.FakeAsyncRedis(server=server))
+    return TieredCache(redis_cache, **kwargs)
+
+
+async def wait_until(condition) -> None:
+    async def poll():
+        while not condition():  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout=5)
+
+
+async def wait_until_listening(*caches: TieredCache) -> None:
+    for cache in caches:
+        await cache.contains("warm-up")
+        await wait_until(lambda cache=cache: cache.stats()["listening"])
+
+
+async def test_reads_are_served_from_memory_after_the_first_one(server):
+    writer, reader = create_cache(server), create_cache(server)
+    await wait_until_listening(writer, reader)
+
+    await writer.set("key", {"value": 1})
+    assert await reader.get("key") == {"value": 1}
+    assert await reader.get("key") == {"value": 1}
+
+    assert reader.stats()["l2_hits"] == 1
+    assert reader.stats()["l1_hits"] == 1
+    await writer.teardown()
+    await reader.teardown()
+
+
+async def test_writes_invalidate_other_processes(server):
+    writer, reader = create_cache(server), create_cache(server)
+    await wait_until_listening(writer, reader)
+    await writer.set("key", "old")
+    assert await reader.get("key") == "old"
+
+    await wait_until(lambda: reader.stats()["invalidations"] == 1)
+
+    await writer.set("key", "new")
+    await wait_until(lambda: reader.stats()["invalidations"] == 2)
+    assert await reader.get("key") == "new"
+
+    await writer.delete("key")
+    await wait_until(lambda: reader.stats()["invalidations"] == 3)
+    assert await reader.get("key") is CACHE_MISS
+    await writer.teardown()
+    await reader.teardown()
+
+
+async def test_write_behind_writes_in_batches(server):
+    writer = create_cache(server, write_mode="write-behind", write_behind_interval=60)
+    reader = create_cache(server)
+
+    await writer.set("a", 1)
+    await writer.upsert("b", {"x": 1})
+    assert await writer.get("a") == 1
+    assert await reader.get("a") is CACHE_MISS
+    assert writer.stats()["pending_writes"] == 2
+
+    await writer.flush()
+
+    assert await reader.get("a") == 1
+    assert await reader.get("b") == {"x": 1}
+    await writer.teardown()
+    await reader.teardown()
+
+
+async def test_memory_is_bypassed_until_subscribed(server):
+    cache = create_cache(server)
+    other = create_cache(server)
+    await other.set("key", "value")
+
+    cache._ensure_background_tasks = lambda: None
+    assert await cache.get("key") == "value"
+    assert await cache.get("key") == "value"
+
+    assert cache.stats()["l1_hits"] == 0
+    assert cache.stats()["l2_hits"] == 2
+    await other.teardown()
+
+
+async def test_touch_restarts_the_expiration_of_existing_keys(server):
+    cache = create_cache(server)
+    await cache.set("key", "value")
+    await cache.l2.client.expire("key", 5)
+
+    assert await cache.touch(["key", "missing"]) == ["missing"]
+    assert await cache.l2.client.ttl("key") == cache.expiration_time
+    await cache.teardown()
+
+
+async def test_operations_do_not_acquire_the_lock_held_by_the_caller(server):
+    cache = create_cache(server)
+    lock = asyncio.Lock()
+
+    async with lock:
+        await asyncio.wait_for(cache.upsert("key", {"a": 1}, lock=lock), timeout=5)
+        await asyncio.wait_for(cache.upsert("key", {"b": 2}, lock=lock), timeout=5)
+        assert await asyncio.wait_for(cache.get("key", lock=lock), timeout=5) == {"a": 1, "b": 2}
+        assert await asyncio.wait_for(cache.touch(["key"], lock=lock), timeout=5) == []
+        await asyncio.wait_for(cache.delete("key", lock=lock), timeout=5)
+    await cache.teardown()
@@ -0,0 +1,148 @@
+import asyncio
+import json
+
+import pytest
+from langflow.graph import Graph
+from langflow.services.cache.disk import AsyncDiskCache
+from langflow.services.cache.utils import CacheMiss
+from langflow.services.chat.graph_state import GraphRunState, GraphStateStore
+
+
+class RecordingDiskCache(AsyncDiskCache):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.written_keys: list[str] = []
+
+    async def set(self, key, value, lock=None) -> None:
+        self.written_keys.append(key)
+        await super().set(key, value, lock=lock)
+
+
+@pytest.fixture
+def cache_service(tmp_path):
+    cache = RecordingDiskCache(tmp_path)
+    yield cache
+    cache.cache.close()
+
+
+@pytest.fixture
+def graph():
+    with pytest.MEMORY_CHATBOT_NO_LLM.open(encoding="utf-8") as f:
+        data = json.load(f)["data"]
+    graph = Graph.from_payload(data, flow_id="flow")
+    graph.prepare()
+    graph.set_run_id()
+    return graph
+
+
+def mark_built(graph: Graph, vertex_id: str) -> None:
+    vertex = graph.get_vertex(vertex_id)
+    vertex.built = True
+    vertex.results = {"message": f"result of {vertex_id}"}
+    graph._changed_vertex_ids.add(vertex_id)
+
+
+def test_save_writes_only_changed_vertices(cache_service, graph):
+    store = GraphStateStore(cache_service)
+    first, second = graph.first_layer[0], graph.vertices[-1].id
+
+    async def run():
+        await store.save("flow", graph)
+        assert cache_service.written_keys == ["flow:graph", "flow"]
+
+        cache_service.written_keys.clear()
+        mark_built(graph, first)
+        await store.save("flow", graph)
+        assert cache_service.written_keys == [f"flow:vertex:{first}", "flow"]
+
+        cache_service.written_keys.clear()
+        mark_built(graph, second)
+        await store.save("flow", graph)
+        assert cache_service.written_keys == [f"flow:vertex:{second}", "flow"]
+
+    asyncio.run(run())
+
+
+def test_save_keeps_the_entries_of_earlier_saves_alive(cache_service, graph):
+    store = GraphStateStore(cache_service)
+    vertex_id = graph.first_layer[0]
+    mark_built(graph, vertex_id)
+
+    async def run():
+        await store.save("flow", graph)
+        structure = await asyncio.to_thread(cache_service.cache.get, "flow:graph")
+
+        cache_service.written_keys.clear()
+        await store.save("flow", graph)
+        assert cache_service.written_keys == ["flow"]
+        assert (await asyncio.to_thread(cache_service.cache.get, "flow:graph"))["time"] > structure["time"]
+
+        # Entries that expired anyway are written again
+        await cache_service.delete("flow:graph")
+        await cache_service.delete(f"flow:vertex:{vertex_id}")
+        await store.save("flow", graph)
+        assert cache_service.written_keys == ["flow", "flow:graph", f"flow:vertex:{vertex_id}", "flow"]
+
+    asyncio.run(run())
+
+
+def test_save_under_the_lock_held_by_the_caller(cache_service, graph):
+    store = GraphStateStore(cache_service)
+    mark_built(graph, graph.first_layer[0])
+
+    async def run():
+        # Graph.get_next_runnable_vertices holds the lock it passes to set_cache
+        lock = asyncio.Lock()
+        async with lock:
+            await asyncio.wait_for(store.save("flow", graph, lock=lock), timeout=5)
+            await asyncio.wait_for(store.save("flow", graph, lock=lock), timeout=5)
+
+    asyncio.run(run())
+
+
+def test_load_rebuilds_graph_in_another_store(cache_service, graph):
+    vertex_id = graph.first_layer[0]
+    mark_built(graph, vertex_id)
+    graph.inactivated_vertices.add("inactive")
+
+    async def run():
+        await GraphStateStore(cache_service).save("flow", graph)
+        cached = await cache_service.get("flow")
+        assert GraphStateStore.is_run_state(cached)
+        assert isinstance(cached["result"], GraphRunState)
+        return await GraphStateStore(cache_service).load("flow", cached)
+
+    restored = asyncio.run(run())["result"]
+
+    assert restored is not graph
+    assert sorted(restored.vertex_map) == sorted(graph.vertex_map)
+    assert restored.get_vertex(vertex_id).built
+    assert restored.get_vertex(vertex_id).results == {"message": f"result of {vertex_id}"}
+    assert list(restored._run_queue) == list(graph._run_queue)
+    assert restored.vertices_layers == graph.vertices_layers
+    assert restored.inactivated_vertices == {"inactive"}
+    assert restored.run_id == graph.run_id
+
+
+def test_load_returns_local_graph_for_same_revision(cache_service, graph):
+    store = GraphStateStore(cache_service)
+
+    async def run():
+        await store.save("flow", graph)
+        return await store.load("flow", await cache_service.get("flow"))
+
+    assert asyncio.run(run())["result"] is graph
+
+
+def test_delete_removes_all_entries(cache_service, graph):
+    store = GraphStateStore(cache_service)
+    vertex_id = graph.first_layer[0]
+    mark_built(graph, vertex_id)
+
+    async def run():
+        await store.save("flow", graph)
+        await store.delete("flow", await cache_service.get("flow"))
+        await cache_service.delete("flow")
+        return [await cache_service.get(key) for key in ("flow", "flow:graph", f"flow:vertex:{vertex_id}")]
+
+    assert all(isinstance(value, CacheMiss) for value in asyncio.run(run()))
@@ -0,0 +1,115 @@
+import json
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+from langflow import initial_setup
+from langflow.services.database.models.flow.crud import get_flow_headers, select_flow_headers
+from langflow.services.database.models.flow.model import Flow
+from sqlalchemy import event, update
+from sqlmodel import col
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+STARTER_PROJECTS = Path(initial_setup.__file__).parent / "starter_projects"
+
+
+@pytest.fixture
+def flow_data():
+    return json.loads((STARTER_PROJECTS / "Basic Prompting.json").read_text(encoding="utf-8"))["data"]
+
+
+@pytest.fixture
+def component_data(flow_data):
+    return {"nodes": flow_data["nodes"][:1], "edges": []}
+
+
+@pytest.fixture
+def data_reads(async_session: AsyncSession):
+    """Collect the SQL statements that read the data of flows."""
+    statements: list[str] = []
+
+    def collect(_conn, _cursor, statement, _parameters, _context, _executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "flow.data" in statement:
+            statements.append(statement)
+
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", collect)
+    yield statements
+    event.remove(engine, "before_cursor_execute", collect)
+
+
+async def test_interface_summary_is_kept_up_to_date_on_save(async_session: AsyncSession, flow_data, component_data):
+    flow = Flow(name="Basic Prompting", data=flow_data, user_id=uuid4())
+    async_session.add(flow)
+    await async_session.commit()
+
+    assert flow.interface_summary["is_component"] is False
+    assert "input_value" in flow.interface_summary["input_schema"]["properties"]
+
+    flow.name = "Renamed"
+    async_session.add(flow)
+    await async_session.commit()
+    assert flow.interface_summary["is_component"] is False
+
+    flow.data = component_data
+    async_session.add(flow)
+    await async_session.commit()
+    assert flow.interface_summary["is_component"] is True
+
+    flow.data = None
+    async_session.add(flow)
+    await async_session.commit()
+    assert flow.interface_summary is None
+
+
+@pytest.mark.parametrize("data", ["null", ["nodes"]])
+async def test_flows_with_data_that_is_not_a_dict_have_no_summary(async_session: AsyncSession, data):
+    flow = Flow(name="Legacy", data=data, user_id=uuid4())
+    async_session.add(flow)
+    await async_session.commit()
+
+    assert flow.interface_summary is None
+    (header,) = await get_flow_headers(async_session, select_flow_headers().where(Flow.id == flow.id))
+    assert header.input_schema is None
+
+
+async def test_flow_headers_are_read_without_the_data(
+    async_session: AsyncSession, flow_data, component_data, data_reads
+):
+    user_id = uuid4()
+    async_session.add(Flow(name="Flow", description="A flow", data=flow_data, user_id=user_id))
+    async_session.add(Flow(name="Component", data=component_data, is_component=True, user_id=user_id))
+    await async_session.commit()
+
+    stmt = select_flow_headers().where(Flow.user_id == user_id).order_by(Flow.name)
+    component, flow = await get_flow_headers(async_session, stmt)
+
+    assert not data_reads
+    assert (flow.name, flow.description, flow.is_component, flow.data) == ("Flow", "A flow", False, None)
+    assert flow.updated_at is not None
+    assert "input_value" in flow.input_schema["properties"]
+    assert component.is_component is True
+    assert component.data is None
+
+    component, flow = await get_flow_headers(async_session, stmt, with_component_data=True)
+    assert component.data == component_data
+    assert flow.data is None
+    assert len(data_reads) == 1
+
+
+async def test_flow_headers_of_flows_saved_without_a_summary(async_session: AsyncSession, flow_data, data_reads):
+    flow = Flow(name="Legacy", data=flow_data, user_id=uuid4())
+    async_session.add(flow)
+    await async_session.commit()
+    # Flows saved before the interface summary existed have none until they are saved again
+    await async_session.exec(update(Flow).where(col(Flow.id) == flow.id).values(interface_summary=None))
+    await async_session.commit()
+
+    stmt = select_flow_headers().where(Flow.id == flow.id)
+    (header,) = await get_flow_headers(async_session, stmt)
+    assert header.is_component is False
+    assert header.input_schema is None
+
+    (header,) = await get_flow_headers(async_session, stmt, with_input_schema=True)
+    assert "input_value" in header.input_schema["properties"]
+    assert len(data_reads) == 2
@@ -0,0 +1,185 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+from langflow.services.job_queue.registry import RedisJobRegistry
+from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
+from langflow.services.settings.base import Settings
+
+
+@pytest.fixture
+def server():
+    server = fakeredis.FakeServer()
+    # The first connection reads the redis package metadata, which is a blocking call inside the event loop
+    fakeredis.FakeRedis(server=server).ping()
+    return server
+
+
+@pytest.fixture(scope="module")
+def settings():
+    # Tokens are sent as they come, to check the events one by one
+    return Settings().model_copy(update={"token_batch_interval": 0.0})
+
+
+@pytest.fixture
+async def workers(server, settings):
+    """Two job queue services sharing a job registry, as two workers of a deployment."""
+    services = [
+        JobQueueService(
+            SimpleNamespace(settings=settings),
+            job_registry=RedisJobRegistry(fakeredis.FakeAsyncRedis(server=server), ttl=60),
+        )
+        for _ in range(2)
+    ]
+    for service in services:
+        service.start()
+    await wait_until(lambda: all(service.job_registry.listening for service in services))
+    yield services
+    for service in services:
+        await service.stop()
+
+
+async def wait_until(condition) -> None:
+    async def poll():
+        while not condition():  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout=5)
+
+
+async def start_build(service: JobQueueService, job_id: str, job) -> None:
+    _, event_manager = service.create_queue(job_id)
+    service.start_job(job_id, job(event_manager))
+    await service.register_job(job_id)
+
+
+async def read_all(queue) -> list[dict]:
+    events = []
+    while True:
+        _, value, _ = await asyncio.wait_for(queue.get(), timeout=5)
+        if value is None:
+            return events
+        events.append(json.loads(value))
+
+
+async def test_events_of_a_job_can_be_read_from_another_worker(workers):
+    owner, other = workers
+
+    async def job(event_manager):
+        for chunk in ["a", "b", "c"]:
+            event_manager.on_token(data={"chunk": chunk, "id": "m1"})
+        event_manager.on_end(data={})
+        await event_manager.queue.put((None, None, 0.0))
+
+    await start_build(owner, "job1", job)
+    queue, _, _, _ = await other.aget_queue_data("job1")
+    events = await read_all(queue)
+
+    assert [event["data"].get("chunk", event["event"]) for event in events] == ["a", "b", "c", "end"]
+
+
+async def test_each_event_is_delivered_once_across_workers(workers):
+    owner, other = workers
+    released = asyncio.Event()
+
+    async def job(event_manager):
+        for index in range(4):
+            event_manager.on_message(data={"index": index})
+            if index == 1:
+                await released.wait()
+        await event_manager.queue.put((None, None, 0.0))
+
+    await start_build(owner, "job1", job)
+    owner_queue, _, _, _ = owner.get_queue_data("job1")
+    other_queue, _, _, _ = await other.aget_queue_data("job1")
+
+    first = [await owner_queue.get()]
+    while not owner_queue.empty():
+        first.append(owner_queue.get_nowait())
+    released.set()
+    rest = await read_all(other_queue)
+    indexes = [json.loads(value)["data"]["index"] for _, value, _ in first] + [event["data"]["index"] for event in rest]
+    assert indexes == [0, 1, 2, 3]
+
+
+async def test_available_events_are_read_at_once(workers):
+    owner, other = workers
+
+    async def job(event_manager):
+        for index in range(4):
+            event_manager.on_message(data={"index": index})
+        await event_manager.queue.put((None, None, 0.0))
+
+    await start_build(owner, "job1", job)
+    await wait_until(lambda: owner.get_queue_data("job1")[2].done())
+    while await owner.job_registry.stream_length("job1") < 5:  # noqa: ASYNC110
+        await asyncio.sleep(0.01)
+    queue, _, _, _ = await other.aget_queue_data("job1")
+
+    items = [await queue.get()]
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    assert [value is None for _, value, _ in items] == [False, False, False, False, True]
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+
+async def test_events_wait_in_the_job_queue_while_the_stream_is_full(server, settings):
+    registry = RedisJobRegistry(fakeredis.FakeAsyncRedis(server=server), ttl=60, stream_max_len=3)
+    service = JobQueueService(
+        SimpleNamespace(settings=settings.model_copy(update={"event_queue_max_size": 4})), job_registry=registry
+    )
+    service.start()
+
+    async def job(event_manager):
+        for index in range(10):
+            event_manager.on_message(data={"index": index})
+            for chunk in "abc":
+                event_manager.on_token(data={"chunk": chunk, "id": f"m{index}"})
+        event_manager.on_end(data={})
+        await event_manager.queue.put((None, None, 0.0))
+
+    await start_build(service, "job1", job)
+    await wait_until(lambda: service.get_queue_data("job1")[2].done())
+    # Nothing was read yet, so the stream holds stream_max_len events and the room for the last read one
+    assert await registry.stream_length("job1") == 4
+
+    queue, _, _, _ = service.get_queue_data("job1")
+    events = await read_all(queue)
+    await service.stop()
+
+    # Tokens were coalesced or dropped while nobody read the events, every other event was kept
+    assert [event["data"]["index"] for event in events if event["event"] == "add_message"] == list(range(10))
+    assert len([event for event in events if event["event"] == "token"]) < 30
+    assert events[-1]["event"] == "end"
+
+
+async def test_a_job_can_be_cancelled_from_another_worker(workers):
+    owner, other = workers
+    started = asyncio.Event()
+
+    async def job(_event_manager):
+        started.set()
+        await asyncio.sleep(60)
+
+    await start_build(owner, "job1", job)
+    await started.wait()
+    task = owner.get_queue_data("job1")[2]
+
+    assert not other.owns_job("job1")
+    assert await other.request_cancel("job1")
+    await wait_until(lambda: not owner.owns_job("job1"))
+
+    assert task.cancelled()
+    queue, _, _, _ = await other.aget_queue_data("job1")
+    assert await read_all(queue) == []
+
+
+async def test_unknown_jobs_are_not_found(workers):
+    _, other = workers
+    with pytest.raises(JobQueueNotFoundError):
+        await other.aget_queue_data("missing")
+    with pytest.raises(JobQueueNotFoundError):
+        await other.request_cancel("missing")
@@ -0,0 +1,157 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from langflow.services.job_queue.event_queue import BoundedEventQueue
+from langflow.services.job_queue.service import JobQueueFullError, JobQueueService
+from langflow.services.settings.base import Settings
+
+
+@pytest.fixture(scope="module")
+def settings():
+    return Settings()
+
+
+def make_service(settings, **overrides) -> JobQueueService:
+    return JobQueueService(SimpleNamespace(settings=settings.model_copy(update=overrides)))
+
+
+def start_jobs(service: JobQueueService, jobs: list[tuple[str, str]], started: list[str], release: asyncio.Event):
+    async def job(job_id: str):
+        started.append(job_id)
+        await release.wait()
+
+    for job_id, user_id in jobs:
+        service.create_queue(job_id)
+        service.start_job(job_id, job(job_id), user_id=user_id)
+
+
+async def wait_for_jobs(service: JobQueueService, job_ids: list[str]) -> None:
+    await asyncio.wait([service.get_queue_data(job_id)[2] for job_id in job_ids])
+
+
+async def test_global_limit_admits_waiting_jobs_in_order(settings):
+    service = make_service(settings, max_concurrent_builds=2)
+    started: list[str] = []
+    release = asyncio.Event()
+    start_jobs(service, [(f"job{i}", f"user{i}") for i in range(4)], started, release)
+    await asyncio.sleep(0)
+
+    assert started == ["job0", "job1"]
+    assert service.stats()["running"] == 2
+    assert service.stats()["waiting"] == 2
+
+    release.set()
+    await wait_for_jobs(service, [f"job{i}" for i in range(4)])
+    assert started == ["job0", "job1", "job2", "job3"]
+    assert service.admission.stats() | {"max_wait_time": 0} == {
+        "running": 0,
+        "waiting": 0,
+        "admitted": 4,
+        "rejected": 0,
+        "max_wait_time": 0,
+    }
+
+
+async def test_per_user_limit_does_not_block_other_users(settings):
+    service = make_service(settings, max_concurrent_builds=0, max_concurrent_builds_per_user=1)
+    started: list[str] = []
+    release = asyncio.Event()
+    start_jobs(service, [("a1", "a"), ("a2", "a"), ("b1", "b")], started, release)
+    await asyncio.sleep(0)
+
+    assert started == ["a1", "b1"]
+    release.set()
+    await wait_for_jobs(service, ["a1", "a2", "b1"])
+    assert started == ["a1", "b1", "a2"]
+
+
+async def test_priority_policy_admits_lower_priority_values_first(settings):
+    service = make_service(settings, max_concurrent_builds=1, build_admission_policy="priority")
+    started: list[str] = []
+    release = asyncio.Event()
+
+    async def job(job_id: str):
+        started.append(job_id)
+        await release.wait()
+
+    for job_id, priority in [("running", 0), ("public", 1), ("user", 0)]:
+        service.create_queue(job_id)
+        service.start_job(job_id, job(job_id), priority=priority)
+    release.set()
+    await wait_for_jobs(service, ["running", "public", "user"])
+    assert started == ["running", "user", "public"]
+
+
+async def test_full_admission_queue_rejects_the_job(settings):
+    service = make_service(settings, max_concurrent_builds=1, max_queued_builds=1)
+    started: list[str] = []
+    release = asyncio.Event()
+    start_jobs(service, [("job0", "u"), ("job1", "u")], started, release)
+
+    service.create_queue("job2")
+    with pytest.raises(JobQueueFullError):
+        service.start_job("job2", release.wait(), user_id="u")
+    assert "job2" not in service._queues
+    assert service.stats()["rejected"] == 1
+
+    release.set()
+    await wait_for_jobs(service, ["job0", "job1"])
+
+
+async def test_cancelling_a_waiting_job_frees_its_place(settings):
+    service = make_service(settings, max_concurrent_builds=1)
+    started: list[str] = []
+    release = asyncio.Event()
+    start_jobs(service, [("job0", "u"), ("job1", "u"), ("job2", "u")], started, release)
+    await asyncio.sleep(0)
+
+    await service.cleanup_job("job1")
+    assert service.stats()["waiting"] == 1
+
+    release.set()
+    await wait_for_jobs(service, ["job0", "job2"])
+    assert started == ["job0", "job2"]
+    assert service.stats()["running"] == 0
+
+
+def token_event(message_id: str, chunk: str) -> tuple[str, bytes, float]:
+    value = json.dumps({"event": "token", "data": {"chunk": chunk, "id": message_id}}) + "\n\n"
+    return f"token-{chunk}", value.encode(), 0.0
+
+
+async def test_full_event_queue_coalesces_tokens_and_keeps_other_events():
+    queue = BoundedEventQueue(2, overflow_policy="coalesce")
+    for chunk in ["a", "b", "c", "d"]:
+        queue.put_nowait(token_event("m1", chunk))
+    assert queue.qsize() == 2
+    assert queue.coalesced == 2
+
+    await queue.put(("add_message-1", b"message", 0.0))
+    await queue.put((None, None, 0.0))
+    await queue.put(("end-1", b"end", 0.0))
+
+    events = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert [event_id for event_id, _, _ in events] == ["add_message-1", None, "end-1"]
+    assert queue.dropped == 2
+
+
+async def test_full_event_queue_drops_tokens_with_drop_policy():
+    queue = BoundedEventQueue(2, overflow_policy="drop")
+    for chunk in ["a", "b", "c"]:
+        queue.put_nowait(token_event("m1", chunk))
+    chunks = [json.loads(queue.get_nowait()[1])["data"]["chunk"] for _ in range(queue.qsize())]
+    assert chunks == ["a", "b"]
+    assert queue.stats() == {"size": 0, "coalesced": 0, "dropped": 1}
+
+
+async def test_coalesced_token_event_contains_all_chunks():
+    queue = BoundedEventQueue(1)
+    for chunk in ["Hello", ", ", "world"]:
+        queue.put_nowait(token_event("m1", chunk))
+    queue.put_nowait(token_event("m2", "other"))
+
+    _, value, _ = queue.get_nowait()
+    assert json.loads(value)["data"] == {"chunk": "Hello, world", "id": "m1"}
+    assert queue.dropped == 1
@@ -0,0 +1,173 @@
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from langflow.custom.custom_component.component import Component
+from langflow.events.event_manager import create_default_event_manager
+from langflow.schema.message import Message
+from langflow.services.database.models.message.model import MessageTable
+from langflow.services.message_writer.service import MessageWriterService
+from langflow.services.settings.base import Settings
+from sqlalchemy.orm.attributes import set_attribute
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+class StreamingComponent(Component):
+    def build(self) -> None:
+        pass
+
+
+class StreamChunk:
+    def __init__(self, content: str):
+        self.content = content
+
+
+@pytest.fixture
+def settings():
+    return Settings().model_copy(
+        update={
+            "message_persistence": "write_once",
+            "message_checkpoint_interval": 0.0,
+            "message_writer_batch_size": 10,
+            "message_writer_flush_interval": 10,
+        }
+    )
+
+
+@pytest.fixture
+def use_test_session(async_session: AsyncSession):
+    @asynccontextmanager
+    async def session_scope():
+        try:
+            yield async_session
+            await async_session.commit()
+        except Exception:
+            await async_session.rollback()
+            raise
+
+    with patch("langflow.services.message_writer.service.session_scope", session_scope):
+        yield
+
+
+@pytest.fixture
+async def writer(settings):
+    service = MessageWriterService(SimpleNamespace(settings=settings))
+    service.start()
+    yield service
+    await service.stop()
+
+
+def use_writer(writer: MessageWriterService, settings: Settings):
+    component_module = "langflow.custom.custom_component.component"
+    return patch.multiple(
+        component_module,
+        get_settings_service=lambda: SimpleNamespace(settings=settings),
+        get_message_writer_service=lambda: writer,
+        astore_message=AssertionError,
+    )
+
+
+def make_row(message_id, text: str) -> MessageTable:
+    message = Message(text=text, sender="Machine", sender_name="AI", session_id="session")
+    row = MessageTable.from_message(message)
+    row.id = message_id
+    return row
+
+
+async def read_rows(session: AsyncSession) -> list[MessageTable]:
+    return list((await session.exec(select(MessageTable))).all())
+
+
+@pytest.mark.usefixtures("use_test_session")
+async def test_the_last_write_of_a_message_wins(async_session, writer):
+    message_id = uuid4()
+
+    writer.write(make_row(message_id, "Hel"))
+    await writer.flush()
+    writer.write(make_row(message_id, "Hello"))
+    writer.write(make_row(message_id, "Hello World"))
+    writer.write(make_row(uuid4(), "Other"))
+    await writer.flush()
+
+    rows = {row.id: row.text for row in await read_rows(async_session)}
+    assert rows[message_id] == "Hello World"
+    assert len(rows) == 2
+    assert writer.stats() == {"queued": 0, "written": 3, "deleted": 0, "failed": 0, "batches": 2}
+
+
+@pytest.mark.usefixtures("use_test_session")
+async def test_an_invalid_message_does_not_drop_the_rest_of_its_batch(async_session, writer):
+    # A message without a sender violates the NOT NULL constraint of its table
+    invalid = make_row(uuid4(), "Invalid")
+    set_attribute(invalid, "sender", None)
+    writer.write(make_row(uuid4(), "First"))
+    writer.write(invalid)
+    writer.write(make_row(uuid4(), "Last"))
+    await writer.flush()
+
+    assert sorted(row.text for row in await read_rows(async_session)) == ["First", "Last"]
+    assert writer.stats()["written"] == 2
+    assert writer.stats()["failed"] == 1
+
+
+@pytest.mark.usefixtures("use_test_session")
+async def test_a_deletion_removes_the_writes_queued_before(async_session, writer):
+    message_id = uuid4()
+
+    writer.write(make_row(message_id, "Hel"))
+    await writer.flush()
+    writer.write(make_row(message_id, "Hello"))
+    writer.delete(message_id)
+    await writer.stop()
+
+    assert await read_rows(async_session) == []
+    assert writer.stats()["deleted"] == 1
+
+
+@pytest.mark.usefixtures("use_test_session")
+async def test_streamed_messages_are_written_once_at_the_end(async_session, writer, settings):
+    component = StreamingComponent()
+    component.set_event_manager(create_default_event_manager(asyncio.Queue()))
+    written_during_stream = []
+
+    async def llm_answer():
+        for chunk in ["Hello", " ", "World"]:
+            yield StreamChunk(chunk)
+        written_during_stream.extend(await read_rows(async_session))
+
+    message = Message(text=llm_answer(), sender="Machine", sender_name="AI", session_id="session")
+    with use_writer(writer, settings):
+        sent_message = await component.send_message(message)
+    await writer.flush()
+
+    assert sent_message.text == "Hello World"
+    assert written_during_stream == []
+    rows = await read_rows(async_session)
+    assert [(str(row.id), row.text) for row in rows] == [(sent_message.id, "Hello World")]
+
+
+@pytest.mark.usefixtures("use_test_session")
+async def test_partial_text_is_checkpointed_on_an_interval(async_session, writer, settings):
+    settings = settings.model_copy(update={"message_checkpoint_interval": 0.005})
+    component = StreamingComponent()
+    component.set_event_manager(create_default_event_manager(asyncio.Queue()))
+    checkpoints = []
+
+    async def llm_answer():
+        for chunk in ["Hello", " ", "World"]:
+            await asyncio.sleep(0.01)
+            await writer.flush()
+            checkpoints.extend(row.text for row in await read_rows(async_session))
+            yield StreamChunk(chunk)
+
+    message = Message(text=llm_answer(), sender="Machine", sender_name="AI", session_id="session")
+    with use_writer(writer, settings):
+        sent_message = await component.send_message(message)
+    await writer.flush()
+
+    assert checkpoints == ["Hello", "Hello "]
+    assert [row.text for row in await read_rows(async_session)] == [sent_message.text]
@@ -0,0 +1,84 @@
+import io
+import zipfile
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from langflow.api.v2.files import open_file_stream, parse_range_header, zip_stream_generator
+from langflow.services.storage.local import LocalStorageService
+
+
+@pytest.fixture
+def storage(tmp_path):
+    settings_service = SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path)))
+    return LocalStorageService(session_service=None, settings_service=settings_service)
+
+
+async def chunks_of(data: bytes, size: int):
+    for offset in range(0, len(data), size):
+        yield data[offset : offset + size]
+
+
+async def read_all(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+async def test_save_stream_and_open_stream_round_trip(storage):
+    data = bytes(range(256)) * 1000
+
+    size = await storage.save_stream("folder", "file.bin", chunks_of(data, 4096))
+
+    assert size == len(data)
+    assert await read_all(storage.open_stream("folder", "file.bin", chunk_size=1000)) == data
+    assert await read_all(storage.open_stream("folder", "file.bin", start=10, end=19)) == data[10:20]
+    assert await read_all(storage.open_stream("folder", "file.bin", start=len(data) - 5)) == data[-5:]
+    assert await storage.get_local_path("folder", "file.bin") is not None
+    assert await storage.get_local_path("folder", "missing.bin") is None
+
+
+async def test_failed_save_stream_leaves_no_file(storage):
+    async def failing_chunks():
+        yield b"partial"
+        msg = "connection lost"
+        raise ConnectionError(msg)
+
+    with pytest.raises(ConnectionError):
+        await storage.save_stream("folder", "file.bin", failing_chunks())
+
+    assert [path async for path in (storage.data_dir / "folder").iterdir()] == []
+
+
+async def test_open_file_stream_fails_before_the_response_for_missing_files(storage):
+    await storage.save_stream("folder", "file.bin", chunks_of(b"content", 3))
+
+    assert await read_all(await open_file_stream(storage.open_stream("folder", "file.bin", chunk_size=3))) == b"content"
+    with pytest.raises(HTTPException) as exc_info:
+        await open_file_stream(storage.open_stream("folder", "missing.bin"))
+    assert exc_info.value.status_code == 404
+
+
+async def test_zip_stream_contains_every_file(storage):
+    await storage.save_stream("folder", "a.txt", chunks_of(b"a" * 3_000_000, 65536))
+    await storage.save_stream("folder", "b.txt", chunks_of(b"hello", 2))
+
+    archive = await read_all(zip_stream_generator(storage, "folder", [("first.txt", "a.txt"), ("second.txt", "b.txt")]))
+
+    with zipfile.ZipFile(io.BytesIO(archive)) as zip_file:
+        assert zip_file.namelist() == ["first.txt", "second.txt"]
+        assert zip_file.read("first.txt") == b"a" * 3_000_000
+        assert zip_file.read("second.txt") == b"hello"
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [("bytes=0-9", (0, 9)), ("bytes=90-", (90, 99)), ("bytes=-10", (90, 99)), ("bytes=95-200", (95, 99))],
+)
+def test_parse_range_header(header, expected):
+    assert parse_range_header(header, 100) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=100-", "bytes=5-2", "items=0-1", "bytes=-"])
+def test_parse_range_header_rejects_unsatisfiable_ranges(header):
+    with pytest.raises(HTTPException) as exc_info:
+        parse_range_header(header, 100)
+    assert exc_info.value.status_code == 416
@@ -0,0 +1,49 @@
+import io
+from types import SimpleNamespace
+
+import boto3
+import pytest
+from botocore import UNSIGNED
+from botocore.config import Config
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+from langflow.services.storage import s3
+from langflow.services.storage.s3 import S3StorageService
+
+
+@pytest.fixture
+def stubber(tmp_path, monkeypatch):
+    client = boto3.client("s3", region_name="us-east-1", config=Config(signature_version=UNSIGNED))
+    monkeypatch.setattr(s3.boto3, "client", lambda *_args, **_kwargs: client)
+    settings_service = SimpleNamespace(settings=SimpleNamespace(config_dir=str(tmp_path)))
+    storage = S3StorageService(session_service=None, settings_service=settings_service)
+    with Stubber(client) as stubber:
+        stubber.storage = storage
+        yield stubber
+    stubber.assert_no_pending_responses()
+
+
+def object_response(data: bytes) -> dict:
+    return {"Body": StreamingBody(io.BytesIO(data), len(data)), "ContentLength": len(data)}
+
+
+async def read_all(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+async def test_open_stream_sends_a_range_only_for_part_of_the_file(stubber):
+    key = {"Bucket": "langflow", "Key": "folder/file.bin"}
+    stubber.add_response("get_object", object_response(b""), key)
+    stubber.add_response("get_object", object_response(b"data"), {**key, "Range": "bytes=2-"})
+    stubber.add_response("get_object", object_response(b"da"), {**key, "Range": "bytes=0-1"})
+
+    assert await read_all(stubber.storage.open_stream("folder", "file.bin")) == b""
+    assert await read_all(stubber.storage.open_stream("folder", "file.bin", start=2)) == b"data"
+    assert await read_all(stubber.storage.open_stream("folder", "file.bin", end=1)) == b"da"
+
+
+async def test_open_stream_of_a_missing_file(stubber):
+    stubber.add_client_error("get_object", service_error_code="NoSuchKey", http_status_code=404)
+
+    with pytest.raises(FileNotFoundError):
+        await read_all(stubber.storage.open_stream("folder", "missing.bin"))
@@ -240,3 +240,56 @@ async def test_create_variable(service, session: AsyncSession):
     assert result.type == CREDENTIAL_TYPE
     assert isinstance(result.created_at, datetime)
     assert isinstance(result.updated_at, datetime)
+
+
+async def test_get_stored_variables__loads_several_names_without_decrypting(service, session: AsyncSession):
+    user_id = uuid4()
+    await service.create_variable(user_id, "A", "value_a", session=session)
+    await service.create_variable(user_id, "B", "value_b", session=session)
+
+    stored = await service.get_stored_variables(user_id, ["A", "B", "MISSING"], session=session)
+
+    assert set(stored) == {"A", "B"}
+    assert stored["A"].value != "value_a"
+    assert service.decrypt_variable(stored["A"]) == "value_a"
+
+
+async def test_get_stored_variables__cache_is_cleared_on_update(session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(get_settings_service().settings, "variable_cache_ttl", 60)
+    service = DatabaseVariableService(get_settings_service())
+    user_id = uuid4()
+    await service.create_variable(user_id, "A", "old", session=session)
+
+    assert await service.get_variable(user_id, "A", "", session=session) == "old"
+    with patch.object(session, "exec", side_effect=AssertionError("not cached")):
+        assert await service.get_variable(user_id, "A", "", session=session) == "old"
+
+    await service.update_variable(user_id, "A", "new", session=session)
+
+    assert await service.get_variable(user_id, "A", "", session=session) == "new"
+
+
+async def test_run_variable_resolver__loads_all_names_at_once(service, session: AsyncSession, monkeypatch):
+    from contextlib import asynccontextmanager
+
+    from langflow.services.variable.resolver import RunVariableResolver
+
+    @asynccontextmanager
+    async def session_scope():
+        yield session
+
+    monkeypatch.setattr("langflow.services.variable.resolver.session_scope", session_scope)
+    user_id = uuid4()
+    await service.create_variable(user_id, "A", "value_a", session=session)
+    await service.create_variable(user_id, "B", "value_b", session=session)
+    resolver = RunVariableResolver(service, user_id)
+
+    await resolver.prefetch(["A", "B", "MISSING"])
+
+    assert await resolver.get_variable("A", "api_key") == "value_a"
+    assert await resolver.get_variable("B", "api_key") == "value_b"
+    with pytest.raises(ValueError, match="MISSING variable not found"):
+        await resolver.get_variable("MISSING", "api_key")
+    with pytest.raises(TypeError, match="cannot be used in a Session ID field"):
+        await resolver.get_variable("A", "session_id")
+    assert resolver.loads == 1
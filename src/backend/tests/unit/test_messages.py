@@ -7,6 +7,7 @@ from langflow.memory import (
     aadd_messagetables,
     add_messages,
     adelete_messages,
+    aget_last_messages,
     aget_messages,
     astore_message,
     aupdate_messages,
@@ -20,9 +21,11 @@ from langflow.schema.properties import Properties, Source
 
 # Assuming you have these imports available
 from langflow.services.database.models.message import MessageCreate, MessageRead
+from langflow.services.database.models.message.crud import get_messages_page
 from langflow.services.database.models.message.model import MessageTable
 from langflow.services.deps import session_scope
 from langflow.services.tracing.utils import convert_to_langchain_type
+from sqlmodel import select
 
 
 @pytest.fixture
@@ -75,6 +78,69 @@ async def test_aget_messages():
     assert messages[1].text == "Test message 2"
 
 
+@pytest.mark.usefixtures("client")
+async def test_aget_last_messages():
+    await aadd_messages(
+        [
+            Message(
+                text=f"Test message {index}",
+                sender="User",
+                sender_name="User",
+                session_id="last_messages_session",
+                timestamp=datetime(2025, 1, 1, 0, 0, index, tzinfo=timezone.utc),
+            )
+            for index in range(5)
+        ]
+    )
+    messages = await aget_last_messages("last_messages_session", 2)
+    assert [message.text for message in messages] == ["Test message 3", "Test message 4"]
+    # A question and its answer stored in the same second stay in the order they were stored
+    same_second = datetime(2025, 1, 1, 0, 1, tzinfo=timezone.utc)
+    await aadd_messages(
+        [
+            Message(
+                text=text, sender=sender, sender_name=sender, session_id="last_messages_session", timestamp=same_second
+            )
+            for text, sender in (("Question", "User"), ("Answer", "AI"))
+        ]
+    )
+    messages = await aget_last_messages("last_messages_session", 2)
+    assert [message.text for message in messages] == ["Question", "Answer"]
+    assert await aget_last_messages("last_messages_session", 0) == []
+
+
+async def test_get_messages_page_reads_each_message_once(async_session):
+    timestamp = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    messages = [
+        MessageTable(text=f"Message {i}", sender="User", sender_name="User", session_id="paged", timestamp=timestamp)
+        for i in range(5)
+    ]
+    messages.append(
+        MessageTable(text="Other session", sender="User", sender_name="User", session_id="other", timestamp=timestamp)
+    )
+    async_session.add_all(messages)
+    await async_session.commit()
+    stmt = select(MessageTable).where(MessageTable.session_id == "paged")
+
+    for descending in (False, True):
+        pages, cursor = [], None
+        while True:
+            page, cursor = await get_messages_page(async_session, stmt, 2, cursor, descending=descending)
+            pages.append(page)
+            if cursor is None:
+                break
+        ids = [message.id for page in pages for message in page]
+        assert [len(page) for page in pages] == [2, 2, 1]
+        # The messages share their timestamp, they are paged in the order they were stored
+        stored_ids = [message.id for message in messages[:5]]
+        assert ids == (stored_ids[::-1] if descending else stored_ids)
+
+
+async def test_get_messages_page_rejects_invalid_cursors(async_session):
+    with pytest.raises(ValueError, match="Invalid message cursor"):
+        await get_messages_page(async_session, select(MessageTable), 2, "not-a-cursor")
+
+
 @pytest.mark.usefixtures("client")
 def test_add_messages():
     message = Message(text="New Test message", sender="User", sender_name="User", session_id="new_session_id")
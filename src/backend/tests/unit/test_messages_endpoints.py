@@ -77,6 +77,34 @@ async def test_delete_messages_session(client: AsyncClient, created_messages, lo
     assert len(response.json()) == 0
 
 
+@pytest.mark.api_key_required
+async def test_get_messages_paginated(client: AsyncClient, created_messages, logged_in_headers):
+    params = {"session_id": "session_id2", "limit": 2}
+    response = await client.get("api/v1/monitor/messages", params=params, headers=logged_in_headers)
+    assert response.status_code == 200, response.text
+    first_page = response.json()
+    cursor = response.headers["X-Next-Cursor"]
+
+    response = await client.get(
+        "api/v1/monitor/messages", params={**params, "cursor": cursor}, headers=logged_in_headers
+    )
+    assert response.status_code == 200, response.text
+    assert "X-Next-Cursor" not in response.headers
+    ids = [message["id"] for message in first_page + response.json()]
+    assert len(first_page) == 2
+    assert sorted(ids) == sorted(str(message.id) for message in created_messages)
+
+
+@pytest.mark.api_key_required
+async def test_get_messages_paginated_rejects_invalid_requests(client: AsyncClient, logged_in_headers):
+    response = await client.get(
+        "api/v1/monitor/messages", params={"limit": 2, "order_by": "sender"}, headers=logged_in_headers
+    )
+    assert response.status_code == 400
+    response = await client.get("api/v1/monitor/messages", params={"cursor": "invalid"}, headers=logged_in_headers)
+    assert response.status_code == 400
+
+
 # Successfully update session ID for all messages with the old session ID
 @pytest.mark.usefixtures("session")
 async def test_successfully_update_session_id(client, logged_in_headers, created_messages):